@@ -3,6 +3,7 @@ from django.contrib import admin
 from django.utils.html import format_html
 from .models import User, Pembayaran, Anggota, Jadwal, DetailAnggotaJadwal, TimPengangkut, LaporanSampah, Tamu, PushSubscription, Notification
 from .utils.notifications import NotificationService
+from .utils.images import rendition_urls
 
 # Register basic models without custom admin
 @admin.register(User)
@@ -24,7 +25,7 @@ class JadwalAdmin(admin.ModelAdmin):
 
 @admin.register(TimPengangkut)
 class TimPengangkutAdmin(admin.ModelAdmin):
-    list_display = ('namaTim', 'noWhatsapp')
+    list_display = ('namaTim', 'noWhatsapp', 'kapasitas')
     search_fields = ('namaTim',)
 
 @admin.register(LaporanSampah)
@@ -58,7 +59,7 @@ class PembayaranAdmin(admin.ModelAdmin):
     
     def bukti_bayar_preview(self, obj):
         if obj.buktiBayar:
-            return format_html('<img src="{}" width="50" height="50" />', obj.buktiBayar.url)
+            return format_html('<img src="{}" width="50" height="50" />', rendition_urls(obj.buktiBayar)['thumb'])
         return "No Image"
     bukti_bayar_preview.short_description = 'Bukti Bayar'
     
@@ -0,0 +1,79 @@
+# asyncapi.py
+"""
+APIView DRF versi async untuk dijalankan di ASGI (cleanupapk/asgi.py).
+
+DRF belum mendukung view async: AsyncAPIView menjalankan initial()
+(autentikasi JWT, permission, throttle) lewat sync_to_async lalu meng-await
+handler `async def get/post`. Di dalam handler gunakan ORM async Django
+(acount, aget, `async for`, acreate) agar query tidak memblokir event loop.
+
+Di WSGI view ini tetap berjalan (Django membungkusnya dengan async_to_sync).
+"""
+from asgiref.sync import sync_to_async
+from django.core.paginator import InvalidPage
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    """APIView dengan handler `async def` (semua handler wajib async)"""
+
+    async def dispatch(self, request, *args, **kwargs):
+        # Sama dengan APIView.dispatch, bagian sync dijalankan di thread
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            # options() & http_method_not_allowed() bawaan DRF tetap sync
+            if hasattr(response, '__await__'):
+                response = await response
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+
+class AsyncPageNumberPagination(PageNumberPagination):
+    """
+    PageNumberPagination dengan count & slice lewat ORM async
+    (apaginate_queryset). Format response & link sama dengan versi sync,
+    paginate_queryset() sync tetap bisa dipakai ViewSet biasa.
+    """
+
+    async def apaginate_queryset(self, queryset, request, view=None, page_size=None):
+        self.request = request
+        page_size = page_size or self.get_page_size(request)
+        if not page_size:
+            return None
+
+        paginator = self.django_paginator_class(queryset, page_size)
+        # count (cached_property) diisi dari query async, tidak dihitung ulang
+        paginator.count = await queryset.acount()
+        page_number = self.get_page_number(request, paginator)
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            msg = self.invalid_page_message.format(page_number=page_number, message=str(exc))
+            raise NotFound(msg)
+
+        # object_list masih queryset ter-slice (lazy), diambil secara async
+        self.page.object_list = items = [obj async for obj in self.page.object_list]
+
+        if paginator.num_pages > 1 and self.template is not None:
+            # The browsable API should display pagination controls.
+            self.display_page_controls = True
+        return items
@@ -0,0 +1,145 @@
+# authentication.py
+"""
+Autentikasi JWT tanpa query User di setiap request.
+
+JWTAuthentication bawaan simplejwt memuat baris User dari database untuk
+setiap request, lalu permission & get_queryset mencari Anggota/TimPengangkut
+milik user dengan query tambahan. CachedJWTAuthentication menyimpan snapshot
+kecil per user di cache (TTL pendek):
+
+- field User yang dipakai otorisasi (role, is_active, is_staff, ...)
+- idAnggota & daftar idTim milik user (linked_anggota_id / linked_tim_ids)
+
+Snapshot dihapus saat User, Anggota atau TimPengangkut milik user berubah
+(signal di apk/signals.py, dijalankan setelah commit). Claim role di token
+tidak dipakai untuk otorisasi: token berlaku 1 hari dan tidak bisa ditarik
+saat role berubah.
+
+User hasil snapshot adalah instance User dengan field lain di-defer: field
+yang tidak di-cache (mis. password, date_joined) dimuat saat diakses dan
+save() hanya menyimpan field yang dimuat.
+
+Cache memakai backend 'default'. Dengan CACHE_PROFILE=local (LocMemCache)
+invalidasi hanya berlaku di proses yang sama, worker lain tertinggal paling
+lama TIMEOUT; profil redis membagi snapshot & invalidasi ke semua worker.
+
+Konfigurasi: settings.AUTH_USER_CACHE
+"""
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import F
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import Anggota, TimPengangkut
+from .utils.cache import make_key
+
+DEFAULT_CONFIG = {
+    'ENABLED': True,
+    'TIMEOUT': 60,  # detik
+}
+
+# Field User yang ikut snapshot; sisanya di-defer
+USER_FIELDS = (
+    'id', 'username', 'email', 'first_name', 'last_name',
+    'role', 'is_active', 'is_staff', 'is_superuser', 'date_joined',
+)
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'AUTH_USER_CACHE', {})}
+
+
+def _cache_key(user_id):
+    return make_key('auth-user', user_id)
+
+
+def load_user_snapshot(user_id):
+    """Snapshot user dari database (None jika tidak ada) dalam satu query"""
+    # LEFT JOIN anggota & tim: satu baris per tim milik user (minimal satu baris)
+    rows = list(
+        get_user_model().objects
+        .filter(pk=user_id)
+        .values(*USER_FIELDS, anggota_id=F('anggota__idAnggota'), tim_id=F('timpengangkut__idTim'))
+    )
+    if not rows:
+        return None
+    return {
+        'fields': {field: rows[0][field] for field in USER_FIELDS},
+        'anggota_id': rows[0]['anggota_id'],
+        'tim_ids': sorted(row['tim_id'] for row in rows if row['tim_id'] is not None),
+    }
+
+
+def get_user_snapshot(user_id):
+    config = get_config()
+    if not config['ENABLED']:
+        return load_user_snapshot(user_id)
+
+    key = _cache_key(user_id)
+    snapshot = cache.get(key)
+    if snapshot is None:
+        snapshot = load_user_snapshot(user_id)
+        if snapshot is not None:
+            cache.set(key, snapshot, config['TIMEOUT'])
+    return snapshot
+
+
+def user_from_snapshot(snapshot):
+    """Instance User dari snapshot, seolah dimuat dengan .only(*USER_FIELDS)"""
+    User = get_user_model()
+    fields = snapshot['fields']
+    attnames = [f.attname for f in User._meta.concrete_fields if f.attname in fields]
+    # db diisi agar save() hanya menyimpan field yang dimuat
+    user = User.from_db(DEFAULT_DB_ALIAS, attnames, [fields[name] for name in attnames])
+    user._linked_anggota_id = snapshot['anggota_id']
+    user._linked_tim_ids = list(snapshot['tim_ids'])
+    return user
+
+
+def invalidate_user(user_id):
+    """Hapus snapshot user setelah transaksi commit (langsung jika di luar transaksi)"""
+    if user_id is not None:
+        transaction.on_commit(lambda: cache.delete(_cache_key(user_id)))
+
+
+def linked_anggota_id(user):
+    """idAnggota milik user (None jika tidak ada), tanpa query untuk user dari snapshot"""
+    if hasattr(user, '_linked_anggota_id'):
+        return user._linked_anggota_id
+    return Anggota.objects.filter(user=user).values_list('idAnggota', flat=True).first()
+
+
+def linked_tim_ids(user):
+    """idTim milik user tim_angkut, tanpa query untuk user dari snapshot"""
+    if hasattr(user, '_linked_tim_ids'):
+        return user._linked_tim_ids
+    return list(TimPengangkut.objects.filter(idUser=user).order_by('idTim').values_list('idTim', flat=True))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication dengan user dari snapshot cache (lihat docstring modul)"""
+
+    def get_user(self, validated_token):
+        if api_settings.CHECK_REVOKE_TOKEN:
+            # Pemeriksaan hash password butuh baris User lengkap
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+        snapshot = get_user_snapshot(user_id)
+        if snapshot is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        user = user_from_snapshot(snapshot)
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        return user
@@ -0,0 +1,209 @@
+"""
+Router database: baca report & analitik publik dari read replica.
+
+- View yang memakai ReadReplicaMixin membaca dari alias READ_REPLICA['ALIAS'];
+  semua query lain (dan semua write) tetap ke 'default'.
+- Lag tolerance: view menentukan `replica_max_lag` (detik). Jika lag replica
+  lebih besar, query kembali ke 'default'.
+- Read-your-writes: setelah user melakukan POST/PUT/PATCH/DELETE yang sukses,
+  request user tersebut dibaca dari 'default' selama STICKY_SECONDS.
+- view.read_alias = database sumber data request. ETag & key cache dari
+  version counter (apk/utils/conditional.py) wajib dibaca dari alias ini,
+  agar versi tidak pernah lebih baru dari data replica yang tertinggal.
+
+Konfigurasi: settings.READ_REPLICA, alias database di settings.DATABASES.
+"""
+import contextvars
+import logging
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.utils import DatabaseError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework.permissions import SAFE_METHODS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIG = {
+    'ALIAS': 'replica',
+    'MAX_LAG_SECONDS': 30,
+    'STICKY_SECONDS': 15,
+    'LAG_CHECK_INTERVAL': 5,
+}
+
+# Tabel penanda waktu sinkron untuk replica SQLite lokal (command sync_replica)
+SQLITE_SYNC_TABLE = 'replica_sync'
+
+_read_alias = contextvars.ContextVar('read_alias', default=None)
+_lag_cache = {}
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'READ_REPLICA', {})}
+
+
+def replica_alias():
+    """Alias replica jika dikonfigurasi, selain itu None"""
+    alias = get_config()['ALIAS']
+    return alias if alias in settings.DATABASES else None
+
+
+def _sticky_key(user_id):
+    return f"replica-sticky:{user_id}"
+
+
+def mark_recent_write(user):
+    """Baca user ini dari primary selama STICKY_SECONDS"""
+    if user is not None and user.is_authenticated:
+        cache.set(_sticky_key(user.pk), True, get_config()['STICKY_SECONDS'])
+
+
+def has_recent_write(user):
+    return bool(user is not None and user.is_authenticated and cache.get(_sticky_key(user.pk)))
+
+
+def _measure_lag(alias):
+    connection = connections[alias]
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute(
+                "SELECT CASE WHEN pg_is_in_recovery() "
+                "THEN EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) "
+                "ELSE 0 END"
+            )
+            lag = cursor.fetchone()[0]
+            return float(lag) if lag is not None else None
+
+        if connection.vendor == 'sqlite':
+            if SQLITE_SYNC_TABLE not in connection.introspection.table_names(cursor):
+                return None
+            cursor.execute(f"SELECT synced_at FROM {SQLITE_SYNC_TABLE} LIMIT 1")
+            row = cursor.fetchone()
+            synced_at = parse_datetime(row[0]) if row else None
+            return (timezone.now() - synced_at).total_seconds() if synced_at else None
+
+    return None
+
+
+def replica_lag(alias):
+    """
+    Lag replica (detik), disimpan per proses selama LAG_CHECK_INTERVAL.
+    None jika tidak bisa diukur.
+    """
+    now = time.monotonic()
+    cached = _lag_cache.get(alias)
+    if cached and now - cached[0] < get_config()['LAG_CHECK_INTERVAL']:
+        return cached[1]
+
+    try:
+        lag = _measure_lag(alias)
+    except DatabaseError as e:
+        logger.warning("⚠️ Replica %s tidak bisa diakses: %s", alias, e)
+        lag = float('inf')
+
+    _lag_cache[alias] = (now, lag)
+    return lag
+
+
+def choose_read_alias(user, max_lag=None):
+    """Alias untuk query baca request ini, None = 'default'"""
+    alias = replica_alias()
+    if alias is None or has_recent_write(user):
+        return None
+
+    max_lag = get_config()['MAX_LAG_SECONDS'] if max_lag is None else max_lag
+    lag = replica_lag(alias)
+    if lag is not None and lag > max_lag:
+        return None
+    return alias
+
+
+class ReadReplicaRouter:
+    """Dipasang di settings.DATABASE_ROUTERS"""
+
+    def db_for_read(self, model, **hints):
+        return _read_alias.get()
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replica berisi data yang sama dengan primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == 'default'
+
+
+class ReadReplicaMixin:
+    """
+    Untuk APIView yang hanya membaca (report, analitik publik).
+    Request ini tidak memicu read-your-writes walaupun memakai POST.
+    """
+    replica_max_lag = None  # detik; None = READ_REPLICA['MAX_LAG_SECONDS']
+    read_alias = DEFAULT_DB_ALIAS
+
+    def dispatch(self, request, *args, **kwargs):
+        request.replica_read_only = True
+        token = _read_alias.set(None)
+        if self.view_is_async:
+            return self._dispatch_async(token, request, *args, **kwargs)
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        finally:
+            _read_alias.reset(token)
+
+    async def _dispatch_async(self, token, request, *args, **kwargs):
+        # AsyncAPIView: alias baru di-reset setelah handler async selesai
+        try:
+            return await super().dispatch(request, *args, **kwargs)
+        finally:
+            _read_alias.reset(token)
+
+    def initial(self, request, *args, **kwargs):
+        # Autentikasi & permission dibaca dari primary, baru data report dari replica
+        super().initial(request, *args, **kwargs)
+        alias = choose_read_alias(request.user, self.replica_max_lag)
+        _read_alias.set(alias)
+        self.read_alias = alias or DEFAULT_DB_ALIAS
+
+
+class ReadYourWritesMiddleware:
+    """
+    Tandai user yang baru saja menulis agar request berikutnya tidak
+    membaca data lama dari replica.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        response = self.get_response(request)
+        if self.should_mark(request, response):
+            mark_recent_write(getattr(request, 'user', None))
+        return response
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        if self.should_mark(request, response):
+            await sync_to_async(mark_recent_write)(getattr(request, 'user', None))
+        return response
+
+    def should_mark(self, request, response):
+        return (
+            request.method not in SAFE_METHODS
+            and response.status_code < 400
+            and not getattr(request, 'replica_read_only', False)
+            and replica_alias() is not None
+        )
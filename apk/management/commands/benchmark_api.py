@@ -0,0 +1,259 @@
+import gc
+import json
+import os
+import time
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.runner import DiscoverRunner
+from django.test.utils import CaptureQueriesContext, setup_test_environment, teardown_test_environment
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apk.management.commands.benchmark_sqlite import percentile
+from apk.models import Anggota, Notification, TimPengangkut, User
+from apk.urls import report_urlpatterns, router
+from apk.utils.synthetic import DatasetGenerator
+
+BUDGET_FILE = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), '..', '..', 'benchmark_budgets.json')
+)
+
+# Ruang toleransi latency saat --update-budgets (mesin CI lebih lambat/berisik).
+# Jumlah query dibandingkan persis; latency hanya menangkap regresi besar.
+LATENCY_HEADROOM = 3.0
+LATENCY_MIN_SLACK_MS = 25.0
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark regresi API: buat dataset sintetis di database test, panggil setiap "
+        "endpoint router, report & publik, catat jumlah query serta latency p50/p95, "
+        "lalu bandingkan dengan budget di apk/benchmark_budgets.json (exit 1 jika terlampaui)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--anggota", type=int, default=1000, help="Jumlah anggota (default 1000)")
+        parser.add_argument("--days", type=int, default=28, help="Panjang riwayat dalam hari (default 28)")
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--repeat", type=int, default=10, help="Request per endpoint (default 10)")
+        parser.add_argument("--only", default="", help="Hanya endpoint yang namanya mengandung teks ini")
+        parser.add_argument("--budgets", default=BUDGET_FILE, help="File budget JSON")
+        parser.add_argument(
+            "--update-budgets", action="store_true",
+            help="Tulis hasil pengukuran sebagai budget baru",
+        )
+        parser.add_argument(
+            "--latency-factor", type=float, default=float(os.environ.get("BENCHMARK_LATENCY_FACTOR", 1)),
+            help="Pengali budget latency untuk mesin yang lebih lambat (env BENCHMARK_LATENCY_FACTOR)",
+        )
+
+    def handle(self, *args, **options):
+        dataset = {"anggota": options["anggota"], "days": options["days"], "seed": options["seed"]}
+        budgets = self.load_budgets(options["budgets"])
+        if not options["update_budgets"] and budgets.get("dataset") not in (None, dataset):
+            raise CommandError(
+                f"Budget dibuat dengan dataset {budgets['dataset']}, bukan {dataset}. "
+                "Jalankan dengan parameter yang sama atau --update-budgets."
+            )
+
+        setup_test_environment()
+        runner = DiscoverRunner(verbosity=0, interactive=False)
+        old_config = runner.setup_databases()
+        try:
+            start = time.perf_counter()
+            counts = DatasetGenerator(
+                anggota=options["anggota"], days=options["days"], seed=options["seed"], prefix="bench",
+            ).run()
+            self.stdout.write(
+                f"🧪 Dataset ({time.perf_counter() - start:.1f}s): "
+                + ", ".join(f"{model} {count}" for model, count in counts.items())
+            )
+            results = self.run_cases(options)
+        finally:
+            runner.teardown_databases(old_config)
+            teardown_test_environment()
+
+        if options["update_budgets"]:
+            self.write_budgets(options["budgets"], dataset, results)
+            return
+
+        failures = self.report(results, budgets.get("endpoints", {}), options["latency_factor"])
+        if failures:
+            raise CommandError(f"{len(failures)} endpoint melampaui budget: {', '.join(failures)}")
+        self.stdout.write(self.style.SUCCESS("🎯 Semua endpoint dalam budget"))
+
+    # ===== skenario =====
+
+    def users(self):
+        admin = User.objects.create_user(
+            username="bench_admin", password="bench", role="admin", email="admin@example.com",
+        )
+        # Admin juga punya notifikasi sendiri (NotificationViewSet di-scope per user)
+        Notification.objects.bulk_create([
+            Notification(user=admin, title=f"Notifikasi {i}", message="Benchmark", read=i % 3 == 0)
+            for i in range(50)
+        ])
+        anggota = Anggota.objects.filter(status="aktif").select_related("user").order_by("pk").first().user
+        tim = TimPengangkut.objects.select_related("idUser").order_by("pk").first().idUser
+        return {"admin": admin, "anggota": anggota, "tim_angkut": tim, "anon": None}
+
+    def cases(self, users, today):
+        """(nama, role, method, path, data)"""
+        period = {
+            "start_date": (today - timedelta(days=30)).isoformat(),
+            "end_date": today.isoformat(),
+            # MonthlyReportView
+            "month": today.month,
+            "year": today.year,
+        }
+        cases = []
+
+        for prefix, viewset, basename in router.registry:
+            model = viewset.queryset.model if viewset.queryset is not None else viewset.serializer_class.Meta.model
+            list_url = reverse(f"cleanapk:{basename}-list")
+            for role in ("admin", "anggota", "tim_angkut"):
+                cases.append((f"GET {list_url} [{role}]", role, "get", list_url, None))
+
+            obj = model.objects.order_by("pk").first()
+            if "user" in {f.name for f in model._meta.get_fields()}:
+                obj = model.objects.filter(user=users["admin"]).order_by("pk").first() or obj
+            if obj is None:
+                continue
+
+            detail_url = reverse(f"cleanapk:{basename}-detail", args=[obj.pk])
+            cases.append((f"GET {prefix}/<pk>/ [admin]", "admin", "get", detail_url, None))
+
+            for action in viewset.get_extra_actions():
+                if "get" not in action.mapping:
+                    continue
+                name = f"cleanapk:{basename}-{action.url_name}"
+                url = reverse(name, args=[obj.pk]) if action.detail else reverse(name)
+                label = f"{prefix}/<pk>/{action.url_path}/" if action.detail else url
+                cases.append((f"GET {label} [admin]", "admin", "get", url, None))
+
+        for pattern in report_urlpatterns:
+            url = reverse(f"cleanapk:{pattern.name}")
+            view_class = pattern.callback.view_class
+            if view_class.__name__ == "ExportReportView":
+                for fmt in ("json", "pdf", "excel"):
+                    data = {"report_type": "keuangan", "format": fmt, "filters": period}
+                    cases.append((f"POST {url} keuangan.{fmt} [admin]", "admin", "post", url, data))
+            elif "POST" in view_class().allowed_methods:
+                cases.append((f"POST {url} [admin]", "admin", "post", url, period))
+            else:
+                cases.append((f"GET {url} [admin]", "admin", "get", url, period))
+
+        for name in ("public-landing", "public-analisis"):
+            url = reverse(f"cleanapk:{name}")
+            cases.append((f"GET {url} [anon]", "anon", "get", url, None))
+        url = reverse("cleanapk:laporan-sampah-list")
+        cases.append((f"GET {url} [anon]", "anon", "get", url, None))
+
+        return cases
+
+    def client_for(self, user):
+        client = APIClient()
+        if user is not None:
+            # Token JWT asli: query autentikasi ikut terhitung
+            token = RefreshToken.for_user(user).access_token
+            client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        return client
+
+    def run_cases(self, options):
+        users = self.users()
+        clients = {role: self.client_for(user) for role, user in users.items()}
+        results = {}
+
+        for name, role, method, path, data in self.cases(users, timezone.now().date()):
+            if options["only"] and options["only"] not in name:
+                continue
+            client = clients[role]
+            call = getattr(client, method)
+
+            # Pemanasan: import lazy, cache compile template/regex
+            response = call(path, data, format="json")
+            results[name] = self.measure(call, path, data, options["repeat"])
+
+            # Polling dengan ETag dari response sebelumnya: harus 304 tanpa serialisasi
+            etag = response.get("ETag")
+            if method == "get" and etag:
+                results[f"{name} 304"] = self.measure(
+                    call, path, data, options["repeat"], HTTP_IF_NONE_MATCH=etag,
+                )
+        return results
+
+    def measure(self, call, path, data, repeat, **headers):
+        timings = []
+        queries = status = None
+        for _ in range(repeat):
+            # Ukur jalur dingin: cache aplikasi dikosongkan setiap request.
+            # GC dijalankan di luar pengukuran agar p95 tidak didominasi jeda GC.
+            cache.clear()
+            gc.collect()
+            with CaptureQueriesContext(connection) as captured:
+                start = time.perf_counter()
+                response = call(path, data, format="json", **headers)
+                timings.append(time.perf_counter() - start)
+            if queries is None:
+                queries, status = len(captured), response.status_code
+
+        return {
+            "status": status,
+            "queries": queries,
+            "p50_ms": round(percentile(timings, 50) * 1000, 1),
+            "p95_ms": round(percentile(timings, 95) * 1000, 1),
+        }
+
+    # ===== budget =====
+
+    def load_budgets(self, path):
+        if not os.path.exists(path):
+            return {}
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def write_budgets(self, path, dataset, results):
+        endpoints = {
+            name: {
+                "status": result["status"],
+                "queries": result["queries"],
+                "p95_ms": round(max(
+                    result["p95_ms"] * LATENCY_HEADROOM, result["p95_ms"] + LATENCY_MIN_SLACK_MS,
+                ), 1),
+            }
+            for name, result in sorted(results.items())
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"dataset": dataset, "endpoints": endpoints}, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        self.stdout.write(self.style.SUCCESS(f"💾 Budget {len(endpoints)} endpoint ditulis ke {path}"))
+
+    def report(self, results, budgets, latency_factor):
+        failures = []
+        for name, result in results.items():
+            budget = budgets.get(name)
+            problems = []
+            if budget is None:
+                problems.append("belum ada budget")
+            else:
+                if result["status"] != budget["status"]:
+                    problems.append(f"status {result['status']} != {budget['status']}")
+                if result["queries"] > budget["queries"]:
+                    problems.append(f"query {result['queries']} > {budget['queries']}")
+                if result["p95_ms"] > budget["p95_ms"] * latency_factor:
+                    problems.append(f"p95 {result['p95_ms']}ms > {budget['p95_ms'] * latency_factor:.1f}ms")
+
+            icon = "❌" if problems else "✅"
+            self.stdout.write(
+                f"{icon} {name:60} {result['status']}  "
+                f"query {result['queries']:4}  p50 {result['p50_ms']:8.1f} ms  p95 {result['p95_ms']:8.1f} ms"
+                + (f"  ({'; '.join(problems)})" if problems else "")
+            )
+            if problems:
+                failures.append(name)
+        return failures
@@ -0,0 +1,83 @@
+import os
+import re
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Library berat yang hanya boleh dimuat saat dipakai (export laporan)
+LAZY_MODULES = ('reportlab', 'openpyxl', 'pandas')
+
+# Dijalankan di proses baru: setup Django + load URLconf, seperti worker saat start
+STARTUP_SCRIPT = """
+import resource
+import django
+django.setup()
+from django.urls import get_resolver
+get_resolver().url_patterns
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+def measure():
+    """(total_ms, rss_mb, {modul: (self_us, cumulative_us, depth)}) satu start-up"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', STARTUP_SCRIPT],
+        cwd=settings.BASE_DIR, env=os.environ.copy(), capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise CommandError(f"Start-up gagal:\n{result.stderr[-2000:]}")
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules[name] = (int(self_us), int(cumulative_us), len(indent) // 2)
+
+    total_ms = sum(self_us for self_us, _, _ in modules.values()) / 1000
+    rss_mb = int(result.stdout.strip().splitlines()[-1]) / 1024  # ru_maxrss dalam KB (Linux)
+    return total_ms, rss_mb, modules
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark start-up (python -X importtime): waktu import Django + URLconf dan RSS "
+        "proses baru. Gagal (exit 1) jika library berat (reportlab, openpyxl, pandas) ikut "
+        "dimuat atau budget terlampaui."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=3, help="Jumlah start-up, diambil yang tercepat")
+        parser.add_argument("--max-ms", type=float, default=1000, help="Budget total waktu import (ms)")
+        parser.add_argument("--max-rss-mb", type=float, default=120, help="Budget RSS setelah start-up (MB)")
+        parser.add_argument("--top", type=int, default=15, help="Tampilkan N package teratas")
+
+    def handle(self, *args, **options):
+        runs = [measure() for _ in range(max(options["repeat"], 1))]
+        total_ms, rss_mb, modules = min(runs, key=lambda run: run[0])
+
+        packages = {}
+        for name, (_, cumulative_us, depth) in modules.items():
+            if depth == 0:
+                top = name.split('.')[0]
+                packages[top] = packages.get(top, 0) + cumulative_us
+        for name, cumulative_us in sorted(packages.items(), key=lambda p: p[1], reverse=True)[:options["top"]]:
+            self.stdout.write(f"   {name:30} {cumulative_us / 1000:8.1f} ms")
+
+        problems = []
+        loaded = sorted({name.split('.')[0] for name in modules} & set(LAZY_MODULES))
+        if loaded:
+            problems.append(f"modul lazy ikut dimuat saat start-up: {', '.join(loaded)}")
+        if total_ms > options["max_ms"]:
+            problems.append(f"import {total_ms:.0f} ms > {options['max_ms']:.0f} ms")
+        if rss_mb > options["max_rss_mb"]:
+            problems.append(f"RSS {rss_mb:.0f} MB > {options['max_rss_mb']:.0f} MB")
+
+        self.stdout.write(f"⏱️ Import {total_ms:.0f} ms, RSS {rss_mb:.0f} MB, {len(modules)} modul")
+        if problems:
+            raise CommandError("; ".join(problems))
+        self.stdout.write(self.style.SUCCESS("🎯 Start-up dalam budget"))
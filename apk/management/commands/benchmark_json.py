@@ -0,0 +1,120 @@
+import io
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test.runner import DiscoverRunner
+from django.test.utils import setup_test_environment, teardown_test_environment
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from apk import report_datasets  # noqa: F401 (mendaftarkan report)
+from apk.management.commands.benchmark_reports import report_params
+from apk.models import DetailAnggotaJadwal, LaporanSampah
+from apk.parsers import ORJSONParser
+from apk.renderers import ORJSONRenderer, orjson
+from apk.report_engine import REPORTS
+from apk.serializers import DetailAnggotaJadwalSerializer, LaporanSampahSerializer
+from apk.utils.synthetic import DatasetGenerator
+
+# Payload list endpoint terbesar (tanpa paginasi)
+LIST_PAYLOADS = [
+    (
+        "list detail-anggota-jadwal",
+        lambda: DetailAnggotaJadwal.objects.select_related(
+            "idAnggota", "idAnggota__user", "idJadwal", "idJadwal__idTim",
+        ).order_by("-created_at"),
+        DetailAnggotaJadwalSerializer,
+    ),
+    (
+        "list laporan-sampah",
+        lambda: LaporanSampah.objects.select_related("idUser"),
+        LaporanSampahSerializer,
+    ),
+]
+
+
+def throughput(func, size, seconds):
+    """(MB/s, panggilan/s) menjalankan func berulang selama `seconds`"""
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        func()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= seconds:
+            return size * calls / elapsed / 1024 / 1024, calls / elapsed
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark throughput JSON: render & parse payload report dan list terbesar "
+        "dengan JSONRenderer/JSONParser bawaan DRF vs ORJSONRenderer/ORJSONParser."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--anggota", type=int, default=5000, help="Jumlah anggota (default 5000)")
+        parser.add_argument("--days", type=int, default=30, help="Panjang riwayat dalam hari (default 30)")
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--seconds", type=float, default=1.0, help="Durasi per pengukuran (default 1 detik)")
+        parser.add_argument("--top", type=int, default=4, help="Jumlah payload report terbesar (default 4)")
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            raise CommandError("orjson tidak terpasang: pip install orjson")
+
+        setup_test_environment()
+        runner = DiscoverRunner(verbosity=0, interactive=False)
+        old_config = runner.setup_databases()
+        try:
+            DatasetGenerator(
+                anggota=options["anggota"], days=options["days"], seed=options["seed"], prefix="bench",
+            ).run()
+            payloads = self.payloads(options)
+        finally:
+            runner.teardown_databases(old_config)
+            teardown_test_environment()
+
+        self.stdout.write(
+            f"   {'payload':32} {'ukuran':>9}  {'render json':>12} {'orjson':>12} {'x':>6}"
+            f"  {'parse json':>12} {'orjson':>12} {'x':>6}"
+        )
+        context = {"encoding": "utf-8"}
+        mismatches = []
+        for name, data in payloads:
+            body = JSONRenderer().render(data)
+            size = len(body)
+            # Hasil orjson harus sama isinya dengan renderer/parser bawaan
+            fast_body = ORJSONRenderer().render(data)
+            if JSONParser().parse(io.BytesIO(body), parser_context=context) != ORJSONParser().parse(
+                io.BytesIO(fast_body), parser_context=context,
+            ):
+                mismatches.append(name)
+            render_std, _ = throughput(lambda: JSONRenderer().render(data), size, options["seconds"])
+            render_fast, _ = throughput(lambda: ORJSONRenderer().render(data), size, options["seconds"])
+            parse_std, _ = throughput(
+                lambda: JSONParser().parse(io.BytesIO(body), parser_context=context), size, options["seconds"],
+            )
+            parse_fast, _ = throughput(
+                lambda: ORJSONParser().parse(io.BytesIO(body), parser_context=context), size, options["seconds"],
+            )
+            self.stdout.write(
+                f"   {name:32} {size / 1024 / 1024:7.2f}MB  "
+                f"{render_std:8.1f}MB/s {render_fast:8.1f}MB/s {render_fast / render_std:5.1f}x  "
+                f"{parse_std:8.1f}MB/s {parse_fast:8.1f}MB/s {parse_fast / parse_std:5.1f}x"
+            )
+
+        if mismatches:
+            raise CommandError(f"Output orjson berbeda dari JSON bawaan: {', '.join(mismatches)}")
+        self.stdout.write(self.style.SUCCESS("🎯 Output orjson identik dengan JSON bawaan"))
+
+    def payloads(self, options):
+        """(nama, data) report terbesar + list endpoint, dibangun sekali"""
+        params = report_params(options["days"])
+        reports = [(f"report {name}", report_class(params).build()) for name, report_class in REPORTS.items()]
+        reports.sort(key=lambda item: len(JSONRenderer().render(item[1])), reverse=True)
+
+        lists = [
+            (name, serializer_class(queryset(), many=True).data)
+            for name, queryset, serializer_class in LIST_PAYLOADS
+        ]
+        return reports[:options["top"]] + lists
@@ -0,0 +1,121 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test.runner import DiscoverRunner
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from apk import report_datasets  # noqa: F401 (mendaftarkan report)
+from apk.management.commands.benchmark_sqlite import percentile
+from apk.renderers import ORJSONRenderer, orjson
+from apk.report_engine import REPORTS
+from apk.utils.synthetic import DatasetGenerator
+
+
+def legacy_validate(serializer_class, data):
+    """
+    Jalur lama: info & table divalidasi terpisah lalu sekali lagi lewat
+    serializer report (Serializer(data=...).is_valid()).
+    """
+    fields = serializer_class().fields
+    if 'info' in fields and 'table' in fields:
+        info = fields['info'].__class__(data=data['info'])
+        table = fields['table'].child.__class__(data=data['table'], many=True)
+        info.is_valid(raise_exception=True)
+        table.is_valid(raise_exception=True)
+        data = {'info': info.validated_data, 'table': table.validated_data}
+    serializer = serializer_class(data=data)
+    serializer.is_valid(raise_exception=True)
+    return serializer.validated_data
+
+
+def report_params(days):
+    """Parameter report untuk periode `days` hari terakhir (dan bulan ini)"""
+    today = timezone.now().date()
+    return {
+        "start_date": (today - timedelta(days=days)).isoformat(),
+        "end_date": today.isoformat(),
+        "month": today.month,
+        "year": today.year,
+    }
+
+
+def timed(func, repeat):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return percentile(timings, 50) * 1000, result
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark payload report: waktu build() dibanding validasi serializer "
+        "round-trip (jalur lama) dan render JSON stdlib vs orjson, di database test "
+        "berisi dataset sintetis."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--anggota", type=int, default=5000, help="Jumlah anggota (default 5000)")
+        parser.add_argument("--days", type=int, default=30, help="Panjang riwayat dalam hari (default 30)")
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--repeat", type=int, default=5, help="Pengulangan per langkah (default 5)")
+        parser.add_argument(
+            "--min-speedup", type=float, default=1.0,
+            help="Gagal jika report yang dulu divalidasi tidak secepat ini kali jalur lama",
+        )
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        runner = DiscoverRunner(verbosity=0, interactive=False)
+        old_config = runner.setup_databases()
+        try:
+            counts = DatasetGenerator(
+                anggota=options["anggota"], days=options["days"], seed=options["seed"], prefix="bench",
+            ).run()
+            self.stdout.write("🧪 Dataset: " + ", ".join(f"{model} {count}" for model, count in counts.items()))
+            failures = self.run_reports(options)
+        finally:
+            runner.teardown_databases(old_config)
+            teardown_test_environment()
+
+        if failures:
+            raise CommandError(f"Speed-up di bawah {options['min_speedup']}x: {', '.join(failures)}")
+        self.stdout.write(self.style.SUCCESS("🎯 Semua report lebih cepat dari jalur lama"))
+
+    def run_reports(self, options):
+        params = report_params(options["days"])
+        repeat = options["repeat"]
+        stdlib, fast = JSONRenderer(), ORJSONRenderer()
+        if orjson is None:
+            self.stdout.write("⚠️ orjson tidak terpasang, ORJSONRenderer = JSONRenderer bawaan")
+
+        self.stdout.write(
+            f"   {'report':20} {'baris':>7} {'build':>9} {'validasi':>9} "
+            f"{'json':>9} {'orjson':>9} {'lama':>9} {'baru':>9} {'speed-up':>8}"
+        )
+        failures = []
+        for name, report_class in REPORTS.items():
+            report = report_class(params)
+            build_ms, data = timed(report.build, repeat)
+            validate_ms = 0.0
+            if report.serializer_class is not None:
+                validate_ms, _ = timed(lambda: legacy_validate(report.serializer_class, data), repeat)
+            json_ms, _ = timed(lambda: stdlib.render(data), repeat)
+            orjson_ms, _ = timed(lambda: fast.render(data), repeat)
+
+            old_ms = build_ms + validate_ms + json_ms
+            new_ms = build_ms + orjson_ms
+            speedup = old_ms / new_ms if new_ms else 0
+            rows = len(data.get("table") or [])
+            self.stdout.write(
+                f"   {name:20} {rows:7} {build_ms:7.1f}ms {validate_ms:7.1f}ms "
+                f"{json_ms:7.1f}ms {orjson_ms:7.1f}ms {old_ms:7.1f}ms {new_ms:7.1f}ms {speedup:7.2f}x"
+            )
+            if report.serializer_class is not None and speedup < options["min_speedup"]:
+                failures.append(name)
+        return failures
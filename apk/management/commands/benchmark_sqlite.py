@@ -0,0 +1,167 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Setara dengan OPTIONS bawaan Django (tanpa pragma, timeout 5 detik)
+BASIC_PROFILE = {
+    'timeout': 5,
+    'transaction_mode': None,
+    'init_command': '',
+}
+
+
+def tuned_profile():
+    """OPTIONS profil `sqlite` dari settings (walau DB_PROFILE sedang sqlite-basic)"""
+    options = {**BASIC_PROFILE, **settings.DATABASES['default'].get('OPTIONS', {})}
+    if not options['init_command']:
+        pragmas = getattr(settings, 'SQLITE_PRAGMAS', {})
+        options.update(
+            timeout=pragmas.get('busy_timeout', 5000) / 1000,
+            transaction_mode='IMMEDIATE',
+            init_command=';'.join(f"PRAGMA {k}={v}" for k, v in pragmas.items()),
+        )
+    return options
+
+
+def connect(path, options):
+    """Buka koneksi seperti backend sqlite3 Django dengan OPTIONS tertentu"""
+    conn = sqlite3.connect(
+        path, timeout=options['timeout'], isolation_level=None, check_same_thread=False
+    )
+    for command in options['init_command'].split(';'):
+        if command.strip():
+            conn.execute(command)
+    return conn
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(int(len(values) * pct / 100), len(values) - 1)]
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark baca/tulis konkuren SQLite: profil bawaan Django vs profil "
+        "tuning (WAL, pragma, busy timeout) di DATABASES. Memakai file database sementara."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--writers", type=int, default=4, help="Thread penulis (default 4)")
+        parser.add_argument("--readers", type=int, default=8, help="Thread pembaca (default 8)")
+        parser.add_argument("--seconds", type=float, default=5, help="Durasi per profil (default 5)")
+        parser.add_argument("--rows", type=int, default=20000, help="Baris awal (default 20000)")
+        parser.add_argument(
+            "--think-ms", type=float, default=1,
+            help="Jeda antar transaksi per thread, meniru kerja request (default 1 ms)",
+        )
+
+    def handle(self, *args, **options):
+        profiles = [
+            ("sqlite-basic", BASIC_PROFILE),
+            ("sqlite (tuned)", tuned_profile()),
+        ]
+
+        for label, profile in profiles:
+            result = self.run_profile(profile, options)
+            self.stdout.write(
+                f"📊 {label:15} "
+                f"tulis {result['writes'] / options['seconds']:8.1f}/s  "
+                f"baca {result['reads'] / options['seconds']:8.1f}/s  "
+                f"p95 tulis {result['write_p95'] * 1000:7.1f} ms  "
+                f"p95 baca {result['read_p95'] * 1000:7.1f} ms  "
+                f"locked {result['locked']}"
+            )
+
+    def run_profile(self, profile, options):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bench.sqlite3")
+            self.prepare(path, profile, options["rows"])
+
+            think = options["think_ms"] / 1000
+            stop = threading.Event()
+            lock = threading.Lock()
+            result = {"writes": 0, "reads": 0, "locked": 0, "write_lat": [], "read_lat": []}
+
+            def record(kind, latency):
+                with lock:
+                    result[f"{kind}s"] += 1
+                    result[f"{kind}_lat"].append(latency)
+
+            def locked():
+                with lock:
+                    result["locked"] += 1
+
+            def writer(n):
+                conn = connect(path, profile)
+                begin = f"BEGIN {profile['transaction_mode']}" if profile["transaction_mode"] else "BEGIN"
+                i = 0
+                while not stop.is_set():
+                    start = time.perf_counter()
+                    try:
+                        # Pola signal: baca status lalu tulis notifikasi + update
+                        conn.execute(begin)
+                        conn.execute("SELECT status FROM laporan WHERE id = ?", (i % 1000 + 1,)).fetchone()
+                        conn.execute(
+                            "INSERT INTO notifikasi (laporan_id, pesan) VALUES (?, ?)",
+                            (i % 1000 + 1, f"writer {n} #{i}"),
+                        )
+                        conn.execute("UPDATE laporan SET status = ? WHERE id = ?", (i % 3, i % 1000 + 1))
+                        conn.execute("COMMIT")
+                        record("write", time.perf_counter() - start)
+                    except sqlite3.OperationalError:
+                        locked()
+                        if conn.in_transaction:
+                            conn.execute("ROLLBACK")
+                    i += 1
+                    time.sleep(think)
+                conn.close()
+
+            def reader():
+                conn = connect(path, profile)
+                while not stop.is_set():
+                    start = time.perf_counter()
+                    try:
+                        # Pola report: agregasi per status
+                        conn.execute(
+                            "SELECT status, COUNT(*) FROM laporan GROUP BY status"
+                        ).fetchall()
+                        conn.execute("SELECT COUNT(*) FROM notifikasi").fetchone()
+                        record("read", time.perf_counter() - start)
+                    except sqlite3.OperationalError:
+                        locked()
+                    time.sleep(think)
+                conn.close()
+
+            threads = [threading.Thread(target=writer, args=(n,)) for n in range(options["writers"])]
+            threads += [threading.Thread(target=reader) for _ in range(options["readers"])]
+            for thread in threads:
+                thread.start()
+            time.sleep(options["seconds"])
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+        result["write_p95"] = percentile(result.pop("write_lat"), 95)
+        result["read_p95"] = percentile(result.pop("read_lat"), 95)
+        return result
+
+    def prepare(self, path, profile, rows):
+        conn = connect(path, profile)
+        conn.execute("CREATE TABLE laporan (id INTEGER PRIMARY KEY, status INTEGER, alamat TEXT)")
+        conn.execute(
+            "CREATE TABLE notifikasi (id INTEGER PRIMARY KEY, laporan_id INTEGER, pesan TEXT)"
+        )
+        conn.execute("BEGIN")
+        conn.executemany(
+            "INSERT INTO laporan (status, alamat) VALUES (?, ?)",
+            ((i % 3, f"Jl. Contoh {i}") for i in range(rows)),
+        )
+        conn.execute("COMMIT")
+        conn.close()
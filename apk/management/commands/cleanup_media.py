@@ -0,0 +1,206 @@
+import os
+from collections import Counter
+from datetime import timedelta
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from apk.models import LaporanSampah, MediaBlob, Pembayaran
+from apk.utils.conditional import bump_version
+from apk.utils.images import PROCESSED_DIR, get_config, is_processed, rendition_name
+from apk.utils.thumbnails import THUMB_DIR
+
+TARGETS = [
+    (LaporanSampah, "foto_bukti"),
+    (Pembayaran, "buktiBayar"),
+]
+
+
+def referenced_names():
+    """Jumlah baris yang menunjuk tiap file"""
+    counts = Counter()
+    for model, field_name in TARGETS:
+        names = (
+            model.objects
+            .exclude(**{field_name: ""})
+            .exclude(**{f"{field_name}__isnull": True})
+            .values_list(field_name, flat=True)
+        )
+        counts.update(names.iterator())
+    return counts
+
+
+class Command(BaseCommand):
+    help = (
+        "Bersihkan media berbasis hash: hitung ulang referensi, "
+        "gabungkan file lama yang duplikat, dan hapus blob yatim"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--recount",
+            action="store_true",
+            help="Hitung ulang ref_count dari LaporanSampah & Pembayaran",
+        )
+        parser.add_argument(
+            "--dedupe-existing",
+            action="store_true",
+            help="Simpan ulang file lama (nama non-hash) sebagai blob berbasis hash",
+        )
+        parser.add_argument(
+            "--grace-hours",
+            type=int,
+            default=24,
+            help="Blob yatim baru dihapus setelah N jam tanpa referensi (default 24)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Tampilkan yang akan dihapus tanpa menghapus",
+        )
+
+    def handle(self, *args, **options):
+        if not hasattr(default_storage, "is_content_addressed"):
+            raise CommandError("STORAGES['default'] bukan apk.storage.ContentAddressedStorage")
+
+        dry_run = options["dry_run"]
+
+        if options["dedupe_existing"]:
+            self.dedupe_existing(dry_run)
+        if options["recount"] or options["dedupe_existing"]:
+            self.recount(dry_run)
+
+        cutoff = timezone.now() - timedelta(hours=options["grace_hours"])
+        self.delete_orphans(cutoff, dry_run)
+
+    def recount(self, dry_run):
+        counts = referenced_names()
+        changed = 0
+
+        with transaction.atomic():
+            for blob in MediaBlob.objects.select_for_update().iterator():
+                actual = counts.pop(blob.name, 0)
+                if blob.ref_count != actual:
+                    changed += 1
+                    if not dry_run:
+                        MediaBlob.objects.filter(pk=blob.pk).update(
+                            ref_count=actual, updated_at=timezone.now()
+                        )
+
+            # File yang direferensikan tapi belum tercatat
+            missing = [
+                MediaBlob(
+                    name=name,
+                    ref_count=count,
+                    size=default_storage.size(name) if default_storage.exists(name) else 0,
+                )
+                for name, count in counts.items()
+                if default_storage.is_content_addressed(name)
+            ]
+            if not dry_run:
+                MediaBlob.objects.bulk_create(missing, ignore_conflicts=True)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"✅ ref_count diperbarui: {changed} blob, {len(missing)} blob baru dicatat")
+        )
+
+    def dedupe_existing(self, dry_run):
+        """
+        File dari sebelum storage berbasis hash disimpan ulang dengan nama hash,
+        sehingga file lama yang isinya sama menjadi satu blob.
+        """
+        moved = 0
+        for name in referenced_names():
+            if not default_storage.is_content_addressed(name) or default_storage.is_hashed_name(name):
+                continue
+            if not default_storage.exists(name):
+                continue
+
+            if dry_run:
+                self.stdout.write(f"  ↪️ {name}")
+                moved += 1
+                continue
+
+            # Penanda hasil pipeline gambar dipertahankan (subfolder opt/)
+            target = name
+            if is_processed(name):
+                top = name.split("/", 1)[0]
+                target = f"{top}/{PROCESSED_DIR}/{os.path.basename(name)}"
+
+            with default_storage.open(name, "rb") as f:
+                new_name = default_storage.save(target, f)
+            if new_name == name:
+                continue
+
+            for model, field_name in TARGETS:
+                if model.objects.filter(**{field_name: name}).update(**{field_name: new_name}):
+                    bump_version(model)
+            default_storage.delete(name)
+            self._delete_renditions(name)
+            moved += 1
+
+        self.stdout.write(self.style.SUCCESS(f"✅ {moved} file lama disimpan ulang berbasis hash"))
+        if moved and not dry_run:
+            self.stdout.write("ℹ️ Jalankan `manage.py process_images` untuk membuat ulang rendisi")
+
+    def delete_orphans(self, cutoff, dry_run):
+        orphans = MediaBlob.objects.filter(ref_count__lte=0, updated_at__lt=cutoff)
+        deleted = 0
+        freed = 0
+
+        for blob in orphans.iterator():
+            if dry_run:
+                self.stdout.write(f"  🗑️ {blob.name} ({blob.size} byte)")
+            else:
+                # delete() mengecek ulang ref_count sehingga blob yang baru
+                # dipakai lagi tidak ikut terhapus
+                default_storage.delete(blob.name)
+                if MediaBlob.objects.filter(pk=blob.pk).exists():
+                    continue
+                self._delete_renditions(blob.name)
+            deleted += 1
+            freed += blob.size
+
+        # Sisa upload yang gagal di-rename (.tmp)
+        for prefix in default_storage.prefixes:
+            deleted += self._delete_temp_files(prefix.rstrip("/"), cutoff, dry_run)
+
+        label = "akan dihapus" if dry_run else "dihapus"
+        self.stdout.write(
+            self.style.SUCCESS(f"✅ {deleted} blob yatim {label} ({freed / 1024 / 1024:.2f} MB)")
+        )
+
+    def _delete_renditions(self, name):
+        for rendition in get_config()["RENDITIONS"]:
+            target = rendition_name(name, rendition)
+            if default_storage.exists(target):
+                default_storage.delete(target)
+
+        # Thumbnail PDF (thumbcache/<hh>/<sha256>_<w>x<h>.<ext>)
+        digest = os.path.splitext(os.path.basename(name))[0]
+        directory = f"{THUMB_DIR}/{digest[:2]}"
+        if default_storage.is_hashed_name(name) and default_storage.exists(directory):
+            for filename in default_storage.listdir(directory)[1]:
+                if filename.startswith(f"{digest}_"):
+                    default_storage.delete(f"{directory}/{filename}")
+
+    def _delete_temp_files(self, directory, cutoff, dry_run):
+        if not default_storage.exists(directory):
+            return 0
+
+        deleted = 0
+        dirs, files = default_storage.listdir(directory)
+        for filename in files:
+            path = f"{directory}/{filename}"
+            if (
+                filename.startswith(".") and filename.endswith(".tmp")
+                and default_storage.get_modified_time(path) < cutoff
+            ):
+                if not dry_run:
+                    os.remove(default_storage.path(path))
+                deleted += 1
+        for sub in dirs:
+            deleted += self._delete_temp_files(f"{directory}/{sub}", cutoff, dry_run)
+        return deleted
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from apk.utils.query_plans import check_plans
+
+
+class Command(BaseCommand):
+    help = (
+        "EXPLAIN query yang paling sering dijalankan viewset & report dan pastikan "
+        "index komposit yang sesuai dipakai. Gagal (exit 1) jika ada yang tidak memakai index."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, **options):
+        failed = []
+
+        for label, name, plan, used in check_plans(options["database"]):
+            if used:
+                self.stdout.write(f"✅ {label}: {name}")
+            else:
+                failed.append(label)
+                self.stdout.write(f"❌ {label}: {name} tidak dipakai")
+            if options["verbosity"] > 1 or not used:
+                self.stdout.write(f"   {plan}")
+
+        if failed:
+            raise CommandError(f"{len(failed)} query tidak memakai index: {', '.join(failed)}")
+        self.stdout.write(self.style.SUCCESS("🎯 Semua query memakai index"))
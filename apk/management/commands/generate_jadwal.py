@@ -0,0 +1,56 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apk.utils.scheduling import generate_schedule
+
+
+class Command(BaseCommand):
+    help = "Buat jadwal pengangkutan otomatis untuk anggota aktif berdasarkan lokasi"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--mulai", required=True, help="Tanggal mulai (YYYY-MM-DD)")
+        parser.add_argument("--selesai", required=True, help="Tanggal selesai (YYYY-MM-DD)")
+        parser.add_argument("--tim", type=int, nargs="*", help="Batasi ke ID tim tertentu")
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Hanya tampilkan preview, tidak menyimpan data",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            mulai = date.fromisoformat(options["mulai"])
+            selesai = date.fromisoformat(options["selesai"])
+            summary = generate_schedule(
+                mulai,
+                selesai,
+                dry_run=options["dry_run"],
+                tim_ids=options["tim"],
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(
+            f"📅 {summary['tanggal_mulai']} s/d {summary['tanggal_selesai']} | "
+            f"{summary['jumlah_anggota']} anggota, {summary['jumlah_tim']} tim, "
+            f"siklus {summary['siklus_hari']} hari"
+        )
+        for item in summary["jadwal"]:
+            self.stdout.write(
+                f"   {item['tanggal']} - {item['nama_tim']}: {item['jumlah_anggota']} anggota"
+            )
+
+        if summary["dry_run"]:
+            self.stdout.write(
+                f"ℹ Dry run: {summary['jumlah_jadwal']} jadwal, "
+                f"{summary['jumlah_detail']} detail tidak disimpan"
+            )
+        else:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"✅ {summary['jumlah_jadwal_baru']} jadwal baru, "
+                    f"{summary['jumlah_detail_baru']} dari {summary['jumlah_detail']} "
+                    f"detail jadwal dibuat"
+                )
+            )
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+from apk.models import LaporanSampah, Pembayaran
+from apk.utils.images import process_image
+
+
+class Command(BaseCommand):
+    help = "Encode ulang foto_bukti & buktiBayar yang sudah ada dan buat rendisinya"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Buat ulang rendisi walaupun sudah ada",
+        )
+
+    def handle(self, *args, **options):
+        targets = [
+            (LaporanSampah, "foto_bukti"),
+            (Pembayaran, "buktiBayar"),
+        ]
+
+        for model, field_name in targets:
+            pks = (
+                model.objects
+                .exclude(**{field_name: ""})
+                .exclude(**{f"{field_name}__isnull": True})
+                .values_list("pk", flat=True)
+            )
+            processed = 0
+            for pk in pks.iterator():
+                if process_image(model, pk, field_name, force=options["force"]):
+                    processed += 1
+
+            self.stdout.write(
+                self.style.SUCCESS(f"✅ {model.__name__}.{field_name}: {processed} gambar diproses")
+            )
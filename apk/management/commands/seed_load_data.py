@@ -0,0 +1,68 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from apk.utils.synthetic import DEFAULT_PASSWORD, DatasetGenerator
+
+
+class Command(BaseCommand):
+    help = (
+        "Isi database dengan data sintetis volume produksi untuk uji beban: user, anggota "
+        "(koordinat sekitar Kota Kupang), tim, jadwal, detail jadwal, pembayaran, laporan "
+        "sampah & notifikasi. Memakai bulk_create per chunk, signal dimatikan."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--anggota", type=int, required=True, help="Jumlah anggota")
+        parser.add_argument("--days", type=int, default=30, help="Panjang riwayat dalam hari (default 30)")
+        parser.add_argument("--seed", type=int, default=42, help="Seed random (default 42)")
+        parser.add_argument(
+            "--chunk-size", type=int, default=5000,
+            help="Anggota per transaksi (default 5000)",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=1000,
+            help="Baris per INSERT bulk_create (default 1000)",
+        )
+        parser.add_argument(
+            "--prefix", default=None,
+            help="Prefix username (default acak, agar bisa dijalankan berulang)",
+        )
+
+    def handle(self, *args, **options):
+        if options["anggota"] < 1 or options["days"] < 1:
+            raise CommandError("--anggota dan --days harus lebih dari 0")
+
+        self.stdout.write(
+            f"🌱 Seed {options['anggota']} anggota, {options['days']} hari "
+            f"ke database {connection.settings_dict['NAME']}"
+        )
+        start = time.perf_counter()
+
+        def progress(done, counts):
+            elapsed = time.perf_counter() - start
+            rows = sum(counts.values())
+            self.stdout.write(
+                f"   {done}/{options['anggota']} anggota, {rows} baris "
+                f"({elapsed:.1f}s, {rows / elapsed:,.0f} baris/s)"
+            )
+
+        generator = DatasetGenerator(
+            anggota=options["anggota"],
+            days=options["days"],
+            seed=options["seed"],
+            batch_size=options["batch_size"],
+            chunk_size=options["chunk_size"],
+            prefix=options["prefix"],
+            progress=progress,
+        )
+        counts = generator.run()
+
+        elapsed = time.perf_counter() - start
+        for model, count in counts.items():
+            self.stdout.write(f"   {model:22} {count:>10,}")
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ {sum(counts.values()):,} baris dalam {elapsed:.1f}s. "
+            f"Login: {generator.prefix}_anggota_0 / {DEFAULT_PASSWORD}"
+        ))
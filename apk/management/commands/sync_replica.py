@@ -0,0 +1,60 @@
+import sqlite3
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apk.db_routers import SQLITE_SYNC_TABLE, get_config
+
+
+class Command(BaseCommand):
+    help = (
+        "Salin database SQLite default ke file replica (DB_REPLICA_NAME) untuk "
+        "mencoba read replica secara lokal. Jalankan berkala (mis. cron) atau --every."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--every", type=float, default=0,
+            help="Ulangi setiap N detik (default 0 = sekali saja)",
+        )
+
+    def handle(self, *args, **options):
+        alias = get_config()['ALIAS']
+        if alias not in settings.DATABASES:
+            raise CommandError(f"Database '{alias}' belum dikonfigurasi (set DB_REPLICA_NAME)")
+
+        source = settings.DATABASES['default']
+        target = settings.DATABASES[alias]
+        if not (source['ENGINE'].endswith('sqlite3') and target['ENGINE'].endswith('sqlite3')):
+            raise CommandError("sync_replica hanya untuk SQLite; PostgreSQL memakai streaming replication")
+
+        while True:
+            start = time.perf_counter()
+            self.sync(str(source['NAME']), str(target['NAME']))
+            self.stdout.write(
+                f"🔁 Replica {target['NAME']} disinkronkan ({time.perf_counter() - start:.2f}s)"
+            )
+            if not options["every"]:
+                break
+            time.sleep(options["every"])
+
+    def sync(self, source_path, target_path):
+        src = sqlite3.connect(source_path)
+        dst = sqlite3.connect(target_path)
+        # Lag dihitung dari saat snapshot diambil
+        synced_at = timezone.now()
+        try:
+            # Backup online: aman walau default sedang dipakai (WAL)
+            src.backup(dst)
+            dst.execute(f"CREATE TABLE IF NOT EXISTS {SQLITE_SYNC_TABLE} (synced_at TEXT NOT NULL)")
+            dst.execute(f"DELETE FROM {SQLITE_SYNC_TABLE}")
+            dst.execute(
+                f"INSERT INTO {SQLITE_SYNC_TABLE} (synced_at) VALUES (?)",
+                (synced_at.isoformat(),),
+            )
+            dst.commit()
+        finally:
+            dst.close()
+            src.close()
@@ -0,0 +1,97 @@
+"""
+Middleware instrumentasi request: latency, jumlah & waktu query SQL per route
+(apk/utils/metrics.py), plus log request lambat dengan query terlamanya.
+"""
+import logging
+import time
+from contextlib import ExitStack, contextmanager
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from .utils.metrics import DB_QUERIES, DB_QUERY_SECONDS, REQUEST_LATENCY, REQUESTS, get_config
+
+logger = logging.getLogger(__name__)
+
+SQL_LOG_MAX_LENGTH = 500
+
+
+class MetricsMiddleware:
+    # Async di ASGI agar view async tidak dipaksa jalan di thread sync
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        config = get_config()
+        if not config['ENABLED']:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.slow_ms = config['SLOW_REQUEST_MS']
+        self.top_queries = config['SLOW_REQUEST_TOP_QUERIES']
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with self.measure(request) as result:
+            result['wrap_connections']()
+            result['response'] = self.get_response(request)
+        return result['response']
+
+    async def __acall__(self, request):
+        with self.measure(request) as result:
+            # Koneksi DB per thread: query ORM async & view sync berjalan di
+            # thread sync_to_async milik request, wrapper dipasang di sana
+            await sync_to_async(result['wrap_connections'])()
+            result['response'] = await self.get_response(request)
+        return result['response']
+
+    @contextmanager
+    def measure(self, request):
+        """Catat latency & query SQL selama blok; response diisi ke result['response']"""
+        stats = {'count': 0, 'seconds': 0.0}
+        # (durasi, sql) hanya disimpan jika log request lambat aktif
+        queries = [] if self.slow_ms is not None else None
+
+        def record_query(execute, sql, params, many, context):
+            start = time.perf_counter()
+            try:
+                return execute(sql, params, many, context)
+            finally:
+                elapsed = time.perf_counter() - start
+                stats['count'] += 1
+                stats['seconds'] += elapsed
+                if queries is not None:
+                    queries.append((elapsed, sql))
+
+        def wrap_connections():
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(record_query))
+
+        result = {'wrap_connections': wrap_connections}
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            yield result
+        elapsed = time.perf_counter() - start
+        response = result['response']
+
+        match = request.resolver_match
+        route = match.view_name if match else 'unmatched'
+        REQUEST_LATENCY.observe(elapsed, route, request.method)
+        REQUESTS.inc(route, request.method, str(response.status_code))
+        DB_QUERIES.observe(stats['count'], route)
+        DB_QUERY_SECONDS.inc(route, amount=stats['seconds'])
+
+        if queries is not None and elapsed * 1000 >= self.slow_ms:
+            self.log_slow_request(request, route, elapsed, stats, queries)
+
+    def log_slow_request(self, request, route, elapsed, stats, queries):
+        top = sorted(queries, key=lambda q: q[0], reverse=True)[:self.top_queries]
+        lines = [
+            f"🐢 Request lambat {request.method} {request.path} ({route}): "
+            f"{elapsed * 1000:.0f} ms, {stats['count']} query {stats['seconds'] * 1000:.0f} ms"
+        ]
+        lines += [f"   {duration * 1000:8.1f} ms  {sql[:SQL_LOG_MAX_LENGTH]}" for duration, sql in top]
+        logger.warning('\n'.join(lines))
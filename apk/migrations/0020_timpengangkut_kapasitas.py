@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apk', '0019_alter_laporansampah_latitude_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='timpengangkut',
+            name='kapasitas',
+            field=models.PositiveIntegerField(default=50),
+        ),
+    ]
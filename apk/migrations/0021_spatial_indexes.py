@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apk', '0020_timpengangkut_kapasitas'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='anggota',
+            index=models.Index(fields=['latitude', 'longitude'], name='apk_anggota_latitud_10439a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='laporansampah',
+            index=models.Index(fields=['latitude', 'longitude'], name='laporan_sam_latitud_da01a6_idx'),
+        ),
+    ]
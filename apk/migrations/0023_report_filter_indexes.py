@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apk', '0022_mediablob'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='anggota',
+            index=models.Index(fields=['status', 'tanggalEnd'], name='apk_anggota_status_e03dae_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='detailanggotajadwal',
+            index=models.Index(fields=['idJadwal', 'status_pengangkutan'], name='apk_detaila_idJadwa_13ba2b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jadwal',
+            index=models.Index(fields=['tanggalJadwal', 'idTim'], name='apk_jadwal_tanggal_81c65c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='laporansampah',
+            index=models.Index(fields=['tanggal_lapor', 'status'], name='laporan_sam_tanggal_6cbc16_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pembayaran',
+            index=models.Index(fields=['tanggalBayar', 'statusBayar'], name='apk_pembaya_tanggal_b2d7eb_idx'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apk', '0023_report_filter_indexes'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='anggota',
+            index=models.Index(fields=['tanggalStart', 'status'], name='apk_anggota_tanggal_23a5e0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='detailanggotajadwal',
+            index=models.Index(fields=['created_at'], name='apk_detaila_created_d96a61_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='laporansampah',
+            index=models.Index(fields=['status', 'tanggal_lapor'], name='laporan_sam_status_a885ea_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(condition=models.Q(('read', False)), fields=['user', '-created_at'], name='notification_unread_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['role'], name='apk_user_role_5b68f2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['date_joined'], name='apk_user_date_jo_45b215_idx'),
+        ),
+    ]
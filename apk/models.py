@@ -1,12 +1,84 @@
+import logging
+
 from django.db import models
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import FileExtensionValidator
 from django.conf import settings
+from django.db.models.fields.files import FieldFile
 from django.db.models.signals import post_save, pre_save
 from django.dispatch import receiver
 from django.utils import timezone
 
-class User(AbstractUser):
+from .utils.conditional import bump_version
+from .utils.logs import get_logger
+
+log = get_logger(__name__)
+
+
+class TrackedFieldsMixin:
+    """
+    Mixin untuk mencatat nilai awal field di `tracked_fields` saat instance
+    dimuat dari database (from_db), sehingga perubahan bisa dicek lewat
+    has_changed() tanpa SELECT tambahan di signal pre_save/post_save.
+    """
+    tracked_fields = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._snapshot_tracked_fields()
+        return instance
+
+    def _snapshot_tracked_fields(self):
+        # Field yang di-defer (only/defer) tidak ada di __dict__ dan dilewati
+        self._original_values = {
+            field: self._tracked_value(self.__dict__[field])
+            for field in self.tracked_fields
+            if field in self.__dict__
+        }
+
+    @staticmethod
+    def _tracked_value(value):
+        # FieldFile bisa berubah in-place, simpan namanya saja
+        if isinstance(value, FieldFile):
+            return value.name or None
+        return value
+
+    def get_original(self, field, default=None):
+        """Nilai field saat terakhir dimuat/disimpan"""
+        return getattr(self, '_original_values', {}).get(field, default)
+
+    def has_changed(self, field):
+        """
+        True jika nilai field berbeda dari snapshot.
+        Instance baru (belum pernah dimuat/disimpan) dianggap berubah semua.
+        Field yang di-defer dan belum diisi dianggap tidak berubah.
+        """
+        original = getattr(self, '_original_values', None)
+        if original is None:
+            return True
+        if field not in original:
+            # Nilai awal tidak dimuat: berubah hanya jika di-assign setelahnya
+            return field not in self.get_deferred_fields()
+        return original[field] != self._tracked_value(getattr(self, field))
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+        # Field di-defer yang dimuat belakangan (saat diakses) masuk snapshot
+        original = getattr(self, '_original_values', None)
+        if original is None:
+            return
+        for field in self.tracked_fields if fields is None else fields:
+            if field in self.tracked_fields and field in self.__dict__:
+                original[field] = self._tracked_value(self.__dict__[field])
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # Snapshot diperbarui setelah signal post_save selesai dijalankan
+        self._snapshot_tracked_fields()
+
+
+class User(TrackedFieldsMixin, AbstractUser):
     ROLE_CHOICES = (
         ("anggota", "Anggota"),
         ("tim_angkut", "Tim Angkut"),
@@ -19,22 +91,37 @@ class User(AbstractUser):
         choices=ROLE_CHOICES, default="tamu"
     )
 
+    tracked_fields = ('role',)
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Hitung user per role (report user-stats, dashboard)
+            models.Index(fields=['role']),
+            # Daftar user terbaru & user baru bulan ini
+            models.Index(fields=['date_joined']),
+        ]
+
     def __str__(self):
         return f"{self.id}, {self.username} ({self.role})"
 
-class TimPengangkut(models.Model):
+class TimPengangkut(TrackedFieldsMixin, models.Model):
     idTim = models.AutoField(primary_key=True)
     namaTim = models.CharField(max_length=100, null=False)
     noWhatsapp = models.CharField(max_length=12, null=False)  # Changed to CharField
     idUser = models.ForeignKey(
         User,
         on_delete=models.CASCADE)
+    # Jumlah maksimal anggota yang dilayani tim dalam satu jadwal (per hari)
+    kapasitas = models.PositiveIntegerField(default=50)
+
+    # Pemilik lama ikut di-invalidate dari snapshot auth saat tim dipindah
+    tracked_fields = ('idUser_id',)
     
     def __str__(self):
         return self.namaTim
 
 # models.py - Simplify the Anggota model (hapus duplicate code)
-class Anggota(models.Model):
+class Anggota(TrackedFieldsMixin, models.Model):
     JENIS_SAMPAH_CHOICES = [
         ('Rumah Tangga', 'Rumah Tangga'),
         ('Tempat Usaha', 'Tempat Usaha'),
@@ -57,10 +144,22 @@ class Anggota(models.Model):
     tanggalEnd = models.DateField(null=False)
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, null=False)
     jenisSampah = models.CharField(max_length=15, choices=JENIS_SAMPAH_CHOICES, null=False)
+
+    tracked_fields = ('status', 'user_id')
+
+    class Meta:
+        indexes = [
+            # Prefilter bounding box untuk pencarian radius (?near=)
+            models.Index(fields=['latitude', 'longitude']),
+            # Anggota aktif yang akan/sudah berakhir (report, reminder, generate jadwal)
+            models.Index(fields=['status', 'tanggalEnd']),
+            # Report anggota: rentang tanggalStart + hitung per status
+            models.Index(fields=['tanggalStart', 'status']),
+        ]
     
     def __str__(self):
         return self.nama
-    
+
     def save(self, *args, **kwargs):
         # Set status default jika tidak ada
         if not self.status:
@@ -68,6 +167,32 @@ class Anggota(models.Model):
         
         super().save(*args, **kwargs)
 
+    def jadwal_dibatalkan_mendatang(self):
+        """Detail jadwal yang dibatalkan dan tanggalnya belum lewat"""
+        return DetailAnggotaJadwal.objects.filter(
+            idAnggota=self,
+            status_pengangkutan='dibatalkan',
+            idJadwal__tanggalJadwal__gte=timezone.now().date(),
+        )
+
+    def batalkan_jadwal(self):
+        """Batalkan semua detail jadwal anggota ini dalam satu UPDATE"""
+        updated = DetailAnggotaJadwal.objects.filter(idAnggota=self).update(
+            status_pengangkutan='dibatalkan',
+            catatan=f"Status pengangkutan dibatalkan karena anggota non-aktif (ID: {self.idAnggota})",
+        )
+        bump_version(DetailAnggotaJadwal)
+        return updated
+
+    def aktifkan_kembali_jadwal(self, catatan=None):
+        """Aktifkan kembali jadwal mendatang yang dibatalkan dalam satu UPDATE"""
+        updated = self.jadwal_dibatalkan_mendatang().update(
+            status_pengangkutan='terjadwal',
+            catatan=catatan or f"Status pengangkutan diaktifkan kembali (ID Anggota: {self.idAnggota})",
+        )
+        bump_version(DetailAnggotaJadwal)
+        return updated
+
 # class Anggota(models.Model):
 #     JENIS_SAMPAH_CHOICES = [
 #         ('Rumah Tangga', 'Rumah Tangga'),
@@ -115,11 +240,16 @@ class Jadwal(models.Model):
     idJadwal = models.AutoField(primary_key=True)
     tanggalJadwal = models.DateField(null=False)
     idTim = models.ForeignKey(TimPengangkut, on_delete=models.CASCADE, null=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['tanggalJadwal', 'idTim']),
+        ]
     
     def __str__(self):
         return f"Jadwal {self.tanggalJadwal} - {self.idTim.namaTim}"
 
-class Pembayaran(models.Model):
+class Pembayaran(TrackedFieldsMixin, models.Model):
     STATUS_BAYAR_CHOICES = [
         ('pending', 'Pending'),
         ('lunas', 'Lunas'),
@@ -138,11 +268,19 @@ class Pembayaran(models.Model):
         null=True,
         verbose_name='Bukti Pembayaran'
     )
+
+    tracked_fields = ('statusBayar', 'buktiBayar')
+
+    class Meta:
+        indexes = [
+            # Report keuangan: rentang tanggal + status
+            models.Index(fields=['tanggalBayar', 'statusBayar']),
+        ]
     
     def __str__(self):
         return f"Pembayaran {self.idPembayaran} - {self.idAnggota.nama}"
 
-class DetailAnggotaJadwal(models.Model):
+class DetailAnggotaJadwal(TrackedFieldsMixin, models.Model):
     STATUS_PENGANGKUTAN_CHOICES = [
         ('terjadwal', 'Terjadwal'),
         ('dalam_proses', 'Dalam Proses'),
@@ -160,6 +298,8 @@ class DetailAnggotaJadwal(models.Model):
     )
     catatan = models.TextField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
+
+    tracked_fields = ('status_pengangkutan',)
     
     class Meta:
         constraints = [
@@ -168,6 +308,11 @@ class DetailAnggotaJadwal(models.Model):
                 name='unique_anggota_jadwal'
             )
         ]
+        indexes = [
+            models.Index(fields=['idJadwal', 'status_pengangkutan']),
+            # Daftar detail jadwal terbaru (admin / tim angkut)
+            models.Index(fields=['created_at']),
+        ]
     
     def __str__(self):
         return f"{self.idAnggota.nama} - {self.idJadwal}"
@@ -211,7 +356,7 @@ class DetailAnggotaJadwal(models.Model):
 #     def __str__(self):
 #         return f"{self.idAnggota.nama} - {self.idJadwal}"
 
-class LaporanSampah(models.Model):
+class LaporanSampah(TrackedFieldsMixin, models.Model):
     idLaporan = models.AutoField(primary_key=True)
     nama = models.CharField(max_length=100, null=False)
     tanggal_lapor = models.DateField(auto_now_add=True)
@@ -246,11 +391,20 @@ class LaporanSampah(models.Model):
         default='pending',
     )
 
+    tracked_fields = ('status', 'foto_bukti')
+
     def __str__(self):
         return f"Laporan {self.idLaporan} - {self.nama}"
 
     class Meta:
         db_table = 'laporan_sampah'
+        indexes = [
+            # Prefilter bounding box untuk pencarian radius (?near=)
+            models.Index(fields=['latitude', 'longitude']),
+            models.Index(fields=['tanggal_lapor', 'status']),
+            # ?status=pending diurutkan tanggal (antrian laporan)
+            models.Index(fields=['status', 'tanggal_lapor']),
+        ]
 
 
 class PushSubscription(models.Model):
@@ -330,6 +484,14 @@ class Notification(models.Model):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['user', 'read', 'created_at']),
+            # Notifikasi belum dibaca per user (badge & dropdown). Partial index
+            # karena filter read=False dirender sebagai `NOT read`, yang tidak
+            # bisa memakai kolom read di index komposit di atas.
+            models.Index(
+                fields=['user', '-created_at'],
+                condition=models.Q(read=False),
+                name='notification_unread_idx',
+            ),
         ]
     
     def __str__(self):
@@ -354,53 +516,61 @@ class Notification(models.Model):
         }
 
 
+
+class MediaBlob(models.Model):
+    """
+    File media yang disimpan berdasarkan hash isinya (apk.storage).
+    Satu file fisik bisa dipakai beberapa baris; ref_count mencatat jumlahnya.
+    Blob dengan ref_count 0 dihapus oleh command `cleanup_media`.
+    """
+    name = models.CharField(max_length=255, unique=True)
+    size = models.BigIntegerField(default=0)
+    ref_count = models.IntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'media_blob'
+        indexes = [
+            models.Index(fields=['ref_count', 'updated_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.ref_count} ref)"
+
+
+class ModelVersion(models.Model):
+    """
+    Version counter per model (apk/utils/conditional.py), naik setiap kali data
+    model berubah. Dipakai sebagai ETag endpoint list/detail & report.
+    """
+    model = models.CharField(max_length=100, primary_key=True)
+    version = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        db_table = 'model_version'
+
+    def __str__(self):
+        return f"{self.model} v{self.version}"
+
+
 @receiver(post_save, sender=Anggota)
 def update_detail_jadwal_on_status_change(sender, instance, created, **kwargs):
     """
-    Signal untuk handle perubahan status anggota
-    Tanpa circular import
+    Signal untuk handle perubahan status anggota.
+    Status lama diambil dari snapshot TrackedFieldsMixin,
+    jadi tidak ada query tambahan jika status tidak berubah.
     """
     if created:
         return  # Skip untuk instance baru
-    
-    try:
-        # Dapatkan instance sebelumnya
-        old_instance = Anggota.objects.get(pk=instance.pk)
-    except Anggota.DoesNotExist:
+
+    if not instance.has_changed('status'):
         return
-    
-    # Cek perubahan status
-    if old_instance.status != instance.status:
-        if instance.status == 'non-aktif':
-            # Non-aktifkan semua detail jadwal
-            detail_jadwals = DetailAnggotaJadwal.objects.filter(idAnggota=instance)
-            
-            # Update status menjadi 'dibatalkan'
-            detail_jadwals.update(status_pengangkutan='dibatalkan')
-            
-            # Update catatan untuk setiap detail
-            for detail in detail_jadwals:
-                detail.catatan = f"Status pengangkutan dibatalkan karena anggota non-aktif (ID: {instance.idAnggota})"
-                detail.save()
-                
-            print(f"✅ Semua jadwal untuk anggota {instance.nama} telah dinon-aktifkan")
-            
-        elif instance.status == 'aktif':
-            # Aktifkan kembali detail jadwal yang masih valid
-            detail_jadwals = DetailAnggotaJadwal.objects.filter(
-                idAnggota=instance,
-                status_pengangkutan='dibatalkan'
-            )
-            
-            # Aktifkan kembali jadwal yang masih di masa depan
-            today = timezone.now().date()
-            reactivated_count = 0
-            
-            for detail in detail_jadwals:
-                if detail.idJadwal.tanggalJadwal >= today:
-                    detail.status_pengangkutan = 'terjadwal'
-                    detail.catatan = f"Status pengangkutan diaktifkan kembali (ID Anggota: {instance.idAnggota})"
-                    detail.save()
-                    reactivated_count += 1
-            
-            print(f"✅ {reactivated_count} jadwal untuk anggota {instance.nama} telah diaktifkan kembali")
\ No newline at end of file
+
+    if instance.status == 'non-aktif':
+        jumlah = instance.batalkan_jadwal()
+        log.event(logging.INFO, "anggota.jadwal_dinonaktifkan", anggota_id=instance.pk, jumlah=jumlah)
+
+    elif instance.status == 'aktif':
+        reactivated_count = instance.aktifkan_kembali_jadwal()
+        log.event(logging.INFO, "anggota.jadwal_diaktifkan", anggota_id=instance.pk, jumlah=reactivated_count)
@@ -0,0 +1,25 @@
+# parsers.py
+"""
+Parser JSON DRF berbasis orjson (opsional, pasangan apk/renderers.py).
+
+Jika orjson tidak terpasang atau body bukan UTF-8, jatuh ke JSONParser
+bawaan DRF. NaN/Infinity ditolak (seperti STRICT_JSON bawaan).
+"""
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from .renderers import ORJSONRenderer, orjson
+
+
+class ORJSONParser(JSONParser):
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get('encoding', 'utf-8').lower().replace('_', '-')
+        if orjson is None or encoding not in ('utf-8', 'utf8'):
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f'JSON parse error - {exc}')
@@ -62,7 +62,7 @@ class CanUpdateAnggotaStatus(BasePermission):
             return True
         
         # Anggota hanya bisa update status mereka sendiri
-        if request.user.role == 'anggota' and obj.user == request.user:
+        if request.user.role == 'anggota' and obj.user_id == request.user.pk:
             # Anggota hanya bisa mengupdate status mereka ke 'aktif' jika bayar
             if 'status' in request.data:
                 return request.data['status'] == 'aktif'
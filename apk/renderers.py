@@ -0,0 +1,52 @@
+# renderers.py
+"""
+Renderer JSON DRF berbasis orjson (opsional, `pip install orjson`).
+
+Setara dengan JSONRenderer bawaan DRF (Decimal -> angka, datetime ISO 8601
+dengan 'Z' untuk UTC, tapi presisi mikrodetik); jika orjson tidak terpasang,
+jatuh ke JSONRenderer bawaan. date/datetime/UUID diserialisasi native oleh
+orjson. Dipasang global lewat REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'],
+pasangannya ORJSONParser (apk/parsers.py).
+"""
+import datetime
+import decimal
+
+from django.db.models.query import QuerySet
+from django.utils.functional import Promise
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def _default(obj):
+    """Tipe yang tidak ditangani orjson, disamakan dengan encoder DRF"""
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    if isinstance(obj, Promise):
+        return str(obj)
+    if isinstance(obj, datetime.timedelta):
+        return str(obj.total_seconds())
+    if isinstance(obj, (QuerySet, set, frozenset, tuple)):
+        return list(obj)
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    if hasattr(obj, '__iter__'):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class ORJSONRenderer(JSONRenderer):
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_default, option=option)
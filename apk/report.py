@@ -107,6 +107,7 @@ class LaporanSampahTableSerializer(serializers.Serializer):
     nama_pelapor = serializers.CharField()
     alamat = serializers.CharField()
     status = serializers.CharField()
+    foto_bukti = serializers.CharField(required=False, allow_blank=True, allow_null=True)
 
 
 class LaporanSampahReportSerializer(serializers.Serializer):
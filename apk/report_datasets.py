@@ -0,0 +1,1655 @@
+# report_datasets.py
+"""
+Dataset laporan admin: satu kelas Report per report_type (apk/report_engine.py).
+Dipakai oleh view report & ExportReportView.
+
+Data dibangun server sendiri, jadi tidak divalidasi ulang lewat
+Serializer(data=...).is_valid(); `serializer_class` hanya skema output
+(apk/report.py). Perbandingan waktu: manage.py benchmark_reports.
+"""
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+
+from django.contrib.auth import get_user_model
+from django.db.models import Count, F, Q, Sum
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from .models import Anggota, DetailAnggotaJadwal, Jadwal, LaporanSampah, Pembayaran
+from .report import (
+    KeuanganReportSerializer, AnggotaReportSerializer, LaporanSampahReportSerializer,
+    JadwalReportSerializer, UserStatReportSerializer, MonthlyReportSerializer,
+)
+from .report_engine import Report, register_report
+
+# Baris tabel report dibaca bertahap dengan .iterator(); di PostgreSQL
+# memakai server-side cursor sehingga hasil besar tidak dimuat sekaligus.
+REPORT_ITERATOR_CHUNK_SIZE = 2000
+
+
+@register_report
+class KeuanganReport(Report):
+    """Laporan pembayaran"""
+    name = 'keuangan'
+    title = 'LAPORAN KEUANGAN'
+    model = Pembayaran
+    date_field = 'tanggalBayar'
+    serializer_class = KeuanganReportSerializer
+
+    def summary(self, pembayaran_qs):
+        return {
+            "period": self.period,
+            "total_pendapatan": pembayaran_qs.filter(
+                statusBayar="lunas"
+            ).aggregate(total=Sum("jumlahBayar"))["total"] or 0,
+            "total_lunas": pembayaran_qs.filter(statusBayar="lunas").count(),
+            "total_pending": pembayaran_qs.filter(statusBayar="pending").count(),
+            "total_gagal": pembayaran_qs.filter(statusBayar="gagal").count(),
+            "metode_bayar_stats": {
+                row["metodeBayar"]: {
+                    "count": row["count"],
+                    "total": row["total"]
+                }
+                for row in pembayaran_qs.values("metodeBayar")
+                    .annotate(count=Count("idPembayaran"), total=Sum("jumlahBayar"))
+            },
+            "tanggal_generate": timezone.now()
+        }
+
+    def table(self, pembayaran_qs):
+        table_qs = pembayaran_qs.select_related("idAnggota").values(
+            "tanggalBayar",
+            "idAnggota__nama",
+            "jumlahBayar",
+            "metodeBayar",
+            "statusBayar"
+        ).order_by("-tanggalBayar")
+
+        return [
+            {
+                "tanggal_bayar": r["tanggalBayar"],
+                "nama_anggota": r["idAnggota__nama"],
+                "jumlah_bayar": r["jumlahBayar"],
+                "metode_bayar": r["metodeBayar"],
+                "status_bayar": r["statusBayar"],
+            }
+            for r in table_qs.iterator(chunk_size=REPORT_ITERATOR_CHUNK_SIZE)
+        ]
+
+
+@register_report
+class AnggotaReport(Report):
+    """Laporan anggota"""
+    name = 'anggota'
+    title = 'LAPORAN ANGGOTA'
+    model = Anggota
+    date_field = 'tanggalStart'
+    serializer_class = AnggotaReportSerializer
+
+    def summary(self, anggota_qs):
+        # Satu scan index (tanggalStart, status) untuk semua hitungan periode
+        counts = anggota_qs.aggregate(
+            total=Count('idAnggota'),
+            aktif=Count('idAnggota', filter=Q(status='aktif')),
+            non_aktif=Count('idAnggota', filter=Q(status='non-aktif')),
+        )
+
+        today = timezone.now().date()
+        akan_expired = Anggota.objects.filter(
+            status='aktif',
+            tanggalEnd__range=[today, today + timedelta(days=30)]
+        ).count()
+
+        jenis_sampah_stats = {
+            i['jenisSampah'] or 'Tidak diketahui': i['count']
+            for i in anggota_qs.values('jenisSampah')
+            .annotate(count=Count('idAnggota'))
+        }
+
+        return {
+            'period': self.period,
+            'total_anggota': counts['total'],
+            'aktif': counts['aktif'],
+            'non_aktif': counts['non_aktif'],
+            'akan_expired': akan_expired,
+            # Anggota dengan tanggalStart dalam periode = total_anggota
+            'baru_bulan_ini': counts['total'],
+            'jenis_sampah_stats': jenis_sampah_stats,
+            'tanggal_generate': timezone.now()
+        }
+
+    def table(self, anggota_qs):
+        return [
+            {
+                'nama_anggota': a.nama,
+                'status': a.status,
+                'jenis_sampah': a.jenisSampah or '-',
+                'tanggal_start': a.tanggalStart,
+                'tanggal_end': a.tanggalEnd
+            }
+            for a in anggota_qs.order_by('-tanggalStart').only(
+                'nama', 'status', 'jenisSampah', 'tanggalStart', 'tanggalEnd'
+            ).iterator(chunk_size=REPORT_ITERATOR_CHUNK_SIZE)
+        ]
+
+
+@register_report
+class LaporanSampahReport(Report):
+    """Laporan sampah"""
+    name = 'laporan-sampah'
+    title = 'LAPORAN SAMPAH'
+    model = LaporanSampah
+    date_field = 'tanggal_lapor'
+    serializer_class = LaporanSampahReportSerializer
+
+    def summary(self, laporan_qs):
+        return {
+            "period": self.period,
+            "total_laporan": laporan_qs.count(),
+            "pending": laporan_qs.filter(status="pending").count(),
+            "proses": laporan_qs.filter(status="proses").count(),
+            "selesai": laporan_qs.filter(status="selesai").count(),
+            "avg_response_time": None,  # TODO: Hitung jika ada data waktu respons
+            "tanggal_generate": timezone.now()
+        }
+
+    def table(self, laporan_qs):
+        table_qs = laporan_qs.values(
+            "tanggal_lapor",
+            "alamat",
+            "status",
+            "foto_bukti",
+            nama_pelapor=F("nama"),
+        ).order_by("-tanggal_lapor")
+
+        return list(table_qs.iterator(chunk_size=REPORT_ITERATOR_CHUNK_SIZE))
+
+
+@register_report
+class JadwalReport(Report):
+    """Laporan pengangkutan (group by tim angkut)"""
+    name = 'jadwal'
+    title = 'LAPORAN JADWAL'
+    model = Jadwal
+    date_field = 'tanggalJadwal'
+    serializer_class = JadwalReportSerializer
+
+    def detail_queryset(self):
+        return DetailAnggotaJadwal.objects.select_related(
+            "idJadwal", "idAnggota", "idJadwal__idTim"
+        ).filter(
+            idJadwal__tanggalJadwal__range=[self.start_date, self.end_date]
+        )
+
+    def summary(self, jadwal_qs):
+        detail_qs = self.detail_queryset()
+        return {
+            "period": self.period,
+            "total_jadwal": jadwal_qs.count(),
+            "total_tim": jadwal_qs.values("idTim").distinct().count(),
+            "total_anggota_terjadwal": detail_qs.count(),
+            "status_stats": {
+                row["status_pengangkutan"]: row["count"]
+                for row in detail_qs.values("status_pengangkutan")
+                    .annotate(count=Count("id"))
+            },
+            "tanggal_generate": timezone.now()
+        }
+
+    def table(self, jadwal_qs):
+        data_by_tim = defaultdict(lambda: {
+            "total_jadwal": set(),
+            "total_anggota": 0,
+            "status_stats": defaultdict(int),
+            "detail": []
+        })
+
+        for d in self.detail_queryset().iterator(chunk_size=REPORT_ITERATOR_CHUNK_SIZE):
+            tim = d.idJadwal.idTim.namaTim
+
+            data_by_tim[tim]["total_jadwal"].add(d.idJadwal_id)
+            data_by_tim[tim]["total_anggota"] += 1
+            data_by_tim[tim]["status_stats"][d.status_pengangkutan] += 1
+
+            data_by_tim[tim]["detail"].append({
+                "tanggal_jadwal": d.idJadwal.tanggalJadwal,
+                "nama_anggota": d.idAnggota.nama,
+                "status_pengangkutan": d.status_pengangkutan
+            })
+
+        return [
+            {
+                "nama_tim": tim,
+                "total_jadwal": len(v["total_jadwal"]),
+                "total_anggota": v["total_anggota"],
+                "status_stats": dict(v["status_stats"]),
+                "detail": v["detail"]
+            }
+            for tim, v in data_by_tim.items()
+        ]
+
+
+@register_report
+class UserStatReport(Report):
+    """Statistik user (summary + table sortable lewat `ordering`)"""
+    name = 'user-stats'
+    title = 'STATISTIK PENGGUNA'
+    serializer_class = UserStatReportSerializer
+
+    def queryset(self):
+        return get_user_model().objects.all()
+
+    def summary(self, users):
+        today = timezone.now().date()
+        counts = users.aggregate(
+            total_users=Count('id'),
+            admin_count=Count('id', filter=Q(role='admin')),
+            anggota_count=Count('id', filter=Q(role='anggota')),
+            tamu_count=Count('id', filter=Q(role='tamu')),
+            tim_angkut_count=Count('id', filter=Q(role='tim_angkut')),
+            active_users=Count('id', filter=Q(is_active=True)),
+            new_users_month=Count('id', filter=Q(date_joined__date__gte=today.replace(day=1))),
+        )
+        return {**counts, "tanggal_generate": timezone.now()}
+
+    def table(self, users):
+        ordering = self.params.get("ordering") or "-date_joined"
+        table_qs = users.values(
+            "username",
+            "email",
+            "role",
+            "is_active",
+            "date_joined"
+        ).order_by(ordering)
+
+        return list(table_qs.iterator(chunk_size=REPORT_ITERATOR_CHUNK_SIZE))
+
+
+@register_report
+class MonthlyReport(Report):
+    """Laporan bulanan (parameter month & year)"""
+    name = 'monthly'
+    title = 'LAPORAN BULANAN'
+    serializer_class = MonthlyReportSerializer
+
+    MONTH_NAMES = [
+        'Januari', 'Februari', 'Maret', 'April', 'Mei', 'Juni',
+        'Juli', 'Agustus', 'September', 'Oktober', 'November', 'Desember'
+    ]
+
+    def month_range(self):
+        month = self.params.get('month')
+        year = self.params.get('year')
+
+        if not month or not year:
+            raise ValidationError({'error': 'month dan year diperlukan'})
+
+        try:
+            month = int(month)
+            year = int(year)
+        except ValueError:
+            raise ValidationError({'error': 'Month dan year harus angka'})
+
+        if month < 1 or month > 12:
+            raise ValidationError({'error': 'Month harus antara 1-12'})
+
+        if year < 2000 or year > 2100:
+            raise ValidationError({'error': 'Year tidak valid'})
+
+        # Hitung range tanggal untuk bulan tersebut
+        start_date = datetime(year, month, 1).date()
+        if month == 12:
+            end_date = datetime(year + 1, 1, 1).date() - timedelta(days=1)
+        else:
+            end_date = datetime(year, month + 1, 1).date() - timedelta(days=1)
+        return month, year, start_date, end_date
+
+    def build(self):
+        month, year, start_date, end_date = self.month_range()
+
+        keuangan_data = self.get_keuangan_data(start_date, end_date)
+        anggota_data = self.get_anggota_data(start_date, end_date)
+        jadwal_data = self.get_jadwal_data(start_date, end_date)
+        laporan_data = self.get_laporan_data(start_date, end_date)
+
+        # Hitung success rate (simplified)
+        total_services = jadwal_data['total_anggota_terjadwal']
+        completed_services = jadwal_data['selesai']
+        success_rate = (completed_services / total_services * 100) if total_services > 0 else 0
+
+        # Hitung resolution rate
+        total_reports = laporan_data['total_laporan']
+        completed_reports = laporan_data['selesai']
+        resolution_rate = (completed_reports / total_reports * 100) if total_reports > 0 else 0
+
+        report_data = {
+            'bulan': f"{self.MONTH_NAMES[month-1]} {year}",
+            'tahun': year,
+            'total_pendapatan': float(keuangan_data['total_pendapatan']),
+            'total_transaksi': keuangan_data['total_lunas'],
+            'total_anggota': anggota_data['total_anggota'],
+            'anggota_baru': anggota_data['baru_bulan_ini'],
+            'anggota_expired': anggota_data['akan_expired'],
+            'total_jadwal': jadwal_data['total_jadwal'],
+            'anggota_dilayani': jadwal_data['total_anggota_terjadwal'],
+            'success_rate': round(success_rate, 2),
+            'total_laporan': laporan_data['total_laporan'],
+            'resolution_rate': round(resolution_rate, 2),
+            'summary': {
+                'pendapatan_per_anggota': round(
+                    float(keuangan_data['total_pendapatan']) /
+                    max(anggota_data['aktif'], 1),
+                    2
+                ),
+                'laporan_per_user': round(
+                    laporan_data['total_laporan'] /
+                    max(get_user_model().objects.count(), 1),
+                    2
+                ),
+                'efficiency_rate': round(
+                    (success_rate + resolution_rate) / 2,
+                    2
+                ) if total_reports > 0 else 0
+            },
+            'tanggal_generate': timezone.now()
+        }
+
+        return report_data
+
+    def get_keuangan_data(self, start_date, end_date):
+        """Pendapatan & transaksi lunas dalam periode (satu query)"""
+        aggregation = Pembayaran.objects.filter(
+            tanggalBayar__range=[start_date, end_date], statusBayar='lunas'
+        ).aggregate(total_pendapatan=Sum('jumlahBayar'), total_lunas=Count('idPembayaran'))
+
+        return {
+            'total_pendapatan': aggregation['total_pendapatan'] or 0,
+            'total_lunas': aggregation['total_lunas'],
+        }
+
+    def get_anggota_data(self, start_date, end_date):
+        """Jumlah anggota, aktif, baru & akan expired (satu query)"""
+        today = timezone.now().date()
+        return Anggota.objects.aggregate(
+            total_anggota=Count('idAnggota'),
+            aktif=Count('idAnggota', filter=Q(status='aktif')),
+            baru_bulan_ini=Count('idAnggota', filter=Q(tanggalStart__range=[start_date, end_date])),
+            akan_expired=Count('idAnggota', filter=Q(
+                status='aktif', tanggalEnd__range=[today, today + timedelta(days=30)]
+            )),
+        )
+
+    def get_jadwal_data(self, start_date, end_date):
+        """Jumlah jadwal, anggota terjadwal & pengangkutan selesai"""
+        detail = DetailAnggotaJadwal.objects.filter(
+            idJadwal__tanggalJadwal__range=[start_date, end_date]
+        ).aggregate(
+            total_anggota_terjadwal=Count('id'),
+            selesai=Count('id', filter=Q(status_pengangkutan='selesai')),
+        )
+        return {
+            'total_jadwal': Jadwal.objects.filter(tanggalJadwal__range=[start_date, end_date]).count(),
+            **detail,
+        }
+
+    def get_laporan_data(self, start_date, end_date):
+        """Jumlah laporan & yang selesai (satu query)"""
+        return LaporanSampah.objects.filter(
+            tanggal_lapor__range=[start_date, end_date]
+        ).aggregate(
+            total_laporan=Count('idLaporan'),
+            selesai=Count('idLaporan', filter=Q(status='selesai')),
+        )
+
+
+@register_report
+class DampakLingkunganReport(Report):
+    """Laporan dampak lingkungan dari laporan sampah"""
+    name = 'dampak-lingkungan'
+    title = 'LAPORAN DAMPAK LINGKUNGAN'
+    model = LaporanSampah
+    date_field = 'tanggal_lapor'
+
+    def build(self):
+        start_date, end_date = self.date_range()
+
+        laporan_qs = LaporanSampah.objects.filter(
+            tanggal_lapor__range=[start_date, end_date]
+        )
+
+        # Analisis dasar
+        total_laporan = laporan_qs.count()
+        laporan_selesai = laporan_qs.filter(status='selesai').count()
+
+        # Klasifikasi jenis sampah berdasarkan data asli
+        klasifikasi_sampah = self.klasifikasi_jenis_sampah_berdasarkan_data(
+            laporan_qs)
+
+        # Analisis wilayah administrasi (kelurahan/desa/kecamatan)
+        analisis_wilayah = self.analisis_wilayah_administrasi(laporan_qs)
+
+        # 🆕 Analisis dampak lingkungan berdasarkan JENIS SAMPAH
+        dampak_lingkungan = self.analisis_dampak_lingkungan(
+            laporan_qs, klasifikasi_sampah)
+
+        # Tren waktu
+        tren_waktu = self.analisis_tren_waktu(
+            laporan_qs, start_date, end_date)
+
+        # Efektivitas penanganan
+        efektivitas = self.hitung_efektivitas_penanganan(laporan_qs)
+
+        # Ranking wilayah terbersih & terkotor
+        ranking_wilayah = self.ranking_wilayah_bersih_kotor(
+            analisis_wilayah)
+
+        return {
+            'period': self.format_period(start_date, end_date),
+            'total_laporan': total_laporan,
+            'laporan_selesai': laporan_selesai,
+            'tingkat_penyelesaian': (
+                (laporan_selesai / total_laporan *
+                 100) if total_laporan > 0 else 0
+            ),
+            'klasifikasi_sampah': klasifikasi_sampah,
+            'analisis_wilayah': analisis_wilayah,
+            'dampak_lingkungan': dampak_lingkungan,  # 🆕 Fitur baru
+            'ranking_wilayah': ranking_wilayah,
+            'tren_waktu': tren_waktu,
+            'efektivitas_penanganan': efektivitas,
+            'rekomendasi': self.generate_rekomendasi(
+                klasifikasi_sampah, analisis_wilayah, ranking_wilayah, efektivitas, dampak_lingkungan
+            ),
+            'tanggal_generate': timezone.now()
+        }
+
+    def klasifikasi_jenis_sampah_berdasarkan_data(self, queryset):
+        """
+        Klasifikasi jenis sampah berdasarkan data asli dari database
+        """
+        counter = Counter()
+        
+        for laporan in queryset:
+            # Cek berbagai kemungkinan field untuk jenis sampah
+            jenis = self.identifikasi_jenis_sampah(laporan)
+            counter[jenis] += 1
+        
+        total = sum(counter.values()) or 1
+        
+        hasil = []
+        for jenis, jumlah in counter.items():
+            hasil.append({
+                'jenis': jenis,
+                'jumlah': jumlah,
+                'persentase': round((jumlah / total) * 100, 1),
+                'data_valid': jumlah
+            })
+        
+        return {
+            'detail_klasifikasi': hasil,
+            'total_data_terstruktur': total,
+            'persentase_data_terstruktur': 100
+        }
+
+    def identifikasi_jenis_sampah(self, laporan):
+        """
+        Identifikasi jenis sampah dari laporan
+        """
+        # Cek jika ada field 'jenis' langsung di model LaporanSampah
+        if hasattr(laporan, 'jenis') and laporan.jenis:
+            return laporan.jenis.lower()
+        
+        # Fallback ke deteksi dari deskripsi
+        deskripsi = (laporan.deskripsi or "").lower()
+        return self.deteksi_jenis_sampah_dari_deskripsi(deskripsi)
+
+    def analisis_dampak_lingkungan(self, queryset, klasifikasi_sampah):
+        """
+        Analisis dampak lingkungan berdasarkan JENIS SAMPAH yang berbahaya
+        """
+        dampak_data = {
+            'total_analisis': queryset.count(),
+            'jenis_berbahaya': {},
+            'peringatan': [],
+            'analisis_detail': []
+        }
+        
+        # Ambil data klasifikasi detail
+        detail_klasifikasi = klasifikasi_sampah.get('detail_klasifikasi', [])
+        
+        # Analisis dampak per jenis sampah
+        for item in detail_klasifikasi:
+            jenis = item.get('jenis', '')
+            jumlah = item.get('jumlah', 0)
+            persentase = item.get('persentase', 0)
+            
+            # Analisis dampak lingkungan berdasarkan jenis sampah
+            dampak_info = self.analisis_dampak_per_jenis(jenis, jumlah, persentase, queryset.count())
+            
+            if dampak_info:
+                dampak_data['analisis_detail'].append(dampak_info)
+                
+                # Jika ada peringatan, tambahkan ke list peringatan
+                if dampak_info.get('peringatan_level'):
+                    dampak_data['peringatan'].append({
+                        'level': dampak_info['peringatan_level'],
+                        'jenis': jenis,
+                        'jumlah': jumlah,
+                        'persentase': persentase,
+                        'dampak': dampak_info['dampak_potensial'],
+                        'rekomendasi': dampak_info['rekomendasi']
+                    })
+                
+                # Simpan jenis berbahaya
+                if dampak_info.get('tingkat_bahaya') in ['sangat_tinggi', 'tinggi', 'sedang']:
+                    dampak_data['jenis_berbahaya'][jenis] = {
+                        'jumlah': jumlah,
+                        'persentase': persentase,
+                        'tingkat_bahaya': dampak_info['tingkat_bahaya'],
+                        'dampak': dampak_info['dampak_potensial']
+                    }
+        
+        # Analisis lokasi dengan sampah berbahaya
+        lokasi_berbahaya = self.analisis_lokasi_berbahaya(queryset)
+        if lokasi_berbahaya:
+            dampak_data['lokasi_berbahaya'] = lokasi_berbahaya
+        
+        # Analisis waktu penanganan sampah berbahaya
+        waktu_penanganan = self.analisis_waktu_penanganan_berbahaya(queryset)
+        if waktu_penanganan:
+            dampak_data['waktu_penanganan_berbahaya'] = waktu_penanganan
+        
+        # Ringkasan
+        dampak_data['ringkasan'] = {
+            'total_jenis_berbahaya': len(dampak_data['jenis_berbahaya']),
+            'total_peringatan': len(dampak_data['peringatan']),
+            'tingkat_risiko': self.hitung_tingkat_risiko(dampak_data)
+        }
+        
+        return dampak_data
+
+    def analisis_dampak_per_jenis(self, jenis, jumlah, persentase, total_laporan):
+        """
+        Analisis dampak lingkungan per jenis sampah
+        """
+        # Map untuk jenis sampah yang umum
+        dampak_map = {
+            'b3': {
+                'tingkat_bahaya': 'sangat_tinggi',
+                'dampak_potensial': [
+                    'Pencemaran tanah dan air',
+                    'Bahaya kesehatan bagi warga',
+                    'Kebakaran atau ledakan',
+                    'Racun bagi ekosistem'
+                ],
+                'rekomendasi': 'Penanganan khusus oleh tim berwenang, pemisahan limbah, edukasi masyarakat',
+                'ambang_peringatan': 1  # 1 laporan sudah perlu peringatan
+            },
+            'plastik': {
+                'tingkat_bahaya': 'sedang',
+                'dampak_potensial': [
+                    'Pencemaran tanah jangka panjang',
+                    'Menyumbat saluran air',
+                    'Bahaya bagi hewan',
+                    'Mikroplastik di lingkungan'
+                ],
+                'rekomendasi': 'Program daur ulang, pengurangan penggunaan plastik, bank sampah',
+                'ambang_peringatan': 30  # >30% dari total laporan
+            },
+            'organik': {
+                'tingkat_bahaya': 'rendah',
+                'dampak_potensial': [
+                    'Bau tidak sedap',
+                    'Menyebabkan penyakit',
+                    'Mengundang hama',
+                    'Pencemaran udara'
+                ],
+                'rekomendasi': 'Pengomposan, pengangkutan rutin, TPS terpadu',
+                'ambang_peringatan': 40  # >40% dari total laporan
+            },
+            'logam': {
+                'tingkat_bahaya': 'sedang',
+                'dampak_potensial': [
+                    'Luka fisik',
+                    'Karat mencemari tanah',
+                    'Bahaya bagi anak-anak'
+                ],
+                'rekomendasi': 'Daur ulang, pengumpulan terpisah',
+                'ambang_peringatan': 20  # >20% dari total laporan
+            },
+            'kaca': {
+                'tingkat_bahaya': 'sedang',
+                'dampak_potensial': [
+                    'Luka fisik',
+                    'Bahaya bagi hewan',
+                    'Sulit terurai'
+                ],
+                'rekomendasi': 'Pengumpulan terpisah, daur ulang',
+                'ambang_peringatan': 15  # >15% dari total laporan
+            },
+            'campuran': {
+                'tingkat_bahaya': 'rendah',
+                'dampak_potensial': [
+                    'Kesulitan daur ulang',
+                    'Peningkatan volume TPA',
+                    'Potensi pencemaran campuran'
+                ],
+                'rekomendasi': 'Program pemilahan sampah, edukasi masyarakat',
+                'ambang_peringatan': 50  # >50% dari total laporan
+            },
+            'kertas': {
+                'tingkat_bahaya': 'rendah',
+                'dampak_potensial': [
+                    'Mudah terbakar',
+                    'Menyumbat saluran air',
+                    'Rawan penyakit saat basah'
+                ],
+                'rekomendasi': 'Daur ulang, bank sampah',
+                'ambang_peringatan': 25  # >25% dari total laporan
+            }
+        }
+        
+        # Jika jenis tidak dikenali, gunakan default
+        if jenis not in dampak_map:
+            # Default untuk jenis tidak dikenal
+            info = {
+                'tingkat_bahaya': 'rendah',
+                'dampak_potensial': ['Dampak lingkungan perlu investigasi lebih lanjut'],
+                'rekomendasi': 'Identifikasi jenis sampah yang lebih spesifik',
+                'ambang_peringatan': 50
+            }
+        else:
+            info = dampak_map[jenis]
+        
+        # Tentukan level peringatan
+        peringatan_level = None
+        if jenis == 'b3' and jumlah > 0:
+            peringatan_level = 'sangat_tinggi'
+        elif persentase > info['ambang_peringatan']:
+            if info['tingkat_bahaya'] == 'sangat_tinggi':
+                peringatan_level = 'sangat_tinggi'
+            elif info['tingkat_bahaya'] == 'tinggi':
+                peringatan_level = 'tinggi'
+            elif info['tingkat_bahaya'] == 'sedang':
+                peringatan_level = 'sedang'
+            elif info['tingkat_bahaya'] == 'rendah' and persentase > 50:
+                peringatan_level = 'rendah'
+        
+        return {
+            'jenis': jenis,
+            'jumlah': jumlah,
+            'persentase': persentase,
+            'tingkat_bahaya': info['tingkat_bahaya'],
+            'dampak_potensial': info['dampak_potensial'],
+            'rekomendasi': info['rekomendasi'],
+            'ambang_peringatan': info['ambang_peringatan'],
+            'peringatan_level': peringatan_level,
+            'status': 'aman' if not peringatan_level else 'perhatian'
+        }
+
+    def analisis_lokasi_berbahaya(self, queryset):
+        """
+        Analisis lokasi dengan konsentrasi sampah berbahaya tinggi
+        """
+        lokasi_berbahaya = []
+        
+        # Kelompokkan per wilayah berdasarkan koordinat (grid)
+        from collections import defaultdict
+        lokasi_counter = defaultdict(lambda: {
+            'b3': 0,
+            'plastik': 0,
+            'logam': 0,
+            'kaca': 0,
+            'total': 0,
+            'alamat_samples': [],
+            'koordinat': None
+        })
+        
+        for laporan in queryset:
+            jenis = self.identifikasi_jenis_sampah(laporan)
+            
+            if jenis in ['b3', 'plastik', 'logam', 'kaca']:
+                try:
+                    lat = round(float(laporan.latitude), 3) if laporan.latitude else None
+                    lon = round(float(laporan.longitude), 3) if laporan.longitude else None
+                    
+                    if lat and lon:
+                        # Buat key berdasarkan grid koordinat (presisi 3 desimal ≈ 111m)
+                        grid_key = f"{lat:.3f},{lon:.3f}"
+                        
+                        lokasi_counter[grid_key][jenis] += 1
+                        lokasi_counter[grid_key]['total'] += 1
+                        
+                        # Simpan alamat sample
+                        if len(lokasi_counter[grid_key]['alamat_samples']) < 3:
+                            lokasi_counter[grid_key]['alamat_samples'].append(laporan.alamat[:50] if laporan.alamat else "Alamat tidak tersedia")
+                        
+                        # Simpan koordinat
+                        if not lokasi_counter[grid_key]['koordinat']:
+                            lokasi_counter[grid_key]['koordinat'] = {
+                                'lat': lat,
+                                'lon': lon
+                            }
+                except (ValueError, TypeError):
+                    continue
+        
+        # Filter lokasi dengan sampah berbahaya signifikan
+        for grid_key, data in lokasi_counter.items():
+            if data['b3'] > 0 or data['plastik'] > 5 or data['total'] > 10:
+                lokasi_berbahaya.append({
+                    'lokasi': f"Koordinat: {data['koordinat']['lat']:.4f}, {data['koordinat']['lon']:.4f}" if data['koordinat'] else 'Lokasi tidak diketahui',
+                    'b3': data['b3'],
+                    'plastik': data['plastik'],
+                    'logam': data['logam'],
+                    'kaca': data['kaca'],
+                    'total_berbahaya': data['total'],
+                    'alamat_samples': data['alamat_samples'],
+                    'koordinat': data['koordinat'],
+                    'tingkat_risiko': 'tinggi' if data['b3'] > 0 else 'sedang'
+                })
+        
+        # Urutkan berdasarkan tingkat risiko
+        lokasi_berbahaya.sort(key=lambda x: (1 if x['tingkat_risiko'] == 'tinggi' else 0, x['total_berbahaya']), reverse=True)
+        
+        return lokasi_berbahaya[:10]
+
+    def analisis_waktu_penanganan_berbahaya(self, queryset):
+        """
+        Analisis waktu penanganan sampah berbahaya
+        """
+        # Cek jika ada field tanggal_selesai
+        if not hasattr(queryset.first(), 'tanggal_selesai'):
+            return None
+        
+        laporan_berbahaya = []
+        for laporan in queryset:
+            jenis = self.identifikasi_jenis_sampah(laporan)
+            if jenis in ['b3', 'plastik', 'logam', 'kaca']:
+                if hasattr(laporan, 'tanggal_selesai') and laporan.tanggal_selesai and laporan.tanggal_lapor:
+                    try:
+                        waktu_penanganan = (laporan.tanggal_selesai - laporan.tanggal_lapor).days
+                        laporan_berbahaya.append({
+                            'jenis': jenis,
+                            'waktu_hari': waktu_penanganan,
+                            'status': laporan.status
+                        })
+                    except (TypeError, AttributeError):
+                        continue
+        
+        if not laporan_berbahaya:
+            return None
+        
+        # Hitung statistik
+        total = len(laporan_berbahaya)
+        selesai = sum(1 for x in laporan_berbahaya if x['status'] == 'selesai')
+        if selesai > 0:
+            rata_waktu = sum(x['waktu_hari'] for x in laporan_berbahaya if x['status'] == 'selesai') / selesai
+        else:
+            rata_waktu = 0
+        
+        return {
+            'total_laporan_berbahaya': total,
+            'selesai': selesai,
+            'pending': total - selesai,
+            'rata_waktu_penanganan_hari': round(rata_waktu, 1),
+            'tingkat_penanganan': round((selesai / total) * 100, 1) if total > 0 else 0
+        }
+
+    def hitung_tingkat_risiko(self, dampak_data):
+        """
+        Hitung tingkat risiko keseluruhan
+        """
+        peringatan_sangat_tinggi = sum(1 for p in dampak_data.get('peringatan', []) if p['level'] == 'sangat_tinggi')
+        peringatan_tinggi = sum(1 for p in dampak_data.get('peringatan', []) if p['level'] == 'tinggi')
+        peringatan_sedang = sum(1 for p in dampak_data.get('peringatan', []) if p['level'] == 'sedang')
+        
+        if peringatan_sangat_tinggi > 0:
+            return 'sangat_tinggi'
+        elif peringatan_tinggi > 0:
+            return 'tinggi'
+        elif peringatan_sedang > 2:
+            return 'sedang'
+        elif dampak_data.get('jenis_berbahaya'):
+            return 'rendah'
+        else:
+            return 'aman'
+        
+    def deteksi_jenis_sampah_dari_deskripsi(self, deskripsi):
+        """Deteksi cepat jenis sampah dari deskripsi pendek"""
+        keywords = {
+            # ==================== B3 (BAHAN BERBAHAYA & BERACUN) ====================
+            'b3': [
+                # B3 Umum
+                'b3', 'berbahaya', 'beracun', 'toxic', 'hazardous', 'limbah b3',
+                'bahan berbahaya', 'bahan beracun', 'limbah berbahaya', 
+                'limbah beracun', 'zat berbahaya', 'zat beracun',
+                
+                # B3 Medis/Kesehatan
+                'jarum suntik', 'suntik', 'infus bekas', 'medis', 'kesehatan',
+                'perban bekas', 'alat medis', 'sarana kesehatan', 'klinik',
+                'rumah sakit', 'laboratorium', 'spuit', 'needle', 'syringe',
+                'iv set', 'kateter', 'sarung tangan medis', 'masker medis',
+                'pembalut medis', 'plester medis', 'alkohol medis', 'betadine',
+                'obat suntik', 'vaksin', 'sampah medis', 'limbah medis',
+                'limbah infeksius', 'limbah patologi', 'limbah farmasi',
+                
+                # B3 Elektronik/E-Waste
+                'elektronik', 'e-waste', 'lampu neon', 'lampu hemat energi',
+                'lampu led rusak', 'lampu tl', 'lampu fluorescent',
+                'komputer rusak', 'laptop rusak', 'tv rusak', 'kulkas rusak',
+                'ac rusak', 'ponsel rusak', 'hp rusak', 'tablet rusak',
+                'baterai', 'aki', 'accu', 'accumulator', 'baterai mobil',
+                'baterai motor', 'baterai lithium', 'baterai isi ulang',
+                'crt', 'monitor rusak', 'pc rusak', 'printer rusak',
+                'scanner rusak', 'kabel listrik', 'transformator', 'trafo',
+                'power supply', 'charger rusak', 'adaptor rusak',
+                'microwave rusak', 'oven rusak', 'blender rusak',
+                
+                # B3 Oli & Pelumas
+                'oli bekas', 'pelumas', 'minyak mesin', 'gemuk', 'lumas',
+                'oli motor', 'oli mobil', 'oli industri', 'oli hydraulic',
+                'oli transmisi', 'oli gardan', 'oli rem', 'oli sampah',
+                'minyak bekas', 'gemuk bekas', 'grease', 'oli sintetis',
+                
+                # B3 Cat & Pelarut
+                'cat bekas', 'thinner', 'vernis', 'pelarut', 'solvent',
+                'aerosol', 'semprot', 'spray can', 'kaleng cat', 'kaleng semprot',
+                'cat minyak', 'cat tembok', 'cat kayu', 'cat besi',
+                'lak', 'pengencer', 'pembersih cat', 'penghapus cat',
+                'acetone', 'tiner', 'spiritus', 'alkohol teknis',
+                
+                # B3 Logam Berat
+                'merkuri', 'timbal', 'kadmium', 'logam berat', 'air raksa',
+                'raksa', 'arsen', 'kromium', 'nikel', 'seng', 'tembaga beracun',
+                'aluminium beracun', 'besi beracun', 'solder timah',
+                'timah hitam', 'timah putih', 'sianida', 'sianida',
+                
+                # B3 Gas & Tabung
+                'tabung gas', 'aerosol', 'freon', 'refrigerant', 'kaleng semprot',
+                'gas', 'elpiji bekas', 'tabung elpiji', 'tabung oksigen',
+                'tabung nitrogen', 'tabung co2', 'tabung las', 'tabung ac',
+                'korek gas', 'lighters', 'pemantik', 'butane', 'propane',
+                
+                # B3 Asbes & Konstruksi
+                'asbes', 'atap asbes', 'serat asbes', 'asbestos', 'gypsum',
+                'bahan bangunan berbahaya', 'cat timbal', 'cat mengandung timbal',
+                
+                # B3 Farmasi
+                'obat kadaluarsa', 'obat rusak', 'farmasi', 'obat bekas',
+                'vaksin kadaluarsa', 'antibiotik kadaluarsa', 'sirup kadaluarsa',
+                'tablet kadaluarsa', 'kapsul kadaluarsa', 'obat cair kadaluarsa',
+                'suplemen kadaluarsa', 'vitamin kadaluarsa', 'obat resep',
+                'obat keras', 'psikotropika', 'narkotika', 'obat terlarang',
+                
+                # B3 Pertanian
+                'pestisida', 'herbisida', 'insektisida', 'fungisida',
+                'racun tikus', 'racun serangga', 'urea kadaluarsa', 'pupuk kadaluarsa',
+                'pupuk kimia', 'zat perangsang', 'hormon tanaman', 'antibiotik hewan',
+                'vaksin hewan', 'obat hewan kadaluarsa', 'desinfektan',
+                
+                # B3 Industri
+                'limbah pabrik', 'limbah industri', 'slag', 'abu industri',
+                'sludge', 'limbah cair berbahaya', 'limbah padat berbahaya',
+                'limbah gas berbahaya', 'cairan kimia', 'bahan kimia industri',
+                'acid', 'asam', 'basa', 'alkali', 'detergen industri',
+                'pemutih industri', 'pelarut industri', 'catalyst',
+                'resin', 'polimer berbahaya', 'plastik pvc',
+                
+                # B3 Rumah Tangga
+                'pembalut wanita', 'pembalut bekas', 'popok bekas', 'diapers',
+                'tissue bekas darah', 'tissue medis', 'kapas medis',
+                'pembersih lantai', 'pembersih toilet', 'pemutih pakaian',
+                'pengharum ruangan', 'insektisida rumah', 'anti nyamuk',
+                'obat nyamuk', 'repellent', 'racun kecoa', 'racun semut',
+            ],
+            
+            # ==================== PLASTIK ====================
+            'plastik': [
+                # Plastik Umum
+                'plastik', 'botol plastik', 'gelas plastik', 'kresek', 'kantong plastik',
+                'kemasan plastik', 'bungkus plastik', 'plastik kemasan',
+                'plastik pembungkus', 'plastik belanja', 'tas plastik',
+                'plastik tipis', 'plastik tebal', 'plastik transparan',
+                'plastik berwarna', 'plastik bening', 'plastik putih',
+                
+                # Jenis Plastik Spesifik
+                'pet', 'hdpe', 'pvc', 'ldpe', 'pp', 'ps', 'other',
+                'polyethylene', 'polypropylene', 'polystyrene', 'polyvinyl',
+                'nylon', 'polyester', 'acrylic', 'polycarbonate',
+                
+                # Botol & Wadah Plastik
+                'botol air mineral', 'botol minuman', 'botol soda',
+                'botol jus', 'botol sirup', 'botol kecap', 'botol saus',
+                'botol sampo', 'botol sabun', 'botol deterjen',
+                'botol minyak', 'botol obat', 'botol vitamin',
+                'galon', 'jerigen', 'drum plastik', 'ember plastik',
+                'bak plastik', 'wadah plastik', 'kontainer plastik',
+                'tupperware', 'tempat makan plastik', 'kotak plastik',
+                
+                # Kemasan Makanan Plastik
+                'styrofoam', 'gabus plastik', 'bungkus makanan',
+                'plastik wrap', 'cling wrap', 'plastik pembungkus makanan',
+                'kemasan snack', 'bungkus permen', 'bungkus coklat',
+                'bungkus mi instan', 'bungkus kopi', 'bungkus teh',
+                'sachet', 'bungkus kecil', 'pouch',
+                
+                # Peralatan Plastik
+                'sedotan', 'straw', 'sendok plastik', 'garpu plastik',
+                'pisau plastik', 'piring plastik', 'mangkuk plastik',
+                'gelas plastik', 'cup plastik', 'tutup plastik',
+                'stirrer', 'pengaduk plastik', 'tusuk gigi plastik',
+                'sumpit plastik', 'tutup gelas', 'tutup botol plastik',
+                
+                # Plastik Konstruksi & Rumah Tangga
+                'pipa plastik', 'paralon', 'talang plastik', 'pipa pvc',
+                'pipa hdpe', 'plastik cor', 'terpal plastik', 'plastik mulsa',
+                'plastik tanaman', 'pot plastik', 'polybag',
+                'plastik sampah', 'kantong sampah', 'trash bag',
+                'plastik hitam', 'plastik biru', 'plastik merah',
+                
+                # Mainan & Perlengkapan Plastik
+                'mainan plastik', 'boneka plastik', 'lego', 'blok plastik',
+                'ember mainan', 'bak mandi plastik', 'kursi plastik',
+                'meja plastik', 'rak plastik', 'lemari plastik',
+                'box plastik', 'container plastik', 'organizer plastik',
+            ],
+            
+            # ==================== ORGANIK ====================
+            'organik': [
+                # Sisa Makanan
+                'sisa makanan', 'makanan basi', 'makanan kadaluarsa',
+                'nasi basi', 'nasi sisa', 'roti basi', 'kue basi',
+                'sayur basi', 'buah busuk', 'daging busuk', 'ikan busuk',
+                'ayam busuk', 'telur busuk', 'susu basi', 'keju busuk',
+                'makanan berjamur', 'makanan fermentasi', 'makanan terbuang',
+                
+                # Buah & Sayuran
+                'buah', 'sayur', 'daun', 'tumbuhan', 'tanaman',
+                'kulit buah', 'kulit sayur', 'biji buah', 'biji sayur',
+                'batang', 'ranting', 'dahan', 'ranting pohon',
+                'daun kering', 'daun basah', 'daun gugur',
+                'pepaya', 'pisang', 'apel', 'jeruk', 'mangga',
+                'semangka', 'melon', 'anggur', 'strawberry',
+                'bayam', 'kangkung', 'sawi', 'wortel', 'kentang',
+                'tomat', 'cabe', 'bawang', 'jahe', 'kunyit',
+                
+                # Dedaunan & Tanaman
+                'rumput', 'rumput potong', 'rumput liar',
+                'ranting kecil', 'ranting besar', 'dahan pohon',
+                'bambu', 'daun bambu', 'batang pisang', 'pelepah',
+                'batang jagung', 'batang singkong', 'batang ubi',
+                'akar', 'umbi', 'rimpang',
+                
+                # Bahan Organik Lainnya
+                'telur', 'cangkang telur', 'kulit telur',
+                'tulang', 'tulang ayam', 'tulang ikan', 'tulang sapi',
+                'cangkang', 'cangkang kerang', 'cangkang kepiting',
+                'sisik ikan', 'kepala ikan', 'insang ikan',
+                'bulu', 'bulu ayam', 'bulu hewan', 'rambut',
+                'kotoran hewan', 'kotoran sapi', 'kotoran kambing',
+                'kotoran ayam', 'pupuk kandang', 'kompos',
+                
+                # Organik Dapur
+                'ampas kopi', 'ampas teh', 'serbuk kayu',
+                'bumbu dapur', 'rempah', 'merica', 'ketumbar',
+                'bawang merah', 'bawang putih', 'bawang bombay',
+                'daun bawang', 'seledri', 'kemangi', 'daun salam',
+                'serai', 'lengkuas', 'kencur', 'temulawak',
+                
+                # Organik Kebun
+                'dedaunan', 'ranting pohon', 'batang kecil',
+                'bunga', 'bunga layu', 'bunga gugur',
+                'tanaman mati', 'tanaman layu', 'tanaman sakit',
+                'potongan rumput', 'clipping', 'trimming',
+                'gulma', 'tanaman liar', 'tumbuhan liar',
+            ],
+            
+            # ==================== KERTAS ====================
+            'kertas': [
+                # Kertas Umum
+                'kertas', 'kertas bekas', 'kertas koran', 'koran',
+                'majalah', 'tabloid', 'buku', 'buku bekas',
+                'novel', 'komik', 'majalah bekas', 'kertas hvs',
+                'kertas folio', 'kertas a4', 'kertas f4',
+                'kertas buram', 'kertas sampul', 'kertas kado',
+                'kertas warna', 'kertas karton', 'karton',
+                
+                # Kertas Kemasan
+                'kardus', 'kardus bekas', 'box kardus',
+                'dus', 'dus kardus', 'kotak kardus',
+                'kemasan kardus', 'pembungkus kardus',
+                'karton box', 'karton dus', 'paper bag',
+                'tas kertas', 'kantong kertas', 'bungkus kertas',
+                'kertas minyak', 'kertas roti', 'kertas nasi',
+                'kertas pembungkus', 'kertas kemasan',
+                
+                # Kertas Kantor
+                'dokumen', 'arsip', 'file', 'laporan',
+                'surat', 'nota', 'faktur', 'invoice',
+                'kwitansi', 'struk', 'tiket', 'karcis',
+                'formulir', 'lembar kerja', 'worksheet',
+                'print out', 'hasil print', 'fotokopi',
+                'printan', 'print-an', 'cetakan',
+                
+                # Kertas Rumah Tangga
+                'tissue', 'tisu', 'kertas tissue', 'kertas tisu',
+                'tissue toilet', 'tissue wajah', 'tissue dapur',
+                'serviet', 'napkin', 'handuk kertas',
+                'kertas rokok', 'bungkus rokok', 'kemasan rokok',
+                'bungkus gula', 'bungkus tepung', 'bungkus garam',
+                
+                # Kertas Spesial
+                'kertas foto', 'foto', 'print foto',
+                'poster', 'brosur', 'leaflet', 'pamflet',
+                'flyer', 'spanduk kertas', 'banner kertas',
+                'kalender', 'kalender bekas', 'agenda',
+                'notes', 'buku catatan', 'notebook',
+                
+                # Kertas Industri
+                'kertas kraft', 'kertas packing',
+                'kertas semen', 'kertas gipsum',
+                'kertas duplex', 'kertas ivory',
+                'kertas art paper', 'kertas art carton',
+                'kertas sticker', 'label', 'stiker',
+            ],
+            
+            # ==================== LOGAM ====================
+            'logam': [
+                # Logam Umum
+                'logam', 'besi', 'baja', 'steel', 'stainless',
+                'aluminium', 'alumunium', 'alumimum',
+                'tembaga', 'copper', 'kuningan', 'brass',
+                'perunggu', 'bronze', 'timah', 'tin',
+                'seng', 'zinc', 'nikel', 'nickel',
+                'krom', 'chromium', 'magnesium',
+                
+                # Kaleng & Kemasan Logam
+                'kaleng', 'kaleng bekas', 'kaleng minuman',
+                'kaleng soda', 'kaleng bir', 'kaleng susu',
+                'kaleng cat', 'kaleng makanan', 'kaleng sarden',
+                'kaleng kornet', 'kaleng susu kental',
+                'kemasan kaleng', 'wadah kaleng',
+                
+                # Peralatan Rumah Tangga Logam
+                'panci', 'wajan', 'teflon', 'kuali',
+                'sendok logam', 'garpu logam', 'pisau logam',
+                'sodet', 'spatula', 'saringan',
+                'ember logam', 'bak logam', 'bucket',
+                'keranjang logam', 'rak logam',
+                'gantungan baju logam', 'hanger',
+                
+                # Perkakas & Konstruksi
+                'paku', 'sekrup', 'baut', 'mur',
+                'kawat', 'kawat berduri', 'kawat ayam',
+                'kawat bendrat', 'kabel listrik',
+                'besi beton', 'besi cor', 'besi hollow',
+                'besi siku', 'besi plat', 'plat besi',
+                'pipa besi', 'pipa galvanis', 'pipa tembaga',
+                'paralon besi', 'talang seng',
+                
+                # Elektronik & Komponen
+                'motor listrik', 'dinamo', 'generator',
+                'transformator', 'trafo', 'kumparan',
+                'kawat tembaga', 'kabel bekas', 'kabel listrik',
+                'kabel telepon', 'kabel coaxial', 'kabel usb',
+                'pcb', 'printed circuit board', 'komponen elektronik',
+                'chip', 'processor', 'ram', 'harddisk',
+                
+                # Kendaraan & Mesin
+                'velg', 'roda', 'rantai', 'gear',
+                'mesin', 'engine', 'blok mesin',
+                'knalpot', 'exhaust', 'karburator',
+                'radiator', 'alternator', 'starter',
+                'body mobil', 'body motor', 'chassis',
+                
+                # Furniture & Dekorasi
+                'ranjang besi', 'tempat tidur besi',
+                'kursi besi', 'meja besi', 'lemari besi',
+                'pagar besi', 'teralis', 'jeruji',
+                'kanopi besi', 'atap seng', 'seng',
+                'genteng metal', 'atap metal',
+            ],
+            
+            # ==================== KACA ====================
+            'kaca': [
+                # Kaca Umum
+                'kaca', 'beling', 'pecahan kaca', 'kaca pecah',
+                'gelas kaca', 'gelas beling', 'piring kaca',
+                'mangkuk kaca', 'cangkir kaca', 'teko kaca',
+                'vas kaca', 'botol kaca', 'botol beling',
+                
+                # Botol Kaca Spesifik
+                'botol sirup', 'botol kecap', 'botol saus',
+                'botol selai', 'botol madu', 'botol vitamin',
+                'botol obat', 'botol parfum', 'botol kosmetik',
+                'botol minuman', 'botol bir', 'botol anggur',
+                'botol champagne', 'botol spirit',
+                'botol susu', 'botol bayi', 'botol dot',
+                
+                # Peralatan Dapur Kaca
+                'toples kaca', 'jar kaca', 'wadah kaca',
+                'container kaca', 'mangkuk kaca', 'piring kaca',
+                'gelas minum', 'gelas wine', 'gelas cocktail',
+                'gelas shot', 'gelas beer', 'gelas juice',
+                'teko', 'ceret kaca', 'kendi kaca',
+                
+                # Kaca Jendela & Bangunan
+                'kaca jendela', 'jendela kaca', 'kaca pintu',
+                'kaca mobil', 'kaca motor', 'kaca spion',
+                'kaca cermin', 'cermin', 'kaca reflektor',
+                'kaca film', 'kaca tempered', 'kaca laminasi',
+                'kaca patri', 'stained glass',
+                
+                # Elektronik & Peralatan
+                'lampu pijar', 'lampu bohlam', 'lampu halogen',
+                'tabung tv', 'crt monitor', 'tabung neon',
+                'kaca mikroskop', 'kaca teropong', 'lensa',
+                'kacamata', 'spectacles', 'lensa kacamata',
+                'kaca pembesar', 'magnifying glass',
+                
+                # Dekorasi & Seni
+                'vas bunga', 'pot kaca', 'aquarium',
+                'terarium', 'display case', 'etalse kaca',
+                'pigura kaca', 'frame kaca', 'plakat kaca',
+                'trophy', 'piala', 'medali dengan kaca',
+            ],
+            
+            # ==================== CAMPURAN ====================
+            'campuran': [
+                # Umum
+                'campuran', 'bermacam', 'beragam', 'beraneka',
+                'sampah rumah tangga', 'sampah dapur',
+                'sampah kebun', 'sampah taman',
+                'sampah kantor', 'sampah sekolah',
+                'sampah pasar', 'sampah komersial',
+                
+                # Rumah Tangga Campuran
+                'sampah rumah', 'sampah keluarga',
+                'sampah sehari-hari', 'sampah harian',
+                'sampah basah kering', 'sampah basah',
+                'sampah kering', 'sampah residu',
+                
+                # Spesifik Lokasi
+                'sampah sekolah', 'sampah kampus',
+                'sampah kantor', 'sampah perkantoran',
+                'sampah pabrik', 'sampah industri',
+                'sampah pasar', 'sampah tradisional',
+                'sampah mall', 'sampah pusat perbelanjaan',
+                'sampah hotel', 'sampah restoran',
+                'sampah kafe', 'sampah warung',
+                
+                # Tak Terklasifikasi
+                'sampah tak terpilah', 'sampah tercampur',
+                'sampah tidak terpisah', 'sampah gabungan',
+                'sampah all in', 'sampah semua jenis',
+                'sampah berbagai jenis', 'sampah heterogen',
+            ],
+            
+            # ==================== KARET ====================
+            'karet': [
+                # Ban
+                'ban', 'ban bekas', 'ban mobil', 'ban motor',
+                'ban sepeda', 'ban truk', 'ban bus',
+                'ban luar', 'ban dalam', 'tube',
+                'ban vulkanisir', 'ban recapan',
+                
+                # Alas Kaki
+                'sandal', 'sandal bekas', 'sandal jepit',
+                'sepatu', 'sepatu bekas', 'sepatu kets',
+                'sepatu olahraga', 'boots', 'sepatu boot',
+                'sepatu kulit sintetis', 'sepatu karet',
+                
+                # Peralatan Karet
+                'tali karet', 'karet gelang', 'gelang karet',
+                'rubber band', 'elastic band', 'karet pentil',
+                'karet penghapus', 'penghapus', 'eraser',
+                'karet sandal', 'sol karet', 'sole',
+                
+                # Karet Industri
+                'belt', 'conveyor belt', 'fan belt',
+                'timing belt', 'v-belt', 'karet mesin',
+                'gasket', 'seal', 'oring', 'o-ring',
+                'rubber sheet', 'lembaran karet',
+                'karet busa', 'foam rubber',
+                
+                # Mainan & Perlengkapan
+                'balon', 'balloon', 'balon karet',
+                'mainan karet', 'rubber toy', 'bola karet',
+                'basketball', 'volleyball', 'football',
+                'karet stress ball', 'anti stress ball',
+                
+                # Karet Rumah Tangga
+                'sarung tangan karet', 'glove karet',
+                'karet pel', 'pel karet', 'squeegee',
+                'karet pintu', 'door seal', 'weather strip',
+                'karet jendela', 'window seal',
+            ],
+            
+            # ==================== TEKSTIL ====================
+            'tekstil': [
+                # Pakaian
+                'baju', 'pakaian', 'clothing', 'apparel',
+                'kaos', 't-shirt', 'kemeja', 'shirt',
+                'celana', 'pants', 'jeans', 'jins',
+                'rok', 'skirt', 'dress', 'gaun',
+                'jaket', 'jacket', 'sweater', 'hoodie',
+                'kaus kaki', 'socks', 'stocking',
+                'dalaman', 'underwear', 'bra', 'bh',
+                'pakaian dalam', 'inner wear',
+                
+                # Kain & Bahan
+                'kain', 'textile', 'fabric', 'cloth',
+                'kain perca', 'kain sisa', 'kain bekas',
+                'kain potongan', 'scrap fabric',
+                'kain katun', 'cotton', 'kain sutra', 'silk',
+                'kain wol', 'wool', 'kain linen', 'linen',
+                'kain polyester', 'polyester', 'nylon',
+                'kain denim', 'denim', 'kain jeans',
+                
+                # Sprei & Perlengkapan Tidur
+                'sprei', 'bedsheet', 'sarung bantal',
+                'pillow case', 'sarung guling',
+                'selimut', 'blanket', 'bedcover',
+                'quilt', 'bedspread', 'kain tempat tidur',
+                
+                # Handuk & Kain Lap
+                'handuk', 'towel', 'handuk mandi',
+                'handuk kecil', 'face towel',
+                'handuk dapur', 'kitchen towel',
+                'kain lap', 'lap', 'rag', 'kain pel',
+                'kain bersih', 'cleaning cloth',
+                
+                # Tas & Aksesoris
+                'tas', 'bag', 'tas kain', 'cloth bag',
+                'tas belanja', 'shopping bag',
+                'tas tangan', 'handbag', 'tas ransel',
+                'backpack', 'tas sekolah', 'school bag',
+                'topi', 'hat', 'cap', 'kupluk',
+                'sarung tangan', 'gloves', 'mittens',
+                'syal', 'scarf', 'shawl',
+                
+                # Gorden & Dekorasi
+                'gorden', 'curtain', 'tirai', 'blind',
+                'korden', 'window curtain', 'kain penutup',
+                'taplak', 'table cloth', 'table runner',
+                'karpet', 'carpet', 'rug', 'keset',
+                'doormat', 'welcome mat',
+            ],
+            
+            # ==================== KAYU ====================
+            'kayu': [
+                # Kayu Umum
+                'kayu', 'wood', 'kayu bekas', 'kayu sisa',
+                'potongan kayu', 'serpihan kayu', 'serbuk kayu',
+                'ranting kayu', 'dahan kayu', 'batang kayu',
+                
+                # Furniture Kayu
+                'meja kayu', 'kursi kayu', 'lemari kayu',
+                'rak kayu', 'tempat tidur kayu', 'bangku kayu',
+                'bufet kayu', 'kitchen set kayu',
+                
+                # Konstruksi & Bangunan
+                'papan', 'balok', 'kasau', 'reng',
+                'kayu lapis', 'plywood', 'triplek',
+                'multiplek', 'blockboard', 'particle board',
+                'mdf', 'hdf', 'hardboard',
+                
+                # Kemasan Kayu
+                'palet', 'pallet', 'dus kayu', 'peti kayu',
+                'crate', 'kotak kayu', 'box kayu',
+                'kemasan kayu', 'packing kayu',
+                
+                # Peralatan & Perlengkapan
+                'gagang sapu', 'gagang perkakas',
+                'tongkat', 'stick', 'batang',
+                'pohon tumbang', 'kayu bakar', 'firewood',
+                'ranting kering', 'dahan kering',
+            ],
+            
+            # ==================== KERAMIK ====================
+            'keramik': [
+                'keramik', 'ceramic', 'porselen', 'porcelain',
+                'piring keramik', 'mangkuk keramik', 'gelas keramik',
+                'guci', 'vas keramik', 'pot keramik',
+                'ubin', 'tile', 'lantai keramik', 'wall tile',
+                'kloset', 'toilet', 'washtafel', 'sink',
+                'bathtub', 'bath tub', 'shower tray',
+            ],
+            
+            # ==================== ELEKTRONIK ====================
+            'elektronik': [
+                # Umum
+                'elektronik', 'e-waste', 'limbah elektronik',
+                'barang elektronik rusak', 'perangkat elektronik',
+                
+                # Komputer & Aksesoris
+                'komputer', 'pc', 'laptop', 'notebook',
+                'monitor', 'crt', 'lcd', 'led monitor',
+                'keyboard', 'mouse', 'printer', 'scanner',
+                'harddisk', 'hdd', 'ssd', 'flashdisk',
+                'cd', 'dvd', 'bluray', 'optical disc',
+                
+                # Telekomunikasi
+                'ponsel', 'hp', 'smartphone', 'tablet',
+                'ipad', 'telepon', 'telepon rumah',
+                'modem', 'router', 'switch', 'hub',
+                
+                # Peralatan Rumah Tangga
+                'tv', 'televisi', 'kulkas', 'refrigerator',
+                'ac', 'air conditioner', 'kipas angin',
+                'blender', 'mixer', 'juicer', 'food processor',
+                'microwave', 'oven', 'toaster', 'rice cooker',
+                'dispenser', 'water dispenser',
+                
+                # Audio & Video
+                'radio', 'speaker', 'sound system',
+                'dvd player', 'bluray player', 'game console',
+                'playstation', 'xbox', 'nintendo',
+                'kamera', 'camera', 'camcorder', 'video camera',
+                
+                # Baterai & Power
+                'baterai', 'battery', 'aki', 'accu',
+                'charger', 'adaptor', 'power supply',
+            ],
+            
+            # ==================== MEDIS ====================
+            'medis': [
+                'medis', 'kesehatan', 'sarana kesehatan',
+                'rumah sakit', 'klinik', 'puskesmas',
+                'laboratorium', 'apotek', 'farmasi',
+                'obat', 'vaksin', 'antibiotik',
+                'perban', 'kasa', 'kapas',
+                'jarum', 'suntik', 'infus',
+                'sarung tangan', 'masker',
+                'pembalut', 'popok',
+            ]
+        }
+        
+        deskripsi = deskripsi.lower()
+        for jenis, kata_kunci in keywords.items():
+            if any(kata in deskripsi for kata in kata_kunci):
+                return jenis
+        
+        return 'tidak_terdeteksi'
+
+    def format_period(self, start_date, end_date):
+        return {
+            'start_date': start_date.strftime('%Y-%m-%d'),
+            'end_date': end_date.strftime('%Y-%m-%d'),
+            'label': f"{start_date.strftime('%d %b %Y')} - {end_date.strftime('%d %b %Y')}"
+        }
+
+    def analisis_tren_waktu(self, queryset, start_date, end_date):
+        """
+        Analisis tren laporan sampah berdasarkan waktu (harian)
+        Output siap untuk chart (line / bar)
+        """
+        # Inisialisasi range tanggal
+        delta = (end_date - start_date).days
+        date_range = [
+            start_date + timedelta(days=i)
+            for i in range(delta + 1)
+        ]
+
+        # Siapkan struktur default
+        tren = {
+            'labels': [d.strftime('%Y-%m-%d') for d in date_range],
+            'total_laporan': [],
+            'laporan_selesai': [],
+            'laporan_pending': []
+        }
+
+        # Pre-calc queryset
+        qs = queryset.values('tanggal_lapor', 'status')
+
+        for tanggal in date_range:
+            harian = [q for q in qs if q['tanggal_lapor'] == tanggal]
+
+            total = len(harian)
+            selesai = sum(1 for q in harian if q['status'] == 'selesai')
+            pending = total - selesai
+
+            tren['total_laporan'].append(total)
+            tren['laporan_selesai'].append(selesai)
+            tren['laporan_pending'].append(pending)
+
+        return tren
+
+    def analisis_wilayah_administrasi(self, queryset):
+        """
+        Analisis wilayah administrasi - VERSI SIMPLIFIED
+        """
+        wilayah_data = []
+        
+        for laporan in queryset[:50]:  # Batasi untuk performa
+            try:
+                lat = float(laporan.latitude) if laporan.latitude else None
+                lon = float(laporan.longitude) if laporan.longitude else None
+                
+                # SIMPLIFIED: Ekstrak informasi dari alamat (jika ada)
+                alamat = laporan.alamat or ""
+                
+                # Coba ekstrak kecamatan/kelurahan dari alamat jika memungkinkan
+                # atau gunakan informasi koordinat saja
+                wilayah_info = {
+                    'alamat': alamat,
+                    'koordinat': {'lat': lat, 'lon': lon} if lat and lon else None,
+                    'status': laporan.status,
+                    'id_laporan': laporan.idLaporan,
+                    'nama_pelapor': laporan.nama,
+                    'tanggal_lapor': laporan.tanggal_lapor.strftime('%Y-%m-%d') if laporan.tanggal_lapor else None
+                }
+                
+                wilayah_data.append(wilayah_info)
+                
+            except (TypeError, ValueError, AttributeError):
+                continue
+        
+        return wilayah_data
+    
+    def ranking_wilayah_bersih_kotor(self, wilayah_data):
+        from collections import defaultdict
+        
+        # Kelompokkan data per wilayah (gunakan ekstrak dari alamat atau koordinat grid)
+        wilayah_counter = defaultdict(lambda: {
+            'total_laporan': 0,
+            'laporan_selesai': 0,
+            'laporan_pending': 0,
+            'alamat_samples': []
+        })
+        
+        for entry in wilayah_data:
+            # Gunakan bagian pertama dari alamat sebagai identifikasi wilayah
+            alamat = entry.get('alamat', '')
+            if alamat:
+                # Coba ekstrak wilayah dari alamat (contoh: ambil 3 kata pertama)
+                wilayah_parts = alamat.split()[:3]
+                if wilayah_parts:
+                    key = ' '.join(wilayah_parts)
+                else:
+                    key = 'Lokasi Tidak Jelas'
+            else:
+                # Jika tidak ada alamat, gunakan koordinat grid
+                if entry.get('koordinat'):
+                    lat = entry['koordinat'].get('lat')
+                    lon = entry['koordinat'].get('lon')
+                    if lat and lon:
+                        key = f"Koordinat: {lat:.3f},{lon:.3f}"
+                    else:
+                        key = 'Lokasi Tidak Diketahui'
+                else:
+                    key = 'Lokasi Tidak Diketahui'
+            
+            wilayah_counter[key]['total_laporan'] += 1
+            
+            if entry.get('status') == 'selesai':
+                wilayah_counter[key]['laporan_selesai'] += 1
+            else:
+                wilayah_counter[key]['laporan_pending'] += 1
+            
+            # Simpan sample alamat
+            if len(wilayah_counter[key]['alamat_samples']) < 3 and alamat:
+                wilayah_counter[key]['alamat_samples'].append(alamat[:50])
+        
+        # Hitung metrics untuk ranking
+        ranking_list = []
+        for wilayah, data in wilayah_counter.items():
+            if data['total_laporan'] > 0:
+                tingkat_penyelesaian = (data['laporan_selesai'] / data['total_laporan']) * 100
+                kepadatan_laporan = data['total_laporan']
+                
+                ranking_list.append({
+                    'wilayah': wilayah,
+                    'total_laporan': data['total_laporan'],
+                    'laporan_selesai': data['laporan_selesai'],
+                    'laporan_pending': data['laporan_pending'],
+                    'tingkat_penyelesaian': round(tingkat_penyelesaian, 1),
+                    'kepadatan_laporan': kepadatan_laporan,
+                    'alamat_samples': data['alamat_samples'],
+                    'skor_kebersihan': self.hitung_skor_kebersihan(
+                        tingkat_penyelesaian, 
+                        kepadatan_laporan
+                    )
+                })
+        
+        # Urutkan: terkotor (skor kebersihan terendah) sampai terbersih
+        ranking_list.sort(key=lambda x: x['skor_kebersihan'])
+        
+        # Tambahkan peringkat
+        for i, item in enumerate(ranking_list):
+            item['peringkat'] = i + 1
+            item['kategori'] = self.kategori_kebersihan(item['skor_kebersihan'])
+        
+        return {
+            'ranking_terkotor': ranking_list[:5] if len(ranking_list) >= 5 else ranking_list,
+            'ranking_terbersih': ranking_list[-5:][::-1] if len(ranking_list) >= 5 else ranking_list[::-1],
+            'total_wilayah_teranalisis': len(ranking_list)
+        }
+
+    def hitung_skor_kebersihan(self, tingkat_penyelesaian, kepadatan_laporan):
+        """
+        Hitung skor kebersihan (0-100)
+        Semakin tinggi skor = semakin bersih
+        """
+        # Faktor 1: Tingkat penyelesaian (60%)
+        skor_penyelesaian = tingkat_penyelesaian * 0.6
+        
+        # Faktor 2: Kepadatan laporan (40%)
+        # Normalisasi: asumsi maks 50 laporan/wilayah = sangat padat
+        max_density = 50
+        density_normalized = min(kepadatan_laporan / max_density, 1.0)
+        skor_kepadatan = (1 - density_normalized) * 40
+        
+        total_skor = skor_penyelesaian + skor_kepadatan
+        return round(total_skor, 1)
+    
+    def kategori_kebersihan(self, skor):
+        """Kategorikan berdasarkan skor kebersihan"""
+        if skor >= 80:
+            return 'Sangat Bersih'
+        elif skor >= 60:
+            return 'Bersih'
+        elif skor >= 40:
+            return 'Cukup Bersih'
+        elif skor >= 20:
+            return 'Kotor'
+        else:
+            return 'Sangat Kotor'
+    
+    def generate_rekomendasi(self, klasifikasi, analisis_wilayah, ranking_wilayah, efektivitas, dampak_lingkungan):
+        """Generate rekomendasi berdasarkan analisis dampak lingkungan"""
+        rekomendasi = []
+        
+        # 1. Rekomendasi berdasarkan jenis sampah berbahaya
+        if dampak_lingkungan.get('peringatan'):
+            for peringatan in dampak_lingkungan['peringatan']:
+                if peringatan['level'] == 'sangat_tinggi':
+                    rekomendasi.append({
+                        'prioritas': 'sangat_tinggi',
+                        'kategori': 'keamanan',
+                        'rekomendasi': f'PENANGANAN SEGERA: Limbah {peringatan["jenis"].upper()}',
+                        'alasan': f'Ditemukan {peringatan["jumlah"]} laporan limbah berbahaya ({peringatan["persentase"]}%)',
+                        'sumber_data': 'dampak_lingkungan'
+                    })
+                elif peringatan['level'] == 'sedang':
+                    rekomendasi.append({
+                        'prioritas': 'tinggi',
+                        'kategori': 'lingkungan',
+                        'rekomendasi': f'Program khusus untuk sampah {peringatan["jenis"]}',
+                        'alasan': f'Sampah {peringatan["jenis"]} mencapai {peringatan["persentase"]}% dari total laporan',
+                        'sumber_data': 'dampak_lingkungan'
+                    })
+        
+        # 2. Rekomendasi berdasarkan lokasi berbahaya - FIX: gunakan 'lokasi' bukan 'wilayah'
+        if dampak_lingkungan.get('lokasi_berbahaya'):
+            lokasi_prioritas = [l for l in dampak_lingkungan['lokasi_berbahaya'] if l.get('tingkat_risiko') == 'tinggi']
+            if lokasi_prioritas:
+                # Gunakan key 'lokasi' yang sesuai dengan struktur data
+                lokasi_nama = lokasi_prioritas[0].get('lokasi', 'Lokasi tidak diketahui')
+                rekomendasi.append({
+                    'prioritas': 'tinggi',
+                    'kategori': 'lokasi',
+                    'rekomendasi': f'Fokuskan pembersihan di {lokasi_nama}',
+                    'alasan': f'Wilayah dengan konsentrasi sampah berbahaya tertinggi',
+                    'sumber_data': 'dampak_lingkungan'
+                })
+        
+        # 3. Rekomendasi efektivitas rendah
+        if efektivitas.get('tingkat_penyelesaian', 0) < 50:
+            rekomendasi.append({
+                'prioritas': 'tinggi',
+                'kategori': 'operasional',
+                'rekomendasi': 'Optimalkan tim lapangan dan tingkatkan respons time',
+                'alasan': f'Tingkat penyelesaian hanya {efektivitas.get("tingkat_penyelesaian", 0):.1f}%',
+                'sumber_data': 'efektivitas_penanganan'
+            })
+        
+        # 4. Rekomendasi untuk wilayah terkotor
+        if ranking_wilayah.get('ranking_terkotor'):
+            wilayah_terkotor = ranking_wilayah['ranking_terkotor'][0]
+            rekomendasi.append({
+                'prioritas': 'sedang',
+                'kategori': 'wilayah',
+                'rekomendasi': f'Perhatian khusus untuk {wilayah_terkotor.get("wilayah", "wilayah terkotor")}',
+                'alasan': f'Wilayah dengan skor kebersihan terendah ({wilayah_terkotor.get("skor_kebersihan", 0)})',
+                'sumber_data': 'ranking_wilayah'
+            })
+        
+        # 5. Rekomendasi edukasi
+        if klasifikasi.get('detail_klasifikasi'):
+            plastik_data = next((item for item in klasifikasi['detail_klasifikasi'] if item.get('jenis') == 'plastik'), None)
+            if plastik_data and plastik_data.get('persentase', 0) > 20:
+                rekomendasi.append({
+                    'prioritas': 'sedang',
+                    'kategori': 'edukasi',
+                    'rekomendasi': 'Kampanye pengurangan sampah plastik',
+                    'alasan': f'Sampah plastik mencapai {plastik_data.get("persentase", 0):.1f}% dari total',
+                    'sumber_data': 'klasifikasi_sampah'
+                })
+        
+        # 6. Rekomendasi umum monitoring
+        if klasifikasi.get('persentase_data_terstruktur', 0) < 50:
+            rekomendasi.append({
+                'prioritas': 'rendah',
+                'kategori': 'monitoring',
+                'rekomendasi': 'Tingkatkan pengisian data jenis sampah',
+                'alasan': f'Hanya {klasifikasi.get("persentase_data_terstruktur", 0):.1f}% data memiliki klasifikasi terstruktur',
+                'sumber_data': 'klasifikasi_sampah'
+            })
+        
+        return rekomendasi[:6]
+    
+    def hitung_efektivitas_penanganan(self, queryset):
+        """
+        Menghitung efektivitas penanganan laporan sampah
+        """
+        total = queryset.count()
+        selesai = queryset.filter(status='selesai').count()
+        pending = total - selesai
+
+        return {
+            'total_laporan': total,
+            'laporan_selesai': selesai,
+            'laporan_pending': pending,
+            'tingkat_penyelesaian': round((selesai / total) * 100, 2) if total > 0 else 0
+        }
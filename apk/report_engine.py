@@ -0,0 +1,122 @@
+# report_engine.py
+"""
+Engine laporan admin.
+
+- Report: satu jenis laporan. Dataset dideklarasikan sekali (model + field
+  tanggal -> queryset periode, lalu summary() & table()) dan dihitung sekali
+  per request lewat build().
+- Registry REPORTS: report_type -> kelas Report (@register_report).
+- Renderer per format (RENDERERS), di-import saat dipakai agar reportlab /
+  openpyxl tidak dimuat saat start-up. JSON dikirim langsung sebagai
+  Response DRF oleh view.
+
+View report (apk/reports.py) dan ExportReportView memakai data build() yang
+sama; tidak ada view yang dipanggil ulang dengan request.data palsu.
+"""
+from datetime import datetime
+
+from django.utils.module_loading import import_string
+from rest_framework.exceptions import ValidationError
+
+# format -> kelas renderer (path), lihat apk/report_renderers/
+RENDERERS = {
+    'pdf': 'apk.report_renderers.pdf.PdfReportRenderer',
+    'excel': 'apk.report_renderers.excel.ExcelReportRenderer',
+    'csv': 'apk.report_renderers.csv.CsvReportRenderer',
+}
+
+REPORTS = {}
+
+
+def register_report(report_class):
+    REPORTS[report_class.name] = report_class
+    return report_class
+
+
+def get_report(report_type, params):
+    """Instance Report untuk report_type, ValidationError jika tidak dikenal"""
+    try:
+        report_class = REPORTS[report_type]
+    except KeyError:
+        raise ValidationError({'error': 'Jenis report tidak valid'})
+    return report_class(params)
+
+
+def get_renderer(format_type):
+    """Instance renderer untuk format, ValidationError jika tidak didukung"""
+    try:
+        path = RENDERERS[format_type]
+    except KeyError:
+        raise ValidationError({'error': 'Format tidak didukung'})
+    return import_string(path)()
+
+
+def request_params(request):
+    """Parameter laporan dari query string + body (body menang)"""
+    params = request.query_params.dict()
+    params.update(request.data.items())
+    return params
+
+
+class Report:
+    """
+    Dasar satu jenis laporan.
+
+    Laporan periode cukup mengisi `model` & `date_field` lalu override
+    summary(queryset) dan table(queryset). Laporan dengan bentuk lain
+    override build().
+    """
+    name = None
+    title = 'LAPORAN'
+    model = None
+    date_field = None
+    # Skema output (apk/report.py), tidak dipakai untuk validasi saat request
+    serializer_class = None
+
+    def __init__(self, params):
+        self.params = params
+
+    # ===== parameter =====
+
+    def date_range(self):
+        start_date = self.params.get('start_date')
+        end_date = self.params.get('end_date')
+
+        if not start_date or not end_date:
+            raise ValidationError({'error': 'start_date dan end_date wajib diisi'})
+
+        try:
+            start_date = datetime.strptime(str(start_date), '%Y-%m-%d').date()
+            end_date = datetime.strptime(str(end_date), '%Y-%m-%d').date()
+        except ValueError:
+            raise ValidationError({'error': 'Format tanggal harus YYYY-MM-DD'})
+
+        if start_date > end_date:
+            raise ValidationError({'error': 'start_date tidak boleh lebih besar dari end_date'})
+
+        return start_date, end_date
+
+    def format_period(self, start_date, end_date):
+        return f"{start_date.strftime('%d/%m/%Y')} s/d {end_date.strftime('%d/%m/%Y')}"
+
+    # ===== dataset =====
+
+    def queryset(self):
+        self.start_date, self.end_date = self.date_range()
+        self.period = self.format_period(self.start_date, self.end_date)
+        return self.model._default_manager.filter(**{
+            f'{self.date_field}__range': [self.start_date, self.end_date],
+        })
+
+    def summary(self, queryset):
+        raise NotImplementedError
+
+    def table(self, queryset):
+        return []
+
+    def build(self):
+        queryset = self.queryset()
+        return {
+            'info': self.summary(queryset),
+            'table': self.table(queryset),
+        }
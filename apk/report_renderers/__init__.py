@@ -0,0 +1,93 @@
+"""
+Renderer file export laporan (ExportReportView).
+
+Setiap format ada di modulnya sendiri dan di-import saat dipakai, sehingga
+reportlab / openpyxl tidak dimuat ketika URLconf atau manage.py di-load:
+
+- pdf.PdfReportRenderer     (reportlab)
+- excel.ExcelReportRenderer (openpyxl)
+- csv.CsvReportRenderer     (stdlib)
+
+render(report, data, filters) menerima Report (apk/report_engine.py) dan
+data hasil Report.build(). Layout khusus per report ada di method
+`_create_<report>_<format>`; report tanpa layout khusus dirender sebagai
+tabel generik dari data['table'].
+
+Modul ini sendiri tidak boleh meng-import library berat.
+"""
+import json
+from datetime import datetime
+
+
+class BaseReportRenderer:
+    """Helper format angka, tanggal & tabel generik yang dipakai semua renderer"""
+
+    def layout_method(self, report, fmt):
+        """Method `_create_<report>_<fmt>` jika report punya layout khusus"""
+        return getattr(self, f"_create_{report.name.replace('-', '_')}_{fmt}", None)
+
+    def table_rows(self, data):
+        """(kolom, baris) dari data['table']; nilai dict/list ditulis sebagai JSON"""
+        table = data.get('table') or []
+        columns = list(table[0].keys()) if table else []
+        rows = [
+            [
+                json.dumps(row.get(column), default=str, ensure_ascii=False)
+                if isinstance(row.get(column), (dict, list)) else row.get(column)
+                for column in columns
+            ]
+            for row in table
+        ]
+        return columns, rows
+
+    def filename(self, report, ext):
+        return f"laporan_{report.name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{ext}"
+
+    def _format_number(self, value):
+        """Safely format number, handle None and non-numeric values"""
+        if value is None:
+            return 0
+        try:
+            # Convert to float first, then to int if no decimal
+            num = float(value)
+            if num.is_integer():
+                return int(num)
+            return num
+        except (ValueError, TypeError):
+            return 0
+
+    def format_date_for_report(self, date_value):
+        """
+        Format date for report output.
+        Accepts string, datetime, date, or None.
+        Returns formatted string or empty string.
+        """
+        if not date_value:
+            return ''
+        
+        try:
+            if isinstance(date_value, str):
+                # Try to parse ISO format
+                try:
+                    # Handle ISO format with timezone
+                    date_str = date_value.replace('Z', '+00:00')
+                    dt = datetime.fromisoformat(date_str)
+                except:
+                    # Try other common formats
+                    for fmt in ['%Y-%m-%d', '%Y/%m/%d', '%d-%m-%Y', '%d/%m/%Y', '%Y-%m-%d %H:%M:%S']:
+                        try:
+                            dt = datetime.strptime(date_value[:19], fmt)
+                            break
+                        except:
+                            continue
+                    else:
+                        # Return first 10 chars if parsing fails
+                        return str(date_value)[:10]
+            elif hasattr(date_value, 'strftime'):
+                dt = date_value
+            else:
+                return str(date_value)[:10]
+            
+            return dt.strftime('%d-%m-%Y')
+        except Exception:
+            return str(date_value)[:10]
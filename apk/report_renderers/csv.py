@@ -0,0 +1,30 @@
+# report_renderers/csv.py
+"""Renderer CSV laporan: baris data['table'] (stdlib csv, di-stream)"""
+import csv
+
+from django.http import StreamingHttpResponse
+
+from . import BaseReportRenderer
+
+
+class _Echo:
+    """Pseudo-buffer: csv.writer menulis, StreamingHttpResponse mengirim"""
+
+    def write(self, value):
+        return value
+
+
+class CsvReportRenderer(BaseReportRenderer):
+
+    def render(self, report, data, filters):
+        columns, rows = self.table_rows(data)
+        if not columns:
+            # Report tanpa tabel (mis. monthly): ringkasan key,value
+            columns = ['key', 'value']
+            rows = [[key, value] for key, value in data.items() if not isinstance(value, (dict, list))]
+
+        writer = csv.writer(_Echo())
+        lines = (writer.writerow(row) for row in [columns, *rows])
+        response = StreamingHttpResponse(lines, content_type='text/csv; charset=utf-8')
+        response['Content-Disposition'] = f'attachment; filename="{self.filename(report, "csv")}"'
+        return response
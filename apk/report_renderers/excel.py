@@ -0,0 +1,1025 @@
+# report_renderers/excel.py
+"""Renderer Excel (.xlsx) laporan (openpyxl)"""
+import io
+import os
+from datetime import datetime
+
+from django.conf import settings
+from django.http import HttpResponse
+from openpyxl import Workbook
+from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+from openpyxl.utils import get_column_letter
+
+from . import BaseReportRenderer
+
+header_font = Font(bold=True, color="FFFFFF")
+header_fill = PatternFill(start_color="34495E", fill_type="solid")
+center_alignment = Alignment(horizontal="center", vertical="center")
+
+subheader_fill = PatternFill(start_color="9B59B6", fill_type="solid")
+left_alignment = Alignment(horizontal="left", vertical="center")
+
+
+class ExcelReportRenderer(BaseReportRenderer):
+
+    def render(self, report, data, filters):
+        """Generate Excel response"""
+        wb = Workbook()
+        ws = wb.active
+        ws.title = report.name.capitalize()[:31]  # Excel sheet name limit
+
+        # Styling definitions
+        header_font = Font(bold=True, color="FFFFFF", size=11)
+        header_fill = PatternFill(start_color="3498DB", end_color="3498DB", fill_type="solid")
+        center_alignment = Alignment(horizontal='center', vertical='center')
+        border = Border(
+            left=Side(style='thin'),
+            right=Side(style='thin'),
+            top=Side(style='thin'),
+            bottom=Side(style='thin')
+        )
+
+        current_row = 1  # Start from row 1
+
+        # ===== TAMBAHKAN LOGO DAN INFO PERUSAHAAN =====
+        logo_path = os.path.join(
+            settings.BASE_DIR,
+            "static",
+            "images",
+            "logo_3d.png"
+        )
+
+        if os.path.exists(logo_path):
+            # Excel tidak bisa langsung Image dari PIL/OpenPyXL dengan sizing otomatis,
+            # tapi openpyxl punya Image class
+            from openpyxl.drawing.image import Image as XLImage
+            logo = XLImage(logo_path)
+            logo.width = 200  # sesuaikan
+            logo.height = 100
+            ws.add_image(logo, f"A{current_row}")
+            current_row += 6  # kasih spasi setelah logo
+
+        # Company info
+        company_lines = [
+            "Clean Up",
+            "Berdiri sejak: 15 Februari 2025",
+            "Alamat: Fatululi",
+            "Telp: 081626261761 | Email: cleanup@yahoo.com"
+        ]
+        for line in company_lines:
+            ws.merge_cells(start_row=current_row, start_column=1, end_row=current_row, end_column=6)
+            cell = ws.cell(row=current_row, column=1)
+            cell.value = line
+            cell.font = Font(bold=True if current_row == 1 else False, color="2C3E50")
+            cell.alignment = center_alignment
+            current_row += 1
+
+        current_row += 1  # spasi sebelum title laporan
+
+        # Add title
+        ws.merge_cells(start_row=current_row, start_column=1, end_row=current_row, end_column=6)
+        title_cell = ws.cell(row=current_row, column=1)
+        title_cell.value = f"LAPORAN {report.name.upper()}"
+        title_cell.font = Font(bold=True, size=14, color="2C3E50")
+        title_cell.alignment = center_alignment
+        current_row += 1
+
+        # Add timestamp
+        ws['A' + str(current_row)] = f"Dibuat: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}"
+        current_row += 1
+
+        # Add filters if any
+        if filters:
+            filter_text = " | ".join([f"{k}: {v}" for k, v in filters.items() if v])
+            ws.merge_cells(start_row=current_row, start_column=1, end_row=current_row, end_column=6)
+            cell = ws.cell(row=current_row, column=1)
+            cell.value = f"Filter: {filter_text}"
+            cell.alignment = center_alignment
+            current_row += 2  # spasi sebelum data
+
+        # Add data based on report type
+        create = self.layout_method(report, 'excel') or self._create_table_excel
+        current_row = create(ws, data, current_row)
+
+        # Auto adjust column widths
+        for column in ws.columns:
+            max_length = 0
+            column_letter = get_column_letter(column[0].column)
+            for cell in column:
+                try:
+                    if cell.value and len(str(cell.value)) > max_length:
+                        max_length = len(str(cell.value))
+                except:
+                    pass
+            adjusted_width = min(max_length + 2, 50)
+            ws.column_dimensions[column_letter].width = adjusted_width
+
+        # Save to buffer
+        buffer = io.BytesIO()
+        wb.save(buffer)
+        buffer.seek(0)
+
+        # Create response
+        response = HttpResponse(
+            buffer.getvalue(),
+            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        )
+        filename = self.filename(report, 'xlsx')
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+
+        return response
+
+    def _create_table_excel(self, ws, data, start_row):
+        """Tabel generik dari data['table'] untuk report tanpa layout khusus"""
+        columns, rows = self.table_rows(data)
+        current_row = start_row
+        for col, column in enumerate(columns, 1):
+            cell = ws.cell(row=current_row, column=col, value=column)
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = center_alignment
+        for row in rows:
+            current_row += 1
+            for col, value in enumerate(row, 1):
+                ws.cell(row=current_row, column=col, value=value)
+        return current_row + 2
+
+    def _create_keuangan_excel(self, ws, data, start_row):
+        info = data.get("info", {})
+        table = data.get("table", [])
+
+        # Title
+        ws.merge_cells(f'A{start_row}:F{start_row}')
+        title_cell = ws[f'A{start_row}']
+        title_cell.value = "SUMMARY KEUANGAN"
+        title_cell.font = Font(bold=True, size=12, color="2C3E50")
+        title_cell.alignment = center_alignment
+        
+        current_row = start_row + 2
+        
+        # Summary
+        summary_rows = [
+            ("Total Pendapatan", info.get("total_pendapatan", 0)),
+            ("Transaksi Pending", info.get("total_pending", 0)),
+            ("Transaksi Lunas", info.get("total_lunas", 0)),
+            ("Transaksi Gagal", info.get("total_gagal", 0)),
+        ]
+
+        for i, (label, val) in enumerate(summary_rows, start=current_row):
+            ws[f"A{i}"] = label
+            ws[f"A{i}"].font = Font(bold=True)
+            ws[f"B{i}"] = self._format_number(val)
+            if label == "Total Pendapatan":
+                ws[f"B{i}"].number_format = '"Rp"#,##0'
+        
+        current_row += len(summary_rows) + 2
+
+        # Metode Bayar Stats
+        metode_stats = info.get("metode_bayar_stats", {})
+        if metode_stats:
+            ws[f"A{current_row}"] = "STATISTIK METODE PEMBAYARAN"
+            ws[f"A{current_row}"].font = Font(bold=True, size=12, color="2C3E50")
+            current_row += 2
+            
+            # Header
+            headers = ["Metode", "Jumlah Transaksi", "Total (Rp)"]
+            for col, header in enumerate(headers, start=1):
+                cell = ws.cell(row=current_row, column=col)
+                cell.value = header
+                cell.font = header_font
+                cell.fill = header_fill
+                cell.alignment = center_alignment
+            
+            current_row += 1
+            
+            # Data
+            for metode, stats in metode_stats.items():
+                if isinstance(stats, dict):
+                    count = stats.get("count", 0)
+                    total = stats.get("total", 0)
+                else:
+                    count = 0
+                    total = 0
+                
+                ws.cell(row=current_row, column=1).value = str(metode)
+                ws.cell(row=current_row, column=2).value = self._format_number(count)
+                ws.cell(row=current_row, column=3).value = self._format_number(total)
+                ws.cell(row=current_row, column=3).number_format = '"Rp"#,##0'
+                current_row += 1
+            
+            current_row += 2
+
+        # Detail Transaksi
+        if table:
+            ws[f"A{current_row}"] = "DETAIL TRANSAKSI"
+            ws[f"A{current_row}"].font = Font(bold=True, size=12, color="2C3E50")
+            current_row += 2
+            
+            # Header
+            headers = ["No", "Tanggal", "Nama Anggota", "Metode", "Status", "Jumlah (Rp)"]
+            for col, header in enumerate(headers, start=1):
+                cell = ws.cell(row=current_row, column=col)
+                cell.value = header
+                cell.font = header_font
+                cell.fill = PatternFill(start_color="2C3E50", fill_type="solid")
+                cell.alignment = center_alignment
+            
+            current_row += 1
+            
+            # Data
+            for i, transaksi in enumerate(table, start=1):
+                ws.cell(row=current_row, column=1).value = i
+                ws.cell(row=current_row, column=2).value = self.format_date_for_report(transaksi.get('tanggal_bayar'))
+                ws.cell(row=current_row, column=3).value = transaksi.get('nama_anggota', '')
+                ws.cell(row=current_row, column=4).value = transaksi.get('metode_bayar', '')
+                ws.cell(row=current_row, column=5).value = transaksi.get('status_bayar', '')
+                
+                # Format jumlah dengan Rupiah
+                jumlah = transaksi.get('jumlah_bayar', 0)
+                ws.cell(row=current_row, column=6).value = self._format_number(jumlah)
+                ws.cell(row=current_row, column=6).number_format = '"Rp"#,##0'
+                
+                current_row += 1
+        
+        return current_row
+
+    def _create_anggota_excel(self, ws, data, start_row):
+        info = data.get('info', {})
+        table = data.get('table', [])
+
+        # Title
+        ws.merge_cells(f'A{start_row}:F{start_row}')
+        title_cell = ws[f'A{start_row}']
+        title_cell.value = "SUMMARY ANGGOTA"
+        title_cell.font = Font(bold=True, size=12, color="2C3E50")
+        title_cell.alignment = center_alignment
+        
+        current_row = start_row + 2
+        
+        # Summary
+        summary = [
+            ('Total Anggota', info.get('total_anggota', 0)),
+            ('Aktif', info.get('aktif', 0)),
+            ('Non Aktif', info.get('non_aktif', 0)),
+            ('Akan Expired', info.get('akan_expired', 0)),
+            ('Baru Bulan Ini', info.get('baru_bulan_ini', 0)),
+        ]
+
+        for i, (label, val) in enumerate(summary, start=current_row):
+            ws[f'A{i}'] = label
+            ws[f'B{i}'] = self._format_number(val)
+            ws[f'A{i}'].font = Font(bold=True)
+        
+        current_row += len(summary) + 2
+
+        # Jenis Sampah Stats
+        jenis_stats = info.get("jenis_sampah_stats", {})
+        if jenis_stats:
+            ws[f'A{current_row}'] = "DISTRIBUSI JENIS SAMPAH"
+            ws[f'A{current_row}'].font = Font(bold=True, size=12, color="2C3E50")
+            current_row += 2
+            
+            # Header
+            headers = ["Jenis Sampah", "Jumlah", "Persentase"]
+            for col, header in enumerate(headers, start=1):
+                cell = ws.cell(row=current_row, column=col)
+                cell.value = header
+                cell.font = header_font
+                cell.fill = PatternFill(start_color="27AE60", fill_type="solid")
+                cell.alignment = center_alignment
+            
+            current_row += 1
+            
+            # Data
+            total_anggota = info.get('total_anggota', 1)
+            for jenis, count in jenis_stats.items():
+                count_num = self._format_number(count)
+                percentage = (count_num / total_anggota * 100) if total_anggota else 0
+                
+                ws.cell(row=current_row, column=1).value = str(jenis)
+                ws.cell(row=current_row, column=2).value = count_num
+                ws.cell(row=current_row, column=3).value = f"{percentage:.1f}%"
+                current_row += 1
+            
+            current_row += 2
+
+        # Detail Anggota
+        if table:
+            ws[f'A{current_row}'] = "DETAIL ANGGOTA"
+            ws[f'A{current_row}'].font = Font(bold=True, size=12, color="2C3E50")
+            current_row += 2
+            
+            # Header
+            headers = ['No', 'Nama Anggota', 'Status', 'Jenis Sampah', 'Tanggal Mulai', 'Tanggal Berakhir']
+            for col, header in enumerate(headers, start=1):
+                cell = ws.cell(row=current_row, column=col)
+                cell.value = header
+                cell.font = header_font
+                cell.fill = PatternFill(start_color="3498DB", fill_type="solid")
+                cell.alignment = center_alignment
+            
+            current_row += 1
+            
+            # Data
+            for i, anggota in enumerate(table, start=1):
+                ws.cell(row=current_row, column=1).value = i
+                ws.cell(row=current_row, column=2).value = anggota.get('nama_anggota', '')
+                ws.cell(row=current_row, column=3).value = anggota.get('status', '')
+                ws.cell(row=current_row, column=4).value = anggota.get('jenis_sampah', '')
+                ws.cell(row=current_row, column=5).value = self.format_date_for_report(anggota.get('tanggal_start'))
+                ws.cell(row=current_row, column=6).value = self.format_date_for_report(anggota.get('tanggal_end'))
+                current_row += 1
+        
+        return current_row
+
+    def _create_laporan_sampah_excel(self, ws, data, start_row):
+        info = data.get("info", {})
+        table = data.get("table", [])
+
+        # Title
+        ws.merge_cells(f'A{start_row}:F{start_row}')
+        title_cell = ws[f'A{start_row}']
+        title_cell.value = "SUMMARY LAPORAN SAMPAH"
+        title_cell.font = Font(bold=True, size=12, color="2C3E50")
+        title_cell.alignment = center_alignment
+        
+        current_row = start_row + 2
+        
+        # Summary
+        rows = [
+            ("Total Laporan", info.get("total_laporan", 0)),
+            ("Pending", info.get("pending", 0)),
+            ("Proses", info.get("proses", 0)),
+            ("Selesai", info.get("selesai", 0)),
+        ]
+
+        for i, (label, val) in enumerate(rows, start=current_row):
+            ws[f"A{i}"] = label
+            ws[f"B{i}"] = self._format_number(val)
+            ws[f"A{i}"].font = Font(bold=True)
+        
+        current_row += len(rows) + 2
+
+        # Add average response time if available
+        avg_response_time = info.get("avg_response_time")
+        if avg_response_time is not None:
+            ws[f"A{current_row}"] = "Rata-rata Waktu Respons"
+            ws[f"B{current_row}"] = str(avg_response_time)
+            ws[f"A{current_row}"].font = Font(bold=True)
+            current_row += 2
+
+        # Detail Laporan
+        if table:
+            ws[f"A{current_row}"] = "DETAIL LAPORAN SAMPAH"
+            ws[f"A{current_row}"].font = Font(bold=True, size=12, color="2C3E50")
+            current_row += 2
+            
+            # Header
+            headers = ["No", "Tanggal", "Nama Pelapor", "Alamat", "Status"]
+            for col, header in enumerate(headers, start=1):
+                cell = ws.cell(row=current_row, column=col)
+                cell.value = header
+                cell.font = header_font
+                cell.fill = PatternFill(start_color="E74C3C", fill_type="solid")
+                cell.alignment = center_alignment
+            
+            current_row += 1
+            
+            # Data
+            for i, laporan in enumerate(table, start=1):
+                ws.cell(row=current_row, column=1).value = i
+                ws.cell(row=current_row, column=2).value = self.format_date_for_report(laporan.get('tanggal_lapor'))
+                ws.cell(row=current_row, column=3).value = laporan.get('nama', '')
+                ws.cell(row=current_row, column=4).value = laporan.get('alamat', '')
+                ws.cell(row=current_row, column=5).value = laporan.get('status', '')
+                current_row += 1
+        
+        return current_row
+
+    def _create_jadwal_excel(self, ws, data, start_row):
+        info = data.get("info", {})
+        table = data.get("table", [])
+
+        # Title
+        ws.merge_cells(f'A{start_row}:F{start_row}')
+        title_cell = ws[f'A{start_row}']
+        title_cell.value = "SUMMARY JADWAL PENGANGKUTAN"
+        title_cell.font = Font(bold=True, size=12, color="2C3E50")
+        title_cell.alignment = center_alignment
+        
+        current_row = start_row + 2
+        
+        # Summary
+        rows = [
+            ("Total Jadwal", info.get("total_jadwal", 0)),
+            ("Tim Pengangkut", info.get("total_tim", 0)),
+            ("Anggota Terjadwal", info.get("total_anggota_terjadwal", 0)),
+        ]
+
+        for i, (label, val) in enumerate(rows, start=current_row):
+            ws[f"A{i}"] = label
+            ws[f"B{i}"] = self._format_number(val)
+            ws[f"A{i}"].font = Font(bold=True)
+        
+        current_row += len(rows) + 2
+
+        # Status Stats
+        status_stats = info.get("status_stats", {})
+        if status_stats:
+            ws[f"A{current_row}"] = "STATUS PENGANGKUTAN"
+            ws[f"A{current_row}"].font = Font(bold=True, size=12, color="2C3E50")
+            current_row += 2
+            
+            # Header
+            headers = ["Status", "Jumlah", "Persentase"]
+            for col, header in enumerate(headers, start=1):
+                cell = ws.cell(row=current_row, column=col)
+                cell.value = header
+                cell.font = header_font
+                cell.fill = PatternFill(start_color="9B59B6", fill_type="solid")
+                cell.alignment = center_alignment
+            
+            current_row += 1
+            
+            # Data
+            total = info.get("total_anggota_terjadwal", 1)
+            for status, count in status_stats.items():
+                count_num = self._format_number(count)
+                percentage = (count_num / total * 100) if total else 0
+                
+                ws.cell(row=current_row, column=1).value = str(status)
+                ws.cell(row=current_row, column=2).value = count_num
+                ws.cell(row=current_row, column=3).value = f"{percentage:.1f}%"
+                current_row += 1
+            
+            current_row += 2
+
+        # Detail per Tim
+        if table:
+            ws[f"A{current_row}"] = "DETAIL PER TIM"
+            ws[f"A{current_row}"].font = Font(bold=True, size=12, color="2C3E50")
+            current_row += 2
+            
+            for tim_index, tim_data in enumerate(table, start=1):
+                # Header per tim
+                tim_name = tim_data.get('nama_tim', f'Tim {tim_index}')
+                total_jadwal = self._format_number(tim_data.get('total_jadwal', 0))
+                total_anggota = self._format_number(tim_data.get('total_anggota', 0))
+                
+                ws[f"A{current_row}"] = f"{tim_index}. {tim_name} (Jadwal: {total_jadwal}, Anggota: {total_anggota})"
+                ws[f"A{current_row}"].font = Font(bold=True, color="2C3E50")
+                current_row += 1
+                
+                # Status stats per tim
+                tim_status_stats = tim_data.get('status_stats', {})
+                if tim_status_stats:
+                    # Sub-header
+                    ws[f"B{current_row}"] = "Status"
+                    ws[f"C{current_row}"] = "Jumlah"
+                    ws[f"B{current_row}"].font = Font(bold=True)
+                    ws[f"C{current_row}"].font = Font(bold=True)
+                    current_row += 1
+                    
+                    for status, count in tim_status_stats.items():
+                        ws[f"B{current_row}"] = str(status)
+                        ws[f"C{current_row}"] = self._format_number(count)
+                        current_row += 1
+                
+                # Detail anggota
+                detail_list = tim_data.get('detail', [])
+                if detail_list:
+                    current_row += 1
+                    ws[f"A{current_row}"] = "Detail Anggota:"
+                    ws[f"A{current_row}"].font = Font(bold=True)
+                    current_row += 1
+                    
+                    # Sub-table header
+                    sub_headers = ["No", "Tanggal", "Nama Anggota", "Status"]
+                    for col, header in enumerate(sub_headers, start=1):
+                        cell = ws.cell(row=current_row, column=col)
+                        cell.value = header
+                        cell.font = Font(bold=True, color="FFFFFF")
+                        cell.fill = PatternFill(start_color="34495E", fill_type="solid")
+                        cell.alignment = center_alignment
+                    
+                    current_row += 1
+                    
+                    for i, detail in enumerate(detail_list, start=1):
+                        ws.cell(row=current_row, column=1).value = i
+                        ws.cell(row=current_row, column=2).value = self.format_date_for_report(detail.get('tanggal_jadwal'))
+                        ws.cell(row=current_row, column=3).value = detail.get('nama_anggota', '')
+                        ws.cell(row=current_row, column=4).value = detail.get('status_pengangkutan', '')
+                        current_row += 1
+                
+                current_row += 2  # Spacing antar tim
+        
+        return current_row
+
+    def _create_user_stats_excel(self, ws, data, start_row):
+        info = data.get("info", {})
+        table_data = data.get("table", [])
+
+        # Title
+        ws.merge_cells(f'A{start_row}:F{start_row}')
+        title_cell = ws[f'A{start_row}']
+        title_cell.value = "SUMMARY STATISTIK PENGGUNA"
+        title_cell.font = Font(bold=True, size=12, color="2C3E50")
+        title_cell.alignment = center_alignment
+        
+        current_row = start_row + 2
+        
+        # Summary
+        summary_rows = [
+            ("Keterangan", "Jumlah"),
+            ("Total Pengguna", info.get("total_users", 0)),
+            ("Pengguna Aktif", info.get("active_users", 0)),
+            ("Admin", info.get("admin_count", 0)),
+            ("Anggota", info.get("anggota_count", 0)),
+            ("Tamu", info.get("tamu_count", 0)),
+            ("Tim Pengangkut", info.get("tim_angkut_count", 0)),
+            ("Pengguna Baru Bulan Ini", info.get("new_users_month", 0)),
+        ]
+
+        for i, (label, val) in enumerate(summary_rows, start=current_row):
+            ws[f"A{i}"] = label
+            ws[f"B{i}"] = self._format_number(val) if i > current_row else val
+            ws[f"A{i}"].font = Font(bold=True) if i == current_row else Font()
+        
+        current_row += len(summary_rows) + 2
+
+        # Detail Pengguna
+        if table_data:
+            ws[f"A{current_row}"] = "DETAIL PENGGUNA"
+            ws[f"A{current_row}"].font = Font(bold=True, size=12, color="2C3E50")
+            current_row += 2
+            
+            # Header
+            headers = ["No", "Username", "Email", "Role", "Aktif", "Tanggal Daftar"]
+            for col, header in enumerate(headers, start=1):
+                cell = ws.cell(row=current_row, column=col)
+                cell.value = header
+                cell.font = header_font
+                cell.fill = PatternFill(start_color="2C3E50", fill_type="solid")
+                cell.alignment = center_alignment
+            
+            current_row += 1
+            
+            # Data
+            for i, row in enumerate(table_data, start=1):
+                ws.cell(row=current_row, column=1).value = i
+                ws.cell(row=current_row, column=2).value = row.get("username", "")
+                ws.cell(row=current_row, column=3).value = row.get("email", "")
+                ws.cell(row=current_row, column=4).value = row.get("role", "")
+                ws.cell(row=current_row, column=5).value = "Ya" if row.get("is_active") else "Tidak"
+                ws.cell(row=current_row, column=6).value = self.format_date_for_report(row.get("date_joined"))
+                current_row += 1
+        
+        return current_row
+
+    def _create_monthly_excel(self, ws, data, start_row):
+        # Title
+        ws.merge_cells(f'A{start_row}:F{start_row}')
+        title_cell = ws[f'A{start_row}']
+        title_cell.value = f"LAPORAN BULANAN - {data.get('bulan', '')}"
+        title_cell.font = Font(bold=True, size=12, color="2C3E50")
+        title_cell.alignment = center_alignment
+        
+        current_row = start_row + 2
+        
+        # Header
+        ws[f"A{current_row}"] = "METRIK"
+        ws[f"B{current_row}"] = "NILAI"
+        ws[f"A{current_row}"].font = Font(bold=True, color="FFFFFF")
+        ws[f"B{current_row}"].font = Font(bold=True, color="FFFFFF")
+        ws[f"A{current_row}"].fill = PatternFill(start_color="3498DB", fill_type="solid")
+        ws[f"B{current_row}"].fill = PatternFill(start_color="3498DB", fill_type="solid")
+        ws[f"A{current_row}"].alignment = center_alignment
+        ws[f"B{current_row}"].alignment = center_alignment
+        
+        current_row += 1
+        
+        # Metrics
+        metrics = [
+            ("Pendapatan", data.get('total_pendapatan', 0), "Rp"),
+            ("Transaksi", data.get('total_transaksi', 0), ""),
+            ("Anggota", data.get('total_anggota', 0), ""),
+            ("Anggota Baru", data.get('anggota_baru', 0), ""),
+            ("Jadwal", data.get('total_jadwal', 0), ""),
+            ("Anggota Dilayani", data.get('anggota_dilayani', 0), ""),
+            ("Success Rate", data.get('success_rate', 0), "%"),
+            ("Laporan Sampah", data.get('total_laporan', 0), ""),
+            ("Resolution Rate", data.get('resolution_rate', 0), "%"),
+        ]
+        
+        for label, value, unit in metrics:
+            ws[f"A{current_row}"] = label
+            ws[f"A{current_row}"].font = Font(bold=True)
+            
+            if unit == "Rp":
+                ws[f"B{current_row}"] = self._format_number(value)
+                ws[f"B{current_row}"].number_format = '"Rp"#,##0'
+            elif unit == "%":
+                ws[f"B{current_row}"] = f"{self._format_number(value):.1f}{unit}"
+            else:
+                ws[f"B{current_row}"] = self._format_number(value)
+            
+            current_row += 1
+        
+        current_row += 2
+        
+        # Summary jika ada
+        summary = data.get('summary', {})
+        if summary:
+            ws[f"A{current_row}"] = "ANALISIS PERFORMANCE"
+            ws[f"A{current_row}"].font = Font(bold=True, size=12, color="2C3E50")
+            current_row += 2
+            
+            analysis_metrics = [
+                ("Pendapatan per Anggota", summary.get('pendapatan_per_anggota', 0), "Rp"),
+                ("Laporan per User", summary.get('laporan_per_user', 0), ""),
+                ("Efficiency Rate", summary.get('efficiency_rate', 0), "%"),
+            ]
+            
+            for label, value, unit in analysis_metrics:
+                ws[f"A{current_row}"] = label
+                ws[f"A{current_row}"].font = Font(bold=True)
+                
+                if unit == "Rp":
+                    ws[f"B{current_row}"] = self._format_number(value)
+                    ws[f"B{current_row}"].number_format = '"Rp"#,##0'
+                elif unit == "%":
+                    ws[f"B{current_row}"] = f"{self._format_number(value):.1f}{unit}"
+                else:
+                    ws[f"B{current_row}"] = f"{self._format_number(value):.2f}"
+                
+                current_row += 1
+        
+        return current_row
+
+    def _create_dampak_lingkungan_excel(self, ws, data, start_row):
+        from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+        
+        # Styling
+        header_font = Font(bold=True, color="FFFFFF", size=12)
+        center_alignment = Alignment(horizontal='center', vertical='center')
+        left_alignment = Alignment(horizontal='left', vertical='center', wrap_text=True)
+        border = Border(
+            left=Side(style='thin'),
+            right=Side(style='thin'),
+            top=Side(style='thin'),
+            bottom=Side(style='thin')
+        )
+
+        current_row = start_row
+
+        # ===================== JUDUL LAPORAN =====================
+        ws[f'A{current_row}'] = "LAPORAN ANALISIS DAMPAK LINGKUNGAN"
+        ws[f'A{current_row}'].font = Font(bold=True, size=14, color="2C3E50")
+        ws.merge_cells(f'A{current_row}:E{current_row}')
+        current_row += 2
+
+        # ===================== SUMMARY =====================
+        ws[f'A{current_row}'] = "SUMMARY"
+        ws[f'A{current_row}'].font = Font(bold=True, size=12, color="27AE60")
+        current_row += 2
+
+        summary_data = [
+            ('Total Laporan', data.get('total_laporan', 0)),
+            ('Laporan Selesai', data.get('laporan_selesai', 0)),
+            ('Tingkat Penyelesaian', f"{data.get('tingkat_penyelesaian', 0):.1f}%")
+        ]
+
+        # PERBAIKAN: Tambahkan data dari dampak_lingkungan jika ada
+        if 'dampak_lingkungan' in data:
+            dampak = data['dampak_lingkungan']
+            ringkasan = dampak.get('ringkasan', {})
+            summary_data.append(('Total Analisis', dampak.get('total_analisis', 0)))
+            summary_data.append(('Jenis Berbahaya', ringkasan.get('total_jenis_berbahaya', 0)))
+            summary_data.append(('Total Peringatan', ringkasan.get('total_peringatan', 0)))
+            summary_data.append(('Tingkat Risiko', ringkasan.get('tingkat_risiko', 'aman').capitalize()))
+
+        for label, val in summary_data:
+            ws[f'A{current_row}'] = label
+            ws[f'B{current_row}'] = val
+            ws[f'A{current_row}'].font = Font(bold=True)
+            ws[f'A{current_row}'].alignment = left_alignment
+            ws[f'B{current_row}'].alignment = left_alignment
+            current_row += 1
+
+        current_row += 2
+
+        # ===================== KLASIFIKASI SAMPAH =====================
+        klasifikasi = data.get('klasifikasi_sampah', {})
+        if klasifikasi and 'detail_klasifikasi' in klasifikasi and klasifikasi['detail_klasifikasi']:
+            ws[f'A{current_row}'] = "KLASIFIKASI JENIS SAMPAH"
+            ws[f'A{current_row}'].font = Font(bold=True, size=12, color="3498DB")
+            current_row += 2
+
+            # Header
+            headers = ["Jenis Sampah", "Jumlah", "Persentase", "Status"]
+            for col, header in enumerate(headers, start=1):
+                cell = ws.cell(row=current_row, column=col)
+                cell.value = header
+                cell.font = header_font
+                cell.fill = PatternFill(start_color="3498DB", fill_type="solid")
+                cell.alignment = center_alignment
+                cell.border = border
+            current_row += 1
+
+            # Data
+            for item in klasifikasi['detail_klasifikasi']:
+                jumlah = item.get('jumlah', 0)
+                if jumlah > 0:
+                    ws.cell(row=current_row, column=1).value = str(item.get('jenis', '')).capitalize().replace('_', ' ')
+                    ws.cell(row=current_row, column=2).value = jumlah
+                    ws.cell(row=current_row, column=3).value = f"{item.get('persentase', 0):.1f}%"
+                    ws.cell(row=current_row, column=4).value = item.get('status', 'aman')
+                    
+                    # Warna latar berdasarkan status
+                    status_fill = {
+                        'perhatian': PatternFill(start_color="FFF2CC", fill_type="solid"),
+                        'bahaya': PatternFill(start_color="FFCCCC", fill_type="solid"),
+                        'aman': PatternFill(start_color="D5E8D4", fill_type="solid")
+                    }
+                    ws.cell(row=current_row, column=4).fill = status_fill.get(
+                        item.get('status', 'aman'), 
+                        PatternFill(start_color="FFFFFF", fill_type="solid")
+                    )
+                    
+                    # Border untuk semua cell
+                    for col in range(1, 5):
+                        ws.cell(row=current_row, column=col).border = border
+                        ws.cell(row=current_row, column=col).alignment = center_alignment
+                    
+                    current_row += 1
+
+            # Info total data
+            current_row += 1
+            ws[f'A{current_row}'] = "Informasi Data:"
+            ws[f'B{current_row}'] = f"Total Data Terstruktur: {klasifikasi.get('total_data_terstruktur', 0)}"
+            ws[f'C{current_row}'] = f"({klasifikasi.get('persentase_data_terstruktur', 0):.1f}%)"
+            ws.merge_cells(f'A{current_row}:C{current_row}')
+            current_row += 2
+
+        # ===================== DAMPAK LINGKUNGAN =====================
+        # PERBAIKAN: Gunakan data yang benar
+        dampak = data.get('dampak_lingkungan')
+        if dampak:
+            ws[f'A{current_row}'] = "ANALISIS DAMPAK LINGKUNGAN"
+            ws[f'A{current_row}'].font = Font(bold=True, size=12, color="E74C3C")
+            current_row += 2
+
+            # Ringkasan dampak
+            ringkasan = dampak.get('ringkasan', {})
+            dampak_items = [
+                ('Total Analisis', dampak.get('total_analisis', 0), 'laporan'),
+                ('Jenis Berbahaya', ringkasan.get('total_jenis_berbahaya', 0), 'jenis'),
+                ('Total Peringatan', ringkasan.get('total_peringatan', 0), 'item'),
+                ('Tingkat Risiko', ringkasan.get('tingkat_risiko', 'aman').capitalize(), ''),
+            ]
+
+            # Header
+            headers = ['Parameter', 'Nilai', 'Satuan/Keterangan']
+            for col, header in enumerate(headers, start=1):
+                cell = ws.cell(row=current_row, column=col)
+                cell.value = header
+                cell.font = header_font
+                cell.fill = PatternFill(start_color="E74C3C", fill_type="solid")
+                cell.alignment = center_alignment
+                cell.border = border
+            current_row += 1
+
+            # Data
+            for param, nilai, satuan in dampak_items:
+                ws.cell(row=current_row, column=1).value = param
+                ws.cell(row=current_row, column=2).value = nilai
+                ws.cell(row=current_row, column=3).value = satuan
+                
+                # Border untuk semua cell
+                for col in range(1, 4):
+                    ws.cell(row=current_row, column=col).border = border
+                    ws.cell(row=current_row, column=col).alignment = left_alignment
+                
+                current_row += 1
+
+            current_row += 2
+
+            # ===================== PERINGATAN DAMPAK =====================
+            peringatan = dampak.get('peringatan', [])[:10]  # Ambil 10 teratas
+            if peringatan:
+                ws[f'A{current_row}'] = "PERINGATAN DAMPAK LINGKUNGAN (TOP 10)"
+                ws[f'A{current_row}'].font = Font(bold=True, size=12, color="FF0000")
+                current_row += 2
+
+                headers = ['No', 'Jenis Sampah', 'Level', 'Jumlah', 'Persentase', 'Dampak Utama', 'Rekomendasi']
+                for col, header in enumerate(headers, start=1):
+                    cell = ws.cell(row=current_row, column=col)
+                    cell.value = header
+                    cell.font = header_font
+                    cell.fill = PatternFill(start_color="FF0000", fill_type="solid")
+                    cell.alignment = center_alignment
+                    cell.border = border
+                current_row += 1
+
+                # Warna berdasarkan level
+                level_colors = {
+                    'sangat_tinggi': PatternFill(start_color="FF0000", fill_type="solid"),  # Merah
+                    'tinggi': PatternFill(start_color="FF9900", fill_type="solid"),        # Oranye
+                    'sedang': PatternFill(start_color="FFFF00", fill_type="solid"),        # Kuning
+                    'rendah': PatternFill(start_color="00FF00", fill_type="solid"),        # Hijau
+                    'aman': PatternFill(start_color="CCCCCC", fill_type="solid")           # Abu-abu
+                }
+
+                for i, warning in enumerate(peringatan, start=1):
+                    # Data peringatan
+                    jenis = warning.get('jenis', 'tidak diketahui').capitalize()
+                    level = warning.get('level', 'sedang')
+                    
+                    # Handle dampak (bisa list atau string)
+                    dampak_list = warning.get('dampak', [])
+                    if isinstance(dampak_list, list) and dampak_list:
+                        dampak_text = dampak_list[0] if dampak_list else 'Tidak tersedia'
+                    else:
+                        dampak_text = str(dampak_list)
+                    
+                    rekomendasi = warning.get('rekomendasi', 'Tidak tersedia')
+
+                    # Isi data ke cell
+                    ws.cell(row=current_row, column=1).value = i
+                    ws.cell(row=current_row, column=2).value = jenis
+                    ws.cell(row=current_row, column=3).value = level.capitalize()
+                    ws.cell(row=current_row, column=4).value = warning.get('jumlah', 0)
+                    ws.cell(row=current_row, column=5).value = f"{warning.get('persentase', 0):.1f}%"
+                    ws.cell(row=current_row, column=6).value = dampak_text[:100]
+                    ws.cell(row=current_row, column=7).value = rekomendasi[:150]
+                    
+                    # Warna cell level
+                    ws.cell(row=current_row, column=3).fill = level_colors.get(
+                        level, 
+                        PatternFill(start_color="FFFFFF", fill_type="solid")
+                    )
+                    
+                    # Border dan alignment
+                    for col in range(1, 8):
+                        ws.cell(row=current_row, column=col).border = border
+                        if col in [6, 7]:  # Kolom dengan teks panjang
+                            ws.cell(row=current_row, column=col).alignment = Alignment(
+                                wrap_text=True, 
+                                vertical='top',
+                                horizontal='left'
+                            )
+                        else:
+                            ws.cell(row=current_row, column=col).alignment = center_alignment
+                    
+                    current_row += 1
+
+                # Set column widths
+                ws.column_dimensions['A'].width = 8    # No
+                ws.column_dimensions['B'].width = 20   # Jenis
+                ws.column_dimensions['C'].width = 15   # Level
+                ws.column_dimensions['D'].width = 12   # Jumlah
+                ws.column_dimensions['E'].width = 15   # Persentase
+                ws.column_dimensions['F'].width = 40   # Dampak
+                ws.column_dimensions['G'].width = 50   # Rekomendasi
+
+                current_row += 2
+
+        # ===================== RANKING WILAYAH =====================
+        ranking = data.get('ranking_wilayah', {})
+        if ranking.get('ranking_terkotor'):
+            ws[f'A{current_row}'] = "RANKING WILAYAH - TERKOTOR (TOP 5)"
+            ws[f'A{current_row}'].font = Font(bold=True, size=12, color="9B59B6")
+            current_row += 2
+
+            headers = ['Peringkat', 'Wilayah', 'Total Laporan', 'Selesai', 'Pending', 'Skor Kebersihan', 'Kategori']
+            for col, header in enumerate(headers, start=1):
+                cell = ws.cell(row=current_row, column=col)
+                cell.value = header
+                cell.font = header_font
+                cell.fill = PatternFill(start_color="9B59B6", fill_type="solid")
+                cell.alignment = center_alignment
+                cell.border = border
+            current_row += 1
+
+            for wilayah in ranking['ranking_terkotor'][:5]:
+                ws.cell(row=current_row, column=1).value = wilayah.get('peringkat', 0)
+                ws.cell(row=current_row, column=2).value = wilayah.get('wilayah', '')[:40]
+                ws.cell(row=current_row, column=3).value = wilayah.get('total_laporan', 0)
+                ws.cell(row=current_row, column=4).value = wilayah.get('laporan_selesai', 0)
+                ws.cell(row=current_row, column=5).value = wilayah.get('laporan_pending', 0)
+                ws.cell(row=current_row, column=6).value = wilayah.get('skor_kebersihan', 0)
+                ws.cell(row=current_row, column=7).value = wilayah.get('kategori', '')
+                
+                # Warna berdasarkan kategori
+                kategori_fill = {
+                    'Sangat Kotor': PatternFill(start_color="FF0000", fill_type="solid"),
+                    'Kotor': PatternFill(start_color="FF6600", fill_type="solid"),
+                    'Cukup Bersih': PatternFill(start_color="FFCC00", fill_type="solid"),
+                    'Bersih': PatternFill(start_color="99FF99", fill_type="solid"),
+                    'Sangat Bersih': PatternFill(start_color="00CC00", fill_type="solid")
+                }
+                ws.cell(row=current_row, column=7).fill = kategori_fill.get(
+                    wilayah.get('kategori', ''), 
+                    PatternFill(start_color="FFFFFF", fill_type="solid")
+                )
+                
+                # Border
+                for col in range(1, 8):
+                    ws.cell(row=current_row, column=col).border = border
+                    ws.cell(row=current_row, column=col).alignment = center_alignment
+                
+                current_row += 1
+
+            current_row += 2
+
+        # ===================== REKOMENDASI =====================
+        rekom = data.get('rekomendasi', [])
+        if rekom:
+            ws[f'A{current_row}'] = "REKOMENDASI TINDAKAN"
+            ws[f'A{current_row}'].font = Font(bold=True, size=12, color="F39C12")
+            current_row += 2
+
+            headers = ['No', 'Prioritas', 'Kategori', 'Rekomendasi', 'Alasan', 'Sumber Data']
+            for col, header in enumerate(headers, start=1):
+                cell = ws.cell(row=current_row, column=col)
+                cell.value = header
+                cell.font = header_font
+                cell.fill = PatternFill(start_color="F39C12", fill_type="solid")
+                cell.alignment = center_alignment
+                cell.border = border
+            current_row += 1
+
+            # Warna prioritas
+            prioritas_fill = {
+                'SANGAT_TINGGI': PatternFill(start_color="FF0000", fill_type="solid"),
+                'TINGGI': PatternFill(start_color="FF9900", fill_type="solid"),
+                'SEDANG': PatternFill(start_color="FFFF00", fill_type="solid"),
+                'RENDAH': PatternFill(start_color="00FF00", fill_type="solid")
+            }
+
+            for i, rec in enumerate(rekom, start=1):
+                ws.cell(row=current_row, column=1).value = i
+                prio = rec.get('prioritas', 'SEDANG').upper()
+                ws.cell(row=current_row, column=2).value = prio
+                ws.cell(row=current_row, column=2).fill = prioritas_fill.get(prio, prioritas_fill['SEDANG'])
+                ws.cell(row=current_row, column=3).value = rec.get('kategori', '')
+                ws.cell(row=current_row, column=4).value = rec.get('rekomendasi', '')
+                ws.cell(row=current_row, column=5).value = rec.get('alasan', '')
+                ws.cell(row=current_row, column=6).value = rec.get('sumber_data', '')
+
+                # Wrap text untuk kolom dengan teks panjang
+                ws.cell(row=current_row, column=4).alignment = Alignment(wrap_text=True, vertical='top', horizontal='left')
+                ws.cell(row=current_row, column=5).alignment = Alignment(wrap_text=True, vertical='top', horizontal='left')
+                ws.cell(row=current_row, column=6).alignment = Alignment(wrap_text=True, vertical='top', horizontal='left')
+                
+                # Border untuk semua cell
+                for col in range(1, 7):
+                    ws.cell(row=current_row, column=col).border = border
+                
+                current_row += 1
+
+            # Set column widths
+            ws.column_dimensions['A'].width = 8    # No
+            ws.column_dimensions['B'].width = 15   # Prioritas
+            ws.column_dimensions['C'].width = 20   # Kategori
+            ws.column_dimensions['D'].width = 60   # Rekomendasi
+            ws.column_dimensions['E'].width = 40   # Alasan
+            ws.column_dimensions['F'].width = 20   # Sumber Data
+
+            current_row += 2
+
+        # ===================== INFO PERIODE =====================
+        ws[f'A{current_row}'] = "INFORMASI LAPORAN"
+        ws[f'A{current_row}'].font = Font(bold=True, size=11, color="7F8C8D")
+        current_row += 1
+
+        info_row = current_row
+        
+        # Periode analisis
+        if 'period' in data:
+            period = data['period']
+            if isinstance(period, dict) and 'label' in period:
+                ws[f'A{info_row}'] = f"Periode Analisis: {period['label']}"
+            else:
+                ws[f'A{info_row}'] = f"Periode Analisis: {period}"
+        
+        # Tanggal generate
+        if 'tanggal_generate' in data:
+            info_row += 1
+            try:
+                if isinstance(data['tanggal_generate'], str):
+                    tanggal_str = data['tanggal_generate']
+                else:
+                    tanggal_str = data['tanggal_generate'].strftime('%d %B %Y, %H:%M')
+                ws[f'A{info_row}'] = f"Tanggal Generate: {tanggal_str}"
+            except:
+                ws[f'A{info_row}'] = f"Tanggal Generate: {str(data['tanggal_generate'])}"
+        
+        # Format info rows
+        for row in range(current_row, info_row + 1):
+            ws[f'A{row}'].font = Font(size=10, color="7F8C8D")
+            ws[f'A{row}'].alignment = Alignment(horizontal='left')
+
+        current_row = info_row + 2
+
+        return current_row
@@ -0,0 +1,1233 @@
+# report_renderers/pdf.py
+"""Renderer PDF laporan (reportlab)"""
+import io
+import os
+from datetime import datetime
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.http import HttpResponse
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+from ..utils.thumbnails import ReportImages
+from . import BaseReportRenderer
+
+
+class PdfReportRenderer(BaseReportRenderer):
+
+    def render(self, report, data, filters):
+        """Generate PDF response"""
+        buffer = io.BytesIO()
+        
+        doc = SimpleDocTemplate(
+            buffer,
+            pagesize=A4,
+            rightMargin=30,
+            leftMargin=30,
+            topMargin=30,
+            bottomMargin=30
+        )
+        
+        elements = []
+        styles = getSampleStyleSheet()
+
+        # Gambar dari thumbnail cache; file yang sama di-decode sekali per dokumen
+        self.pdf_images = ReportImages()
+
+        # ===== TAMBAHKAN LOGO DAN INFO PERUSAHAAN DI SINI =====
+        # 1. Add logo (jika ada)
+        logo_path = os.path.join(
+            settings.BASE_DIR,
+            "static",
+            "images",
+            "logo_3d.png"
+        )
+        logo = self.pdf_images.flowable(logo_path, width=150, height=100)
+        if logo is not None:
+            elements.append(logo)
+            elements.append(Spacer(1, 10))
+        
+        # 2. Add company info
+        company_info = Paragraph(
+            "<b>Clean Up</b><br/>"
+            "Berdiri sejak: 15 Februari 2025<br/>"
+            "Alamat: Fatululi<br/>"
+            "Telp: 081626261761 | Email: cleanup@yahoo.com",
+            styles['Normal']
+        )
+        elements.append(company_info)
+        elements.append(Spacer(1, 20))
+
+        
+        # Title
+        title_style = ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=16,
+            textColor=colors.HexColor('#2C3E50'),
+            spaceAfter=12,
+            alignment=1
+        )
+        
+        elements.append(Paragraph(report.title, title_style))
+        
+        # Add date and filters
+        elements.append(Paragraph(f"Dibuat: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}", 
+                                 styles['Normal']))
+        
+        if filters:
+            filter_text = " | ".join([f"{k}: {v}" for k, v in filters.items() if v])
+            elements.append(Paragraph(f"Filter: {filter_text}", styles['Normal']))
+        
+        elements.append(Spacer(1, 20))
+        
+        # Period information from data
+        if 'info' in data and 'period' in data['info']:
+            elements.append(Paragraph(f"Periode: {data['info']['period']}", styles['Normal']))
+            elements.append(Spacer(1, 10))
+        
+        # Add data based on report type
+        create = self.layout_method(report, 'pdf')
+        if create is None:
+            elements.extend(self._create_table_pdf(data))
+        elif report.name == 'laporan-sampah':
+            include_foto = str((filters or {}).get('include_foto', '')).lower() in ('1', 'true', 'yes')
+            elements.extend(create(data, include_foto=include_foto))
+        else:
+            elements.extend(create(data))
+        
+        # Build PDF
+        doc.build(elements)
+        
+        # Get PDF value
+        pdf = buffer.getvalue()
+        buffer.close()
+        
+        # Create response
+        response = HttpResponse(content_type='application/pdf')
+        filename = self.filename(report, 'pdf')
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        response.write(pdf)
+        
+        return response
+
+    def _create_table_pdf(self, data):
+        """Tabel generik dari data['table'] untuk report tanpa layout khusus"""
+        columns, rows = self.table_rows(data)
+        if not columns:
+            return [Paragraph("Tidak ada data", getSampleStyleSheet()['Normal'])]
+
+        table = Table(
+            [columns] + [[str(value) if value is not None else '-' for value in row] for row in rows],
+            repeatRows=1,
+        )
+        table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3498DB')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('FONTSIZE', (0, 0), (-1, -1), 8),
+        ]))
+        return [table]
+
+    def _create_keuangan_pdf(self, data):
+        elements = []
+        styles = getSampleStyleSheet()
+
+        info = data.get("info", {})
+        transaksi_list = data.get("table", [])  # ✅ LIST TRANSAKSI
+
+        # =====================
+        # TITLE
+        # =====================
+        elements.append(Paragraph("SUMMARY KEUANGAN", styles['Heading2']))
+        elements.append(Spacer(1, 12))
+
+        # =====================
+        # SUMMARY
+        # =====================
+        summary_data = [
+            ['Total Pendapatan', f"Rp {self._format_number(info.get('total_pendapatan', 0)):,.0f}"],
+            ['Transaksi Pending', str(self._format_number(info.get('total_pending', 0)))],
+            ['Transaksi Lunas', str(self._format_number(info.get('total_lunas', 0)))],
+            ['Transaksi Gagal', str(self._format_number(info.get('total_gagal', 0)))]
+        ]
+
+        summary_table = Table(summary_data, colWidths=[200, 200])
+        summary_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3498DB')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ]))
+
+        elements.append(summary_table)
+        elements.append(Spacer(1, 20))
+
+        # =====================
+        # METODE BAYAR STATS
+        # =====================
+        metode_stats = info.get("metode_bayar_stats", {})
+        if metode_stats:
+            elements.append(Paragraph("Statistik Metode Pembayaran", styles["Heading3"]))
+            elements.append(Spacer(1, 10))
+
+            stats_rows = [['Metode', 'Jumlah Transaksi', 'Total (Rp)']]
+            for metode, stats in metode_stats.items():
+                count = stats.get("count", 0) if isinstance(stats, dict) else 0
+                total = stats.get("total", 0) if isinstance(stats, dict) else 0
+
+                stats_rows.append([
+                    str(metode),
+                    str(self._format_number(count)),
+                    f"Rp {self._format_number(total):,.0f}"
+                ])
+
+            stats_table = Table(stats_rows, colWidths=[150, 120, 150])
+            stats_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2ECC71')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+                ('GRID', (0, 0), (-1, -1), 1, colors.black),
+                ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ]))
+
+            elements.append(stats_table)
+            elements.append(Spacer(1, 20))
+
+        # =====================
+        # DETAIL TRANSAKSI
+        # =====================
+        if transaksi_list:
+            elements.append(Paragraph("Detail Transaksi", styles["Heading3"]))
+            elements.append(Spacer(1, 10))
+
+            detail_rows = [
+                ['No', 'Tanggal', 'Nama Anggota', 'Metode', 'Status', 'Jumlah (Rp)']
+            ]
+
+            for i, transaksi in enumerate(transaksi_list, start=1):
+                detail_rows.append([
+                    i,
+                    self.format_date_for_report(transaksi.get('tanggal_bayar')),
+                    transaksi.get('nama_anggota', '')[:20],
+                    transaksi.get('metode_bayar', ''),
+                    transaksi.get('status_bayar', ''),
+                    f"Rp {self._format_number(transaksi.get('jumlah_bayar', 0)):,.0f}"
+                ])
+
+            detail_table = Table(detail_rows, colWidths=[30, 65, 90, 65, 55, 90])
+            detail_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2C3E50')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+                ('FONTSIZE', (0, 0), (-1, -1), 8),
+                ('ROWBACKGROUNDS', (0, 1), (-1, -1),
+                [colors.white, colors.HexColor('#F8F9FA')])
+            ]))
+
+            elements.append(detail_table)
+            # ===== TANDA TANGAN =====
+            elements.append(Spacer(1, 40))
+            
+            # Buat style khusus untuk nama yang bold
+            bold_style = ParagraphStyle(
+                'BoldStyle',
+                parent=styles['Normal'],
+                fontName='Helvetica-Bold',
+                fontSize=12,
+                spaceAfter=6,
+                alignment=1  # Center alignment
+            )
+            
+            normal_style = ParagraphStyle(
+                'NormalStyle',
+                parent=styles['Normal'],
+                fontSize=12,
+                spaceAfter=6,
+                alignment=1  # Center alignment
+            )
+            
+            # Tanda tangan dengan Table
+            tanda_tangan_data = [
+                ['', Paragraph('Hormat kami,', normal_style)],
+                ['', ''],  # Baris kosong
+                ['', ''],  # Baris kosong
+                ['', ''],  # Baris kosong
+                ['', Paragraph('<b>Julius Yohanes Belo</b>', bold_style)],  # Nama dengan bold
+                ['', Paragraph('Direktur Utama', normal_style)]
+            ]
+            
+            tanda_tangan = Table(tanda_tangan_data, colWidths=[300, 200])
+            
+            tanda_tangan.setStyle(TableStyle([
+                ('ALIGN', (1, 4), (1, 7), 'CENTER'),  # Kolom 2, baris 4-7 center
+                ('VALIGN', (1, 4), (1, 7), 'MIDDLE'),
+                # Add border untuk garis tanda tangan
+                ('LINEABOVE', (1, 1), (1, 3), 1, colors.black),
+            ]))
+            
+            elements.append(tanda_tangan)
+
+        return elements
+
+    def _create_anggota_pdf(self, data):
+        elements = []
+        styles = getSampleStyleSheet()
+
+        info = data.get('info', {})
+        anggota_list = data.get('table', [])  # ✅ LIST DATA
+
+        # =====================
+        # TITLE
+        # =====================
+        elements.append(Paragraph("SUMMARY ANGGOTA", styles['Heading2']))
+        elements.append(Spacer(1, 10))
+
+        # =====================
+        # SUMMARY
+        # =====================
+        summary_data = [
+            ['Total Anggota', self._format_number(info.get('total_anggota', 0))],
+            ['Aktif', self._format_number(info.get('aktif', 0))],
+            ['Non Aktif', self._format_number(info.get('non_aktif', 0))],
+            ['Akan Expired', self._format_number(info.get('akan_expired', 0))],
+            ['Baru Bulan Ini', self._format_number(info.get('baru_bulan_ini', 0))],
+        ]
+
+        summary_table = Table(summary_data, colWidths=[200, 200])
+        summary_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#9B59B6')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ]))
+
+        elements.append(summary_table)
+        elements.append(Spacer(1, 20))
+
+        # =====================
+        # JENIS SAMPAH STATS
+        # =====================
+        jenis_stats = info.get("jenis_sampah_stats", {})
+        total_anggota = info.get('total_anggota', 1) or 1
+
+        if jenis_stats:
+            elements.append(Paragraph("Distribusi Jenis Sampah", styles["Heading3"]))
+            elements.append(Spacer(1, 10))
+
+            rows = [['Jenis Sampah', 'Jumlah', 'Persentase']]
+            for jenis, count in jenis_stats.items():
+                count_int = int(count or 0)
+                percentage = (count_int / total_anggota * 100)
+
+                rows.append([
+                    str(jenis)[:20],
+                    count_int,
+                    f"{percentage:.1f}%"
+                ])
+
+            stats_table = Table(rows, colWidths=[150, 100, 100])
+            stats_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#E67E22')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+                ('GRID', (0, 0), (-1, -1), 1, colors.black),
+                ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ]))
+
+            elements.append(stats_table)
+            elements.append(Spacer(1, 20))
+
+        # =====================
+        # DETAIL ANGGOTA
+        # =====================
+        if anggota_list:
+            elements.append(Paragraph("Detail Anggota", styles["Heading3"]))
+            elements.append(Spacer(1, 10))
+
+            detail_rows = [['No', 'Nama', 'Status', 'Jenis Sampah', 'Mulai', 'Berakhir']]
+            for i, anggota in enumerate(anggota_list, start=1):
+                detail_rows.append([
+                    i,
+                    anggota.get('nama_anggota', '')[:15],
+                    anggota.get('status', ''),
+                    anggota.get('jenis_sampah', '')[:10],
+                    self.format_date_for_report(anggota.get('tanggal_start')),
+                    self.format_date_for_report(anggota.get('tanggal_end'))
+                ])
+
+            detail_table = Table(detail_rows, colWidths=[30, 80, 50, 60, 60, 60])
+            detail_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495E')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+                ('FONTSIZE', (0, 0), (-1, -1), 8),
+                ('ROWBACKGROUNDS', (0, 1), (-1, -1),
+                [colors.white, colors.HexColor('#F8F9FA')])
+            ]))
+
+            elements.append(detail_table)
+            # ===== TANDA TANGAN =====
+            elements.append(Spacer(1, 40))
+            
+            # Buat style khusus untuk nama yang bold
+            bold_style = ParagraphStyle(
+                'BoldStyle',
+                parent=styles['Normal'],
+                fontName='Helvetica-Bold',
+                fontSize=12,
+                spaceAfter=6,
+                alignment=1  # Center alignment
+            )
+            
+            normal_style = ParagraphStyle(
+                'NormalStyle',
+                parent=styles['Normal'],
+                fontSize=12,
+                spaceAfter=6,
+                alignment=1  # Center alignment
+            )
+            
+            # Tanda tangan dengan Table
+            tanda_tangan_data = [
+                ['', Paragraph('Hormat kami,', normal_style)],
+                ['', ''],  # Baris kosong
+                ['', ''],  # Baris kosong
+                ['', ''],  # Baris kosong
+                ['', Paragraph('<b>Julius Yohanes Belo</b>', bold_style)],  # Nama dengan bold
+                ['', Paragraph('Direktur Utama', normal_style)]
+            ]
+            
+            tanda_tangan = Table(tanda_tangan_data, colWidths=[300, 200])
+            
+            tanda_tangan.setStyle(TableStyle([
+                ('ALIGN', (1, 4), (1, 7), 'CENTER'),  # Kolom 2, baris 4-7 center
+                ('VALIGN', (1, 4), (1, 7), 'MIDDLE'),
+                # Add border untuk garis tanda tangan
+                ('LINEABOVE', (1, 1), (1, 3), 1, colors.black),
+            ]))
+            
+            elements.append(tanda_tangan)
+            
+        return elements
+
+    def _create_laporan_sampah_pdf(self, data, include_foto=False):
+        elements = []
+        styles = getSampleStyleSheet()
+
+        info = data.get("info", {})
+        table = data.get("table", [])
+
+        # Title
+        elements.append(Paragraph("SUMMARY LAPORAN SAMPAH", styles['Heading2']))
+        elements.append(Spacer(1, 10))
+
+        # Summary data
+        total = self._format_number(info.get('total_laporan', 0))
+        pending = self._format_number(info.get('pending', 0))
+        proses = self._format_number(info.get('proses', 0))
+        selesai = self._format_number(info.get('selesai', 0))
+
+        summary_data = [
+            ['Total Laporan', total],
+            ['Pending', pending],
+            ['Proses', proses],
+            ['Selesai', selesai],
+        ]
+
+        # Add average response time if available
+        avg_response_time = info.get("avg_response_time")
+        if avg_response_time is not None:
+            try:
+                avg_text = f"{float(avg_response_time):.1f} hari"
+                summary_data.append(['Rata-rata Waktu Respons', avg_text])
+            except:
+                summary_data.append(['Rata-rata Waktu Respons', str(avg_response_time)])
+
+        summary_table = Table(summary_data, colWidths=[200, 200])
+        summary_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#E74C3C')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ]))
+
+        elements.append(summary_table)
+        elements.append(Spacer(1, 20))
+
+        # Detail laporan
+        if table:
+            elements.append(Paragraph("Detail Laporan Sampah", styles["Heading3"]))
+            elements.append(Spacer(1, 10))
+
+            table_data = [['No', 'Tanggal', 'Nama Pelapor', 'Alamat', 'Status']]
+            col_widths = [30, 60, 70, 100, 40]
+            if include_foto:
+                table_data[0].append('Foto')
+                col_widths.append(50)
+
+            for i, laporan in enumerate(table, start=1):
+                row = [
+                    str(i),
+                    self.format_date_for_report(laporan.get('tanggal_lapor')),
+                    laporan.get('nama_pelapor', '')[:15],  # Limit nama
+                    laporan.get('alamat', '')[:20],  # Limit alamat
+                    laporan.get('status', '')
+                ]
+                if include_foto:
+                    row.append(self._foto_thumbnail(laporan.get('foto_bukti')) or '-')
+                table_data.append(row)
+
+            detail_table = Table(table_data, colWidths=col_widths)
+            detail_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2C3E50')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+                ('FONTSIZE', (0, 0), (-1, -1), 8),
+                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F8F9FA')])
+            ]))
+
+            elements.append(detail_table)
+            # ===== TANDA TANGAN =====
+            elements.append(Spacer(1, 40))
+            
+            # Buat style khusus untuk nama yang bold
+            bold_style = ParagraphStyle(
+                'BoldStyle',
+                parent=styles['Normal'],
+                fontName='Helvetica-Bold',
+                fontSize=12,
+                spaceAfter=6,
+                alignment=1  # Center alignment
+            )
+            
+            normal_style = ParagraphStyle(
+                'NormalStyle',
+                parent=styles['Normal'],
+                fontSize=12,
+                spaceAfter=6,
+                alignment=1  # Center alignment
+            )
+            
+            # Tanda tangan dengan Table
+            tanda_tangan_data = [
+                ['', Paragraph('Hormat kami,', normal_style)],
+                ['', ''],  # Baris kosong
+                ['', ''],  # Baris kosong
+                ['', ''],  # Baris kosong
+                ['', Paragraph('<b>Julius Yohanes Belo</b>', bold_style)],  # Nama dengan bold
+                ['', Paragraph('Direktur Utama', normal_style)]
+            ]
+            
+            tanda_tangan = Table(tanda_tangan_data, colWidths=[300, 200])
+            
+            tanda_tangan.setStyle(TableStyle([
+                ('ALIGN', (1, 4), (1, 7), 'CENTER'),  # Kolom 2, baris 4-7 center
+                ('VALIGN', (1, 4), (1, 7), 'MIDDLE'),
+                # Add border untuk garis tanda tangan
+                ('LINEABOVE', (1, 1), (1, 3), 1, colors.black),
+            ]))
+            
+            elements.append(tanda_tangan)
+
+        return elements
+
+    def _create_jadwal_pdf(self, data):
+        elements = []
+        styles = getSampleStyleSheet()
+
+        info = data.get("info", {})
+        tim_list = data.get("table", [])  # ✅ LIST DATA PER TIM
+
+        # =====================
+        # TITLE
+        # =====================
+        elements.append(Paragraph("SUMMARY JADWAL PENGANGKUTAN", styles['Heading2']))
+        elements.append(Spacer(1, 10))
+
+        # =====================
+        # SUMMARY
+        # =====================
+        summary_data = [
+            ['Total Jadwal', self._format_number(info.get('total_jadwal', 0))],
+            ['Tim Pengangkut', self._format_number(info.get('total_tim', 0))],
+            ['Anggota Terjadwal', self._format_number(info.get('total_anggota_terjadwal', 0))]
+        ]
+
+        summary_table = Table(summary_data, colWidths=[200, 200])
+        summary_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1ABC9C')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ]))
+
+        elements.append(summary_table)
+        elements.append(Spacer(1, 20))
+
+        # =====================
+        # STATUS STATS
+        # =====================
+        status_stats = info.get("status_stats", {})
+        total_anggota = int(info.get("total_anggota_terjadwal", 1) or 1)
+
+        if status_stats:
+            elements.append(Paragraph("Status Pengangkutan", styles["Heading3"]))
+            elements.append(Spacer(1, 10))
+
+            rows = [['Status', 'Jumlah', 'Persentase']]
+            for status, count in status_stats.items():
+                count_int = int(count or 0)
+                percent = (count_int / total_anggota) * 100
+
+                rows.append([
+                    str(status),
+                    count_int,
+                    f"{percent:.1f}%"
+                ])
+
+            status_table = Table(rows, colWidths=[150, 100, 100])
+            status_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3498DB')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+                ('GRID', (0, 0), (-1, -1), 1, colors.black),
+                ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ]))
+
+            elements.append(status_table)
+            elements.append(Spacer(1, 20))
+
+        # =====================
+        # DETAIL PER TIM
+        # =====================
+        if tim_list:
+            elements.append(Paragraph("Detail per Tim", styles["Heading3"]))
+            elements.append(Spacer(1, 10))
+
+            for tim_index, tim_data in enumerate(tim_list, start=1):
+                tim_name = tim_data.get('nama_tim', f'Tim {tim_index}')
+                total_jadwal = self._format_number(tim_data.get('total_jadwal', 0))
+                total_anggota_tim = self._format_number(tim_data.get('total_anggota', 0))
+
+                elements.append(Paragraph(
+                    f"{tim_index}. {tim_name} (Jadwal: {total_jadwal}, Anggota: {total_anggota_tim})",
+                    styles["Heading4"]
+                ))
+
+                # Status per tim
+                tim_status_stats = tim_data.get('status_stats', {})
+                if tim_status_stats:
+                    status_rows = [['Status', 'Jumlah']]
+                    for status, count in tim_status_stats.items():
+                        status_rows.append([status, int(count or 0)])
+
+                    tim_status_table = Table(status_rows, colWidths=[100, 80])
+                    tim_status_table.setStyle(TableStyle([
+                        ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+                        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+                        ('FONTSIZE', (0, 0), (-1, -1), 8),
+                    ]))
+                    elements.append(tim_status_table)
+
+                # Detail anggota
+                detail_list = tim_data.get('detail', [])
+                if detail_list:
+                    detail_rows = [['No', 'Tanggal', 'Nama Anggota', 'Status']]
+                    for i, detail in enumerate(detail_list[:5], start=1):
+                        detail_rows.append([
+                            i,
+                            self.format_date_for_report(detail.get('tanggal_jadwal')),
+                            detail.get('nama_anggota', '')[:15],
+                            detail.get('status_pengangkutan', '')
+                        ])
+
+                    detail_table = Table(detail_rows, colWidths=[25, 60, 80, 60])
+                    detail_table.setStyle(TableStyle([
+                        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+                        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+                        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+                        ('FONTSIZE', (0, 0), (-1, -1), 8),
+                    ]))
+                    elements.append(detail_table)
+
+                if len(detail_list) > 5:
+                    elements.append(
+                        Paragraph(f"... dan {len(detail_list) - 5} anggota lainnya", styles['Italic'])
+                    )
+
+                elements.append(Spacer(1, 12))
+                # ===== TANDA TANGAN =====
+                elements.append(Spacer(1, 40))
+                
+                # Buat style khusus untuk nama yang bold
+                bold_style = ParagraphStyle(
+                    'BoldStyle',
+                    parent=styles['Normal'],
+                    fontName='Helvetica-Bold',
+                    fontSize=12,
+                    spaceAfter=6,
+                    alignment=1  # Center alignment
+                )
+                
+                normal_style = ParagraphStyle(
+                    'NormalStyle',
+                    parent=styles['Normal'],
+                    fontSize=12,
+                    spaceAfter=6,
+                    alignment=1  # Center alignment
+                )
+                
+                # Tanda tangan dengan Table
+                tanda_tangan_data = [
+                    ['', Paragraph('Hormat kami,', normal_style)],
+                    ['', ''],  # Baris kosong
+                    ['', ''],  # Baris kosong
+                    ['', ''],  # Baris kosong
+                    ['', Paragraph('<b>Julius Yohanes Belo</b>', bold_style)],  # Nama dengan bold
+                    ['', Paragraph('Direktur Utama', normal_style)]
+                ]
+                
+                tanda_tangan = Table(tanda_tangan_data, colWidths=[300, 200])
+                
+                tanda_tangan.setStyle(TableStyle([
+                    ('ALIGN', (1, 4), (1, 7), 'CENTER'),  # Kolom 2, baris 4-7 center
+                    ('VALIGN', (1, 4), (1, 7), 'MIDDLE'),
+                    # Add border untuk garis tanda tangan
+                    ('LINEABOVE', (1, 1), (1, 3), 1, colors.black),
+                ]))
+                
+                elements.append(tanda_tangan)
+        return elements
+
+    def _create_user_stats_pdf(self, data):
+        elements = []
+        styles = getSampleStyleSheet()
+
+        info = data.get("info", {})
+        table = data.get("table", [])
+
+        # Title
+        elements.append(Paragraph("SUMMARY STATISTIK PENGGUNA", styles['Heading2']))
+        elements.append(Spacer(1, 10))
+
+        # Summary data
+        total_users = self._format_number(info.get('total_users', 0))
+        active_users = self._format_number(info.get('active_users', 0))
+        admin_count = self._format_number(info.get('admin_count', 0))
+        anggota_count = self._format_number(info.get('anggota_count', 0))
+        tamu_count = self._format_number(info.get('tamu_count', 0))
+        tim_angkut_count = self._format_number(info.get('tim_angkut_count', 0))
+        new_users_month = self._format_number(info.get('new_users_month', 0))
+
+        summary_data = [
+            ['Total Pengguna', total_users],
+            ['Pengguna Aktif', f"{active_users} ({active_users/total_users*100:.1f}%)" if total_users else "0"],
+            ['Admin', admin_count],
+            ['Anggota', anggota_count],
+            ['Tamu', tamu_count],
+            ['Tim Pengangkut', tim_angkut_count],
+            ['Pengguna Baru Bulan Ini', new_users_month]
+        ]
+
+        summary_table = Table(summary_data, colWidths=[200, 200])
+        summary_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#F39C12')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ]))
+
+        elements.append(summary_table)
+        elements.append(Spacer(1, 20))
+
+        # Detail pengguna
+        if table:
+            elements.append(Paragraph("Detail Pengguna", styles["Heading3"]))
+            elements.append(Spacer(1, 10))
+
+            table_data = [['No', 'Username', 'Email', 'Role', 'Aktif', 'Tanggal Daftar']]
+            for i, user in enumerate(table, start=1):
+                table_data.append([
+                    str(i),
+                    user.get('username', '')[:15],  # Limit username
+                    user.get('email', '')[:20],  # Limit email
+                    user.get('role', ''),
+                    'Ya' if user.get('is_active') else 'Tidak',
+                    self.format_date_for_report(user.get('date_joined'))
+                ])
+
+            detail_table = Table(table_data, colWidths=[25, 60, 80, 50, 40, 60])
+            detail_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2C3E50')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+                ('FONTSIZE', (0, 0), (-1, -1), 8),
+                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F8F9FA')])
+            ]))
+
+            elements.append(detail_table)
+            # ===== TANDA TANGAN =====
+            elements.append(Spacer(1, 40))
+            
+            # Buat style khusus untuk nama yang bold
+            bold_style = ParagraphStyle(
+                'BoldStyle',
+                parent=styles['Normal'],
+                fontName='Helvetica-Bold',
+                fontSize=12,
+                spaceAfter=6,
+                alignment=1  # Center alignment
+            )
+            
+            normal_style = ParagraphStyle(
+                'NormalStyle',
+                parent=styles['Normal'],
+                fontSize=12,
+                spaceAfter=6,
+                alignment=1  # Center alignment
+            )
+            
+            # Tanda tangan dengan Table
+            tanda_tangan_data = [
+                ['', Paragraph('Hormat kami,', normal_style)],
+                ['', ''],  # Baris kosong
+                ['', ''],  # Baris kosong
+                ['', ''],  # Baris kosong
+                ['', Paragraph('<b>Julius Yohanes Belo</b>', bold_style)],  # Nama dengan bold
+                ['', Paragraph('Direktur Utama', normal_style)]
+            ]
+            
+            tanda_tangan = Table(tanda_tangan_data, colWidths=[300, 200])
+            
+            tanda_tangan.setStyle(TableStyle([
+                ('ALIGN', (1, 4), (1, 7), 'CENTER'),  # Kolom 2, baris 4-7 center
+                ('VALIGN', (1, 4), (1, 7), 'MIDDLE'),
+                # Add border untuk garis tanda tangan
+                ('LINEABOVE', (1, 1), (1, 3), 1, colors.black),
+            ]))
+            
+            elements.append(tanda_tangan)
+
+        return elements
+
+    def _create_monthly_pdf(self, data):
+        """Create PDF content for monthly report"""
+        elements = []
+        styles = getSampleStyleSheet()
+        
+        # Title
+        elements.append(Paragraph(data.get('bulan', 'Laporan Bulanan'), styles['Heading2']))
+        elements.append(Spacer(1, 10))
+        
+        # Metrics
+        metrics_data = [
+            ['Metrik', 'Nilai'],
+            ['Pendapatan', f"Rp {self._format_number(data.get('total_pendapatan', 0)):,.0f}"],
+            ['Transaksi', str(self._format_number(data.get('total_transaksi', 0)))],
+            ['Anggota', str(self._format_number(data.get('total_anggota', 0)))],
+            ['Anggota Baru', str(self._format_number(data.get('anggota_baru', 0)))],
+            ['Jadwal', str(self._format_number(data.get('total_jadwal', 0)))],
+            ['Anggota Dilayani', str(self._format_number(data.get('anggota_dilayani', 0)))],
+            ['Success Rate', f"{self._format_number(data.get('success_rate', 0)):.1f}%"],
+            ['Laporan Sampah', str(self._format_number(data.get('total_laporan', 0)))],
+            ['Resolution Rate', f"{self._format_number(data.get('resolution_rate', 0)):.1f}%"]
+        ]
+        
+        metrics_table = Table(metrics_data, colWidths=[200, 200])
+        metrics_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2C3E50')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F8F9FA')])
+        ]))
+        
+        elements.append(metrics_table)
+        elements.append(Spacer(1, 20))
+        
+        # Summary jika ada
+        summary = data.get('summary', {})
+        if summary:
+            elements.append(Paragraph("Analisis Performance", styles["Heading3"]))
+            elements.append(Spacer(1, 10))
+            
+            analysis_data = [
+                ['Pendapatan per Anggota', f"Rp {self._format_number(summary.get('pendapatan_per_anggota', 0)):,.0f}"],
+                ['Laporan per User', f"{self._format_number(summary.get('laporan_per_user', 0)):.2f}"],
+                ['Efficiency Rate', f"{self._format_number(summary.get('efficiency_rate', 0)):.1f}%"]
+            ]
+            
+            analysis_table = Table(analysis_data, colWidths=[200, 200])
+            analysis_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#27AE60')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+                ('FONTSIZE', (0, 0), (-1, -1), 10),
+                ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ]))
+            
+            elements.append(analysis_table)
+            # ===== TANDA TANGAN =====
+            elements.append(Spacer(1, 40))
+            
+            # Buat style khusus untuk nama yang bold
+            bold_style = ParagraphStyle(
+                'BoldStyle',
+                parent=styles['Normal'],
+                fontName='Helvetica-Bold',
+                fontSize=12,
+                spaceAfter=6,
+                alignment=1  # Center alignment
+            )
+            
+            normal_style = ParagraphStyle(
+                'NormalStyle',
+                parent=styles['Normal'],
+                fontSize=12,
+                spaceAfter=6,
+                alignment=1  # Center alignment
+            )
+            
+            # Tanda tangan dengan Table
+            tanda_tangan_data = [
+                ['', Paragraph('Hormat kami,', normal_style)],
+                ['', ''],  # Baris kosong
+                ['', ''],  # Baris kosong
+                ['', ''],  # Baris kosong
+                ['', Paragraph('<b>Julius Yohanes Belo</b>', bold_style)],  # Nama dengan bold
+                ['', Paragraph('Direktur Utama', normal_style)]
+            ]
+            
+            tanda_tangan = Table(tanda_tangan_data, colWidths=[300, 200])
+            
+            tanda_tangan.setStyle(TableStyle([
+                ('ALIGN', (1, 4), (1, 7), 'CENTER'),  # Kolom 2, baris 4-7 center
+                ('VALIGN', (1, 4), (1, 7), 'MIDDLE'),
+                # Add border untuk garis tanda tangan
+                ('LINEABOVE', (1, 1), (1, 3), 1, colors.black),
+            ]))
+            
+            elements.append(tanda_tangan)
+        
+        return elements
+
+    def _create_dampak_lingkungan_pdf(self, data):
+        """Create PDF content for dampak lingkungan report"""
+        elements = []
+        styles = getSampleStyleSheet()
+        
+        # Judul Laporan
+        elements.append(Paragraph('LAPORAN ANALISIS DAMPAK LINGKUNGAN', styles['Title']))
+        elements.append(Spacer(1, 20))
+        
+        # PERBAIKAN: Summary - menggunakan data yang benar
+        summary_data = [
+            ['Total Laporan', str(data.get('total_laporan', 0))],
+            ['Laporan Selesai', str(data.get('laporan_selesai', 0))],
+            ['Tingkat Penyelesaian', f"{data.get('tingkat_penyelesaian', 0):.1f}%"]
+        ]
+        
+        # PERBAIKAN: Akses data dampak_lingkungan yang benar
+        if 'dampak_lingkungan' in data:
+            dampak = data['dampak_lingkungan']
+            ringkasan = dampak.get('ringkasan', {})
+            
+            # Tambahkan data dari ringkasan dampak lingkungan
+            summary_data.append(['Jenis Berbahaya', str(ringkasan.get('total_jenis_berbahaya', 0))])
+            summary_data.append(['Total Peringatan', str(ringkasan.get('total_peringatan', 0))])
+            summary_data.append(['Tingkat Risiko', str(ringkasan.get('tingkat_risiko', 'aman')).capitalize()])
+        
+        summary_table = Table(summary_data, colWidths=[200, 150])
+        summary_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#27AE60')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#ECF0F1')),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black)
+        ]))
+        
+        elements.append(summary_table)
+        elements.append(Spacer(1, 20))
+        
+        # PERBAIKAN: Klasifikasi sampah - format data yang benar
+        if 'klasifikasi_sampah' in data and data['klasifikasi_sampah']:
+            klasifikasi = data['klasifikasi_sampah']
+            elements.append(Paragraph('Klasifikasi Jenis Sampah', styles['Heading2']))
+            
+            if 'detail_klasifikasi' in klasifikasi and klasifikasi['detail_klasifikasi']:
+                ks_data = [['Jenis Sampah', 'Jumlah Laporan', 'Persentase']]
+                
+                for item in klasifikasi['detail_klasifikasi']:
+                    if item.get('jumlah', 0) > 0:
+                        ks_data.append([
+                            str(item.get('jenis', 'tidak diketahui')).capitalize().replace('_', ' '),
+                            str(item.get('jumlah', 0)),
+                            f"{item.get('persentase', 0):.1f}%"
+                        ])
+                
+                if len(ks_data) > 1:  # Ada data selain header
+                    ks_table = Table(ks_data, colWidths=[150, 100, 100])
+                    ks_table.setStyle(TableStyle([
+                        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3498DB')),
+                        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+                        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+                        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+                    ]))
+                    
+                    elements.append(ks_table)
+                    elements.append(Spacer(1, 10))
+                    
+                    # Info total data
+                    elements.append(Paragraph(
+                        f"Total data terstruktur: {klasifikasi.get('total_data_terstruktur', 0)} "
+                        f"({klasifikasi.get('persentase_data_terstruktur', 0):.1f}%)",
+                        styles['Italic']
+                    ))
+            
+            elements.append(Spacer(1, 20))
+        
+        # PERBAIKAN: Analisis dampak lingkungan
+        if 'dampak_lingkungan' in data:
+            dampak = data['dampak_lingkungan']
+            elements.append(Paragraph('Analisis Dampak Lingkungan', styles['Heading2']))
+            
+            # Ringkasan dampak
+            ringkasan = dampak.get('ringkasan', {})
+            de_data = [
+                ['Parameter', 'Nilai'],
+                ['Total Analisis', str(dampak.get('total_analisis', 0))],
+                ['Jenis Berbahaya', str(ringkasan.get('total_jenis_berbahaya', 0))],
+                ['Total Peringatan', str(ringkasan.get('total_peringatan', 0))],
+                ['Tingkat Risiko', str(ringkasan.get('tingkat_risiko', 'aman')).capitalize()]
+            ]
+            
+            de_table = Table(de_data, colWidths=[200, 150])
+            de_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#E74C3C')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+                ('GRID', (0, 0), (-1, -1), 1, colors.black),
+                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F8F9FA')])
+            ]))
+            
+            elements.append(de_table)
+            elements.append(Spacer(1, 20))
+            
+            # PERBAIKAN: Peringatan dampak lingkungan
+            if 'peringatan' in dampak and dampak['peringatan']:
+                elements.append(Paragraph('Peringatan Dampak Lingkungan', styles['Heading3']))
+                
+                for i, warning in enumerate(dampak['peringatan'][:5], start=1):
+                    # Warna berdasarkan level peringatan
+                    warna_peringatan = {
+                        'sangat_tinggi': '#E74C3C',
+                        'tinggi': '#E67E22',
+                        'sedang': '#F1C40F',
+                        'rendah': '#2ECC71',
+                        'aman': '#27AE60'
+                    }
+                    
+                    level = warning.get('level', 'sedang')
+                    elements.append(Paragraph(
+                        f"{i}. [{level.upper()}] {warning.get('jenis', 'tidak diketahui').capitalize()}",
+                        ParagraphStyle(
+                            'CustomWarning',
+                            parent=styles['Normal'],
+                            textColor=colors.HexColor(warna_peringatan.get(level, '#000000')),
+                            fontSize=11,
+                            spaceAfter=4,
+                            leftIndent=10,
+                            fontName='Helvetica-Bold'
+                        )
+                    ))
+                    
+                    # Dampak potensial (ambil yang pertama jika berupa list)
+                    dampak_list = warning.get('dampak', [])
+                    if isinstance(dampak_list, list) and dampak_list:
+                        dampak_text = dampak_list[0] if dampak_list else 'Tidak tersedia'
+                    else:
+                        dampak_text = str(dampak_list)
+                    
+                    elements.append(Paragraph(
+                        f"   • Jumlah: {warning.get('jumlah', 0)} ({warning.get('persentase', 0):.1f}%)",
+                        styles['Italic']
+                    ))
+                    elements.append(Paragraph(
+                        f"   • Dampak: {dampak_text[:80]}...",
+                        styles['Italic']
+                    ))
+                    elements.append(Spacer(1, 8))
+                
+                elements.append(Spacer(1, 20))
+        
+        # PERBAIKAN: Hotspot lokasi - gunakan data yang benar
+        if 'ranking_wilayah' in data and data['ranking_wilayah']:
+            ranking = data['ranking_wilayah']
+            elements.append(Paragraph('Wilayah dengan Tingkat Kebersihan Terendah', styles['Heading2']))
+            
+            if 'ranking_terkotor' in ranking and ranking['ranking_terkotor']:
+                hs_data = [['No', 'Wilayah', 'Total Laporan', 'Selesai', 'Skor Kebersihan']]
+                
+                for i, hotspot in enumerate(ranking['ranking_terkotor'][:5], start=1):
+                    hs_data.append([
+                        str(i),
+                        hotspot.get('wilayah', 'Tidak diketahui')[:30],
+                        str(hotspot.get('total_laporan', 0)),
+                        str(hotspot.get('laporan_selesai', 0)),
+                        f"{hotspot.get('skor_kebersihan', 0):.1f}"
+                    ])
+                
+                hs_table = Table(hs_data, colWidths=[40, 120, 70, 70, 80])
+                hs_table.setStyle(TableStyle([
+                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#9B59B6')),
+                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+                    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+                ]))
+                
+                elements.append(hs_table)
+                elements.append(Spacer(1, 20))
+        
+        # PERBAIKAN: Rekomendasi
+        if 'rekomendasi' in data and data['rekomendasi']:
+            elements.append(Paragraph('Rekomendasi Tindakan', styles['Heading2']))
+            
+            for i, rec in enumerate(data['rekomendasi'], start=1):
+                prioritas_warna = {
+                    'sangat_tinggi': '#E74C3C',
+                    'tinggi': '#E67E22',
+                    'sedang': '#F1C40F',
+                    'rendah': '#2ECC71'
+                }
+                
+                # Style berdasarkan prioritas
+                prioritas = rec.get('prioritas', 'sedang')
+                text_color = colors.HexColor(prioritas_warna.get(prioritas, '#000000'))
+                
+                elements.append(Paragraph(
+                    f"{i}. [{prioritas.upper()}] {rec['rekomendasi']}",
+                    ParagraphStyle(
+                        'CustomRecommendation',
+                        parent=styles['Normal'],
+                        textColor=text_color,
+                        fontSize=11,
+                        spaceAfter=4,
+                        leftIndent=10,
+                        fontName='Helvetica-Bold'
+                    )
+                ))
+                
+                # Informasi tambahan
+                info_lines = []
+                if rec.get('kategori'):
+                    info_lines.append(f"Kategori: {rec.get('kategori')}")
+                if rec.get('alasan'):
+                    info_lines.append(f"Alasan: {rec.get('alasan')}")
+                if rec.get('sumber_data'):
+                    info_lines.append(f"Sumber Data: {rec.get('sumber_data')}")
+                
+                if info_lines:
+                    elements.append(Paragraph(
+                        f"   {' | '.join(info_lines)}",
+                        styles['Italic']
+                    ))
+                
+                elements.append(Spacer(1, 12))
+        
+        # ===== TANDA TANGAN =====
+        elements.append(Spacer(1, 40))
+        
+        # Buat style khusus
+        bold_style = ParagraphStyle(
+            'BoldStyle',
+            parent=styles['Normal'],
+            fontName='Helvetica-Bold',
+            fontSize=12,
+            spaceAfter=6,
+            alignment=1  # Center alignment
+        )
+        
+        normal_style = ParagraphStyle(
+            'NormalStyle',
+            parent=styles['Normal'],
+            fontSize=12,
+            spaceAfter=6,
+            alignment=1
+        )
+        
+        # Tanda tangan dengan Table
+        tanda_tangan_data = [
+            ['', Paragraph('Hormat kami,', normal_style)],
+            ['', ''],  # Baris kosong untuk garis tanda tangan
+            ['', ''],  # Baris kosong
+            ['', ''],  # Baris kosong
+            ['', Paragraph('<b>Julius Yohanes Belo</b>', bold_style)],
+            ['', Paragraph('Direktur Utama', normal_style)]
+        ]
+        
+        tanda_tangan = Table(tanda_tangan_data, colWidths=[300, 200])
+        
+        tanda_tangan.setStyle(TableStyle([
+            ('ALIGN', (1, 0), (1, 5), 'CENTER'),
+            ('VALIGN', (1, 0), (1, 5), 'MIDDLE'),
+            ('LINEABOVE', (1, 1), (1, 1), 1, colors.black),  # Garis tanda tangan
+        ]))
+        
+        elements.append(tanda_tangan)
+        
+        # Info periode dan tanggal generate
+        elements.append(Spacer(1, 30))
+        
+        info_lines = []
+        if 'period' in data and isinstance(data['period'], dict):
+            period = data['period']
+            if 'label' in period:
+                info_lines.append(f"Periode Analisis: {period['label']}")
+        
+        if 'tanggal_generate' in data:
+            try:
+                # Format tanggal generate
+                from django.utils import timezone
+                if isinstance(data['tanggal_generate'], str):
+                    tanggal_str = data['tanggal_generate']
+                else:
+                    tanggal_str = data['tanggal_generate'].strftime('%d %B %Y, %H:%M')
+                info_lines.append(f"Tanggal Generate: {tanggal_str}")
+            except:
+                info_lines.append(f"Tanggal Generate: {str(data['tanggal_generate'])}")
+        
+        if info_lines:
+            elements.append(Paragraph(
+                " | ".join(info_lines),
+                ParagraphStyle(
+                    'CustomFooter',
+                    parent=styles['Normal'],
+                    fontSize=9,
+                    textColor=colors.gray,
+                    alignment=1
+                )
+            ))
+        
+        return elements
+
+    def _foto_thumbnail(self, name, width=40, height=30):
+        """Thumbnail foto laporan untuk sel tabel PDF"""
+        if not name:
+            return None
+        try:
+            path = default_storage.path(name)
+        except Exception:
+            return None
+        return self.pdf_images.flowable(path, width=width, height=height)
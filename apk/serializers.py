@@ -2,6 +2,8 @@ from rest_framework import serializers
 from .models import *
 from django.contrib.auth.hashers import make_password
 from django.db import transaction
+from django.db.models import Count, Q
+from .utils.images import rendition_urls
 
 class RegisterTamuSerializer(serializers.Serializer):
     username = serializers.CharField()
@@ -152,21 +154,44 @@ class UserSerializer(serializers.ModelSerializer):
 class TimPengangkutSerializer(serializers.ModelSerializer):
     """
     Serializer sederhana untuk TimPengangkut.
-    Untuk CREATE: kirim {'namaTim': '...', 'noWhatsapp': '...', 'idUser': id}
-    Untuk READ: akan tampil {'idTim': ..., 'namaTim': ..., 'noWhatsapp': ..., 'idUser': id}
+    Untuk CREATE: kirim {'namaTim': '...', 'noWhatsapp': '...', 'idUser': id, 'kapasitas': 50}
+    Untuk READ: akan tampil {'idTim': ..., 'namaTim': ..., 'noWhatsapp': ..., 'idUser': id, 'kapasitas': ...}
     """
     class Meta:
         model = TimPengangkut
-        fields = ['idTim', 'namaTim', 'noWhatsapp', 'idUser']
+        fields = ['idTim', 'namaTim', 'noWhatsapp', 'idUser', 'kapasitas']
         read_only_fields = ['idTim']
 
+STATUS_JADWAL = ('terjadwal', 'dibatalkan', 'selesai')
+
+
+def status_jadwal_counts(path=''):
+    """
+    Hitungan DetailAnggotaJadwal (total & per status) untuk annotate/aggregate.
+    path = nama relasi ke DetailAnggotaJadwal, kosong jika dari DetailAnggotaJadwal sendiri.
+    """
+    target = path or 'pk'
+    prefix = f"{path}__" if path else ''
+    counts = {'jadwal_total': Count(target)}
+    for status in STATUS_JADWAL:
+        counts[f'jadwal_{status}'] = Count(
+            target, filter=Q(**{f'{prefix}status_pengangkutan': status})
+        )
+    return counts
+
+
 class AnggotaSerializer(serializers.ModelSerializer):
     status_jadwal_info = serializers.SerializerMethodField(read_only=True)
     user_info = serializers.SerializerMethodField(read_only=True)  # Tambah field user info
+    jarak_m = serializers.SerializerMethodField(read_only=True)  # Hanya terisi saat ?near=
     
     class Meta:
         model = Anggota
         fields = '__all__'
+
+    def get_jarak_m(self, obj):
+        jarak = getattr(obj, 'jarak_m', None)
+        return round(jarak, 1) if jarak is not None else None
     
     def get_user_info(self, obj):
         """Get user information for anggota"""
@@ -180,12 +205,18 @@ class AnggotaSerializer(serializers.ModelSerializer):
 
     def get_status_jadwal_info(self, obj):
         """Info status jadwal untuk anggota"""
-        detail_jadwals = DetailAnggotaJadwal.objects.filter(idAnggota=obj)
-        
-        total = detail_jadwals.count()
-        terjadwal = detail_jadwals.filter(status_pengangkutan='terjadwal').count()
-        dibatalkan = detail_jadwals.filter(status_pengangkutan='dibatalkan').count()
-        selesai = detail_jadwals.filter(status_pengangkutan='selesai').count()
+        if hasattr(obj, 'jadwal_total'):
+            # Sudah di-annotate oleh AnggotaViewSet (tanpa query per baris)
+            counts = {key: getattr(obj, key) for key in status_jadwal_counts()}
+        else:
+            counts = DetailAnggotaJadwal.objects.filter(idAnggota=obj).aggregate(
+                **status_jadwal_counts()
+            )
+
+        total = counts['jadwal_total']
+        terjadwal = counts['jadwal_terjadwal']
+        dibatalkan = counts['jadwal_dibatalkan']
+        selesai = counts['jadwal_selesai']
         
         return {
             'total_jadwal': total,
@@ -249,12 +280,30 @@ class JadwalSerializer(serializers.ModelSerializer):
         model = Jadwal
         fields = '__all__'
 
+class GenerateJadwalSerializer(serializers.Serializer):
+    """Input untuk pembuatan jadwal otomatis (POST /api/jadwal/generate/)"""
+    tanggal_mulai = serializers.DateField()
+    tanggal_selesai = serializers.DateField()
+    dry_run = serializers.BooleanField(default=True)
+    tim = serializers.ListField(
+        child=serializers.IntegerField(), required=False, allow_empty=True
+    )
+
+    def validate(self, data):
+        if data['tanggal_mulai'] > data['tanggal_selesai']:
+            raise serializers.ValidationError({
+                'tanggal_selesai': 'Tanggal selesai harus setelah tanggal mulai'
+            })
+        return data
+
 class PembayaranSerializer(serializers.ModelSerializer):
     # Tampilkan nama anggota dari relasi idAnggota
     nama_anggota = serializers.CharField(source='idAnggota.nama', read_only=True)
     
     # URL untuk bukti bayar (jika menggunakan ImageField)
     bukti_bayar_url = serializers.SerializerMethodField()
+    # URL rendisi kecil (thumb/medium) untuk list & preview
+    bukti_bayar_renditions = serializers.SerializerMethodField()
 
     class Meta:
         model = Pembayaran
@@ -268,12 +317,16 @@ class PembayaranSerializer(serializers.ModelSerializer):
             'statusBayar',
             'buktiBayar',        # Field asli untuk upload
             'bukti_bayar_url',   # URL untuk display
+            'bukti_bayar_renditions',
         ]
         extra_kwargs = {
             'idAnggota': {'required': True},
             'buktiBayar': {'required': False, 'allow_null': True}
         }
 
+    def get_bukti_bayar_renditions(self, obj):
+        return rendition_urls(obj.buktiBayar, self.context.get('request'))
+
     def get_bukti_bayar_url(self, obj):
         if obj.buktiBayar:
             request = self.context.get('request')
@@ -306,6 +359,8 @@ class DetailAnggotaJadwalSerializer(serializers.ModelSerializer):
 class LaporanSampahSerializer(serializers.ModelSerializer):
     nama_user = serializers.CharField(source='idUser.username', read_only=True)
     foto_bukti_url = serializers.SerializerMethodField()
+    foto_bukti_renditions = serializers.SerializerMethodField()
+    jarak_m = serializers.SerializerMethodField()  # Hanya terisi saat ?near=
 
     class Meta:
         model = LaporanSampah
@@ -319,9 +374,11 @@ class LaporanSampahSerializer(serializers.ModelSerializer):
             'deskripsi',
             'foto_bukti',
             'foto_bukti_url',
+            'foto_bukti_renditions',
             'idUser',
             'status',
-            'nama_user'
+            'nama_user',
+            'jarak_m',
         ]
         extra_kwargs = {
             # HAPUS ini: 'idUser': {'read_only': True} ← HAPUS!
@@ -329,6 +386,13 @@ class LaporanSampahSerializer(serializers.ModelSerializer):
             'tanggal_lapor': {'read_only': True},  # Tanggal tidak bisa diubah
         }
 
+    def get_jarak_m(self, obj):
+        jarak = getattr(obj, 'jarak_m', None)
+        return round(jarak, 1) if jarak is not None else None
+
+    def get_foto_bukti_renditions(self, obj):
+        return rendition_urls(obj.foto_bukti, self.context.get('request'))
+
     def get_foto_bukti_url(self, obj):
         if obj.foto_bukti:
             request = self.context.get('request')
@@ -1,10 +1,15 @@
-from django.db.models.signals import pre_save, post_save
+from django.apps import apps
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.db import transaction
 import logging
 
-from .models import Pembayaran, DetailAnggotaJadwal, LaporanSampah
+from .models import Pembayaran, DetailAnggotaJadwal, LaporanSampah, User, Anggota, TimPengangkut
 from .utils.notifications import NotificationService
+from .utils.images import schedule_image_processing
+from .utils.conditional import VERSIONED_MODELS, bump_version
+from .authentication import invalidate_user
+from .storage import acquire, release
 
 logger = logging.getLogger(__name__)
 
@@ -12,25 +17,8 @@ logger = logging.getLogger(__name__)
 # =====================================================
 # PEMBAYARAN
 # =====================================================
-
-@receiver(pre_save, sender=Pembayaran)
-def cache_old_payment_status(sender, instance, **kwargs):
-    """
-    Simpan status lama sebelum update pembayaran
-    """
-    if not instance.pk:
-        return
-
-    try:
-        instance._old_status_bayar = (
-            Pembayaran.objects
-            .only("statusBayar")
-            .get(pk=instance.pk)
-            .statusBayar
-        )
-    except Pembayaran.DoesNotExist:
-        instance._old_status_bayar = None
-
+# Status lama tidak lagi di-SELECT di pre_save: model memakai
+# TrackedFieldsMixin sehingga cukup cek instance.has_changed(...)
 
 @receiver(post_save, sender=Pembayaran)
 def payment_notifications(sender, instance, created, **kwargs):
@@ -49,8 +37,7 @@ def payment_notifications(sender, instance, created, **kwargs):
         return
 
     # 🔄 Status berubah
-    old_status = getattr(instance, "_old_status_bayar", None)
-    if old_status == instance.statusBayar:
+    if not instance.has_changed("statusBayar"):
         return
 
     transaction.on_commit(
@@ -62,25 +49,6 @@ def payment_notifications(sender, instance, created, **kwargs):
 # DETAIL JADWAL / PENGANGKUTAN
 # =====================================================
 
-@receiver(pre_save, sender=DetailAnggotaJadwal)
-def cache_old_pickup_status(sender, instance, **kwargs):
-    """
-    Simpan status pengangkutan lama sebelum update
-    """
-    if not instance.pk:
-        return
-
-    try:
-        instance._old_status_pengangkutan = (
-            DetailAnggotaJadwal.objects
-            .only("status_pengangkutan")
-            .get(pk=instance.pk)
-            .status_pengangkutan
-        )
-    except DetailAnggotaJadwal.DoesNotExist:
-        instance._old_status_pengangkutan = None
-
-
 @receiver(post_save, sender=DetailAnggotaJadwal)
 def pickup_notifications(sender, instance, created, **kwargs):
     """
@@ -96,17 +64,16 @@ def pickup_notifications(sender, instance, created, **kwargs):
         )
         return
 
-    old_status = getattr(instance, "_old_status_pengangkutan", None)
-    new_status = instance.status_pengangkutan
+    if not instance.has_changed("status_pengangkutan"):
+        return
 
     logger.info(
         "🚨 PICKUP SIGNAL | OLD=%s NEW=%s ID=%s",
-        old_status, new_status, instance.pk
+        instance.get_original("status_pengangkutan"),
+        instance.status_pengangkutan,
+        instance.pk
     )
 
-    if old_status == new_status:
-        return
-
     transaction.on_commit(
         lambda: NotificationService.send_pickup_status_update(instance)
     )
@@ -115,25 +82,6 @@ def pickup_notifications(sender, instance, created, **kwargs):
 # LAPORAN SAMPAH
 # =====================================================
 
-@receiver(pre_save, sender=LaporanSampah)
-def cache_old_laporan_status(sender, instance, **kwargs):
-    """
-    Simpan status laporan lama sebelum update
-    """
-    if not instance.pk:
-        return
-
-    try:
-        instance._old_status = (
-            LaporanSampah.objects
-            .only("status")
-            .get(pk=instance.pk)
-            .status
-        )
-    except LaporanSampah.DoesNotExist:
-        instance._old_status = None
-
-
 @receiver(post_save, sender=LaporanSampah)
 def laporan_notifications(sender, instance, created, **kwargs):
     """
@@ -168,19 +116,19 @@ def laporan_notifications(sender, instance, created, **kwargs):
         return
     
     # 🔄 Status berubah
-    old_status = getattr(instance, "_old_status", None)
-    
-    if old_status == instance.status:
+    if not instance.has_changed("status"):
         logger.info("   ⏩ Status unchanged, skipping")
         return
-    
+
+    # Ambil sekarang: snapshot diperbarui setelah save selesai
+    old_status = instance.get_original("status")
     logger.info(f"   🔄 Status changed from {old_status} to {instance.status}")
     
     # 1. Notify TAMU about status change
     if instance.idUser and instance.idUser.role in ['tamu', 'anggota']:
         logger.info(f"   Notifying user {instance.idUser.username} about status change")
         transaction.on_commit(
-            lambda: NotificationService.notify_pelapor_status_berubah(instance)
+            lambda: NotificationService.notify_pelapor_status_berubah(instance, old_status)
         )
     
     # 2. Notify ADMIN if status changed to "selesai"
@@ -190,6 +138,48 @@ def laporan_notifications(sender, instance, created, **kwargs):
             lambda: NotificationService.notify_admin_laporan_selesai(instance)
         )
 # =====================================================
+# FOTO / BUKTI UPLOAD
+# =====================================================
+# File disimpan berdasarkan hash (apk.storage): setiap baris yang menunjuk
+# sebuah blob menambah ref_count, dan melepasnya saat file diganti/dihapus.
+
+def update_media_reference(instance, field_name, created):
+    if not created and not instance.has_changed(field_name):
+        return False
+    if not created:
+        release(instance.get_original(field_name))
+    acquire(getattr(instance, field_name).name)
+    return True
+
+
+@receiver(post_save, sender=LaporanSampah)
+def process_foto_bukti(sender, instance, created, **kwargs):
+    """
+    Encode ulang foto_bukti & buat rendisi di luar request
+    """
+    if update_media_reference(instance, "foto_bukti", created) and instance.foto_bukti:
+        schedule_image_processing(instance, "foto_bukti")
+
+
+@receiver(post_save, sender=Pembayaran)
+def process_bukti_bayar(sender, instance, created, **kwargs):
+    """
+    Encode ulang buktiBayar & buat rendisi di luar request
+    """
+    if update_media_reference(instance, "buktiBayar", created) and instance.buktiBayar:
+        schedule_image_processing(instance, "buktiBayar")
+
+
+@receiver(post_delete, sender=LaporanSampah)
+def release_foto_bukti(sender, instance, **kwargs):
+    release(instance.foto_bukti.name)
+
+
+@receiver(post_delete, sender=Pembayaran)
+def release_bukti_bayar(sender, instance, **kwargs):
+    release(instance.buktiBayar.name)
+
+# =====================================================
 # TIM ANGKUT - JADWAL BARU
 # =====================================================
 
@@ -206,6 +196,57 @@ def notify_team_on_new_schedule(sender, instance, created, **kwargs):
         lambda: NotificationService.notify_team_new_schedule(instance)
     )
 
+
+# =====================================================
+# VERSION COUNTER (ETag, apk/utils/conditional.py)
+# =====================================================
+
+def bump_model_version(sender, update_fields=None, **kwargs):
+    """Data berubah -> ETag list/detail/report yang memakai model ini tidak berlaku"""
+    # Login hanya mengubah last_login, yang tidak tampil di response mana pun
+    if update_fields and set(update_fields) <= {"last_login"}:
+        return
+    bump_version(sender)
+
+
+# Hanya model ber-versi: receiver tanpa sender mematikan fast delete semua model
+for label in VERSIONED_MODELS:
+    post_save.connect(bump_model_version, sender=apps.get_model(label), dispatch_uid=f"version:{label}")
+    post_delete.connect(bump_model_version, sender=apps.get_model(label), dispatch_uid=f"version:{label}")
+
+
+# =====================================================
+# SNAPSHOT USER AUTENTIKASI (apk/authentication.py)
+# =====================================================
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_auth_user(sender, instance, update_fields=None, **kwargs):
+    """Role / status aktif / data user berubah -> snapshot auth dimuat ulang"""
+    if update_fields and set(update_fields) <= {"last_login"}:
+        return
+    invalidate_user(instance.pk)
+
+
+def invalidate_owners(instance, field):
+    """Snapshot pemilik sekarang & pemilik sebelumnya (jika dipindah ke user lain)"""
+    owner = getattr(instance, field)
+    invalidate_user(owner)
+    previous = instance.get_original(field)
+    if previous != owner:
+        invalidate_user(previous)
+
+
+@receiver([post_save, post_delete], sender=Anggota)
+def invalidate_auth_anggota(sender, instance, **kwargs):
+    """idAnggota milik user ikut snapshot"""
+    invalidate_owners(instance, "user_id")
+
+
+@receiver([post_save, post_delete], sender=TimPengangkut)
+def invalidate_auth_tim(sender, instance, **kwargs):
+    """idTim milik user tim_angkut ikut snapshot"""
+    invalidate_owners(instance, "idUser_id")
+
 # from django.db.models.signals import pre_save, post_save
 # from django.dispatch import receiver
 # from django.db import transaction
@@ -77,27 +77,21 @@ def notify_anggota_upgraded(sender, instance, created, **kwargs):
     TAMU yang UPGRADE menjadi ANGGOTA:
     - Mendapat notifikasi konfirmasi upgrade
     """
-    # Cek jika role berubah dari 'tamu' ke 'anggota'
-    if not created and instance.role == "anggota":
-        try:
-            # Ambil data lama dari database
-            old_instance = User.objects.get(pk=instance.pk)
-            
-            # Jika sebelumnya bukan anggota, sekarang menjadi anggota
-            if old_instance.role != "anggota" and instance.role == "anggota":
-                transaction.on_commit(
-                    lambda: NotificationService.send_notification_to_user(
-                        user=instance,
-                        title="✅ Upgrade Berhasil!",
-                        body="Selamat! Anda sekarang adalah anggota CleanUp. Nikmati layanan angkut sampah reguler.",
-                        notification_type="upgrade_success",
-                        url="/dashboard",
-                        data={
-                            "user_id": instance.pk,
-                            "upgrade_date": timezone.now().isoformat(),
-                            "new_role": "anggota"
-                        },
-                    )
-                )
-        except User.DoesNotExist:
-            pass
+    # Cek jika role berubah menjadi 'anggota' (nilai lama dari snapshot model)
+    if created or instance.role != "anggota" or not instance.has_changed("role"):
+        return
+
+    transaction.on_commit(
+        lambda: NotificationService.send_notification_to_user(
+            user=instance,
+            title="✅ Upgrade Berhasil!",
+            body="Selamat! Anda sekarang adalah anggota CleanUp. Nikmati layanan angkut sampah reguler.",
+            notification_type="upgrade_success",
+            url="/dashboard",
+            data={
+                "user_id": instance.pk,
+                "upgrade_date": timezone.now().isoformat(),
+                "new_role": "anggota"
+            },
+        )
+    )
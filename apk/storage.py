@@ -0,0 +1,131 @@
+"""
+Storage media berbasis hash konten (content-addressed).
+
+File yang disimpan di bawah prefix tertentu (mis. `laporan_fotos/`,
+`bukti_pembayaran/`) diberi nama dari SHA-256 isinya:
+
+    laporan_fotos/ab/ab12...ef.jpg
+
+Upload yang isinya sama menghasilkan nama yang sama, sehingga blob hanya
+ditulis sekali. Jumlah referensi dicatat di model MediaBlob (acquire /
+release dari signal model); delete() hanya menghapus file jika tidak ada
+lagi yang mereferensikan. Blob yatim dibersihkan oleh command
+`cleanup_media`.
+"""
+import hashlib
+import os
+import uuid
+
+from django.core.files.storage import FileSystemStorage
+from django.db.models import F
+from django.utils import timezone
+from django.utils.deconstruct import deconstructible
+
+from .utils.media import is_private, sign_name
+
+HASH_CHUNK_SIZE = 64 * 1024
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    def __init__(self, prefixes=(), **kwargs):
+        super().__init__(**kwargs)
+        self.prefixes = tuple(prefixes)
+
+    def is_content_addressed(self, name):
+        return bool(name) and name.replace('\\', '/').startswith(self.prefixes)
+
+    def is_hashed_name(self, name):
+        stem = os.path.splitext(os.path.basename(name or ''))[0]
+        return len(stem) == 64 and all(c in '0123456789abcdef' for c in stem)
+
+    def content_name(self, name, digest):
+        """Nama blob: <folder asli>/<2 hex pertama>/<sha256><ext>"""
+        directory = os.path.dirname(name)
+        ext = os.path.splitext(name)[1].lower()
+        return '/'.join(filter(None, [directory, digest[:2], f"{digest}{ext}"]))
+
+    def get_available_name(self, name, max_length=None):
+        # Nama final ditentukan oleh isi file di _save()
+        if self.is_content_addressed(name):
+            return name
+        return super().get_available_name(name, max_length=max_length)
+
+    def _save(self, name, content):
+        if not self.is_content_addressed(name):
+            return super()._save(name, content)
+
+        sha = hashlib.sha256()
+        size = 0
+        for chunk in content.chunks(HASH_CHUNK_SIZE):
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+            sha.update(chunk)
+            size += len(chunk)
+        final_name = self.content_name(name, sha.hexdigest())
+
+        if not self.exists(final_name):
+            # Tulis ke nama sementara lalu rename atomik ke nama final;
+            # jika dua upload identik berbarengan, hasilnya tetap sama.
+            tmp_name = super()._save(
+                f"{os.path.dirname(final_name)}/.{uuid.uuid4().hex}.tmp", content
+            )
+            os.replace(self.path(tmp_name), self.path(final_name))
+
+        register_blob(final_name, size)
+        return final_name
+
+    def url(self, name):
+        # Bukti pembayaran: URL bertanda tangan, dicek di apk.viewMedia
+        url = super().url(name)
+        if is_private(name):
+            url = f"{url}?sig={sign_name(name)}"
+        return url
+
+    def delete(self, name):
+        # Blob yang masih direferensikan tidak dihapus
+        if self.is_content_addressed(name):
+            from .models import MediaBlob
+
+            if MediaBlob.objects.filter(name=name, ref_count__gt=0).exists():
+                return
+            MediaBlob.objects.filter(name=name).delete()
+        super().delete(name)
+
+
+def _is_content_addressed(name):
+    from django.core.files.storage import default_storage
+
+    check = getattr(default_storage, 'is_content_addressed', None)
+    return bool(check and check(name))
+
+
+def register_blob(name, size):
+    from .models import MediaBlob
+
+    MediaBlob.objects.get_or_create(name=name, defaults={'size': size})
+
+
+def acquire(name):
+    """Tambah 1 referensi ke blob (dipanggil saat model menunjuk file ini)"""
+    if not _is_content_addressed(name):
+        return
+    from .models import MediaBlob
+
+    updated = MediaBlob.objects.filter(name=name).update(
+        ref_count=F('ref_count') + 1, updated_at=timezone.now()
+    )
+    if not updated:
+        MediaBlob.objects.get_or_create(name=name, defaults={'ref_count': 1})
+
+
+def release(name):
+    """Kurangi 1 referensi; file fisik dihapus oleh cleanup_media"""
+    if not _is_content_addressed(name):
+        return
+    from .models import MediaBlob
+
+    # updated_at dipakai sebagai awal masa tenggang sebelum blob dihapus
+    MediaBlob.objects.filter(name=name, ref_count__gt=0).update(
+        ref_count=F('ref_count') - 1, updated_at=timezone.now()
+    )
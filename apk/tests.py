@@ -1,3 +1,367 @@
-from django.test import TestCase
+import io
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+from datetime import date
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.http import Http404
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from PIL import Image
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .authentication import get_user_snapshot
+from .management.commands.benchmark_import_time import LAZY_MODULES
+from .models import (
+    Anggota, DetailAnggotaJadwal, Jadwal, LaporanSampah, MediaBlob, Notification, Pembayaran,
+    TimPengangkut,
+)
+from .utils.images import get_config, process_image, rendition_name, rendition_urls
+from .utils.query_plans import check_plans
+from .utils.scheduling import generate_schedule
+from .utils.synthetic import DatasetGenerator
+from .viewMedia import _parse_range, serve_media
+
+User = get_user_model()
+
+BLOB_NAME = 'laporan_fotos/aa/' + 'a' * 64 + '.jpg'
+
+
+class TrackedFieldsTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('pelapor', password='x', role='tamu')
+        cls.laporan = LaporanSampah.objects.create(
+            nama='Laporan', alamat='Jl. Test', latitude=-7.0, longitude=110.0,
+            deskripsi='plastik', idUser=cls.user, foto_bukti=BLOB_NAME,
+        )
+
+    def test_field_baru_dianggap_berubah(self):
+        laporan = LaporanSampah(nama='Baru')
+        self.assertTrue(laporan.has_changed('status'))
+
+    def test_field_defer_tidak_dianggap_berubah(self):
+        laporan = LaporanSampah.objects.only('idLaporan', 'status').get(pk=self.laporan.pk)
+        self.assertFalse(laporan.has_changed('foto_bukti'))
+
+        # Dimuat saat diakses: nilai awal ikut tercatat
+        self.assertEqual(laporan.foto_bukti.name, BLOB_NAME)
+        self.assertFalse(laporan.has_changed('foto_bukti'))
+
+        laporan.foto_bukti = 'laporan_fotos/bb/' + 'b' * 64 + '.jpg'
+        self.assertTrue(laporan.has_changed('foto_bukti'))
+
+    def test_save_instance_only_tidak_mengubah_ref_count(self):
+        laporan = LaporanSampah.objects.only('idLaporan', 'status').get(pk=self.laporan.pk)
+        laporan.status = 'proses'
+        laporan.save(update_fields=['status'])
+
+        self.assertEqual(MediaBlob.objects.get(name=BLOB_NAME).ref_count, 1)
+
+
+class GenerateScheduleTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        tim_user = User.objects.create_user('tim', password='x', role='tim_angkut')
+        TimPengangkut.objects.create(namaTim='Tim A', noWhatsapp='0812', idUser=tim_user, kapasitas=10)
+        for i in range(4):
+            Anggota.objects.create(
+                nama=f'Anggota {i}', alamat='Jl. Test', noWA='0813',
+                latitude=-7.0 + i * 0.01, longitude=110.0,
+                tanggalStart=date(2026, 1, 1), tanggalEnd=date(2026, 12, 31),
+                status='aktif', jenisSampah='Rumah Tangga',
+            )
+
+    def test_jalan_ulang_hanya_menghitung_detail_baru(self):
+        mulai, selesai = date(2026, 3, 2), date(2026, 3, 8)
+        pertama = generate_schedule(mulai, selesai, dry_run=False)
+        self.assertGreater(pertama['jumlah_detail'], 0)
+        self.assertEqual(pertama['jumlah_detail_baru'], pertama['jumlah_detail'])
+        self.assertEqual(DetailAnggotaJadwal.objects.count(), pertama['jumlah_detail'])
+
+        kedua = generate_schedule(mulai, selesai, dry_run=False)
+        self.assertEqual(kedua['jumlah_jadwal_baru'], 0)
+        self.assertEqual(kedua['jumlah_detail_baru'], 0)
+        self.assertEqual(kedua['jumlah_detail'], pertama['jumlah_detail'])
+
+
+class DatasetGeneratorTest(TestCase):
+    def test_chunk_kecil_tidak_bentrok(self):
+        for chunk_size in (1, 2, 3, 7):
+            with self.subTest(chunk_size=chunk_size):
+                counts = DatasetGenerator(
+                    anggota=6, days=3, seed=1, chunk_size=chunk_size, prefix=f'chunk{chunk_size}',
+                ).run()
+                self.assertEqual(counts['Anggota'], 6)
+                self.assertEqual(counts['Tamu'], 2)
+
+
+class ImagePipelineTest(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def test_blob_lama_tidak_langsung_dihapus(self):
+        buffer = io.BytesIO()
+        Image.new('RGB', (64, 64), 'green').save(buffer, 'JPEG')
+        user = User.objects.create_user('pelapor', password='x', role='tamu')
+        laporan = LaporanSampah(
+            nama='Laporan', alamat='Jl. Test', latitude=-7.0, longitude=110.0,
+            deskripsi='plastik', idUser=user,
+        )
+        laporan.foto_bukti.save('foto.jpg', ContentFile(buffer.getvalue()))
+        original = laporan.foto_bukti.name
+
+        new_name = process_image(LaporanSampah, laporan.pk, 'foto_bukti')
+
+        self.assertNotEqual(new_name, original)
+        # Referensi dilepas, file dihapus cleanup_media setelah masa tenggang
+        self.assertEqual(MediaBlob.objects.get(name=original).ref_count, 0)
+        self.assertTrue(default_storage.exists(original))
+        self.assertEqual(MediaBlob.objects.get(name=new_name).ref_count, 1)
+
+    def test_rendition_urls_tanpa_stat_storage(self):
+        buffer = io.BytesIO()
+        Image.new('RGB', (64, 64), 'blue').save(buffer, 'JPEG')
+        user = User.objects.create_user('pelapor', password='x', role='tamu')
+        laporan = LaporanSampah(
+            nama='Laporan', alamat='Jl. Test', latitude=-7.0, longitude=110.0,
+            deskripsi='plastik', idUser=user,
+        )
+        laporan.foto_bukti.save('foto.jpg', ContentFile(buffer.getvalue()))
+        process_image(LaporanSampah, laporan.pk, 'foto_bukti')
+        laporan.refresh_from_db()
+
+        with mock.patch.object(laporan.foto_bukti.storage, 'exists', side_effect=AssertionError):
+            urls = rendition_urls(laporan.foto_bukti)
+
+        # Rendisi sudah ditulis saat field menunjuk ke file hasil proses
+        for rendition in get_config()['RENDITIONS']:
+            self.assertTrue(default_storage.exists(rendition_name(laporan.foto_bukti.name, rendition)))
+            self.assertNotEqual(urls[rendition], urls['original'])
+
+
+class RangeHeaderTest(SimpleTestCase):
+    def test_rentang_valid(self):
+        self.assertEqual(_parse_range('bytes=0-99', 1000), (0, 99))
+        self.assertEqual(_parse_range('bytes=900-', 1000), (900, 999))
+        self.assertEqual(_parse_range('bytes=900-5000', 1000), (900, 999))
+        self.assertEqual(_parse_range('bytes=-100', 1000), (900, 999))
+
+    def test_last_pos_lebih_kecil_diabaikan(self):
+        # Tidak valid secara sintaks: file utuh (200), bukan 416
+        self.assertIsNone(_parse_range('bytes=500-100', 1000))
+
+    def test_tidak_bisa_dipenuhi(self):
+        self.assertIs(_parse_range('bytes=1000-', 1000), False)
+        self.assertIs(_parse_range('bytes=1000-1200', 1000), False)
+        self.assertIs(_parse_range('bytes=-0', 1000), False)
+
+
+class MediaPathTest(SimpleTestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        # Ditulis langsung: storage menamai ulang file berdasarkan hash isinya
+        for name in ('bukti_pembayaran/x.jpg', 'laporan_fotos/y.jpg'):
+            path = Path(media_root, name)
+            path.parent.mkdir(parents=True)
+            path.write_bytes(b'isi file')
+        self.factory = RequestFactory()
+
+    def serve(self, path):
+        return serve_media(self.factory.get(f'/media/{path}'), path)
+
+    def test_file_publik(self):
+        self.assertEqual(self.serve('laporan_fotos/y.jpg').status_code, 200)
+
+    def test_bukti_bayar_tanpa_izin(self):
+        paths = [
+            'bukti_pembayaran/x.jpg',
+            './bukti_pembayaran/x.jpg',
+            'laporan_fotos/../bukti_pembayaran/x.jpg',
+            'renditions/../bukti_pembayaran/x.jpg',
+            'laporan_fotos//../bukti_pembayaran/x.jpg',
+            'laporan_fotos\\..\\bukti_pembayaran\\x.jpg',
+        ]
+        for path in paths:
+            with self.subTest(path=path):
+                with self.assertRaises(Http404):
+                    self.serve(path)
+
+
+class AuthSnapshotInvalidationTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.lama = User.objects.create_user('lama', password='x', role='anggota')
+        cls.baru = User.objects.create_user('baru', password='x', role='anggota')
+
+    def setUp(self):
+        cache.clear()
+
+    def test_anggota_dipindah_ke_user_lain(self):
+        anggota = Anggota.objects.create(
+            user=self.lama, nama='Anggota', alamat='Jl. Test', noWA='0813',
+            latitude=-7.0, longitude=110.0,
+            tanggalStart=date(2026, 1, 1), tanggalEnd=date(2026, 12, 31),
+            status='aktif', jenisSampah='Rumah Tangga',
+        )
+        self.assertEqual(get_user_snapshot(self.lama.pk)['anggota_id'], anggota.pk)
+
+        anggota = Anggota.objects.get(pk=anggota.pk)
+        anggota.user = self.baru
+        with self.captureOnCommitCallbacks(execute=True):
+            anggota.save()
+
+        self.assertIsNone(get_user_snapshot(self.lama.pk)['anggota_id'])
+        self.assertEqual(get_user_snapshot(self.baru.pk)['anggota_id'], anggota.pk)
+
+    def test_tim_dipindah_ke_user_lain(self):
+        tim = TimPengangkut.objects.create(namaTim='Tim A', noWhatsapp='0812', idUser=self.lama)
+        self.assertEqual(get_user_snapshot(self.lama.pk)['tim_ids'], [tim.pk])
+
+        tim = TimPengangkut.objects.get(pk=tim.pk)
+        tim.idUser = self.baru
+        with self.captureOnCommitCallbacks(execute=True):
+            tim.save()
+
+        self.assertEqual(get_user_snapshot(self.lama.pk)['tim_ids'], [])
+        self.assertEqual(get_user_snapshot(self.baru.pk)['tim_ids'], [tim.pk])
+
+
+class QueryBudgetTest(TestCase):
+    """
+    Jumlah query endpoint yang sering dipanggil (jalur dingin: cache kosong,
+    query autentikasi ikut terhitung). Jumlahnya tidak boleh bergantung pada
+    jumlah baris: N+1 di serializer/queryset langsung membuat test gagal.
+    Benchmark latency lengkap: manage.py benchmark_api.
+    """
+    # (role, basename): jumlah query GET list
+    LIST_BUDGETS = {
+        ('admin', 'anggota'): 3,
+        ('admin', 'jadwal'): 3,
+        ('admin', 'detail-anggota-jadwal'): 2,
+        ('admin', 'pembayaran'): 2,
+        ('admin', 'laporan-sampah'): 3,
+        ('admin', 'notification'): 3,
+        ('admin', 'users'): 2,
+        ('anggota', 'jadwal'): 3,
+        ('anggota', 'detail-anggota-jadwal'): 2,
+        ('anggota', 'laporan-sampah'): 3,
+        ('tim_angkut', 'jadwal'): 3,
+        ('tim_angkut', 'detail-anggota-jadwal'): 2,
+        ('tim_angkut', 'pembayaran'): 2,
+    }
+    # basename: (model, jumlah query GET detail sebagai admin)
+    DETAIL_BUDGETS = {
+        'anggota': (Anggota, 3),
+        'jadwal': (Jadwal, 3),
+        'detail-anggota-jadwal': (DetailAnggotaJadwal, 2),
+        'pembayaran': (Pembayaran, 2),
+        'laporan-sampah': (LaporanSampah, 3),
+    }
+    # List ber-ETag: If-None-Match yang cocok dijawab 304 tanpa query data
+    NOT_MODIFIED_BUDGET = 2
+
+    @classmethod
+    def setUpTestData(cls):
+        DatasetGenerator(anggota=40, days=7, seed=1, prefix='qbudget').run()
+        admin = User.objects.create_user('qbudget_admin', password='x', role='admin')
+        Notification.objects.bulk_create([
+            Notification(user=admin, title=f'Notifikasi {i}', message='Test') for i in range(15)
+        ])
+        cls.users = {
+            'admin': admin,
+            'anggota': Anggota.objects.filter(status='aktif').order_by('pk').first().user,
+            'tim_angkut': TimPengangkut.objects.order_by('pk').first().idUser,
+        }
+
+    def client_for(self, role):
+        client = APIClient()
+        token = RefreshToken.for_user(self.users[role]).access_token
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        return client
+
+    def get(self, role, url, queries, **headers):
+        client = self.client_for(role)
+        cache.clear()
+        with self.assertNumQueries(queries):
+            response = client.get(url, **headers)
+        return response
+
+    @staticmethod
+    def rows(data):
+        return data if isinstance(data, list) else data['results']
+
+    def test_list(self):
+        for (role, basename), queries in self.LIST_BUDGETS.items():
+            with self.subTest(role=role, endpoint=basename):
+                response = self.get(role, reverse(f'cleanapk:{basename}-list'), queries)
+                self.assertEqual(response.status_code, 200)
+                if role == 'admin':
+                    # Beberapa baris per halaman, agar N+1 terlihat
+                    self.assertGreater(len(self.rows(response.json())), 1)
+
+    def test_detail(self):
+        for basename, (model, queries) in self.DETAIL_BUDGETS.items():
+            with self.subTest(endpoint=basename):
+                pk = model.objects.order_by('pk').values_list('pk', flat=True).first()
+                response = self.get('admin', reverse(f'cleanapk:{basename}-detail', args=[pk]), queries)
+                self.assertEqual(response.status_code, 200)
+
+    def test_list_not_modified(self):
+        for basename in ('anggota', 'jadwal', 'laporan-sampah'):
+            with self.subTest(endpoint=basename):
+                url = reverse(f'cleanapk:{basename}-list')
+                etag = self.client_for('admin').get(url)['ETag']
+                response = self.get('admin', url, self.NOT_MODIFIED_BUDGET, HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(response.status_code, 304)
+
+
+class QueryPlanTest(TestCase):
+    """Hot query viewset & report memakai index komposit (SQLite: EXPLAIN QUERY PLAN)"""
+
+    def test_hot_queries_memakai_index(self):
+        for label, name, plan, used in check_plans():
+            with self.subTest(query=label):
+                self.assertIn(name, plan)
+
+
+# Start-up worker: setup Django + load URLconf, lalu daftar modul yang dimuat
+STARTUP_MODULES_SCRIPT = """
+import json, sys
+import django
+django.setup()
+from django.urls import get_resolver
+get_resolver().url_patterns
+print(json.dumps(sorted({name.split('.')[0] for name in sys.modules})))
+"""
+
+
+class StartupImportTest(SimpleTestCase):
+    def test_renderer_berat_tidak_dimuat_saat_start_up(self):
+        result = subprocess.run(
+            [sys.executable, '-c', STARTUP_MODULES_SCRIPT],
+            cwd=settings.BASE_DIR, capture_output=True, text=True,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr[-2000:])
+
+        loaded = set(json.loads(result.stdout.strip().splitlines()[-1]))
+        self.assertIn('apk', loaded)
+        self.assertFalse(loaded & set(LAZY_MODULES), 'reportlab/openpyxl/pandas dimuat saat start-up')
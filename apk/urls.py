@@ -30,6 +30,8 @@ from .reports import (
 )
 
 from .viewPublik import PublicDampakLingkunganView, PublicLandingPageView
+from .viewNotifikasi import NotificationListView, NotificationUnreadCountView, PushTestNotificationView
+from .viewMetrics import metrics
 
 router = DefaultRouter()
 router.register(r'users', UserViewSet, basename='users')
@@ -71,8 +73,15 @@ urlpatterns = [
     path("upgrade-anggota/", UpgradeAnggotaView.as_view(), name="upgrade_anggota"),
     path('api/public/analisis-lingkungan/', PublicDampakLingkunganView.as_view(), name='public-analisis'),
     path('api/public/landing-stats/', PublicLandingPageView.as_view(), name='public-landing'),
+    # Endpoint async, didaftarkan sebelum router agar URL lama tetap sama
+    path('notifications/', NotificationListView.as_view(), name='notification-list'),
+    path('notifications/unread_count/', NotificationUnreadCountView.as_view(),
+         name='notification-unread-count'),
+    path('push-subscriptions/test_notification/', PushTestNotificationView.as_view(),
+         name='push-subscription-test-notification'),
     path('', include(router.urls)),
     path('api/vapid-key/', vapid_public_key, name='vapid-key-public'),
+    path('metrics', metrics, name='metrics'),
     path('api/pembayaran/<int:payment_id>/success/',
          handle_payment_success,
          name='payment_success'),
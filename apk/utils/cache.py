@@ -0,0 +1,361 @@
+# utils/cache.py
+"""
+Helper cache bersama (Redis) untuk data yang mahal dihitung dan sama untuk
+semua worker: report, analisis publik, snapshot user autentikasi.
+
+- make_key(): key ber-namespace ("report:..."), bagian panjang di-hash.
+  Prefix aplikasi (KEY_PREFIX di CACHES) memisahkan app lain di Redis yang sama.
+- Invalidasi berversi: setiap namespace punya counter di cache.
+  invalidate_namespace() menaikkan counter sehingga semua key lama di
+  namespace itu tidak terpakai lagi (dibiarkan kedaluwarsa), tanpa SCAN/DEL.
+  Counter model (model_namespace) dinaikkan bersama version counter ETag
+  setelah commit (apk/utils/conditional.py).
+- Data yang dibaca dari read replica tidak boleh memakai counter namespace:
+  counter naik saat commit di primary, sebelum replica menerima datanya,
+  sehingga key baru terisi data lama. Pakai version counter database dari
+  alias yang sama (conditional.model_versions(using=...)) + versions_stamp().
+- get_or_compute() / aget_or_compute(): anti stampede. Nilai disimpan
+  bersama lama hitungnya lalu di-refresh lebih awal secara probabilistik
+  (XFetch); hanya satu worker yang menghitung ulang (lock add()), worker
+  lain memakai nilai lama selama STALE_SECONDS.
+- FakeRedisCache: stand-in Redis di dalam proses untuk dev/test tanpa
+  server. Memakai RedisCache bawaan Django (serializer, timeout, key)
+  dengan client palsu, jadi perilakunya sama dengan profil redis.
+
+Profil backend dipilih lewat env CACHE_PROFILE (cleanupapk/settings.py).
+Konfigurasi helper: settings.SHARED_CACHE
+"""
+import asyncio
+import hashlib
+import math
+import random
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.redis import RedisCacheClient, RedisSerializer
+from django.utils.module_loading import import_string
+
+from .metrics import InstrumentedRedisCache
+
+DEFAULT_CONFIG = {
+    'ALIAS': 'default',
+    'TIMEOUT': 300,            # detik, default get_or_compute()
+    'STALE_SECONDS': 60,       # nilai lama tetap dipakai selama dihitung ulang
+    'EARLY_REFRESH_BETA': 1.0,  # >1 refresh lebih awal, 0 = tanpa refresh awal
+    'LOCK_SECONDS': 30,        # batas waktu lock hitung ulang
+    'LOCK_WAIT_SECONDS': 5,    # tunggu worker lain jika belum ada nilai sama sekali
+}
+
+# Key lebih panjang dari ini di-hash (batas aman key memcached/LocMem 250)
+MAX_KEY_LENGTH = 200
+LOCK_POLL_SECONDS = 0.05
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'SHARED_CACHE', {})}
+
+
+def get_cache():
+    return caches[get_config()['ALIAS']]
+
+
+def make_key(namespace, *parts):
+    """Key "namespace:bagian:bagian"; jika terlalu panjang, bagian di-hash"""
+    key = ':'.join([namespace, *(str(part) for part in parts)])
+    if len(key) > MAX_KEY_LENGTH or any(c.isspace() for c in key):
+        digest = hashlib.sha256(key.encode()).hexdigest()[:40]
+        key = f"{namespace}:{digest}"
+    return key
+
+
+# =====================================================
+# INVALIDASI BERVERSI
+# =====================================================
+
+def model_namespace(model):
+    """Namespace yang berubah versi setiap kali data model berubah"""
+    label = model if isinstance(model, str) else model._meta.label
+    return f"model:{label}"
+
+
+def _version_key(namespace):
+    return f"ns-version:{namespace}"
+
+
+def namespace_versions(*namespaces):
+    """{namespace: versi} dalam satu get_many; namespace baru = 0"""
+    cache = get_cache()
+    found = cache.get_many([_version_key(ns) for ns in namespaces])
+    return {ns: found.get(_version_key(ns), 0) for ns in namespaces}
+
+
+def invalidate_namespace(*namespaces):
+    """Naikkan versi namespace: key lama tidak lagi dibaca"""
+    cache = get_cache()
+    for ns in namespaces:
+        key = _version_key(ns)
+        # add() & incr() atomik di Redis; counter tidak pernah kedaluwarsa
+        if cache.add(key, 1, None):
+            continue
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Terhapus di antara add() dan incr()
+            cache.add(key, 1, None)
+
+
+def versions_stamp(versions):
+    """Bagian key dari {nama: versi}, urutan tetap"""
+    return ','.join(f"{name}={version}" for name, version in sorted(versions.items()))
+
+
+def versioned_key(namespace, *parts, depends_on=()):
+    """
+    make_key() yang menyertakan versi `namespace` & `depends_on`;
+    invalidate_namespace() salah satunya membuat key baru.
+    Hanya untuk data yang dibaca dari 'default' (lihat docstring modul).
+    """
+    versions = namespace_versions(namespace, *depends_on)
+    return make_key(namespace, versions_stamp(versions), *parts)
+
+
+# =====================================================
+# ANTI STAMPEDE
+# =====================================================
+
+def _is_fresh(entry, beta):
+    """
+    XFetch: refresh sebelum kedaluwarsa dengan peluang yang makin besar
+    mendekati expires, sebanding lama hitung (delta).
+    """
+    if entry is None:
+        return False
+    jitter = -entry['delta'] * beta * math.log(1.0 - random.random())
+    return time.time() + jitter < entry['expires']
+
+
+def _entry(value, delta, timeout):
+    return {'value': value, 'delta': delta, 'expires': time.time() + timeout}
+
+
+def get_or_compute(key, compute, timeout=None):
+    """
+    Nilai cache `key`, atau compute() jika kosong/kedaluwarsa.
+    Hanya satu pemanggil per key yang menjalankan compute() bersamaan.
+    """
+    config = get_config()
+    cache = get_cache()
+    timeout = config['TIMEOUT'] if timeout is None else timeout
+
+    entry = cache.get(key)
+    if _is_fresh(entry, config['EARLY_REFRESH_BETA']):
+        return entry['value']
+
+    lock_key = f"{key}:lock"
+    if cache.add(lock_key, 1, config['LOCK_SECONDS']):
+        try:
+            start = time.monotonic()
+            value = compute()
+            entry = _entry(value, time.monotonic() - start, timeout)
+            cache.set(key, entry, timeout + config['STALE_SECONDS'])
+            return value
+        finally:
+            cache.delete(lock_key)
+
+    # Worker lain sedang menghitung: pakai nilai lama jika ada
+    if entry is not None:
+        return entry['value']
+    deadline = time.monotonic() + config['LOCK_WAIT_SECONDS']
+    while time.monotonic() < deadline:
+        time.sleep(LOCK_POLL_SECONDS)
+        entry = cache.get(key)
+        if entry is not None:
+            return entry['value']
+    return compute()
+
+
+async def aget_or_compute(key, compute, timeout=None):
+    """get_or_compute() untuk view async; `compute` adalah coroutine function"""
+    config = get_config()
+    cache = get_cache()
+    timeout = config['TIMEOUT'] if timeout is None else timeout
+
+    entry = await cache.aget(key)
+    if _is_fresh(entry, config['EARLY_REFRESH_BETA']):
+        return entry['value']
+
+    lock_key = f"{key}:lock"
+    if await cache.aadd(lock_key, 1, config['LOCK_SECONDS']):
+        try:
+            start = time.monotonic()
+            value = await compute()
+            entry = _entry(value, time.monotonic() - start, timeout)
+            await cache.aset(key, entry, timeout + config['STALE_SECONDS'])
+            return value
+        finally:
+            await cache.adelete(lock_key)
+
+    if entry is not None:
+        return entry['value']
+    deadline = time.monotonic() + config['LOCK_WAIT_SECONDS']
+    while time.monotonic() < deadline:
+        await asyncio.sleep(LOCK_POLL_SECONDS)
+        entry = await cache.aget(key)
+        if entry is not None:
+            return entry['value']
+    return await compute()
+
+
+# =====================================================
+# FAKE REDIS (CACHE_PROFILE=fake)
+# =====================================================
+
+_servers = {}
+_servers_lock = threading.Lock()
+
+
+def _encode(value):
+    # Seperti redis-py: angka disimpan sebagai teks
+    if isinstance(value, bytes):
+        return value
+    return str(value).encode()
+
+
+class FakeRedis:
+    """
+    Subset perintah redis-py yang dipakai RedisCacheClient Django, disimpan
+    di memori proses. Satu instance per URL server (dipakai bersama).
+    """
+
+    def __init__(self):
+        self._data = {}  # key -> (bytes, expires_at monotonic | None)
+        self._lock = threading.RLock()
+
+    def _alive(self, name):
+        item = self._data.get(name)
+        if item is None:
+            return None
+        if item[1] is not None and item[1] <= time.monotonic():
+            del self._data[name]
+            return None
+        return item
+
+    def get(self, name):
+        with self._lock:
+            item = self._alive(name)
+            return None if item is None else item[0]
+
+    def set(self, name, value, ex=None, nx=False):
+        with self._lock:
+            if nx and self._alive(name) is not None:
+                return None
+            expires = None if ex is None else time.monotonic() + ex
+            self._data[name] = (_encode(value), expires)
+            return True
+
+    def delete(self, *names):
+        with self._lock:
+            deleted = 0
+            for name in names:
+                if self._alive(name) is not None:
+                    del self._data[name]
+                    deleted += 1
+            return deleted
+
+    def exists(self, *names):
+        with self._lock:
+            return sum(1 for name in names if self._alive(name) is not None)
+
+    def incr(self, name, amount=1):
+        with self._lock:
+            item = self._alive(name)
+            value = (int(item[0]) if item else 0) + amount
+            self._data[name] = (_encode(value), item[1] if item else None)
+            return value
+
+    def expire(self, name, time_):
+        with self._lock:
+            item = self._alive(name)
+            if item is None:
+                return False
+            self._data[name] = (item[0], time.monotonic() + time_)
+            return True
+
+    def persist(self, name):
+        with self._lock:
+            item = self._alive(name)
+            if item is None or item[1] is None:
+                return False
+            self._data[name] = (item[0], None)
+            return True
+
+    def mget(self, keys):
+        with self._lock:
+            return [self.get(key) for key in keys]
+
+    def mset(self, mapping):
+        with self._lock:
+            for name, value in mapping.items():
+                self._data[name] = (_encode(value), None)
+            return True
+
+    def flushdb(self):
+        with self._lock:
+            self._data.clear()
+            return True
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Perintah ditampung lalu dijalankan berurutan saat execute()"""
+
+    def __init__(self, client):
+        self._client = client
+        self._commands = []
+
+    def __getattr__(self, name):
+        method = getattr(self._client, name)
+
+        def queue(*args, **kwargs):
+            self._commands.append((method, args, kwargs))
+            return self
+        return queue
+
+    def execute(self):
+        with self._client._lock:
+            results = [method(*args, **kwargs) for method, args, kwargs in self._commands]
+        self._commands = []
+        return results
+
+
+def fake_server(url):
+    with _servers_lock:
+        return _servers.setdefault(url, FakeRedis())
+
+
+class FakeRedisCacheClient(RedisCacheClient):
+    """RedisCacheClient Django tanpa redis-py: client = FakeRedis"""
+
+    def __init__(self, servers, serializer=None, **options):
+        self._servers = servers
+        self._pools = {}
+        if isinstance(serializer, str):
+            serializer = import_string(serializer)
+        if callable(serializer):
+            serializer = serializer()
+        self._serializer = serializer or RedisSerializer()
+
+    def get_client(self, key=None, *, write=False):
+        return fake_server(self._servers[self._get_connection_pool_index(write)])
+
+
+class FakeRedisCache(InstrumentedRedisCache):
+    """Backend CACHE_PROFILE=fake: RedisCache + FakeRedis di dalam proses"""
+
+    def __init__(self, server, params):
+        super().__init__(server, params)
+        self._class = FakeRedisCacheClient
@@ -0,0 +1,178 @@
+# utils/conditional.py
+"""
+Conditional GET (ETag / 304) dari version counter per model.
+
+- Setiap save/delete model di VERSIONED_MODELS menaikkan counter model itu
+  (signal di apk/signals.py). QuerySet.update() & bulk_create() tidak memicu
+  signal: pemanggilnya wajib memanggil bump_version(Model) sendiri.
+- ETag = hash counter semua model yang membentuk response + user/role + URL
+  lengkap. Dihitung dengan satu query tanpa menyentuh data, jadi
+  If-None-Match yang cocok dijawab 304 tanpa serialisasi.
+- Counter disimpan di database (tabel model_version), bukan cache lokal,
+  sehingga semua worker melihat versi yang sama. Kenaikan counter dijalankan
+  sekali per model setelah transaksi commit (cascade delete ribuan baris =
+  satu UPDATE counter).
+- Tabel counter ikut tereplikasi: view yang membaca dari read replica
+  membaca counter dari replica yang sama (`using`), sehingga ETag hanya
+  berganti setelah replica menerima perubahannya.
+- Saat yang sama versi namespace model di cache bersama ikut dinaikkan
+  (apk/utils/cache.py), sehingga data ter-cache yang bergantung pada model
+  itu (report, analisis publik) tidak terpakai lagi.
+
+Konfigurasi: settings.CONDITIONAL_GET
+"""
+import hashlib
+import threading
+
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils.cache import patch_vary_headers
+from rest_framework import status
+from rest_framework.response import Response
+
+from .cache import invalidate_namespace, model_namespace
+
+DEFAULT_CONFIG = {
+    'ENABLED': True,
+}
+
+# Model yang datanya tampil di endpoint ber-ETag
+VERSIONED_MODELS = {
+    'apk.User',
+    'apk.TimPengangkut',
+    'apk.Anggota',
+    'apk.Tamu',
+    'apk.Jadwal',
+    'apk.Pembayaran',
+    'apk.DetailAnggotaJadwal',
+    'apk.LaporanSampah',
+}
+
+# Label model yang menunggu dinaikkan saat commit (per thread = per koneksi)
+_pending = threading.local()
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'CONDITIONAL_GET', {})}
+
+
+def is_versioned(model):
+    return model._meta.label in VERSIONED_MODELS
+
+
+def _label(model):
+    return model if isinstance(model, str) else model._meta.label
+
+
+def bump_version(*models):
+    """
+    Naikkan counter model setelah transaksi commit (langsung jika di luar
+    transaksi). Wajib dipanggil setelah update()/bulk_create() model ber-versi.
+    """
+    labels = getattr(_pending, 'labels', None)
+    if labels is None:
+        labels = _pending.labels = set()
+    labels.update(_label(model) for model in models)
+    # Callback berikutnya no-op jika set sudah dikosongkan. Jika transaksi
+    # rollback, label tertinggal ikut dinaikkan di commit berikutnya (aman).
+    transaction.on_commit(_flush)
+
+
+def _flush():
+    labels, _pending.labels = getattr(_pending, 'labels', None), set()
+    if not labels:
+        return
+    ModelVersion = apps.get_model('apk', 'ModelVersion')
+    for label in sorted(labels):
+        updated = ModelVersion.objects.filter(model=label).update(version=F('version') + 1)
+        if not updated:
+            ModelVersion.objects.get_or_create(model=label, defaults={'version': 1})
+    invalidate_namespace(*(model_namespace(label) for label in sorted(labels)))
+
+
+def model_versions(models, using=None):
+    """
+    {label: version} dalam satu query; model yang belum pernah berubah = 0.
+    `using` = database sumber data response (None = router).
+    """
+    ModelVersion = apps.get_model('apk', 'ModelVersion')
+    labels = sorted({_label(model) for model in models})
+    versions = dict(
+        ModelVersion.objects.using(using).filter(model__in=labels).values_list('model', 'version')
+    )
+    return {label: versions.get(label, 0) for label in labels}
+
+
+def make_etag(models, *parts, using=None, versions=None):
+    """
+    ETag lemah dari versi `models` + bagian lain yang membedakan response.
+    `versions` = hasil model_versions() yang sudah dibaca (tanpa query lagi).
+    """
+    if versions is None:
+        versions = model_versions(models, using)
+    raw = '|'.join(
+        [f"{label}:{version}" for label, version in versions.items()]
+        + [str(part) for part in parts]
+    )
+    return f'W/"{hashlib.sha256(raw.encode()).hexdigest()[:32]}"'
+
+
+def etag_matches(header, etag):
+    """If-None-Match cocok dengan etag (perbandingan lemah, W/ diabaikan)"""
+    if not header:
+        return False
+    if header.strip() == '*':
+        return True
+    opaque = etag.removeprefix('W/')
+    return any(tag.strip().removeprefix('W/') == opaque for tag in header.split(','))
+
+
+def conditional_response(request, etag, respond):
+    """
+    304 jika If-None-Match cocok dengan etag, selain itu response dari
+    respond(). ETag hanya dipasang pada response 200/304.
+    """
+    if etag and etag_matches(request.headers.get('If-None-Match'), etag):
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = respond()
+        if not etag or response.status_code != status.HTTP_200_OK:
+            return response
+    response['ETag'] = etag
+    # Isi response tergantung user (token/session)
+    patch_vary_headers(response, ['Authorization', 'Cookie'])
+    return response
+
+
+class ConditionalGetMixin:
+    """
+    ETag / 304 untuk list() & retrieve() ViewSet DRF.
+
+    `etag_models` = semua model yang isinya ikut membentuk response
+    (termasuk relasi & annotate di serializer).
+    """
+    etag_models = ()
+
+    def get_etag(self, request):
+        if not self.etag_models or not get_config()['ENABLED']:
+            return None
+        user = request.user
+        return make_etag(
+            self.etag_models, user.pk, getattr(user, 'role', None), request.get_full_path(),
+        )
+
+    def list(self, request, *args, **kwargs):
+        return conditional_response(
+            request, self.get_etag(request),
+            lambda: super(ConditionalGetMixin, self).list(request, *args, **kwargs),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        # get_object() tetap dijalankan agar 404 & permission object dicek sebelum 304
+        instance = self.get_object()
+        return conditional_response(
+            request, self.get_etag(request),
+            lambda: Response(self.get_serializer(instance).data),
+        )
@@ -0,0 +1,103 @@
+# utils/geo.py
+"""
+Pencarian spasial sederhana (radius di sekitar satu titik).
+
+Dua tahap:
+1. Prefilter bounding box pada kolom latitude/longitude (ber-index),
+   sehingga database hanya membaca baris di sekitar titik.
+2. Jarak haversine dihitung sebagai anotasi `jarak_m` lalu difilter
+   dengan radius yang tepat dan diurutkan dari yang terdekat.
+"""
+import math
+
+from django.db.models import F, FloatField, Value
+from django.db.models.functions import ASin, Cos, Power, Radians, Sin, Sqrt
+from rest_framework.exceptions import ValidationError
+
+from .routing import EARTH_RADIUS_KM
+
+EARTH_RADIUS_M = EARTH_RADIUS_KM * 1000
+DEFAULT_RADIUS_M = 500
+MAX_RADIUS_M = 50000
+
+
+def bounding_box(latitude, longitude, radius_m):
+    """
+    (min_lat, max_lat, min_lon, max_lon) yang pasti memuat lingkaran radius
+    """
+    dlat = math.degrees(radius_m / EARTH_RADIUS_M)
+    cos_lat = math.cos(math.radians(latitude))
+    # Dekat kutub satu derajat longitude sangat pendek: ambil semua longitude
+    dlon = math.degrees(radius_m / (EARTH_RADIUS_M * cos_lat)) if cos_lat > 1e-6 else 180
+
+    return (
+        max(latitude - dlat, -90.0),
+        min(latitude + dlat, 90.0),
+        max(longitude - dlon, -180.0),
+        min(longitude + dlon, 180.0),
+    )
+
+
+def haversine_expression(latitude, longitude, lat_field='latitude', lon_field='longitude'):
+    """
+    Ekspresi ORM jarak (meter) dari titik ke kolom lat/lon
+    """
+    lat1 = math.radians(latitude)
+    lat2 = Radians(F(lat_field))
+    dlat = Radians(F(lat_field)) - Value(lat1)
+    dlon = Radians(F(lon_field)) - Value(math.radians(longitude))
+
+    a = (
+        Power(Sin(dlat / 2), 2)
+        + Value(math.cos(lat1)) * Cos(lat2) * Power(Sin(dlon / 2), 2)
+    )
+    return Value(2 * EARTH_RADIUS_M) * ASin(Sqrt(a), output_field=FloatField())
+
+
+def filter_near(queryset, latitude, longitude, radius_m,
+                lat_field='latitude', lon_field='longitude'):
+    """
+    Batasi queryset ke baris dalam radius (meter), urut dari yang terdekat.
+    Setiap objek mendapat atribut `jarak_m`.
+    """
+    min_lat, max_lat, min_lon, max_lon = bounding_box(latitude, longitude, radius_m)
+
+    return (
+        queryset
+        .filter(**{
+            f'{lat_field}__range': (min_lat, max_lat),
+            f'{lon_field}__range': (min_lon, max_lon),
+        })
+        .annotate(jarak_m=haversine_expression(latitude, longitude, lat_field, lon_field))
+        .filter(jarak_m__lte=radius_m)
+        .order_by('jarak_m')
+    )
+
+
+def parse_near_params(query_params):
+    """
+    Baca `near=lat,lon` dan `radius=` (meter) dari query params.
+    Return None jika `near` tidak dikirim, atau (lat, lon, radius_m).
+    """
+    near = query_params.get('near')
+    if not near:
+        return None
+
+    try:
+        latitude, longitude = (float(v) for v in near.split(','))
+    except ValueError:
+        raise ValidationError({'near': 'Format near harus "latitude,longitude"'})
+
+    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+        raise ValidationError({'near': 'Koordinat tidak valid'})
+
+    radius = query_params.get('radius', DEFAULT_RADIUS_M)
+    try:
+        radius_m = float(radius)
+    except (TypeError, ValueError):
+        raise ValidationError({'radius': 'Radius harus berupa angka (meter)'})
+
+    if not (0 < radius_m <= MAX_RADIUS_M):
+        raise ValidationError({'radius': f'Radius harus antara 0 dan {MAX_RADIUS_M} meter'})
+
+    return latitude, longitude, radius_m
@@ -0,0 +1,239 @@
+# utils/images.py
+"""
+Pipeline gambar untuk upload foto_bukti (LaporanSampah) & buktiBayar (Pembayaran).
+
+Setelah upload tersimpan (on_commit, di luar request):
+1. File asli di-encode ulang ke WebP/JPEG dengan dimensi maksimal tertentu,
+   orientasi EXIF diterapkan lalu seluruh metadata EXIF dibuang.
+   Hasilnya disimpan di subfolder `opt/` (mis. `laporan_fotos/opt/...`).
+2. Rendisi (thumb, medium) dibuat di `renditions/<path asli>_<rendisi>.<ext>`.
+
+Konfigurasi: settings.IMAGE_PIPELINE
+"""
+import io
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import close_old_connections, transaction
+from PIL import Image, ImageOps, UnidentifiedImageError, features
+
+from ..storage import acquire, release
+from .conditional import bump_version
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIG = {
+    'ENABLED': True,
+    'ASYNC': True,
+    'FORMAT': 'WEBP',
+    'QUALITY': 80,
+    'MAX_DIMENSION': 2048,
+    'RENDITIONS': {
+        'thumb': 320,
+        'medium': 1024,
+    },
+    'WORKERS': 2,
+}
+
+PROCESSED_DIR = 'opt'
+PROCESSED_SUFFIX = '_opt'  # penanda lama, sebelum storage berbasis hash
+RENDITION_DIR = 'renditions'
+
+_executor = None
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'IMAGE_PIPELINE', {})}
+
+
+def _output_format():
+    fmt = get_config()['FORMAT'].upper()
+    if fmt == 'WEBP' and not features.check('webp'):
+        fmt = 'JPEG'
+    return fmt
+
+
+def _extension(fmt):
+    return 'webp' if fmt == 'WEBP' else 'jpg'
+
+
+def is_processed(name):
+    """File hasil pipeline berada di subfolder `opt/` (atau berakhiran `_opt`)"""
+    name = (name or '').replace('\\', '/')
+    stem, _ = os.path.splitext(os.path.basename(name))
+    return PROCESSED_DIR in name.split('/')[:-1] or stem.endswith(PROCESSED_SUFFIX)
+
+
+def processed_name(name, fmt):
+    """Nama simpan hasil encode ulang: <folder teratas>/opt/<nama>.<ext>"""
+    top = name.split('/', 1)[0] if '/' in name else ''
+    stem, _ = os.path.splitext(os.path.basename(name))
+    return '/'.join(filter(None, [top, PROCESSED_DIR, f"{stem}.{_extension(fmt)}"]))
+
+
+def rendition_name(name, rendition):
+    """Path rendisi untuk file asli `name`"""
+    stem, _ = os.path.splitext(name)
+    return f"{RENDITION_DIR}/{stem}_{rendition}.{_extension(_output_format())}"
+
+
+def _encode(image, fmt, quality):
+    """Encode ulang tanpa metadata (EXIF tidak ikut disimpan)"""
+    if fmt == 'JPEG':
+        if image.mode in ('RGBA', 'LA', 'P'):
+            image = image.convert('RGBA')
+            background = Image.new('RGB', image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel('A'))
+            image = background
+        elif image.mode != 'RGB':
+            image = image.convert('RGB')
+    elif image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if 'A' in image.getbands() or image.mode == 'P' else 'RGB')
+
+    buffer = io.BytesIO()
+    options = {'quality': quality}
+    if fmt == 'JPEG':
+        options.update(optimize=True, progressive=True)
+    else:
+        options.update(method=4)
+    image.save(buffer, format=fmt, **options)
+    return buffer.getvalue()
+
+
+def _bounded(image, max_dimension):
+    if max(image.size) <= max_dimension:
+        return image
+    image = image.copy()
+    image.thumbnail((max_dimension, max_dimension), Image.LANCZOS)
+    return image
+
+
+def process_image(model, pk, field_name, force=False):
+    """
+    Proses satu file gambar milik `model` (pk, field_name).
+    Return nama file hasil, atau None jika tidak ada yang diproses.
+    """
+    config = get_config()
+    instance = model.objects.filter(pk=pk).only(model._meta.pk.attname, field_name).first()
+    if instance is None:
+        return None
+
+    fieldfile = getattr(instance, field_name)
+    if not fieldfile:
+        return None
+
+    storage = fieldfile.storage
+    name = fieldfile.name
+    fmt = _output_format()
+    quality = config['QUALITY']
+
+    if is_processed(name) and not force and all(
+        storage.exists(rendition_name(name, rendition)) for rendition in config['RENDITIONS']
+    ):
+        return name
+
+    try:
+        with storage.open(name, 'rb') as f:
+            image = Image.open(f)
+            image = ImageOps.exif_transpose(image)
+            image.load()
+    except (FileNotFoundError, UnidentifiedImageError, OSError) as e:
+        logger.warning("🖼️ Gagal membaca gambar %s: %s", name, e)
+        return None
+
+    def save_renditions(target_name):
+        for rendition, size in config['RENDITIONS'].items():
+            target = rendition_name(target_name, rendition)
+            if storage.exists(target):
+                storage.delete(target)
+            storage.save(target, ContentFile(_encode(_bounded(image, size), fmt, quality)))
+
+    if not is_processed(name):
+        data = _encode(_bounded(image, config['MAX_DIMENSION']), fmt, quality)
+        new_name = storage.save(processed_name(name, fmt), ContentFile(data))
+        # Rendisi ditulis sebelum baris menunjuk ke file `opt/`: rendition_urls
+        # cukup memeriksa is_processed() tanpa stat ke storage
+        save_renditions(new_name)
+
+        # Update hanya jika file belum diganti sejak job dijadwalkan
+        updated = model.objects.filter(pk=pk, **{field_name: name}).update(**{field_name: new_name})
+        if not updated:
+            # Blob tanpa referensi (beserta rendisinya) dihapus cleanup_media
+            # setelah masa tenggang
+            return None
+
+        # queryset.update() tidak memicu signal: referensi blob diperbarui di sini.
+        # File lama tidak langsung dihapus: upload lain dengan isi sama bisa saja
+        # sudah menunjuk blob ini tapi belum acquire(). cleanup_media menghapusnya
+        # setelah masa tenggang jika memang tidak dipakai lagi.
+        acquire(new_name)
+        release(name)
+        logger.info("🖼️ %s di-encode ulang menjadi %s", name, new_name)
+        name = new_name
+    else:
+        save_renditions(name)
+
+    # URL file & rendisi di serializer berubah; update() tidak memicu signal
+    bump_version(model)
+    return name
+
+
+def _run_job(model, pk, field_name):
+    try:
+        process_image(model, pk, field_name)
+    except Exception:
+        logger.exception("❌ Image pipeline error (%s pk=%s)", model.__name__, pk)
+    finally:
+        close_old_connections()
+
+
+def schedule_image_processing(instance, field_name):
+    """
+    Jadwalkan proses gambar setelah transaksi commit (di luar request).
+    """
+    config = get_config()
+    if not config['ENABLED']:
+        return
+
+    model, pk = type(instance), instance.pk
+
+    def submit():
+        global _executor
+        if not config['ASYNC']:
+            process_image(model, pk, field_name)
+            return
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=config['WORKERS'], thread_name_prefix='image-pipeline'
+            )
+        _executor.submit(_run_job, model, pk, field_name)
+
+    transaction.on_commit(submit)
+
+
+def rendition_urls(fieldfile, request=None):
+    """
+    URL tiap rendisi untuk ditampilkan di serializer/admin.
+    Jika file belum diproses, URL file asli dipakai. Tidak ada akses ke
+    storage: process_image menulis rendisi sebelum field menunjuk ke `opt/`.
+    """
+    if not fieldfile:
+        return None
+
+    def absolute(url):
+        return request.build_absolute_uri(url) if request else url
+
+    storage = fieldfile.storage
+    processed = is_processed(fieldfile.name)
+    original = absolute(fieldfile.url)
+    urls = {}
+    for rendition in get_config()['RENDITIONS']:
+        urls[rendition] = (
+            absolute(storage.url(rendition_name(fieldfile.name, rendition))) if processed
+            else original
+        )
+    urls['original'] = original
+    return urls
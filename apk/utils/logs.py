@@ -0,0 +1,88 @@
+# utils/logs.py
+"""
+Logging terstruktur untuk apk: event bernama + field, dengan level & sampling.
+
+    log = get_logger(__name__)
+    log.event(logging.DEBUG, 'detail_jadwal.queryset', role=role, count=qs.count)
+
+- Level dicek dulu: jika logger tidak aktif untuk level itu, tidak ada yang
+  dievaluasi.
+- Field callable (mis. `qs.count`) baru dipanggil saat event benar-benar
+  ditulis, jadi query khusus debug tidak jalan di produksi.
+- Event di bawah WARNING bisa di-sampling per nama event (SAMPLE_RATES);
+  WARNING ke atas selalu ditulis.
+
+JsonFormatter menulis satu baris JSON per record (LOG_FORMAT=json).
+
+Konfigurasi: settings.STRUCTURED_LOGGING
+"""
+import json
+import logging
+import random
+
+from django.conf import settings
+
+DEFAULT_CONFIG = {
+    # Peluang event ditulis (0..1) per nama event, untuk level < WARNING
+    'SAMPLE_RATES': {},
+    'DEFAULT_SAMPLE_RATE': 1.0,
+}
+
+# Atribut bawaan LogRecord, tidak ikut ditulis sebagai field
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {'message', 'asctime'}
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'STRUCTURED_LOGGING', {})}
+
+
+class StructuredLogger(logging.LoggerAdapter):
+
+    def __init__(self, logger):
+        super().__init__(logger, {})
+
+    def sampled(self, level, name):
+        """True jika event `name` pada `level` akan ditulis"""
+        if not self.logger.isEnabledFor(level):
+            return False
+        if level >= logging.WARNING:
+            return True
+        config = get_config()
+        rate = config['SAMPLE_RATES'].get(name, config['DEFAULT_SAMPLE_RATE'])
+        return rate >= 1 or random.random() < rate
+
+    def event(self, level, name, exc_info=None, **fields):
+        if not self.sampled(level, name):
+            return
+        fields = {key: value() if callable(value) else value for key, value in fields.items()}
+        message = ' '.join([name] + [f"{key}={value}" for key, value in fields.items()])
+        self.logger.log(
+            level, message, exc_info=exc_info, stacklevel=2,
+            extra={'event': name, 'fields': fields},
+        )
+
+
+def get_logger(name):
+    return StructuredLogger(logging.getLogger(name))
+
+
+class JsonFormatter(logging.Formatter):
+    """Satu baris JSON: waktu, level, logger, event/message + field"""
+
+    def format(self, record):
+        data = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+        }
+        if hasattr(record, 'event'):
+            data['event'] = record.event
+            data.update(record.fields)
+        else:
+            data['message'] = record.getMessage()
+            data.update({
+                key: value for key, value in vars(record).items() if key not in _RECORD_ATTRS
+            })
+        if record.exc_info:
+            data['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(data, default=str, ensure_ascii=False)
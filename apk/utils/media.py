@@ -0,0 +1,107 @@
+# utils/media.py
+"""
+Helper untuk penyajian file media (apk/viewMedia.py).
+
+- File privat (bukti pembayaran & rendisinya) hanya bisa diakses dengan
+  URL bertanda tangan (?sig=...) atau user yang berhak.
+- ETag kuat diambil dari hash isi file: untuk blob berbasis hash cukup
+  dari namanya, selain itu di-hash sekali lalu disimpan di cache.
+
+Konfigurasi: settings.MEDIA_SERVING
+"""
+import hashlib
+import os
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core import signing
+
+DEFAULT_CONFIG = {
+    # None | 'x-sendfile' (Apache/lighttpd) | 'x-accel-redirect' (nginx)
+    'SENDFILE_BACKEND': None,
+    'X_ACCEL_PREFIX': '/protected-media/',
+    'PRIVATE_PREFIXES': ['bukti_pembayaran/'],
+    'SIGNED_URL_MAX_AGE': 60 * 60 * 24,
+    'IMMUTABLE_MAX_AGE': 60 * 60 * 24 * 365,
+    'DEFAULT_MAX_AGE': 60 * 60,
+    'CHUNK_SIZE': 64 * 1024,
+}
+
+RENDITION_DIR = 'renditions'
+SIGNING_SALT = 'apk.media'
+HASH_CHUNK_SIZE = 64 * 1024
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'MEDIA_SERVING', {})}
+
+
+def source_name(name):
+    """Nama file asli untuk sebuah rendisi (`renditions/<asli>_<rendisi>`)"""
+    prefix = f"{RENDITION_DIR}/"
+    return name[len(prefix):] if name.startswith(prefix) else name
+
+
+def is_private(name):
+    return source_name(name or '').startswith(tuple(get_config()['PRIVATE_PREFIXES']))
+
+
+def sign_name(name):
+    """Token tanda tangan untuk ?sig= (berlaku SIGNED_URL_MAX_AGE detik)"""
+    signed = signing.TimestampSigner(salt=SIGNING_SALT).sign(name)
+    return signed[len(name) + 1:]
+
+
+def verify_signature(name, token):
+    if not token:
+        return False
+    try:
+        signing.TimestampSigner(salt=SIGNING_SALT).unsign(
+            f"{name}:{token}", max_age=get_config()['SIGNED_URL_MAX_AGE']
+        )
+    except signing.BadSignature:
+        return False
+    return True
+
+
+def _hashed_stem(name):
+    stem = os.path.splitext(os.path.basename(name))[0]
+    digest = stem.split('_', 1)[0]
+    if len(digest) == 64 and all(c in '0123456789abcdef' for c in digest):
+        return stem
+    return None
+
+
+def is_immutable(name):
+    """
+    Blob berbasis hash (dan rendisinya) tidak pernah berubah isi
+    untuk nama yang sama, jadi boleh di-cache selamanya.
+    """
+    return _hashed_stem(name) is not None
+
+
+def content_hash(name, path, stat=None):
+    """
+    SHA-256 isi file (hex). Blob berbasis hash cukup dibaca dari namanya,
+    selain itu dihitung sekali per (nama, mtime, ukuran) lalu disimpan di cache.
+    """
+    stem = _hashed_stem(name)
+    if stem is not None and not name.startswith(f"{RENDITION_DIR}/"):
+        return stem
+
+    stat = stat or os.stat(path)
+    key = f"media-hash:{name}:{stat.st_mtime_ns}:{stat.st_size}"
+    digest = cache.get(key)
+    if digest is None:
+        sha = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                sha.update(chunk)
+        digest = sha.hexdigest()
+        cache.set(key, digest, None)
+    return digest
+
+
+def file_etag(name, path, stat):
+    """ETag kuat (dengan tanda kutip) dari hash isi file"""
+    return f'"{content_hash(name, path, stat)}"'
@@ -0,0 +1,182 @@
+# utils/metrics.py
+"""
+Metrik aplikasi dalam format teks Prometheus (GET /api/metrics).
+
+- Latency request per route (histogram), jumlah & waktu query SQL per route
+- Hit/miss cache (backend InstrumentedLocMemCache / InstrumentedRedisCache)
+- Hasil pengiriman web push dari NotificationService
+- Opsional: log request lambat beserta query terlamanya (SLOW_REQUEST_MS)
+
+Metrik disimpan per proses; dengan beberapa worker, scrape tiap worker
+atau agregasikan di Prometheus.
+
+Konfigurasi: settings.METRICS
+"""
+import threading
+from bisect import bisect_left
+
+from django.conf import settings
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.redis import RedisCache
+
+DEFAULT_CONFIG = {
+    'ENABLED': True,
+    # None = tidak log request lambat
+    'SLOW_REQUEST_MS': None,
+    'SLOW_REQUEST_TOP_QUERIES': 5,
+    # Jika diisi, /api/metrics butuh header Authorization: Bearer <TOKEN>
+    'TOKEN': None,
+    # Tanpa TOKEN, /api/metrics hanya untuk IP ini
+    'ALLOWED_IPS': ['127.0.0.1', '::1'],
+}
+
+PREFIX = 'cleanup'
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+_lock = threading.Lock()
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'METRICS', {})}
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(names, values, extra=None):
+    pairs = list(zip(names, values)) + list(extra or [])
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _number(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    type = 'counter'
+
+    def __init__(self, name, help_text, labels=()):
+        self.name = f"{PREFIX}_{name}"
+        self.help = help_text
+        self.label_names = tuple(labels)
+        self.values = {}
+
+    def inc(self, *labels, amount=1):
+        with _lock:
+            self.values[labels] = self.values.get(labels, 0) + amount
+
+    def samples(self):
+        for labels, value in sorted(self.values.items()):
+            yield f"{self.name}{_labels(self.label_names, labels)} {_number(value)}"
+
+
+class Histogram:
+    type = 'histogram'
+
+    def __init__(self, name, help_text, labels=(), buckets=LATENCY_BUCKETS):
+        self.name = f"{PREFIX}_{name}"
+        self.help = help_text
+        self.label_names = tuple(labels)
+        self.buckets = tuple(buckets)
+        self.values = {}
+
+    def observe(self, value, *labels):
+        with _lock:
+            counts, total = self.values.get(labels, ([0] * (len(self.buckets) + 1), 0.0))
+            counts[bisect_left(self.buckets, value)] += 1
+            self.values[labels] = (counts, total + value)
+
+    def samples(self):
+        for labels, (counts, total) in sorted(self.values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                le = _labels(self.label_names, labels, [('le', _number(bound))])
+                yield f"{self.name}_bucket{le} {cumulative}"
+            yield f"{self.name}_sum{_labels(self.label_names, labels)} {_number(total)}"
+            yield f"{self.name}_count{_labels(self.label_names, labels)} {cumulative}"
+
+
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds', 'Latency request HTTP per route', ('route', 'method'),
+)
+REQUESTS = Counter(
+    'http_requests_total', 'Jumlah request HTTP per route & status', ('route', 'method', 'status'),
+)
+DB_QUERIES = Histogram(
+    'db_queries_per_request', 'Jumlah query SQL per request', ('route',), QUERY_COUNT_BUCKETS,
+)
+DB_QUERY_SECONDS = Counter(
+    'db_query_seconds_total', 'Total waktu query SQL per route', ('route',),
+)
+CACHE_REQUESTS = Counter(
+    'cache_requests_total', 'Jumlah lookup cache per hasil (hit/miss)', ('cache', 'result'),
+)
+PUSH_DELIVERIES = Counter(
+    'push_deliveries_total', 'Hasil pengiriman web push NotificationService', ('outcome',),
+)
+
+REGISTRY = [REQUEST_LATENCY, REQUESTS, DB_QUERIES, DB_QUERY_SECONDS, CACHE_REQUESTS, PUSH_DELIVERIES]
+
+
+def record_push(outcome):
+    """outcome: success | failed | expired | error | no_subscription"""
+    PUSH_DELIVERIES.inc(outcome)
+
+
+def _cache_hit_ratio_samples():
+    totals = {}
+    for (cache_name, result), value in CACHE_REQUESTS.values.items():
+        totals.setdefault(cache_name, {'hit': 0, 'miss': 0})[result] += value
+    for cache_name, counts in sorted(totals.items()):
+        lookups = counts['hit'] + counts['miss']
+        ratio = counts['hit'] / lookups if lookups else 0.0
+        yield f'{PREFIX}_cache_hit_ratio{{cache="{_escape(cache_name)}"}} {_number(ratio)}'
+
+
+def render():
+    """Semua metrik dalam format teks Prometheus 0.0.4"""
+    lines = []
+    with _lock:
+        for metric in REGISTRY:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(metric.samples())
+        lines.append(f"# HELP {PREFIX}_cache_hit_ratio Rasio hit cache sejak proses mulai")
+        lines.append(f"# TYPE {PREFIX}_cache_hit_ratio gauge")
+        lines.extend(_cache_hit_ratio_samples())
+    return '\n'.join(lines) + '\n'
+
+
+_MISSING = object()
+
+
+class InstrumentedCacheMixin:
+    """
+    Catat hit/miss get() ke cache_requests_total.
+    get_many() bawaan BaseCache memanggil get() per key, jadi ikut tercatat.
+    """
+
+    def __init__(self, location, params):
+        super().__init__(location, params)
+        # CACHES[...]['METRICS_NAME'], label `cache` di metrik
+        self.metrics_name = params.get('METRICS_NAME', 'default')
+
+    def get(self, key, default=None, version=None):
+        value = super().get(key, _MISSING, version=version)
+        CACHE_REQUESTS.inc(self.metrics_name, 'miss' if value is _MISSING else 'hit')
+        return default if value is _MISSING else value
+
+
+class InstrumentedLocMemCache(InstrumentedCacheMixin, LocMemCache):
+    pass
+
+
+class InstrumentedRedisCache(InstrumentedCacheMixin, RedisCache):
+    """RedisCache + hit/miss get() (get_many() memakai MGET, tidak tercatat)"""
@@ -1,6 +1,8 @@
 # utils/notifications.py
+import asyncio
 import json
 import logging
+from asgiref.sync import sync_to_async
 from django.db import models
 from django.conf import settings
 from django.contrib.auth import get_user_model
@@ -8,11 +10,21 @@ from pywebpush import webpush, WebPushException
 from django.utils import timezone
 from datetime import timedelta
 
+try:
+    import aiohttp
+    from pywebpush import webpush_async
+except ImportError:  # pywebpush < 2.0: pengiriman async jatuh ke webpush() di thread
+    aiohttp = webpush_async = None
+
 from ..models import PushSubscription, Notification, LaporanSampah, TimPengangkut
+from .metrics import record_push
 
 logger = logging.getLogger(__name__)
 User = get_user_model()
 
+# Batas waktu satu request ke push service (detik), untuk pengiriman async
+PUSH_TIMEOUT_SECONDS = 10
+
 
 class NotificationService:
     """
@@ -53,13 +65,19 @@ class NotificationService:
             except Exception as e:
                 logger.error(f"❌ Failed to create database notification: {e}")
         
-        subscriptions = PushSubscription.objects.filter(user=user)
+        subscriptions = list(PushSubscription.objects.filter(user=user))
 
-        if not subscriptions.exists():
+        if not subscriptions:
             logger.warning("❌ No subscription for user %s", user.username)
+            record_push("no_subscription")
             return []
 
-        payload = {
+        payload = NotificationService._build_payload(title, body, notification_type, url, data)
+        return NotificationService.push_subscriptions(user, subscriptions, payload)
+
+    @staticmethod
+    def _build_payload(title, body, notification_type, url, data):
+        return {
             "title": title,
             "body": body,
             "icon": "/icons/icon-192x192.png",
@@ -68,6 +86,38 @@ class NotificationService:
             "data": data or {},
         }
 
+    @staticmethod
+    def _vapid_kwargs():
+        # Claims dibuat baru per kirim: webpush() mengisi "aud" sesuai endpoint
+        return {
+            "vapid_private_key": settings.WEBPUSH_SETTINGS["VAPID_PRIVATE_KEY"],
+            "vapid_claims": {
+                "sub": f"mailto:{settings.WEBPUSH_SETTINGS['VAPID_ADMIN_EMAIL']}"
+            },
+        }
+
+    @staticmethod
+    def is_expired(ex):
+        """WebPushException karena subscription sudah tidak berlaku (404/410)"""
+        # requests.Response bernilai False untuk status 4xx, jadi cek status langsung
+        response = ex.response
+        status_code = getattr(response, "status_code", getattr(response, "status", None))
+        return status_code in (404, 410)
+
+    @staticmethod
+    def _push_failed(user, ex):
+        """Catat kegagalan WebPush, True jika subscription perlu dihapus"""
+        expired = NotificationService.is_expired(ex)
+        record_push("expired" if expired else "failed")
+        logger.error("❌ WebPush error (%s): %s", user.username, ex)
+        return expired
+
+    @staticmethod
+    def push_subscriptions(user, subscriptions, payload):
+        """
+        Kirim payload ke setiap subscription user (berurutan).
+        Subscription kedaluwarsa dihapus.
+        """
         results = []
 
         for subscription in subscriptions:
@@ -75,33 +125,74 @@ class NotificationService:
                 webpush(
                     subscription_info=subscription.to_dict(),
                     data=json.dumps(payload),
-                    vapid_private_key=settings.WEBPUSH_SETTINGS["VAPID_PRIVATE_KEY"],
-                    vapid_claims={
-                        "sub": f"mailto:{settings.WEBPUSH_SETTINGS['VAPID_ADMIN_EMAIL']}"
-                    },
+                    **NotificationService._vapid_kwargs(),
                 )
 
                 results.append({
                     "status": "success",
                     "endpoint": subscription.endpoint,
                 })
+                record_push("success")
 
-                logger.info("✅ Notification sent to %s with URL: %s", user.username, url)
+                logger.info("✅ Notification sent to %s with URL: %s", user.username, payload.get("url"))
 
             except WebPushException as ex:
                 # Subscription expired / gone
-                if ex.response and ex.response.status_code in (404, 410):
+                if NotificationService._push_failed(user, ex):
                     subscription.delete()
                     logger.warning("🧹 Deleted expired subscription for %s", user.username)
-
-                logger.error("❌ WebPush error (%s): %s", user.username, ex)
-                results.append({"status": "failed", "error": str(ex)})
+                results.append({"status": "failed", "error": str(ex), "type": "WebPushException"})
 
             except Exception as e:
+                record_push("error")
                 logger.exception("❌ Unknown push error: %s", e)
+                results.append({"status": "failed", "error": str(e), "type": "Unknown"})
 
         return results
 
+    # =====================================================
+    # ASYNC SENDER (view async / ASGI)
+    # =====================================================
+
+    @staticmethod
+    async def apush_subscriptions(user, subscriptions, payload):
+        """
+        Kirim payload ke semua subscription bersamaan lewat aiohttp (satu
+        ClientSession). Hasil sama dengan push_subscriptions().
+        """
+        if webpush_async is None:
+            return await sync_to_async(NotificationService.push_subscriptions)(user, subscriptions, payload)
+
+        data = json.dumps(payload)
+        timeout = aiohttp.ClientTimeout(total=PUSH_TIMEOUT_SECONDS)
+
+        async def send(session, subscription):
+            try:
+                await webpush_async(
+                    subscription_info=subscription.to_dict(),
+                    data=data,
+                    aiohttp_session=session,
+                    timeout=timeout,
+                    **NotificationService._vapid_kwargs(),
+                )
+                record_push("success")
+                logger.info("✅ Notification sent to %s with URL: %s", user.username, payload.get("url"))
+                return {"status": "success", "endpoint": subscription.endpoint}
+
+            except WebPushException as ex:
+                if NotificationService._push_failed(user, ex):
+                    await subscription.adelete()
+                    logger.warning("🧹 Deleted expired subscription for %s", user.username)
+                return {"status": "failed", "error": str(ex), "type": "WebPushException"}
+
+            except Exception as e:
+                record_push("error")
+                logger.exception("❌ Unknown push error: %s", e)
+                return {"status": "failed", "error": str(e), "type": "Unknown"}
+
+        async with aiohttp.ClientSession() as session:
+            return list(await asyncio.gather(*(send(session, s) for s in subscriptions)))
+
     # =====================================================
     # ADMIN HELPERS
     # =====================================================
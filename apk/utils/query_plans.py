@@ -0,0 +1,101 @@
+# utils/query_plans.py
+"""
+Query yang paling sering dijalankan viewset & report, beserta index komposit
+(Meta.indexes) yang wajib dipakai. Dicek oleh test (apk/tests.py) dan
+manage.py explain_hot_queries untuk database lain (mis. PostgreSQL produksi).
+"""
+from datetime import timedelta
+
+from django.db import DEFAULT_DB_ALIAS
+from django.utils import timezone
+
+from ..models import (
+    Anggota, DetailAnggotaJadwal, Jadwal, LaporanSampah, Notification, Pembayaran, User,
+)
+
+
+def index_name(model, fields):
+    """Nama index Meta.indexes dengan kolom `fields`"""
+    for index in model._meta.indexes:
+        if tuple(index.fields) == tuple(fields):
+            return index.name
+    raise LookupError(f"{model.__name__} tidak punya index {fields}")
+
+
+def hot_queries():
+    """
+    (label, queryset, model, fields index yang harus dipakai).
+    Bentuk query sama dengan yang dijalankan viewset & report.
+    """
+    today = timezone.now().date()
+    start, end = today - timedelta(days=30), today
+
+    return [
+        (
+            "report keuangan: pembayaran lunas per periode",
+            Pembayaran.objects.filter(tanggalBayar__range=[start, end], statusBayar='lunas'),
+            Pembayaran, ['tanggalBayar', 'statusBayar'],
+        ),
+        (
+            "report anggota: anggota per periode",
+            Anggota.objects.filter(tanggalStart__range=[start, end]).order_by('-tanggalStart'),
+            Anggota, ['tanggalStart', 'status'],
+        ),
+        (
+            "anggota aktif akan expired",
+            Anggota.objects.filter(status='aktif', tanggalEnd__range=[today, today + timedelta(days=30)]),
+            Anggota, ['status', 'tanggalEnd'],
+        ),
+        (
+            "report laporan sampah per periode",
+            LaporanSampah.objects.filter(tanggal_lapor__range=[start, end]).order_by('-tanggal_lapor'),
+            LaporanSampah, ['tanggal_lapor', 'status'],
+        ),
+        (
+            "antrian laporan ?status=pending",
+            LaporanSampah.objects.filter(status='pending').order_by('-tanggal_lapor')[:20],
+            LaporanSampah, ['status', 'tanggal_lapor'],
+        ),
+        (
+            "jadwal per periode",
+            Jadwal.objects.filter(tanggalJadwal__range=[start, end]),
+            Jadwal, ['tanggalJadwal', 'idTim'],
+        ),
+        (
+            "pengangkutan selesai per periode",
+            DetailAnggotaJadwal.objects.filter(
+                idJadwal__tanggalJadwal__range=[start, end], status_pengangkutan='selesai'
+            ),
+            DetailAnggotaJadwal, ['idJadwal', 'status_pengangkutan'],
+        ),
+        (
+            "daftar detail jadwal terbaru",
+            DetailAnggotaJadwal.objects.order_by('-created_at')[:20],
+            DetailAnggotaJadwal, ['created_at'],
+        ),
+        (
+            "hitung user per role",
+            User.objects.filter(role='anggota'),
+            User, ['role'],
+        ),
+        (
+            "daftar user terbaru",
+            User.objects.order_by('-date_joined')[:20],
+            User, ['date_joined'],
+        ),
+        (
+            "notifikasi belum dibaca",
+            Notification.objects.filter(user_id=1, read=False).order_by('-created_at')[:20],
+            Notification, ['user', '-created_at'],
+        ),
+    ]
+
+
+def check_plans(using=DEFAULT_DB_ALIAS):
+    """[(label, nama index, plan EXPLAIN, index dipakai?)] untuk semua hot_queries()"""
+    results = []
+    for label, queryset, model, fields in hot_queries():
+        name = index_name(model, fields)
+        plan = queryset.using(using).explain()
+        results.append((label, name, plan, name in plan))
+    return results
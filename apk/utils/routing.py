@@ -0,0 +1,115 @@
+# utils/routing.py
+"""
+Optimasi urutan titik pengangkutan (rute truk) untuk satu Jadwal.
+
+Heuristik: nearest-neighbour dari depot, lalu diperbaiki dengan 2-opt.
+Matriks jarak haversine dihitung sekaligus dengan NumPy.
+"""
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_matrix(latitudes, longitudes):
+    """
+    Matriks jarak (km) antar semua titik, dihitung vektor tanpa loop Python
+    """
+    lat = np.radians(np.asarray(latitudes, dtype=float))
+    lon = np.radians(np.asarray(longitudes, dtype=float))
+
+    dlat = lat[:, None] - lat[None, :]
+    dlon = lon[:, None] - lon[None, :]
+
+    a = (
+        np.sin(dlat / 2) ** 2
+        + np.cos(lat)[:, None] * np.cos(lat)[None, :] * np.sin(dlon / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def nearest_neighbour_route(dist, start=0):
+    """
+    Rute awal: selalu ke titik terdekat yang belum dikunjungi
+    """
+    n = dist.shape[0]
+    visited = np.zeros(n, dtype=bool)
+    route = [start]
+    visited[start] = True
+
+    for _ in range(n - 1):
+        row = np.where(visited, np.inf, dist[route[-1]])
+        nxt = int(np.argmin(row))
+        route.append(nxt)
+        visited[nxt] = True
+
+    return route
+
+
+def two_opt(route, dist, max_iterations=100):
+    """
+    Perbaiki rute dengan 2-opt. Titik pertama dan terakhir tidak dipindah.
+    Untuk setiap i, semua kandidat j dievaluasi sekaligus (vektor).
+    """
+    route = np.asarray(route)
+    m = len(route)
+
+    for _ in range(max_iterations):
+        improved = False
+
+        for i in range(1, m - 2):
+            a, b = route[i - 1], route[i]
+            js = np.arange(i + 1, m - 1)
+            c, d = route[js], route[js + 1]
+
+            delta = dist[a, c] + dist[b, d] - dist[a, b] - dist[c, d]
+            k = int(np.argmin(delta))
+
+            if delta[k] < -1e-9:
+                j = js[k]
+                route[i:j + 1] = route[i:j + 1][::-1]
+                improved = True
+
+        if not improved:
+            break
+
+    return route.tolist()
+
+
+def plan_route(stops, depot, return_to_depot=False, max_iterations=100):
+    """
+    Urutkan titik pengangkutan mulai dari depot.
+
+    stops  : list (latitude, longitude)
+    depot  : (latitude, longitude)
+
+    Return (urutan, jarak_leg):
+    - urutan    : index `stops` sesuai urutan kunjungan
+    - jarak_leg : jarak (km) dari titik sebelumnya ke tiap titik; jika
+                  return_to_depot, elemen terakhir adalah jarak kembali ke depot
+    """
+    if not stops:
+        return [], []
+
+    points = [tuple(depot)] + [tuple(stop) for stop in stops]
+    lats, lons = zip(*points)
+    dist = haversine_matrix(lats, lons)
+
+    # Node tambahan di akhir sebagai titik akhir tetap:
+    # - rute terbuka  : node dummy berjarak 0 ke semua titik
+    # - kembali depot : salinan depot
+    n = len(points)
+    extended = np.zeros((n + 1, n + 1))
+    extended[:n, :n] = dist
+    if return_to_depot:
+        extended[n, :n] = dist[0]
+        extended[:n, n] = dist[0]
+
+    route = nearest_neighbour_route(dist, start=0) + [n]
+    route = two_opt(route, extended, max_iterations=max_iterations)
+
+    legs = [float(extended[route[k - 1], route[k]]) for k in range(1, len(route))]
+    if not return_to_depot:
+        legs = legs[:-1]
+
+    order = [node - 1 for node in route[1:-1]]
+    return order, legs
@@ -0,0 +1,255 @@
+# utils/scheduling.py
+"""
+Pembuatan Jadwal & DetailAnggotaJadwal otomatis untuk anggota aktif.
+
+Anggota dibagi menjadi kelompok yang berdekatan secara geografis dengan
+ukuran sesuai kapasitas tiap TimPengangkut (recursive coordinate bisection,
+sehingga ukuran kelompok selalu seimbang). Jika total kapasitas harian
+kurang dari jumlah anggota, kelompok digilir dalam siklus beberapa hari.
+"""
+import math
+from datetime import timedelta
+
+import numpy as np
+from django.db import transaction
+
+from ..models import Anggota, Jadwal, DetailAnggotaJadwal, TimPengangkut
+from .conditional import bump_version
+
+MAX_RANGE_DAYS = 366
+DETAIL_BATCH_SIZE = 1000
+
+
+def _distribute(total, capacities):
+    """
+    Bagi `total` anggota ke tiap kapasitas secara proporsional
+    (largest remainder), tanpa melebihi kapasitas masing-masing.
+    """
+    capacity_total = sum(capacities)
+    shares = [total * cap / capacity_total for cap in capacities]
+    sizes = [math.floor(share) for share in shares]
+
+    sisa = total - sum(sizes)
+    by_remainder = sorted(
+        range(len(capacities)),
+        key=lambda i: shares[i] - sizes[i],
+        reverse=True,
+    )
+    for i in by_remainder[:sisa]:
+        sizes[i] += 1
+
+    return sizes
+
+
+def balanced_clusters(latitudes, longitudes, sizes):
+    """
+    Kelompokkan titik menjadi len(sizes) kelompok yang berdekatan,
+    kelompok ke-i berisi tepat sizes[i] titik (sum(sizes) == jumlah titik).
+    Return list array index titik.
+    """
+    lat = np.asarray(latitudes, dtype=float)
+    lon = np.asarray(longitudes, dtype=float)
+    if not len(lat):
+        return [np.empty(0, dtype=int) for _ in sizes]
+
+    # Skala longitude agar jarak kedua sumbu sebanding
+    coords = np.column_stack([lat, lon * math.cos(math.radians(lat.mean()))])
+
+    clusters = [None] * len(sizes)
+
+    def split(indices, slots):
+        if len(slots) == 1:
+            clusters[slots[0]] = indices
+            return
+
+        half = len(slots) // 2
+        left_slots, right_slots = slots[:half], slots[half:]
+        left_total = sum(sizes[i] for i in left_slots)
+
+        points = coords[indices]
+        if not len(points):
+            split(indices, left_slots)
+            split(indices, right_slots)
+            return
+
+        spread = points.max(axis=0) - points.min(axis=0)
+        axis = int(np.argmax(spread))
+        ordered = indices[np.argsort(points[:, axis], kind='stable')]
+
+        split(ordered[:left_total], left_slots)
+        split(ordered[left_total:], right_slots)
+
+    split(np.arange(len(coords)), list(range(len(sizes))))
+    return clusters
+
+
+def build_plan(tanggal_mulai, tanggal_selesai, tim_ids=None):
+    """
+    Susun rencana jadwal tanpa menulis ke database.
+
+    Return dict berisi ringkasan dan daftar `jadwal`, tiap item:
+    {'tanggal', 'tim', 'anggota_ids', 'pusat'}
+    """
+    if tanggal_selesai < tanggal_mulai:
+        raise ValueError("Tanggal selesai harus setelah tanggal mulai")
+
+    jumlah_hari = (tanggal_selesai - tanggal_mulai).days + 1
+    if jumlah_hari > MAX_RANGE_DAYS:
+        raise ValueError(f"Rentang tanggal maksimal {MAX_RANGE_DAYS} hari")
+
+    tim_qs = TimPengangkut.objects.filter(kapasitas__gt=0).order_by('idTim')
+    if tim_ids:
+        tim_qs = tim_qs.filter(idTim__in=tim_ids)
+    tim_list = list(tim_qs.only('idTim', 'namaTim', 'kapasitas'))
+    if not tim_list:
+        raise ValueError("Tidak ada tim pengangkut dengan kapasitas tersedia")
+
+    anggota_rows = list(
+        Anggota.objects
+        .filter(status='aktif', tanggalEnd__gte=tanggal_mulai)
+        .order_by('idAnggota')
+        .values_list('idAnggota', 'latitude', 'longitude', 'tanggalEnd')
+    )
+    jumlah_anggota = len(anggota_rows)
+
+    plan = {
+        'tanggal_mulai': tanggal_mulai,
+        'tanggal_selesai': tanggal_selesai,
+        'jumlah_anggota': jumlah_anggota,
+        'jumlah_tim': len(tim_list),
+        'siklus_hari': 0,
+        'jadwal': [],
+    }
+    if not jumlah_anggota:
+        return plan
+
+    kapasitas = [tim.kapasitas for tim in tim_list]
+    siklus_hari = math.ceil(jumlah_anggota / sum(kapasitas))
+    plan['siklus_hari'] = siklus_hari
+
+    # Slot = (hari ke-d dalam siklus, tim); ukuran slot <= kapasitas tim
+    slots = []
+    for hari, jumlah_hari_ini in enumerate(_distribute(jumlah_anggota, [1] * siklus_hari)):
+        for tim, ukuran in zip(tim_list, _distribute(jumlah_hari_ini, kapasitas)):
+            slots.append((hari, tim, ukuran))
+
+    ids, lats, lons, ends = zip(*anggota_rows)
+    ids = np.asarray(ids)
+    lats = np.asarray(lats, dtype=float)
+    lons = np.asarray(lons, dtype=float)
+    ends = np.asarray(ends)
+
+    clusters = balanced_clusters(lats, lons, [ukuran for _, _, ukuran in slots])
+
+    slot_per_hari = {}
+    for (hari, tim, _), indices in zip(slots, clusters):
+        if len(indices):
+            slot_per_hari.setdefault(hari, []).append((tim, indices))
+
+    for offset in range(jumlah_hari):
+        tanggal = tanggal_mulai + timedelta(days=offset)
+        for tim, indices in slot_per_hari.get(offset % siklus_hari, []):
+            # Lewati anggota yang masa keanggotaannya sudah berakhir
+            aktif = indices[ends[indices] >= tanggal]
+            if not len(aktif):
+                continue
+            plan['jadwal'].append({
+                'tanggal': tanggal,
+                'tim': tim,
+                'anggota_ids': ids[aktif].tolist(),
+                'pusat': {
+                    'latitude': float(lats[aktif].mean()),
+                    'longitude': float(lons[aktif].mean()),
+                },
+            })
+
+    return plan
+
+
+def generate_schedule(tanggal_mulai, tanggal_selesai, dry_run=True, tim_ids=None):
+    """
+    Buat Jadwal & DetailAnggotaJadwal untuk rentang tanggal.
+
+    dry_run=True hanya mengembalikan preview. Jika tidak, semua baris
+    dibuat dengan bulk_create dalam satu transaksi. Jadwal yang sudah ada
+    untuk (tanggal, tim) dipakai ulang dan detail yang sudah ada dilewati:
+    jumlah_detail = rencana, jumlah_detail_baru = yang benar-benar dibuat.
+    Catatan: bulk_create tidak memicu signal/notifikasi per baris.
+    """
+    plan = build_plan(tanggal_mulai, tanggal_selesai, tim_ids=tim_ids)
+
+    summary = {
+        'dry_run': dry_run,
+        'tanggal_mulai': plan['tanggal_mulai'],
+        'tanggal_selesai': plan['tanggal_selesai'],
+        'jumlah_anggota': plan['jumlah_anggota'],
+        'jumlah_tim': plan['jumlah_tim'],
+        'siklus_hari': plan['siklus_hari'],
+        'jumlah_jadwal': len(plan['jadwal']),
+        'jumlah_detail': sum(len(item['anggota_ids']) for item in plan['jadwal']),
+        'jadwal': [
+            {
+                'tanggal': item['tanggal'],
+                'tim_id': item['tim'].idTim,
+                'nama_tim': item['tim'].namaTim,
+                'jumlah_anggota': len(item['anggota_ids']),
+                'pusat': item['pusat'],
+                **({'anggota_ids': item['anggota_ids']} if dry_run else {}),
+            }
+            for item in plan['jadwal']
+        ],
+    }
+
+    if dry_run or not plan['jadwal']:
+        summary['jumlah_jadwal_baru'] = 0
+        summary['jumlah_detail_baru'] = 0
+        return summary
+
+    tim_ids = {item['tim'].idTim for item in plan['jadwal']}
+    with transaction.atomic():
+        existing = {
+            (jadwal.tanggalJadwal, jadwal.idTim_id): jadwal
+            for jadwal in Jadwal.objects.filter(
+                tanggalJadwal__range=(tanggal_mulai, tanggal_selesai),
+                idTim__in=tim_ids,
+            )
+        }
+        # ignore_conflicts tidak melaporkan baris yang dilewati: hitung
+        # detail di rentang ini sebelum & sesudah insert
+        detail_periode = DetailAnggotaJadwal.objects.filter(
+            idJadwal__tanggalJadwal__range=(tanggal_mulai, tanggal_selesai),
+            idJadwal__idTim__in=tim_ids,
+        )
+        detail_sebelum = detail_periode.count()
+
+        baru = []
+        for item in plan['jadwal']:
+            key = (item['tanggal'], item['tim'].idTim)
+            if key not in existing:
+                jadwal = Jadwal(tanggalJadwal=item['tanggal'], idTim=item['tim'])
+                existing[key] = jadwal
+                baru.append(jadwal)
+
+        Jadwal.objects.bulk_create(baru, batch_size=DETAIL_BATCH_SIZE)
+
+        details = [
+            DetailAnggotaJadwal(
+                idAnggota_id=anggota_id,
+                idJadwal=existing[(item['tanggal'], item['tim'].idTim)],
+                status_pengangkutan='terjadwal',
+            )
+            for item in plan['jadwal']
+            for anggota_id in item['anggota_ids']
+        ]
+        DetailAnggotaJadwal.objects.bulk_create(
+            details,
+            batch_size=DETAIL_BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+        detail_baru = detail_periode.count() - detail_sebelum
+        # bulk_create tidak memicu signal version counter
+        bump_version(Jadwal, DetailAnggotaJadwal)
+
+    summary['jumlah_jadwal_baru'] = len(baru)
+    summary['jumlah_detail_baru'] = detail_baru
+    return summary
@@ -0,0 +1,350 @@
+# utils/synthetic.py
+"""
+Dataset sintetis untuk benchmark & uji beban (manage.py benchmark_api,
+manage.py seed_load_data).
+
+- Semua baris dimasukkan lewat bulk_create per chunk anggota (satu transaksi
+  per chunk), jadi memori tetap kecil walau jutaan baris.
+- Signal model dimatikan selama generate: tidak ada notifikasi, push,
+  atau pipeline gambar yang ikut berjalan.
+- Random memakai seed tetap supaya dataset yang sama bisa dibuat ulang.
+"""
+import random
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, time, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.utils import timezone
+
+from ..models import (
+    Anggota, DetailAnggotaJadwal, Jadwal, LaporanSampah, Notification, Pembayaran,
+    Tamu, TimPengangkut, User,
+)
+from .conditional import bump_version
+
+DEFAULT_PASSWORD = 'cleanup123'
+
+# Pusat kelurahan di Kota Kupang (lat, lon)
+KUPANG_KELURAHAN = [
+    ('Oebobo', -10.1670, 123.6080),
+    ('Kelapa Lima', -10.1560, 123.6250),
+    ('Oesapa', -10.1440, 123.6400),
+    ('Liliba', -10.1750, 123.6350),
+    ('Penfui', -10.1670, 123.6660),
+    ('Maulafa', -10.1980, 123.6100),
+    ('Sikumana', -10.2010, 123.6150),
+    ('Bakunase', -10.1850, 123.5950),
+    ('Naikoten', -10.1700, 123.5960),
+    ('Kota Raja', -10.1700, 123.5850),
+    ('Kota Lama', -10.1580, 123.5850),
+    ('Alak', -10.1780, 123.5500),
+]
+# ± 0.012 derajat ~ 1.3 km dari pusat kelurahan
+COORD_JITTER = 0.012
+
+NAMA_DEPAN = [
+    'Yohanes', 'Maria', 'Agustinus', 'Yuliana', 'Fransiskus', 'Theresia', 'Petrus',
+    'Katarina', 'Markus', 'Elisabeth', 'Daniel', 'Ester', 'Yosef', 'Margaretha',
+    'Stefanus', 'Agnes', 'Melkianus', 'Rambu', 'Umbu', 'Kornelis',
+]
+NAMA_BELAKANG = [
+    'Ndun', 'Lay', 'Fanggidae', 'Bessie', 'Tallo', 'Manafe', 'Nope', 'Lada',
+    'Radja', 'Kana', 'Sinlae', 'Benu', 'Foenay', 'Toy', 'Pello', 'Dethan',
+]
+
+# Kata kunci sama dengan analisis jenis sampah di viewPublik & report dampak lingkungan
+JENIS_LAPORAN = {
+    'plastik': ['botol plastik', 'kantong plastik', 'kresek', 'styrofoam', 'gelas plastik', 'sachet'],
+    'organik': ['sisa makanan', 'daun', 'ranting', 'kulit buah', 'sampah dapur', 'sayur'],
+    'kertas': ['kardus', 'koran', 'karton', 'kertas bekas'],
+    'logam': ['kaleng minuman', 'besi tua', 'kawat', 'seng'],
+    'kaca': ['botol kaca', 'pecahan kaca', 'beling'],
+    'limbah_berbahaya': ['baterai', 'aki bekas', 'limbah elektronik', 'oli bekas'],
+    'konstruksi': ['puing bangunan', 'semen', 'batako', 'keramik'],
+    'medis': ['masker medis', 'jarum suntik', 'obat kadaluarsa'],
+    'campuran': ['sampah campuran', 'tidak dipilah'],
+}
+LOKASI_LAPORAN = [
+    'di pinggir jalan', 'di selokan', 'dekat pasar', 'di lahan kosong', 'di depan sekolah',
+    'di tepi pantai', 'dekat jembatan', 'di belakang rumah warga', 'di kali',
+]
+KONDISI_LAPORAN = [
+    'menumpuk sejak seminggu', 'mulai berbau', 'menyumbat saluran air',
+    'dibakar warga', 'berserakan karena hujan', 'dikerubungi lalat',
+]
+
+METODE_BAYAR = ['transfer', 'tunai', 'qris']
+IURAN = {'Rumah Tangga': 25000, 'Tempat Usaha': 50000}
+PICKUP_INTERVAL_DAYS = 7
+
+
+@contextmanager
+def manual_timestamps(*fields):
+    """Matikan auto_now/auto_now_add sementara agar tanggal historis bisa diisi"""
+    saved = [(f, f.auto_now, f.auto_now_add) for f in fields]
+    for field, _, _ in saved:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+@contextmanager
+def suppress_signals(*signals):
+    """Kosongkan receiver signal sementara (default: pre/post save & delete)"""
+    signals = signals or (pre_save, post_save, pre_delete, post_delete)
+    saved = []
+    for signal in signals:
+        with signal.lock:
+            saved.append((signal, signal.receivers))
+            signal.receivers = []
+            signal.sender_receivers_cache.clear()
+    try:
+        yield
+    finally:
+        for signal, receivers in saved:
+            with signal.lock:
+                signal.receivers = receivers
+                signal.sender_receivers_cache.clear()
+
+
+def _field(model, name):
+    return model._meta.get_field(name)
+
+
+class DatasetGenerator:
+    """
+    generator = DatasetGenerator(anggota=2000, days=30, seed=42)
+    counts = generator.run()
+
+    `progress(done, counts)` dipanggil setelah setiap chunk anggota selesai.
+    """
+
+    def __init__(self, anggota=1000, days=30, seed=42, batch_size=1000, chunk_size=2000,
+                 prefix=None, progress=None):
+        self.anggota = anggota
+        self.days = days
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.random = random.Random(seed)
+        # Username unik per run agar bisa dijalankan berulang di database yang sama
+        self.prefix = prefix or f"load{uuid.uuid4().hex[:6]}"
+        self.today = timezone.now().date()
+        self.start = self.today - timedelta(days=days)
+        self.password = make_password(DEFAULT_PASSWORD)
+        self.counts = {}
+
+    def run(self):
+        with suppress_signals():
+            with transaction.atomic():
+                tim = self.create_tim()
+                jadwal = self.create_jadwal(tim)
+
+            for offset in range(0, self.anggota, self.chunk_size):
+                size = min(self.chunk_size, self.anggota - offset)
+                with transaction.atomic():
+                    anggota_list = self.create_anggota(offset, size)
+                    tamu_users = self.create_tamu(offset, size)
+                    self.create_detail(anggota_list, jadwal, offset)
+                    self.create_pembayaran(anggota_list)
+                    self.create_laporan([a.user for a in anggota_list] + tamu_users)
+                    self.create_notifications([a.user for a in anggota_list])
+                if self.progress:
+                    self.progress(offset + size, self.counts)
+        # Signal dimatikan & bulk_create: version counter (ETag) dinaikkan manual
+        bump_version(User, TimPengangkut, Anggota, Tamu, Jadwal, Pembayaran, DetailAnggotaJadwal, LaporanSampah)
+        return self.counts
+
+    # ===== helpers =====
+
+    def _bulk(self, model, objs):
+        created = model.objects.bulk_create(objs, batch_size=self.batch_size)
+        self.counts[model.__name__] = self.counts.get(model.__name__, 0) + len(created)
+        return created
+
+    def _nama(self):
+        return f"{self.random.choice(NAMA_DEPAN)} {self.random.choice(NAMA_BELAKANG)}"
+
+    def _no_wa(self):
+        return f"08{self.random.randint(1000000000, 1399999999)}"[:12]
+
+    def _users(self, role, count, start=0):
+        users = [
+            User(
+                username=f"{self.prefix}_{role}_{i}",
+                email=f"{self.prefix}_{role}_{i}@example.com",
+                password=self.password,
+                role=role,
+            )
+            for i in range(start, start + count)
+        ]
+        return self._bulk(User, users)
+
+    def _aware(self, day, hour=None):
+        moment = datetime.combine(day, time(hour if hour is not None else self.random.randint(6, 20)))
+        return timezone.make_aware(moment) if timezone.is_naive(moment) else moment
+
+    # ===== tabel =====
+
+    def create_tim(self):
+        # Satu tim melayani ±50 anggota per jadwal (kapasitas default)
+        count = max(1, self.anggota // 50)
+        users = self._users('tim_angkut', count)
+        return self._bulk(TimPengangkut, [
+            TimPengangkut(
+                namaTim=f"Tim {KUPANG_KELURAHAN[i % len(KUPANG_KELURAHAN)][0]} {i // len(KUPANG_KELURAHAN) + 1}",
+                noWhatsapp=self._no_wa(),
+                idUser=user,
+            )
+            for i, user in enumerate(users)
+        ])
+
+    def create_anggota(self, offset, count):
+        users = self._users('anggota', count, start=offset)
+        anggota_list = []
+        for user in users:
+            _, lat, lon = self.random.choice(KUPANG_KELURAHAN)
+            start = self.today - timedelta(days=self.random.randint(0, 365))
+            end = start + timedelta(days=30 * self.random.choice([1, 3, 6, 12]))
+            anggota_list.append(Anggota(
+                user=user,
+                nama=self._nama(),
+                alamat=f"Jl. {self.random.choice(NAMA_BELAKANG)} No. {self.random.randint(1, 200)}, Kupang",
+                noWA=self._no_wa(),
+                latitude=round(lat + self.random.uniform(-COORD_JITTER, COORD_JITTER), 6),
+                longitude=round(lon + self.random.uniform(-COORD_JITTER, COORD_JITTER), 6),
+                tanggalStart=start,
+                tanggalEnd=end,
+                status='aktif' if end >= self.today else 'non-aktif',
+                jenisSampah='Tempat Usaha' if self.random.random() < 0.2 else 'Rumah Tangga',
+            ))
+        anggota_list = self._bulk(Anggota, anggota_list)
+        for anggota, user in zip(anggota_list, users):
+            anggota.user = user
+        return anggota_list
+
+    def create_tamu(self, offset, count):
+        # Satu tamu per 5 anggota: tamu ke-i dibuat di chunk yang berisi anggota
+        # ke-5i, sehingga rentang username antar chunk tidak pernah tumpang tindih
+        start = -(-offset // 5)
+        end = -(-(offset + count) // 5)
+        if end <= start:
+            return []
+        users = self._users('tamu', end - start, start=start)
+        self._bulk(Tamu, [
+            Tamu(idUser=user, nama=self._nama(), jk=self.random.choice('LP')) for user in users
+        ])
+        return users
+
+    def create_jadwal(self, tim):
+        """Satu jadwal per tim per hari, dari `days` hari lalu sampai seminggu ke depan"""
+        jadwal = [
+            Jadwal(tanggalJadwal=self.start + timedelta(days=d), idTim=t)
+            for d in range(self.days + PICKUP_INTERVAL_DAYS)
+            for t in tim
+        ]
+        jadwal = self._bulk(Jadwal, jadwal)
+        by_day = {}
+        for j in jadwal:
+            by_day.setdefault(j.tanggalJadwal, []).append(j)
+        return by_day
+
+    def create_detail(self, anggota_list, jadwal_by_day, offset=0):
+        """Setiap anggota diangkut seminggu sekali pada hari & tim yang tetap"""
+        details = []
+        for i, anggota in enumerate(anggota_list, start=offset):
+            offset = i % PICKUP_INTERVAL_DAYS
+            for d in range(offset, self.days + PICKUP_INTERVAL_DAYS, PICKUP_INTERVAL_DAYS):
+                day = self.start + timedelta(days=d)
+                tim_jadwal = jadwal_by_day[day]
+                jadwal = tim_jadwal[i % len(tim_jadwal)]
+
+                if anggota.status != 'aktif' and day > anggota.tanggalEnd:
+                    status = 'dibatalkan'
+                elif day < self.today:
+                    status = 'selesai' if self.random.random() < 0.9 else 'dibatalkan'
+                elif day == self.today:
+                    status = 'dalam_proses'
+                else:
+                    status = 'terjadwal'
+
+                details.append(DetailAnggotaJadwal(
+                    idAnggota=anggota, idJadwal=jadwal, status_pengangkutan=status,
+                    created_at=self._aware(day - timedelta(days=PICKUP_INTERVAL_DAYS)),
+                ))
+
+        with manual_timestamps(_field(DetailAnggotaJadwal, 'created_at')):
+            self._bulk(DetailAnggotaJadwal, details)
+
+    def create_pembayaran(self, anggota_list):
+        """Iuran bulanan selama periode dataset"""
+        pembayaran = []
+        for anggota in anggota_list:
+            for d in range(self.random.randint(0, 29), self.days + 1, 30):
+                roll = self.random.random()
+                pembayaran.append(Pembayaran(
+                    idAnggota=anggota,
+                    tanggalBayar=self.start + timedelta(days=d),
+                    jumlahBayar=IURAN[anggota.jenisSampah],
+                    metodeBayar=self.random.choice(METODE_BAYAR),
+                    statusBayar='lunas' if roll < 0.85 else 'pending' if roll < 0.95 else 'gagal',
+                ))
+        self._bulk(Pembayaran, pembayaran)
+
+    def _deskripsi(self):
+        jenis = self.random.sample(list(JENIS_LAPORAN), k=self.random.choice([1, 1, 2]))
+        barang = ', '.join(self.random.choice(JENIS_LAPORAN[j]) for j in jenis)
+        return (
+            f"Ada sampah {barang} {self.random.choice(LOKASI_LAPORAN)}, "
+            f"{self.random.choice(KONDISI_LAPORAN)}."
+        )
+
+    def create_laporan(self, users):
+        """±1 laporan per 20 pengguna per hari"""
+        laporan = []
+        for d in range(self.days + 1):
+            day = self.start + timedelta(days=d)
+            for _ in range(max(1, len(users) // 20)):
+                user = self.random.choice(users)
+                kelurahan, lat, lon = self.random.choice(KUPANG_KELURAHAN)
+                age = (self.today - day).days
+                status = 'selesai' if age > 7 else self.random.choice(['pending', 'proses', 'selesai'])
+                laporan.append(LaporanSampah(
+                    nama=self._nama(),
+                    tanggal_lapor=day,
+                    alamat=f"Kel. {kelurahan}, Kupang",
+                    latitude=round(lat + self.random.uniform(-COORD_JITTER, COORD_JITTER), 6),
+                    longitude=round(lon + self.random.uniform(-COORD_JITTER, COORD_JITTER), 6),
+                    deskripsi=self._deskripsi(),
+                    idUser=user,
+                    status=status,
+                ))
+
+        with manual_timestamps(_field(LaporanSampah, 'tanggal_lapor')):
+            self._bulk(LaporanSampah, laporan)
+
+    def create_notifications(self, users):
+        """Pengingat jadwal mingguan per anggota, yang lama sudah dibaca"""
+        notifications = []
+        for user in users:
+            for d in range(self.random.randint(0, PICKUP_INTERVAL_DAYS - 1), self.days + 1, PICKUP_INTERVAL_DAYS):
+                created = self._aware(self.start + timedelta(days=d), hour=18)
+                notifications.append(Notification(
+                    user=user,
+                    title='Jadwal Pengangkutan Besok',
+                    message='Sampah Anda akan diangkut besok. Siapkan sampah di depan rumah.',
+                    notification_type='schedule',
+                    read=(self.today - created.date()).days > 2,
+                    url='/jadwal',
+                    created_at=created,
+                    updated_at=created,
+                ))
+
+        with manual_timestamps(_field(Notification, 'created_at'), _field(Notification, 'updated_at')):
+            self._bulk(Notification, notifications)
@@ -0,0 +1,119 @@
+# utils/thumbnails.py
+"""
+Thumbnail untuk gambar yang disisipkan ke PDF laporan (logo, foto laporan).
+
+- Thumbnail disimpan di `thumbcache/<hh>/<sha256>_<w>x<h>.<ext>` (default
+  storage), kunci = hash isi file + ukuran target dalam pixel, sehingga
+  file besar hanya di-decode & diperkecil sekali.
+- ReportImages dipakai per dokumen: setiap file unik hanya di-decode sekali
+  (satu ImageReader) walaupun muncul di banyak baris/halaman; ReportLab
+  juga hanya menyimpan satu salinan gambar yang sama di dalam PDF.
+"""
+import io
+import logging
+import os
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image as PILImage, ImageOps, UnidentifiedImageError
+from reportlab.lib.utils import ImageReader
+from reportlab.platypus import Image
+
+from .media import content_hash
+
+logger = logging.getLogger(__name__)
+
+THUMB_DIR = 'thumbcache'
+DEFAULT_DPI = 150
+JPEG_QUALITY = 85
+
+
+def _pixels(points, dpi):
+    return max(int(round(points / 72 * dpi)), 1)
+
+
+def thumbnail_name(digest, width_px, height_px, ext):
+    return f"{THUMB_DIR}/{digest[:2]}/{digest}_{width_px}x{height_px}.{ext}"
+
+
+def _make_thumbnail(path, width_px, height_px):
+    """Return (bytes, ext) gambar yang muat di kotak width_px x height_px"""
+    with PILImage.open(path) as image:
+        # JPEG besar di-decode langsung pada resolusi yang lebih kecil
+        image.draft('RGB', (width_px, height_px))
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail((width_px, height_px), PILImage.LANCZOS)
+
+        has_alpha = image.mode in ('RGBA', 'LA', 'P') and (
+            image.mode != 'P' or 'transparency' in image.info
+        )
+        buffer = io.BytesIO()
+        if has_alpha:
+            image.convert('RGBA').save(buffer, format='PNG', optimize=True)
+            return buffer.getvalue(), 'png'
+
+        image.convert('RGB').save(buffer, format='JPEG', quality=JPEG_QUALITY, optimize=True)
+        return buffer.getvalue(), 'jpg'
+
+
+def get_thumbnail(path, width_px, height_px):
+    """
+    Bytes thumbnail dari cache, dibuat jika belum ada.
+    Return None jika file tidak ada / bukan gambar.
+    """
+    try:
+        digest = content_hash(path, path)
+    except OSError:
+        return None
+
+    for ext in ('jpg', 'png'):
+        name = thumbnail_name(digest, width_px, height_px, ext)
+        if default_storage.exists(name):
+            with default_storage.open(name, 'rb') as f:
+                return f.read()
+
+    try:
+        data, ext = _make_thumbnail(path, width_px, height_px)
+    except (OSError, UnidentifiedImageError) as e:
+        logger.warning("🖼️ Gagal membuat thumbnail %s: %s", path, e)
+        return None
+
+    default_storage.save(thumbnail_name(digest, width_px, height_px, ext), ContentFile(data))
+    return data
+
+
+class _ReaderImage(Image):
+    """Flowable Image dari ImageReader yang sudah di-decode"""
+
+    def __init__(self, reader, width, height, **kwargs):
+        self._img = reader
+        super().__init__(reader.fp, width=width, height=height, **kwargs)
+
+
+class ReportImages:
+    """
+    Gambar untuk satu dokumen PDF. Buat satu instance per dokumen.
+
+        images = ReportImages()
+        elements.append(images.flowable(logo_path, 150, 100))
+    """
+
+    def __init__(self, dpi=None):
+        self.dpi = dpi or getattr(settings, 'REPORT_IMAGE_DPI', DEFAULT_DPI)
+        self._readers = {}
+
+    def reader(self, path, width, height):
+        """ImageReader untuk kotak width x height (point), di-cache per dokumen"""
+        key = (path, _pixels(width, self.dpi), _pixels(height, self.dpi))
+        if key not in self._readers:
+            data = get_thumbnail(path, key[1], key[2]) if os.path.isfile(path) else None
+            self._readers[key] = ImageReader(io.BytesIO(data)) if data else None
+        return self._readers[key]
+
+    def flowable(self, path, width, height, **kwargs):
+        """Flowable Image ukuran width x height point, None jika gagal"""
+        reader = self.reader(path, width, height)
+        if reader is None:
+            return None
+        return _ReaderImage(reader, width, height, **kwargs)
@@ -0,0 +1,205 @@
+"""
+Penyajian file media (foto laporan, bukti pembayaran & rendisinya).
+
+- Mendukung HTTP Range (satu rentang) dan HEAD.
+- ETag kuat dari hash isi file + If-None-Match / If-Range.
+- Blob berbasis hash di-cache browser/CDN selamanya (immutable).
+- Jika SENDFILE_BACKEND diisi, byte file dikirim oleh web server
+  (X-Sendfile / X-Accel-Redirect), Django hanya memeriksa izin & header.
+- Bukti pembayaran hanya untuk URL bertanda tangan atau user yang berhak.
+"""
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files.storage import default_storage
+from django.http import Http404, HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+from django.views.decorators.http import require_safe
+from rest_framework.exceptions import AuthenticationFailed
+
+from .authentication import CachedJWTAuthentication, linked_anggota_id
+from .models import Pembayaran
+from .utils.conditional import etag_matches
+from .utils.media import (
+    RENDITION_DIR, file_etag, get_config, is_immutable, is_private, source_name,
+    verify_signature,
+)
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def _authenticated_user(request):
+    """User dari session (admin) atau header Authorization: Bearer <JWT>"""
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        return user
+    try:
+        result = CachedJWTAuthentication().authenticate(request)
+    except AuthenticationFailed:
+        return None
+    return result[0] if result else None
+
+
+def _can_view_private(request, name):
+    if verify_signature(name, request.GET.get('sig')):
+        return True
+
+    user = _authenticated_user(request)
+    if user is None:
+        return False
+
+    role = getattr(user, 'role', None)
+    if user.is_superuser or role in ('admin', 'tim_angkut'):
+        return True
+    if role == 'anggota':
+        if name.startswith(f"{RENDITION_DIR}/"):
+            return _owns_rendition(user, name)
+        return Pembayaran.objects.filter(buktiBayar=name, idAnggota=linked_anggota_id(user)).exists()
+    return False
+
+
+def _owns_rendition(user, name):
+    # renditions/<asli tanpa ekstensi>_<rendisi>.<ext>
+    stem = os.path.splitext(source_name(name))[0].rsplit('_', 1)[0]
+    return Pembayaran.objects.filter(
+        buktiBayar__startswith=f"{stem}.", idAnggota=linked_anggota_id(user),
+    ).exists()
+
+
+def _parse_range(header, size):
+    """
+    Return (start, end) inklusif, None jika header tidak dipakai,
+    atau False jika rentang tidak bisa dipenuhi (416).
+    """
+    match = RANGE_RE.match(header.strip())
+    if not match:
+        return None  # multi-range / format lain: kirim file utuh
+
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        length = int(last)
+        if length == 0:
+            return False
+        return max(size - length, 0), size - 1
+
+    start = int(first)
+    if last and int(last) < start:
+        return None  # last-pos < first-pos: header tidak valid, abaikan (RFC 9110)
+    if start >= size:
+        return False
+    end = min(int(last), size - 1) if last else size - 1
+    return start, end
+
+
+def _file_iterator(path, start, length, chunk_size):
+    with open(path, 'rb') as f:
+        f.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def _canonical_name(path):
+    """
+    Nama file relatif MEDIA_ROOT, atau None jika ada segmen kosong / '.' / '..'.
+    Semua pengecekan (privat, izin, ETag, X-Accel) memakai nama ini: path
+    seperti `laporan_fotos/../bukti_pembayaran/x.jpg` tidak boleh lolos
+    pengecekan prefix lalu di-resolve ke file privat.
+    """
+    segments = path.replace('\\', '/').lstrip('/').split('/')
+    if any(segment in ('', '.', '..') for segment in segments):
+        return None
+    return '/'.join(segments)
+
+
+@require_safe
+def serve_media(request, path):
+    config = get_config()
+    name = _canonical_name(path)
+    if name is None:
+        raise Http404("File tidak ditemukan")
+
+    try:
+        full_path = default_storage.path(name)
+    except SuspiciousFileOperation:
+        raise Http404("File tidak ditemukan")
+
+    try:
+        stat = os.stat(full_path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise Http404("File tidak ditemukan")
+    if not os.path.isfile(full_path):
+        raise Http404("File tidak ditemukan")
+
+    private = is_private(name)
+    if private and not _can_view_private(request, name):
+        # 404, bukan 403: keberadaan bukti bayar tidak dibocorkan
+        raise Http404("File tidak ditemukan")
+
+    etag = file_etag(name, full_path, stat)
+    scope = 'private' if private else 'public'
+    if is_immutable(name):
+        cache_control = f"{scope}, max-age={config['IMMUTABLE_MAX_AGE']}, immutable"
+    else:
+        cache_control = f"{scope}, max-age={config['DEFAULT_MAX_AGE']}"
+
+    def with_headers(response):
+        response['ETag'] = etag
+        response['Cache-Control'] = cache_control
+        response['Accept-Ranges'] = 'bytes'
+        if private:
+            response['Vary'] = 'Authorization, Cookie'
+        return response
+
+    if etag_matches(request.headers.get('If-None-Match'), etag):
+        return with_headers(HttpResponseNotModified())
+
+    content_type, encoding = mimetypes.guess_type(full_path)
+    content_type = content_type or 'application/octet-stream'
+    size = stat.st_size
+
+    backend = config['SENDFILE_BACKEND']
+    if backend:
+        # Web server yang membaca file & menangani Range
+        response = HttpResponse(content_type=content_type)
+        if backend == 'x-accel-redirect':
+            response['X-Accel-Redirect'] = quote(f"{config['X_ACCEL_PREFIX'].rstrip('/')}/{name}")
+        else:
+            response['X-Sendfile'] = full_path
+        return with_headers(response)
+
+    byte_range = None
+    range_header = request.headers.get('Range')
+    if range_header and request.headers.get('If-Range', etag) == etag:
+        byte_range = _parse_range(range_header, size)
+
+    if byte_range is False:
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f"bytes */{size}"
+        return with_headers(response)
+
+    start, end = byte_range or (0, size - 1)
+    length = end - start + 1 if size else 0
+
+    if request.method == 'HEAD':
+        response = HttpResponse(content_type=content_type)
+    else:
+        response = StreamingHttpResponse(
+            _file_iterator(full_path, start, length, config['CHUNK_SIZE']),
+            content_type=content_type,
+        )
+    if byte_range:
+        response.status_code = 206
+        response['Content-Range'] = f"bytes {start}-{end}/{size}"
+    response['Content-Length'] = str(length)
+    if encoding:
+        response['Content-Encoding'] = encoding
+    return with_headers(response)
@@ -0,0 +1,29 @@
+"""
+GET /api/metrics: metrik format teks Prometheus (apk/utils/metrics.py).
+
+Akses: header `Authorization: Bearer <METRICS['TOKEN']>` jika TOKEN diisi,
+selain itu hanya dari METRICS['ALLOWED_IPS'].
+"""
+from django.http import Http404, HttpResponse
+from django.utils.crypto import constant_time_compare
+from django.views.decorators.http import require_GET
+
+from .utils.metrics import get_config, render
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+@require_GET
+def metrics(request):
+    config = get_config()
+    if not config['ENABLED']:
+        raise Http404
+
+    token = config['TOKEN']
+    if token:
+        if not constant_time_compare(request.headers.get('Authorization', ''), f"Bearer {token}"):
+            return HttpResponse(status=401)
+    elif request.META.get('REMOTE_ADDR') not in config['ALLOWED_IPS']:
+        raise Http404
+
+    return HttpResponse(render(), content_type=CONTENT_TYPE)
@@ -0,0 +1,164 @@
+# viewNotifikasi.py
+"""
+Endpoint notifikasi yang sering di-poll / menunggu push service, versi async
+(apk/asyncapi.py). Di ASGI satu proses bisa melayani banyak client lambat
+tanpa menghabiskan thread worker.
+
+- GET/POST /api/notifications/                 -> NotificationListView
+- GET      /api/notifications/unread_count/    -> NotificationUnreadCountView
+- POST     /api/push-subscriptions/test_notification/ -> PushTestNotificationView
+
+Endpoint notifikasi lain tetap di NotificationViewSet / PushSubscriptionViewSet.
+"""
+import logging
+from datetime import datetime
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from .asyncapi import AsyncAPIView, AsyncPageNumberPagination
+from .models import Notification, PushSubscription
+from .serializers import NotificationSerializer
+from .utils.logs import get_logger
+from .utils.notifications import NotificationService
+
+log = get_logger(__name__)
+
+
+def filter_notifications(queryset, query_params):
+    """Filter ?user_type, ?read, ?type, ?priority lalu urutkan terbaru dulu"""
+    user_type = query_params.get('user_type', None)
+    if user_type:
+        queryset = queryset.filter(user__role=user_type)
+
+    read_param = query_params.get('read', None)
+    if read_param is not None:
+        read_bool = read_param.lower() == 'true'
+        queryset = queryset.filter(read=read_bool)
+
+    notification_type = query_params.get('type', None)
+    if notification_type:
+        queryset = queryset.filter(notification_type=notification_type)
+
+    priority = query_params.get('priority', None)
+    if priority:
+        queryset = queryset.filter(priority=priority)
+
+    return queryset.order_by('-created_at')
+
+
+class NotificationPagination(AsyncPageNumberPagination):
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class NotificationListView(AsyncAPIView):
+    permission_classes = [IsAuthenticated]
+
+    async def get(self, request):
+        # user ikut di-join: serializer membaca user.role (user_type)
+        queryset = filter_notifications(
+            Notification.objects.filter(user=request.user).select_related('user'),
+            request.query_params,
+        )
+
+        # ?limit=N = ukuran halaman untuk request ini saja
+        page_size = None
+        limit = request.query_params.get('limit', None)
+        if limit:
+            try:
+                page_size = int(limit)
+            except ValueError:
+                pass
+
+        paginator = NotificationPagination()
+        page = await paginator.apaginate_queryset(queryset, request, self, page_size=page_size)
+        serializer = NotificationSerializer(page, many=True, context={'request': request})
+        return paginator.get_paginated_response(serializer.data)
+
+    async def post(self, request):
+        serializer = NotificationSerializer(data=request.data, context={'request': request})
+        await sync_to_async(serializer.is_valid)(raise_exception=True)
+        await sync_to_async(serializer.save)(user=request.user)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+
+class NotificationUnreadCountView(AsyncAPIView):
+    permission_classes = [IsAuthenticated]
+
+    async def get(self, request):
+        count = await Notification.objects.filter(user=request.user, read=False).acount()
+        return Response({'count': count})
+
+
+class PushTestNotificationView(AsyncAPIView):
+    """
+    Send test notification to current user
+    """
+    permission_classes = [IsAuthenticated]
+
+    async def post(self, request):
+        try:
+            subscriptions = [s async for s in PushSubscription.objects.filter(user=request.user)]
+
+            if not subscriptions:
+                log.event(logging.INFO, "push.test.no_subscription", user=request.user.username)
+                return Response({
+                    "success": False,
+                    "message": "Anda belum berlangganan notifikasi push. Silakan aktifkan terlebih dahulu."
+                }, status=status.HTTP_400_BAD_REQUEST)
+
+            if not settings.WEBPUSH_SETTINGS.get("VAPID_PRIVATE_KEY") or not settings.WEBPUSH_SETTINGS.get("VAPID_ADMIN_EMAIL"):
+                log.event(logging.ERROR, "push.test.vapid_missing")
+                return Response({
+                    "success": False,
+                    "message": "Server configuration error: VAPID keys missing"
+                }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+            payload = {
+                "title": "🧪 Test Notification - CleanUp",
+                "body": "Ini adalah notifikasi test dari sistem CleanUp",
+                "icon": "/icons/icon-192x192.png",
+                "badge": "/icons/badge-72x72.png",
+                "url": "/dashboard",
+                "type": "test",
+                "data": {
+                    "test": True,
+                    "timestamp": datetime.now().isoformat(),
+                    "user": request.user.username
+                }
+            }
+
+            # Semua subscription dikirim bersamaan (aiohttp)
+            results = await NotificationService.apush_subscriptions(request.user, subscriptions, payload)
+            success_count = sum(1 for r in results if r.get("status") == "success")
+            log.event(
+                logging.DEBUG, "push.test.sent",
+                user=request.user.username, delivered=success_count, total=len(results),
+            )
+
+            if success_count > 0:
+                return Response({
+                    "success": True,
+                    "message": f"Test notification sent successfully ({success_count} delivered)",
+                    "results": results
+                })
+
+            error_message = results[0].get("error", "Unknown error") if results else "No subscriptions"
+            return Response({
+                "success": False,
+                "message": f"Failed to send test notification: {error_message}",
+                "results": results
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        except Exception as e:
+            log.event(logging.ERROR, "push.test.error", exc_info=True, user=request.user.username)
+
+            return Response({
+                "success": False,
+                "message": f"Server error: {str(e)}",
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
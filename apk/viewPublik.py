@@ -1,150 +1,40 @@
 from django.utils import timezone
 from datetime import datetime, timedelta, date
 from collections import Counter
-from rest_framework.views import APIView
+from asgiref.sync import sync_to_async
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import AllowAny
 import traceback
 import logging
+from .asyncapi import AsyncAPIView
+from .utils.cache import aget_or_compute, make_key, versions_stamp
+from .utils.conditional import model_versions
+from .db_routers import ReadReplicaMixin
 from .models import LaporanSampah
 
 # Setup logger
 logger = logging.getLogger(__name__)
 
-class PublicDampakLingkunganView(APIView):
+class PublicDampakLingkunganView(ReadReplicaMixin, AsyncAPIView):
     """
     View publik untuk analisis dampak lingkungan
     Tidak memerlukan autentikasi/token
     """
     
     permission_classes = [AllowAny]
+    replica_max_lag = 300  # statistik publik boleh tertinggal beberapa menit
 
-    def get(self, request):
+    async def get(self, request):
         try:
             logger.info("📢 PublicDampakLingkunganView accessed")
-            
-            # Default periode: 30 hari terakhir
-            end_date = timezone.now().date()
-            # start_date = end_date - timedelta(days=470)
-            start_date = date(2023, 1, 1)
-            
-            # Bisa juga menerima parameter dari query string
-            # if 'days' in request.GET:
-            #     try:
-            #         days = int(request.GET.get('days'))
-            #         start_date = end_date - timedelta(days=days)
-            #     except ValueError:
-            #         pass
-            
-            logger.info(f"📅 Periode: {start_date} sampai {end_date}")
-            
-            # Query data laporan sampah - TANPA SLICE DI SINI
-            try:
-                # Query dasar tanpa slicing
-                base_query = LaporanSampah.objects.filter(
-                    tanggal_lapor__range=[start_date, end_date]
-                )
-                
-                # Hitung total sebelum slicing
-                total_laporan = base_query.count()
-                logger.info(f"📊 Total laporan dalam periode: {total_laporan}")
-                
-                # Untuk analisis, gunakan slicing
-                laporan_qs = base_query.order_by('-tanggal_lapor')[:1000]
-                logger.info(f"📊 Laporan untuk analisis: {len(laporan_qs)} dari {total_laporan}")
-                
-            except Exception as query_error:
-                logger.error(f"❌ Query error: {str(query_error)}")
-                return Response({
-                    'error': 'Gagal mengambil data dari database',
-                    'detail': str(query_error)
-                }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-            
-            if total_laporan == 0:
-                logger.info("ℹ️ Tidak ada data laporan ditemukan")
-                return Response({
-                    'message': 'Tidak ada data laporan sampah dalam periode ini',
-                    'period': {
-                        'start_date': start_date.strftime('%Y-%m-%d'),
-                        'end_date': end_date.strftime('%Y-%m-%d'),
-                        'label': f"30 Hari Terakhir"
-                    },
-                    'data': {
-                        'analisis_dampak_lingkungan': [],
-                        'wilayah_terkotor': [],
-                        'wilayah_terbersih': [],
-                        'ringkasan': {
-                            'total_laporan': 0,
-                            'pesan': 'Data akan tampil setelah ada laporan dari masyarakat'
-                        }
-                    }
-                })
-            
-            # Hitung laporan selesai dari QUERY UTAMA (bukan dari sliced)
-            try:
-                laporan_selesai = base_query.filter(status='selesai').count()
-                logger.info(f"✅ Laporan selesai: {laporan_selesai} dari {total_laporan}")
-            except Exception as e:
-                logger.warning(f"⚠️ Tidak bisa hitung laporan selesai: {str(e)}")
-                laporan_selesai = 0
-            
-            # Hitung persentase
-            persentase_selesai = round((laporan_selesai / total_laporan * 100), 1) if total_laporan > 0 else 0
-            
-            # 1. Analisis Dampak Lingkungan Berdasarkan Jenis Sampah
-            try:
-                analisis_dampak = self.analisis_dampak_lingkungan_publik(laporan_qs)
-                logger.info(f"✅ Analisis dampak berhasil: {len(analisis_dampak.get('detail', []))} jenis")
-            except Exception as analisis_error:
-                logger.error(f"❌ Analisis error: {str(analisis_error)}")
-                traceback.print_exc()
-                analisis_dampak = {
-                    'detail': [],
-                    'total_jenis': 0,
-                    'total_berbahaya': 0,
-                    'status_lingkungan': 'data_terbatas'
-                }
-            
-            # 2. 5 Wilayah Terkotor
-            try:
-                wilayah_terkotor = self.wilayah_terkotor_publik(laporan_qs)[:5]
-                logger.info(f"✅ Wilayah terkotor berhasil: {len(wilayah_terkotor)} wilayah")
-            except Exception as wilayah_error:
-                logger.error(f"❌ Wilayah terkotor error: {str(wilayah_error)}")
-                traceback.print_exc()
-                wilayah_terkotor = []
-            
-            # 3. 5 Wilayah Terbersih
-            try:
-                wilayah_terbersih = self.wilayah_terbersih_publik(laporan_qs)[:5]
-                logger.info(f"✅ Wilayah terbersih berhasil: {len(wilayah_terbersih)} wilayah")
-            except Exception as wilayah_error:
-                logger.error(f"❌ Wilayah terbersih error: {str(wilayah_error)}")
-                traceback.print_exc()
-                wilayah_terbersih = []
-            
-            # Prepare response data
-            data = {
-                'period': {
-                    'start_date': start_date.strftime('%Y-%m-%d'),
-                    'end_date': end_date.strftime('%Y-%m-%d'),
-                    'label': f"{start_date.strftime('%d %b %Y')} - {end_date.strftime('%d %b %Y')}",
-                    'total_hari': (end_date - start_date).days + 1
-                },
-                'ringkasan': {
-                    'total_laporan': total_laporan,
-                    'laporan_selesai': laporan_selesai,
-                    'persentase_selesai': persentase_selesai,
-                    'update_terakhir': timezone.now().strftime('%Y-%m-%d %H:%M:%S')
-                },
-                'analisis_dampak_lingkungan': analisis_dampak,
-                'wilayah_terkotor': wilayah_terkotor,
-                'wilayah_terbersih': wilayah_terbersih,
-                'tips_lingkungan': self.tips_lingkungan(analisis_dampak)
-            }
-            
-            logger.info("✅ PublicDampakLingkunganView selesai")
+
+            # Hasil sama untuk semua pengunjung: dihitung sekali lalu dibagi
+            # lewat cache bersama sampai LaporanSampah berubah / tanggal berganti.
+            # Versi dibaca dari database yang sama dengan data (replica)
+            versions = await sync_to_async(model_versions)([LaporanSampah], using=self.read_alias)
+            key = make_key('public', versions_stamp(versions), 'dampak-lingkungan', timezone.now().date())
+            data = await aget_or_compute(key, self.build_data)
             return Response(data)
             
         except Exception as e:
@@ -164,6 +54,128 @@ class PublicDampakLingkunganView(APIView):
                 'debug': 'Cek logs di terminal Django'
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
+    async def build_data(self):
+        """Data analisis publik (tanpa Response, agar bisa di-cache)"""
+        # Default periode: 30 hari terakhir
+        end_date = timezone.now().date()
+        # start_date = end_date - timedelta(days=470)
+        start_date = date(2023, 1, 1)
+        
+        # Bisa juga menerima parameter dari query string
+        # if 'days' in request.GET:
+        #     try:
+        #         days = int(request.GET.get('days'))
+        #         start_date = end_date - timedelta(days=days)
+        #     except ValueError:
+        #         pass
+        
+        logger.info(f"📅 Periode: {start_date} sampai {end_date}")
+        
+        # Query data laporan sampah - TANPA SLICE DI SINI
+        try:
+            # Query dasar tanpa slicing
+            base_query = LaporanSampah.objects.filter(
+                tanggal_lapor__range=[start_date, end_date]
+            )
+            
+            # Hitung total sebelum slicing
+            total_laporan = await base_query.acount()
+            logger.info(f"📊 Total laporan dalam periode: {total_laporan}")
+            
+            # Untuk analisis, gunakan slicing (diambil sekali, dipakai ulang)
+            laporan_qs = [laporan async for laporan in base_query.order_by('-tanggal_lapor')[:1000]]
+            logger.info(f"📊 Laporan untuk analisis: {len(laporan_qs)} dari {total_laporan}")
+            
+        except Exception as query_error:
+            logger.error(f"❌ Query error: {str(query_error)}")
+            raise
+        
+        if total_laporan == 0:
+            logger.info("ℹ️ Tidak ada data laporan ditemukan")
+            return {
+                'message': 'Tidak ada data laporan sampah dalam periode ini',
+                'period': {
+                    'start_date': start_date.strftime('%Y-%m-%d'),
+                    'end_date': end_date.strftime('%Y-%m-%d'),
+                    'label': f"30 Hari Terakhir"
+                },
+                'data': {
+                    'analisis_dampak_lingkungan': [],
+                    'wilayah_terkotor': [],
+                    'wilayah_terbersih': [],
+                    'ringkasan': {
+                        'total_laporan': 0,
+                        'pesan': 'Data akan tampil setelah ada laporan dari masyarakat'
+                    }
+                }
+            }
+        
+        # Hitung laporan selesai dari QUERY UTAMA (bukan dari sliced)
+        try:
+            laporan_selesai = await base_query.filter(status='selesai').acount()
+            logger.info(f"✅ Laporan selesai: {laporan_selesai} dari {total_laporan}")
+        except Exception as e:
+            logger.warning(f"⚠️ Tidak bisa hitung laporan selesai: {str(e)}")
+            laporan_selesai = 0
+        
+        # Hitung persentase
+        persentase_selesai = round((laporan_selesai / total_laporan * 100), 1) if total_laporan > 0 else 0
+        
+        # 1. Analisis Dampak Lingkungan Berdasarkan Jenis Sampah
+        try:
+            analisis_dampak = self.analisis_dampak_lingkungan_publik(laporan_qs)
+            logger.info(f"✅ Analisis dampak berhasil: {len(analisis_dampak.get('detail', []))} jenis")
+        except Exception as analisis_error:
+            logger.error(f"❌ Analisis error: {str(analisis_error)}")
+            traceback.print_exc()
+            analisis_dampak = {
+                'detail': [],
+                'total_jenis': 0,
+                'total_berbahaya': 0,
+                'status_lingkungan': 'data_terbatas'
+            }
+        
+        # 2. 5 Wilayah Terkotor
+        try:
+            wilayah_terkotor = self.wilayah_terkotor_publik(laporan_qs)[:5]
+            logger.info(f"✅ Wilayah terkotor berhasil: {len(wilayah_terkotor)} wilayah")
+        except Exception as wilayah_error:
+            logger.error(f"❌ Wilayah terkotor error: {str(wilayah_error)}")
+            traceback.print_exc()
+            wilayah_terkotor = []
+        
+        # 3. 5 Wilayah Terbersih
+        try:
+            wilayah_terbersih = self.wilayah_terbersih_publik(laporan_qs)[:5]
+            logger.info(f"✅ Wilayah terbersih berhasil: {len(wilayah_terbersih)} wilayah")
+        except Exception as wilayah_error:
+            logger.error(f"❌ Wilayah terbersih error: {str(wilayah_error)}")
+            traceback.print_exc()
+            wilayah_terbersih = []
+        
+        # Prepare response data
+        data = {
+            'period': {
+                'start_date': start_date.strftime('%Y-%m-%d'),
+                'end_date': end_date.strftime('%Y-%m-%d'),
+                'label': f"{start_date.strftime('%d %b %Y')} - {end_date.strftime('%d %b %Y')}",
+                'total_hari': (end_date - start_date).days + 1
+            },
+            'ringkasan': {
+                'total_laporan': total_laporan,
+                'laporan_selesai': laporan_selesai,
+                'persentase_selesai': persentase_selesai,
+                'update_terakhir': timezone.now().strftime('%Y-%m-%d %H:%M:%S')
+            },
+            'analisis_dampak_lingkungan': analisis_dampak,
+            'wilayah_terkotor': wilayah_terkotor,
+            'wilayah_terbersih': wilayah_terbersih,
+            'tips_lingkungan': self.tips_lingkungan(analisis_dampak)
+        }
+        
+        logger.info("✅ PublicDampakLingkunganView selesai")
+        return data
+    
     def identifikasi_jenis_sampah_publik(self, laporan):
         """
         Identifikasi jenis sampah sederhana untuk publik
@@ -691,7 +703,7 @@ class PublicDampakLingkunganView(APIView):
 
 
 # Versi SIMPLE untuk landing page (tidak butuh query database)
-class PublicLandingPageView(APIView):
+class PublicLandingPageView(ReadReplicaMixin, AsyncAPIView):
     """
     View SUPER SEDERHANA untuk landing page
     Hanya menampilkan statistik ringkas
@@ -699,7 +711,7 @@ class PublicLandingPageView(APIView):
     
     permission_classes = [AllowAny]
 
-    def get(self, request):
+    async def get(self, request):
         # Data dummy/stub untuk landing page
         # Dalam implementasi nyata, bisa diambil dari cache atau database ringkas
         
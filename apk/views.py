@@ -10,12 +10,19 @@ from django.db.models import Q, Count
 from rest_framework.decorators import action
 from django.conf import settings
 from .utils.notifications import NotificationService
-from rest_framework.pagination import PageNumberPagination
+from .utils.routing import plan_route
+from .utils.scheduling import generate_schedule
+from .utils.geo import filter_near, parse_near_params
 from django.utils import timezone
 from datetime import timedelta
 from django.shortcuts import get_object_or_404
 from rest_framework.decorators import api_view, permission_classes
 from django.db import transaction
+import logging
+from .utils.logs import get_logger
+from .utils.conditional import ConditionalGetMixin, bump_version
+from .authentication import linked_anggota_id, linked_tim_ids
+from .viewNotifikasi import NotificationPagination, filter_notifications
 
 
 from .models import (
@@ -43,8 +50,10 @@ from .serializers import (
     RegisterTamuSerializer,
     RegisterAnggotaSerializer,
     UpgradeAnggotaSerializer,
+    GenerateJadwalSerializer,
     PushSubscriptionSerializer,
     NotificationSerializer,
+    status_jadwal_counts,
 )
 
 from .permissions import (
@@ -58,6 +67,8 @@ from .permissions import (
     PublicReadPermission
 )
 
+log = get_logger(__name__)
+
 
 class RegisterTamuView(APIView):
     permission_classes = [AllowAny]  # Bisa diakses tanpa login
@@ -307,20 +318,30 @@ class TimPengangkutViewSet(ModelViewSet):
 # ============================
 
 
-class AnggotaViewSet(ModelViewSet):
+class AnggotaViewSet(ConditionalGetMixin, ModelViewSet):
     queryset = Anggota.objects.select_related("user")
     serializer_class = AnggotaSerializer
     permission_classes = [PermissionAnggota]
+    # ETag list/detail (user_info & status_jadwal_info ikut di response)
+    etag_models = (Anggota, User, DetailAnggotaJadwal)
 
     def get_queryset(self):
         """
         Filter anggota berdasarkan query param 'user' jika ada.
         Contoh: /api/anggota/?user=6
+        Pencarian radius (meter): /api/anggota/?near=-10.17,123.60&radius=500
         """
-        queryset = super().get_queryset()
+        # status_jadwal_info dihitung sekaligus, bukan 4 query per anggota
+        queryset = super().get_queryset().annotate(
+            **status_jadwal_counts('detailanggotajadwal')
+        )
         user_id = self.request.query_params.get("user")
         if user_id:
             queryset = queryset.filter(user__id=user_id)
+
+        near = parse_near_params(self.request.query_params)
+        if near:
+            queryset = filter_near(queryset, *near)
         return queryset
 
     @action(detail=True, methods=['post'])
@@ -333,20 +354,7 @@ class AnggotaViewSet(ModelViewSet):
                 'error': 'Anggota harus berstatus aktif untuk mengaktifkan jadwal'
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        detail_jadwals = DetailAnggotaJadwal.objects.filter(
-            idAnggota=anggota,
-            status_pengangkutan='dibatalkan'
-        )
-
-        today = timezone.now().date()
-        reactivated_count = 0
-
-        for detail in detail_jadwals:
-            if detail.idJadwal.tanggalJadwal >= today:
-                detail.status_pengangkutan = 'terjadwal'
-                detail.catatan = f"Status pengangkutan diaktifkan kembali (ID Anggota: {anggota.idAnggota})"
-                detail.save()
-                reactivated_count += 1
+        reactivated_count = anggota.aktifkan_kembali_jadwal()
 
         return Response({
             'success': True,
@@ -457,9 +465,10 @@ class TamuViewSet(ModelViewSet):
 # ============================
 #            JADWAL
 # ============================
-class JadwalViewSet(ModelViewSet):
+class JadwalViewSet(ConditionalGetMixin, ModelViewSet):
     serializer_class = JadwalSerializer
     permission_classes = [PermissionJadwal]
+    etag_models = (Jadwal, TimPengangkut)
 
     def get_queryset(self):
         user = self.request.user
@@ -471,13 +480,123 @@ class JadwalViewSet(ModelViewSet):
             return qs
 
         if role == "tim_angkut":
-            return qs.filter(idTim__user=user)
+            return qs.filter(idTim__in=linked_tim_ids(user))
 
         if role == "anggota":
             return qs
 
         return qs.none()
 
+    @action(detail=True, methods=['get'])
+    def rute(self, request, pk=None):
+        """
+        Urutan titik pengangkutan yang dioptimasi (nearest-neighbour + 2-opt).
+        Query param opsional:
+        - depot=lat,lon  : titik awal (default dari settings.ROUTE_OPTIMIZATION)
+        - kembali=true   : rute kembali ke depot
+        """
+        jadwal = self.get_object()
+        config = getattr(settings, 'ROUTE_OPTIMIZATION', {})
+
+        depot = (config.get('DEPOT_LATITUDE'), config.get('DEPOT_LONGITUDE'))
+        depot_param = request.query_params.get('depot')
+        if depot_param:
+            try:
+                depot_lat, depot_lon = (float(v) for v in depot_param.split(','))
+            except ValueError:
+                return Response({
+                    'error': 'Format depot harus "latitude,longitude"'
+                }, status=status.HTTP_400_BAD_REQUEST)
+            if not (-90 <= depot_lat <= 90 and -180 <= depot_lon <= 180):
+                return Response({
+                    'error': 'Koordinat depot tidak valid'
+                }, status=status.HTTP_400_BAD_REQUEST)
+            depot = (depot_lat, depot_lon)
+
+        kembali_param = request.query_params.get('kembali')
+        if kembali_param is None:
+            kembali = config.get('RETURN_TO_DEPOT', False)
+        else:
+            kembali = kembali_param.lower() == 'true'
+
+        details = list(
+            DetailAnggotaJadwal.objects
+            .filter(idJadwal=jadwal)
+            .exclude(status_pengangkutan='dibatalkan')
+            .select_related('idAnggota')
+        )
+
+        order, legs = plan_route(
+            [(d.idAnggota.latitude, d.idAnggota.longitude) for d in details],
+            depot,
+            return_to_depot=kembali,
+            max_iterations=config.get('MAX_2OPT_ITERATIONS', 100),
+        )
+
+        rute = []
+        kumulatif = 0.0
+        for urutan, (index, jarak) in enumerate(zip(order, legs), start=1):
+            detail = details[index]
+            kumulatif += jarak
+            rute.append({
+                'urutan': urutan,
+                'detail_id': detail.id,
+                'anggota_id': detail.idAnggota.idAnggota,
+                'nama_anggota': detail.idAnggota.nama,
+                'alamat': detail.idAnggota.alamat,
+                'latitude': detail.idAnggota.latitude,
+                'longitude': detail.idAnggota.longitude,
+                'status_pengangkutan': detail.status_pengangkutan,
+                'jarak_dari_sebelumnya_km': round(jarak, 3),
+                'jarak_kumulatif_km': round(kumulatif, 3),
+            })
+
+        jarak_kembali = legs[-1] if kembali and legs else 0.0
+
+        return Response({
+            'jadwal_id': jadwal.idJadwal,
+            'tanggal_jadwal': jadwal.tanggalJadwal,
+            'nama_tim': jadwal.idTim.namaTim,
+            'depot': {'latitude': depot[0], 'longitude': depot[1]},
+            'kembali_ke_depot': kembali,
+            'jumlah_titik': len(rute),
+            'jarak_kembali_ke_depot_km': round(jarak_kembali, 3),
+            'total_jarak_km': round(kumulatif + jarak_kembali, 3),
+            'rute': rute,
+        })
+
+    @action(detail=False, methods=['post'])
+    def generate(self, request):
+        """
+        Buat jadwal otomatis untuk anggota aktif (ADMIN).
+        Default dry_run=true: hanya preview, tidak ada data yang disimpan.
+        """
+        if getattr(request.user, 'role', None) != 'admin':
+            return Response(
+                {"error": "Hanya admin yang bisa membuat jadwal otomatis"},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        serializer = GenerateJadwalSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        data = serializer.validated_data
+        try:
+            summary = generate_schedule(
+                data['tanggal_mulai'],
+                data['tanggal_selesai'],
+                dry_run=data['dry_run'],
+                tim_ids=data.get('tim'),
+            )
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(
+            summary,
+            status=status.HTTP_200_OK if data['dry_run'] else status.HTTP_201_CREATED
+        )
+
 
 # ============================
 #          PEMBAYARAN
@@ -507,7 +626,7 @@ class PembayaranViewSet(ModelViewSet):
 
         if role == "anggota":
             # Anggota hanya lihat pembayaran miliknya sendiri
-            return qs.filter(idAnggota__user=user)
+            return qs.filter(idAnggota=linked_anggota_id(user))
 
         if role == "tim_angkut":
             # Tim angkut bisa lihat semua (readonly)
@@ -529,7 +648,7 @@ class PembayaranViewSet(ModelViewSet):
         if user.role == "anggota":
             # Pastikan anggota hanya membuat pembayaran untuk dirinya sendiri
             anggota = serializer.validated_data.get('idAnggota')
-            if anggota.user != user:
+            if anggota.pk != linked_anggota_id(user):
                 raise PermissionDenied(
                     "Anda hanya bisa membuat pembayaran untuk akun Anda sendiri.")
 
@@ -542,7 +661,7 @@ class PembayaranViewSet(ModelViewSet):
         if user.role == "anggota":
             # Anggota hanya bisa update pembayaran miliknya sendiri
             instance = self.get_object()
-            if instance.idAnggota.user != user:
+            if instance.idAnggota_id != linked_anggota_id(user):
                 raise PermissionDenied(
                     "Anda hanya bisa mengupdate pembayaran milik Anda sendiri.")
 
@@ -585,7 +704,7 @@ def handle_payment_success(request, payment_id):
         user = request.user
 
         # Validasi permission
-        if user.role != 'admin' and pembayaran.idAnggota.user != user:
+        if user.role != 'admin' and pembayaran.idAnggota_id != linked_anggota_id(user):
             return Response({
                 'error': 'Anda tidak memiliki izin untuk mengkonfirmasi pembayaran ini'
             }, status=status.HTTP_403_FORBIDDEN)
@@ -608,32 +727,34 @@ def handle_payment_success(request, payment_id):
             # Tambah 30 hari dari tanggalEnd
             new_end_date = anggota.tanggalEnd + timedelta(days=30)
 
-        anggota.tanggalEnd = new_end_date
-        anggota.status = 'aktif'
-        anggota.save()
-
-        # Aktifkan kembali semua detail jadwal yang dibatalkan
-        detail_jadwals = DetailAnggotaJadwal.objects.filter(
-            idAnggota=anggota,
-            status_pengangkutan='dibatalkan'
+        # Aktifkan kembali detail jadwal mendatang yang dibatalkan.
+        # Dilakukan sebelum anggota.save() agar signal status anggota
+        # tidak lagi menemukan jadwal yang perlu diaktifkan.
+        detail_jadwals = list(
+            anggota.jadwal_dibatalkan_mendatang()
+            .select_related('idJadwal__idTim')
         )
+        DetailAnggotaJadwal.objects.filter(
+            pk__in=[detail.pk for detail in detail_jadwals]
+        ).update(
+            status_pengangkutan='terjadwal',
+            catatan=f"Status pengangkutan diaktifkan kembali setelah pembayaran (Pembayaran ID: {payment_id})"
+        )
+        bump_version(DetailAnggotaJadwal)
 
-        reactivated_count = 0
-        upcoming_jadwals = []
-
-        for detail in detail_jadwals:
-            if detail.idJadwal.tanggalJadwal >= today:
-                detail.status_pengangkutan = 'terjadwal'
-                detail.catatan = f"Status pengangkutan diaktifkan kembali setelah pembayaran (Pembayaran ID: {payment_id})"
-                detail.save()
-                reactivated_count += 1
+        reactivated_count = len(detail_jadwals)
+        upcoming_jadwals = [
+            {
+                'id': detail.id,
+                'tanggal': detail.idJadwal.tanggalJadwal,
+                'tim': detail.idJadwal.idTim.namaTim
+            }
+            for detail in detail_jadwals
+        ]
 
-                # Tambah ke list jadwal mendatang
-                upcoming_jadwals.append({
-                    'id': detail.id,
-                    'tanggal': detail.idJadwal.tanggalJadwal,
-                    'tim': detail.idJadwal.idTim.namaTim
-                })
+        anggota.tanggalEnd = new_end_date
+        anggota.status = 'aktif'
+        anggota.save()
 
         # Create notification for user
         if anggota.user:
@@ -688,10 +809,6 @@ class DetailAnggotaJadwalViewSet(ModelViewSet):
     def get_queryset(self):
         user = self.request.user
 
-        # DEBUG: Log user info
-        print(
-            f"🔍 get_queryset called - User: {user.username}, ID: {user.id}, Role: {getattr(user, 'role', 'N/A')}")
-
         # Gunakan select_related untuk optimasi query
         qs = DetailAnggotaJadwal.objects.select_related(
             "idAnggota",           # Load Anggota
@@ -702,33 +819,22 @@ class DetailAnggotaJadwalViewSet(ModelViewSet):
 
         role = getattr(user, "role", None)
 
-        print(f"🔍 User role: {role}")
-
-        if role == "admin":
-            print("🔍 Returning ALL records for admin")
-            return qs
-
-        if role == "tim_angkut":
-            print("🔍 Returning ALL records for tim_angkut")
+        if role in ("admin", "tim_angkut"):
+            log.event(logging.DEBUG, "detail_jadwal.queryset", user_id=user.id, role=role, scope="all")
             return qs
 
         if role == "anggota":
             # Filter hanya untuk anggota ini
-            print(f"🔍 Filtering for anggota with user ID: {user.id}")
-
-            # Cara 1: Filter langsung
-            anggota_qs = qs.filter(idAnggota__user=user)
-            print(f"🔍 Found {anggota_qs.count()} records for this anggota")
-
-            # Debug: lihat data yang ditemukan
-            if anggota_qs.exists():
-                for item in anggota_qs[:3]:  # Lihat 3 pertama
-                    print(
-                        f"   - {item.id}: {item.idAnggota.nama} (User ID: {item.idAnggota.user.id if item.idAnggota.user else 'No user'})")
-
+            anggota_qs = qs.filter(idAnggota=linked_anggota_id(user))
+            # count & sampel id hanya di-query jika log DEBUG aktif
+            log.event(
+                logging.DEBUG, "detail_jadwal.queryset", user_id=user.id, role=role, scope="anggota",
+                count=anggota_qs.count,
+                sample_ids=lambda: list(anggota_qs.values_list("id", flat=True)[:3]),
+            )
             return anggota_qs
 
-        print(f"⚠️ No role or unknown role: {role}")
+        log.event(logging.WARNING, "detail_jadwal.unknown_role", user_id=user.id, role=role)
         return qs.none()
 
     # def perform_create(self, serializer):
@@ -744,9 +850,10 @@ class DetailAnggotaJadwalViewSet(ModelViewSet):
 # ============================
 
 
-class LaporanSampahViewSet(ModelViewSet):
+class LaporanSampahViewSet(ConditionalGetMixin, ModelViewSet):
     queryset = LaporanSampah.objects.all()
     serializer_class = LaporanSampahSerializer
+    etag_models = (LaporanSampah, User)
 
     def get_permissions(self):
         # Public boleh GET
@@ -755,8 +862,19 @@ class LaporanSampahViewSet(ModelViewSet):
         # Selain GET harus login dan role valid
         return [PermissionLaporanSampah()]
 
+    filterset_fields = ['status']
+
     def get_queryset(self):
-        return LaporanSampah.objects.select_related("idUser").all()
+        """
+        Pencarian radius (meter), misal laporan yang belum selesai:
+        /api/laporan-sampah/?near=-10.17,123.60&radius=500&status=pending
+        """
+        queryset = LaporanSampah.objects.select_related("idUser").all()
+
+        near = parse_near_params(self.request.query_params)
+        if near:
+            queryset = filter_near(queryset, *near)
+        return queryset
 
     def perform_create(self, serializer):
         user = self.request.user
@@ -774,10 +892,11 @@ class LaporanSampahViewSet(ModelViewSet):
         instance = self.get_object()
 
         # LOG: Data sebelum update
-        print(f"🔍 BEFORE UPDATE - ID: {instance.idLaporan}")
-        print(
-            f"🔍 BEFORE - Latitude: {instance.latitude}, Longitude: {instance.longitude}")
-        print(f"🔍 REQUEST DATA: {request.data}")
+        log.event(
+            logging.DEBUG, "laporan.update.before", id=instance.idLaporan,
+            latitude=instance.latitude, longitude=instance.longitude,
+            fields=lambda: sorted(request.data.keys()),
+        )
 
         # Handle file upload khusus
         if 'foto_bukti' in request.data:
@@ -786,12 +905,11 @@ class LaporanSampahViewSet(ModelViewSet):
 
         response = super().update(request, *args, **kwargs)
 
-        # LOG: Data setelah update
-        instance.refresh_from_db()
-        print(f"✅ AFTER UPDATE - ID: {instance.idLaporan}")
-        print(
-            f"✅ AFTER - Latitude: {instance.latitude}, Longitude: {instance.longitude}")
-        print(f"✅ RESPONSE DATA: {response.data}")
+        # LOG: Data setelah update (koordinat diambil dari response, tanpa refresh_from_db)
+        log.event(
+            logging.DEBUG, "laporan.update.after", id=instance.idLaporan,
+            latitude=response.data.get("latitude"), longitude=response.data.get("longitude"),
+        )
 
         return response
 
@@ -850,140 +968,7 @@ class PushSubscriptionViewSet(ModelViewSet):
     #         "key_length": len(public_key)
     #     })
 
-    # Perbaikan import - gunakan absolute import
-    @action(detail=False, methods=['post'], url_path='test_notification')
-    def test_notification(self, request):
-        """
-        Send test notification to current user
-        """
-        try:
-            from django.conf import settings
-            import json
-            from pywebpush import webpush, WebPushException
-            from datetime import datetime
-
-            print(
-                f"🧪 Test notification requested by user: {request.user.username}")
-
-            # Cek apakah user sudah subscribe
-            subscriptions = self.get_queryset()
-
-            if not subscriptions.exists():
-                print(f"❌ User {request.user.username} has no subscription")
-                return Response({
-                    "success": False,
-                    "message": "Anda belum berlangganan notifikasi push. Silakan aktifkan terlebih dahulu."
-                }, status=status.HTTP_400_BAD_REQUEST)
-
-            print(
-                f"✅ User {request.user.username} has {subscriptions.count()} subscription(s)")
-
-            # VAPID settings
-            vapid_private_key = settings.WEBPUSH_SETTINGS.get(
-                "VAPID_PRIVATE_KEY")
-            vapid_admin_email = settings.WEBPUSH_SETTINGS.get(
-                "VAPID_ADMIN_EMAIL")
-
-            if not vapid_private_key or not vapid_admin_email:
-                print("❌ VAPID keys not configured")
-                return Response({
-                    "success": False,
-                    "message": "Server configuration error: VAPID keys missing"
-                }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-            # Payload
-            payload = {
-                "title": "🧪 Test Notification - CleanUp",
-                "body": "Ini adalah notifikasi test dari sistem CleanUp",
-                "icon": "/icons/icon-192x192.png",
-                "badge": "/icons/badge-72x72.png",
-                "url": "/dashboard",
-                "type": "test",
-                "data": {
-                    "test": True,
-                    "timestamp": datetime.now().isoformat(),
-                    "user": request.user.username
-                }
-            }
-
-            results = []
-
-            for subscription in subscriptions:
-                try:
-                    print(
-                        f"   Sending to endpoint: {subscription.endpoint[:50]}...")
-
-                    webpush(
-                        subscription_info={
-                            "endpoint": subscription.endpoint,
-                            "keys": {
-                                "p256dh": subscription.p256dh,
-                                "auth": subscription.auth
-                            }
-                        },
-                        data=json.dumps(payload),
-                        vapid_private_key=vapid_private_key,
-                        vapid_claims={
-                            "sub": f"mailto:{vapid_admin_email}"
-                        },
-                    )
-
-                    results.append({
-                        "status": "success",
-                        "endpoint": subscription.endpoint,
-                    })
-
-                    print(f"   ✅ Success!")
-
-                except WebPushException as ex:
-                    print(f"   ❌ WebPushException: {ex}")
-
-                    # Subscription expired / gone
-                    if ex.response and ex.response.status_code in (404, 410):
-                        subscription.delete()
-                        print(f"   🧹 Deleted expired subscription")
-
-                    results.append({
-                        "status": "failed",
-                        "error": str(ex),
-                        "type": "WebPushException"
-                    })
-
-                except Exception as e:
-                    print(f"   ❌ Unknown error: {str(e)}")
-                    results.append({
-                        "status": "failed",
-                        "error": str(e),
-                        "type": "Unknown"
-                    })
-
-            success_count = sum(
-                1 for r in results if r.get("status") == "success")
-
-            if success_count > 0:
-                return Response({
-                    "success": True,
-                    "message": f"Test notification sent successfully ({success_count} delivered)",
-                    "results": results
-                })
-            else:
-                error_message = results[0].get(
-                    "error", "Unknown error") if results else "No subscriptions"
-                return Response({
-                    "success": False,
-                    "message": f"Failed to send test notification: {error_message}",
-                    "results": results
-                }, status=status.HTTP_400_BAD_REQUEST)
-
-        except Exception as e:
-            print(f"❌ Error sending test notification: {str(e)}")
-            import traceback
-            traceback.print_exc()
-
-            return Response({
-                "success": False,
-                "message": f"Server error: {str(e)}",
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    # POST test_notification: viewNotifikasi.PushTestNotificationView (async)
 
     @action(detail=False, methods=['get'])
     def check_subscription(self, request):
@@ -1011,55 +996,19 @@ class PushSubscriptionViewSet(ModelViewSet):
         })
 
 
-class NotificationPagination(PageNumberPagination):
-    page_size = 10
-    page_size_query_param = 'page_size'
-    max_page_size = 100
-
-
 class NotificationViewSet(ModelViewSet):
     serializer_class = NotificationSerializer
     permission_classes = [permissions.IsAuthenticated]
     pagination_class = NotificationPagination
 
     def get_queryset(self):
-        user = self.request.user
-
-        # Mulai dengan queryset dasar
-        queryset = Notification.objects.filter(user=user)
-
-        # Filter berdasarkan parameter query
-        user_type = self.request.query_params.get('user_type', None)
-        if user_type:
-            queryset = queryset.filter(user__role=user_type)
-
-        read_param = self.request.query_params.get('read', None)
-        if read_param is not None:
-            read_bool = read_param.lower() == 'true'
-            queryset = queryset.filter(read=read_bool)
-
-        notification_type = self.request.query_params.get('type', None)
-        if notification_type:
-            queryset = queryset.filter(notification_type=notification_type)
-
-        priority = self.request.query_params.get('priority', None)
-        if priority:
-            queryset = queryset.filter(priority=priority)
-
-        # Order by sebelum pagination
-        queryset = queryset.order_by('-created_at')
-
-        return queryset
+        return filter_notifications(
+            Notification.objects.filter(user=self.request.user), self.request.query_params,
+        )
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
-    @action(detail=False, methods=['get'])
-    def unread_count(self, request):
-        count = Notification.objects.filter(
-            user=request.user, read=False).count()
-        return Response({'count': count})
-
     @action(detail=True, methods=['post'])
     def mark_read(self, request, pk=None):
         notification = self.get_object()
@@ -1114,28 +1063,6 @@ class NotificationViewSet(ModelViewSet):
         serializer = self.get_serializer(notifications, many=True)
         return Response(serializer.data)
 
-    def list(self, request):
-        """Override list untuk menangani limit parameter"""
-        queryset = self.get_queryset()
-
-        # Handle limit parameter tanpa menggunakan slicing pada queryset
-        limit = request.query_params.get('limit', None)
-        if limit:
-            try:
-                limit_int = int(limit)
-                # Gunakan pagination untuk limit
-                self.pagination_class.page_size = limit_int
-            except ValueError:
-                pass
-
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
-
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
@@ -14,6 +14,7 @@ from pathlib import Path
 from datetime import timedelta
 
 import os
+import sys
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -61,7 +62,8 @@ VAPID_ADMIN_EMAIL = WEBPUSH_SETTINGS["VAPID_ADMIN_EMAIL"]
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        # JWT dengan snapshot user di cache (apk/authentication.py)
+        'apk.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
@@ -72,6 +74,17 @@ REST_FRAMEWORK = {
         'rest_framework.filters.OrderingFilter',
     ],
     'DEFAULT_METADATA_CLASS': 'rest_framework.metadata.SimpleMetadata',
+    # JSON lewat orjson jika terpasang (apk/renderers.py, apk/parsers.py);
+    # tanpa orjson otomatis memakai JSONRenderer/JSONParser bawaan DRF
+    'DEFAULT_RENDERER_CLASSES': [
+        'apk.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'apk.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
 }
 
 SIMPLE_JWT = {
@@ -122,26 +135,161 @@ NOMINATIM_CONFIG = {
     'USER_AGENT': 'CleanUp_Kupang/1.0 (contact@email.com)',
 }
 
-# GUNAKAN CACHE LOCAL SAJA untuk sementara (komentari Redis)
+# Optimasi rute pengangkutan (GET /api/jadwal/<id>/rute/)
+# Depot bisa dioverride per request: ?depot=lat,lon
+ROUTE_OPTIMIZATION = {
+    'DEPOT_LATITUDE': float(os.environ.get('ROUTE_DEPOT_LATITUDE', -10.1772)),
+    'DEPOT_LONGITUDE': float(os.environ.get('ROUTE_DEPOT_LONGITUDE', 123.6070)),
+    'RETURN_TO_DEPOT': False,
+    'MAX_2OPT_ITERATIONS': 100,
+}
+
+# CACHE_PROFILE (env):
+#   local : LocMemCache per proses (default), tidak dibagi antar worker
+#   redis : Redis bersama semua worker (redis-py), alamat dari REDIS_URL
+#   fake  : stand-in Redis di dalam proses (apk/utils/cache.py), untuk dev/test
+# Semua profil mencatat hit/miss untuk /api/metrics.
+CACHE_PROFILE = os.environ.get('CACHE_PROFILE', 'local')
+
 CACHES = {
     'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'BACKEND': 'apk.utils.metrics.InstrumentedLocMemCache',
         'LOCATION': 'unique-snowflake',
+        'METRICS_NAME': 'default',
     }
 }
 
+if CACHE_PROFILE in ('redis', 'fake'):
+    CACHES['default'] = {
+        'BACKEND': (
+            'apk.utils.metrics.InstrumentedRedisCache' if CACHE_PROFILE == 'redis'
+            else 'apk.utils.cache.FakeRedisCache'
+        ),
+        'LOCATION': os.environ.get('REDIS_URL', 'redis://127.0.0.1:6379/0'),
+        # Namespace aplikasi di Redis yang dipakai bersama
+        'KEY_PREFIX': os.environ.get('CACHE_KEY_PREFIX', 'cleanup'),
+        'TIMEOUT': 300,
+        'METRICS_NAME': 'default',
+    }
+
+# Helper cache bersama: key ber-namespace, invalidasi berversi, anti stampede
+# (apk/utils/cache.py)
+SHARED_CACHE = {
+    'TIMEOUT': 300,
+    'STALE_SECONDS': 60,
+    'EARLY_REFRESH_BETA': 1.0,
+    'LOCK_SECONDS': 30,
+    'LOCK_WAIT_SECONDS': 5,
+}
+
 AUTH_USER_MODEL = "apk.User"
 
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Foto laporan & bukti bayar disimpan berdasarkan hash isinya (apk/storage.py):
+# upload identik hanya disimpan sekali. Bersihkan blob yatim: manage.py cleanup_media
+STORAGES = {
+    "default": {
+        "BACKEND": "apk.storage.ContentAddressedStorage",
+        "OPTIONS": {
+            "prefixes": ["laporan_fotos/", "bukti_pembayaran/"],
+        },
+    },
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
+    },
+}
+
+# Penyajian media (apk/viewMedia.py)
+MEDIA_SERVING = {
+    # None = dikirim Django; 'x-accel-redirect' (nginx) / 'x-sendfile' (Apache)
+    'SENDFILE_BACKEND': os.environ.get('MEDIA_SENDFILE_BACKEND') or None,
+    # nginx: location /protected-media/ { internal; alias <MEDIA_ROOT>/; }
+    'X_ACCEL_PREFIX': '/protected-media/',
+    'PRIVATE_PREFIXES': ['bukti_pembayaran/'],
+    'SIGNED_URL_MAX_AGE': 60 * 60 * 24,  # detik
+    'IMMUTABLE_MAX_AGE': 60 * 60 * 24 * 365,
+    'DEFAULT_MAX_AGE': 60 * 60,
+}
+
+# Pipeline foto upload (apk/utils/images.py): encode ulang + rendisi
+IMAGE_PIPELINE = {
+    'ENABLED': True,
+    'ASYNC': True,  # False = proses langsung saat commit (mis. untuk test)
+    'FORMAT': 'WEBP',  # fallback ke JPEG jika Pillow tanpa WebP
+    'QUALITY': 80,
+    'MAX_DIMENSION': 2048,
+    'RENDITIONS': {
+        'thumb': 320,
+        'medium': 1024,
+    },
+    'WORKERS': 2,
+}
+
+# Metrik Prometheus (apk/utils/metrics.py, GET /api/metrics)
+METRICS = {
+    'ENABLED': True,
+    # Log request lebih lambat dari ini (ms) beserta query terlamanya; kosong = mati
+    'SLOW_REQUEST_MS': int(os.environ['METRICS_SLOW_REQUEST_MS']) if os.environ.get('METRICS_SLOW_REQUEST_MS') else None,
+    'SLOW_REQUEST_TOP_QUERIES': 5,
+    # Jika diisi, scraper wajib kirim Authorization: Bearer <token>
+    'TOKEN': os.environ.get('METRICS_TOKEN') or None,
+    'ALLOWED_IPS': ['127.0.0.1', '::1'],
+}
+
+# ETag / 304 untuk GET list, detail & report (apk/utils/conditional.py)
+CONDITIONAL_GET = {
+    'ENABLED': True,
+}
+
+# Snapshot user (role, is_active, idAnggota/idTim) untuk autentikasi JWT
+# tanpa query User per request (apk/authentication.py)
+AUTH_USER_CACHE = {
+    'ENABLED': True,
+    'TIMEOUT': 60,  # detik
+}
+
+# Logging terstruktur apk (apk/utils/logs.py)
+STRUCTURED_LOGGING = {
+    # mis. {'detail_jadwal.queryset': 0.01} = tulis 1% event DEBUG/INFO itu
+    'SAMPLE_RATES': {},
+    'DEFAULT_SAMPLE_RATE': 1.0,
+}
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'json': {'()': 'apk.utils.logs.JsonFormatter'},
+        'text': {'format': '%(asctime)s %(levelname)s %(name)s %(message)s'},
+    },
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+            # LOG_FORMAT=json untuk agregator log (satu baris JSON per record)
+            'formatter': 'json' if os.environ.get('LOG_FORMAT') == 'json' else 'text',
+        },
+    },
+    'loggers': {
+        # LOG_LEVEL=DEBUG menyalakan event debug (dan query debug-nya)
+        'apk': {
+            'handlers': ['console'],
+            'level': os.environ.get('LOG_LEVEL', 'INFO'),
+            'propagate': False,
+        },
+    },
+}
+
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'apk.middleware.MetricsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'apk.db_routers.ReadYourWritesMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -169,6 +317,23 @@ WSGI_APPLICATION = 'cleanupapk.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# DB_PROFILE (env):
+#   sqlite       : SQLite + WAL & pragma untuk akses konkuren, koneksi persisten (default)
+#   sqlite-basic : SQLite bawaan Django (rollback journal, tanpa busy timeout)
+#   postgres     : PostgreSQL (psycopg 3) dengan connection pool, lihat POSTGRES_* di bawah
+# Bandingkan keduanya: python manage.py benchmark_sqlite
+DB_PROFILE = os.environ.get('DB_PROFILE', 'sqlite')
+
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',       # pembaca tidak memblokir penulis (dan sebaliknya)
+    'synchronous': 'NORMAL',     # aman dengan WAL, fsync hanya saat checkpoint
+    'mmap_size': 128 * 1024 * 1024,
+    'cache_size': -20000,        # negatif = KiB (±20 MB per koneksi)
+    'busy_timeout': 20000,       # ms menunggu lock sebelum "database is locked"
+    'temp_store': 'MEMORY',
+    'journal_size_limit': 64 * 1024 * 1024,  # potong file -wal setelah checkpoint
+}
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
@@ -176,6 +341,89 @@ DATABASES = {
     }
 }
 
+if DB_PROFILE == 'sqlite':
+    DATABASES['default'].update({
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 600)),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'timeout': SQLITE_PRAGMAS['busy_timeout'] / 1000,
+            # Lock tulis diambil di awal transaksi: tidak ada upgrade lock
+            # di tengah transaksi yang langsung gagal dengan "database is locked"
+            'transaction_mode': 'IMMEDIATE',
+            'init_command': ';'.join(
+                f"PRAGMA {name}={value}" for name, value in SQLITE_PRAGMAS.items()
+            ),
+        },
+    })
+
+elif DB_PROFILE == 'postgres':
+    # pip install "psycopg[binary,pool]"
+    DATABASES['default'] = {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': os.environ.get('POSTGRES_DB', 'cleanup'),
+        'USER': os.environ.get('POSTGRES_USER', 'cleanup'),
+        'PASSWORD': os.environ.get('POSTGRES_PASSWORD', ''),
+        'HOST': os.environ.get('POSTGRES_HOST', 'localhost'),
+        'PORT': os.environ.get('POSTGRES_PORT', '5432'),
+        # Pool psycopg dipakai ulang antar request; CONN_MAX_AGE harus 0
+        'CONN_MAX_AGE': 0,
+        'CONN_HEALTH_CHECKS': True,
+        # Report memakai .iterator() -> server-side cursor (baris dikirim bertahap).
+        # Set True jika lewat PgBouncer mode transaction.
+        'DISABLE_SERVER_SIDE_CURSORS': os.environ.get('POSTGRES_PGBOUNCER', '') == '1',
+        'OPTIONS': {
+            'pool': {
+                'min_size': int(os.environ.get('POSTGRES_POOL_MIN', 2)),
+                'max_size': int(os.environ.get('POSTGRES_POOL_MAX', 10)),
+                'timeout': 10,
+            },
+            'application_name': 'cleanupapk',
+        },
+        'TEST': {
+            'NAME': os.environ.get('POSTGRES_TEST_DB', 'test_cleanup'),
+        },
+    }
+
+# Test suite tetap di SQLite (in-memory), apa pun DB_PROFILE-nya,
+# kecuali TEST_DB_PROFILE=postgres.
+if 'test' in sys.argv[1:2] and os.environ.get('TEST_DB_PROFILE') != 'postgres':
+    DATABASES['default'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'db.sqlite3',
+    }
+
+# Read replica untuk report, export & analitik publik (apk/db_routers.py).
+#   DB_REPLICA_NAME=replica.sqlite3      : file SQLite kedua (isi: manage.py sync_replica)
+#   POSTGRES_REPLICA_HOST=<host standby> : replica streaming PostgreSQL
+# Tanpa keduanya semua query tetap ke 'default'.
+if os.environ.get('DB_REPLICA_NAME') and DATABASES['default']['ENGINE'].endswith('sqlite3'):
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'NAME': BASE_DIR / os.environ['DB_REPLICA_NAME'],
+    }
+elif os.environ.get('POSTGRES_REPLICA_HOST') and DB_PROFILE == 'postgres':
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'HOST': os.environ['POSTGRES_REPLICA_HOST'],
+        'PORT': os.environ.get('POSTGRES_REPLICA_PORT', DATABASES['default']['PORT']),
+    }
+
+if 'replica' in DATABASES:
+    # Test: replica = koneksi yang sama dengan default
+    DATABASES['replica']['TEST'] = {'MIRROR': 'default'}
+
+DATABASE_ROUTERS = ['apk.db_routers.ReadReplicaRouter']
+
+READ_REPLICA = {
+    'ALIAS': 'replica',
+    # Lag replica lebih dari ini -> baca dari default (per view: replica_max_lag)
+    'MAX_LAG_SECONDS': int(os.environ.get('DB_REPLICA_MAX_LAG', 30)),
+    # Setelah POST/PUT/PATCH/DELETE, user dibaca dari default selama ini.
+    # Butuh cache bersama antar worker agar berlaku lintas proses.
+    'STICKY_SECONDS': 15,
+    'LAG_CHECK_INTERVAL': 5,
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
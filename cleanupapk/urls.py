@@ -14,10 +14,11 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+import re
+
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 from django.conf import settings
-from django.conf.urls.static import static
 
 # JWT
 from rest_framework_simplejwt.views import (
@@ -27,6 +28,7 @@ from rest_framework_simplejwt.views import (
 
 # Login Custom (Jika ingin response tambahan)
 from apk.auth_views import CustomLoginView
+from apk.viewMedia import serve_media
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -53,5 +55,12 @@ urlpatterns = [
 # ======================
 #   MEDIA STATIC FILES
 # ======================
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+# Disajikan apk.viewMedia (Range, ETag, cache, X-Sendfile/X-Accel-Redirect)
+# juga di production; bukti pembayaran tetap dicek izinnya.
+urlpatterns += [
+    re_path(
+        rf"^{re.escape(settings.MEDIA_URL.lstrip('/'))}(?P<path>.+)$",
+        serve_media,
+        name='media',
+    ),
+]